@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .dependencies import require_super_admin
 from .news_schemas import (
@@ -17,19 +17,23 @@ from .news_schemas import (
 from ..database.connection import get_db
 from ..database.models import User
 from ..database.competitor_models import CompetitorCompany, CompetitorNews
-from ..services.competitor_news_service import CompetitorNewsService
 from ..models.competitor_news import DEFAULT_COMPETITORS
 
+# 뉴스 수집 스택(Ollama/HTTP 클라이언트)은 첫 수집 요청 시 import
+if TYPE_CHECKING:
+    from ..services.competitor_news_service import CompetitorNewsService
+
 router = APIRouter()
 
 # 서비스 인스턴스 (모듈 레벨)
-_news_service: Optional[CompetitorNewsService] = None
+_news_service: Optional["CompetitorNewsService"] = None
 
 
-def get_news_service() -> CompetitorNewsService:
+def get_news_service() -> "CompetitorNewsService":
     """뉴스 서비스 싱글톤"""
     global _news_service
     if _news_service is None:
+        from ..services.competitor_news_service import CompetitorNewsService
         _news_service = CompetitorNewsService()
     return _news_service
 
@@ -25,6 +25,8 @@ from ..database.models import User, DiagnosisKit, UserDiagnosis, Paper, PaperAll
 from ..database.organization_models import Organization, OrganizationMember
 from ..database.clinical_models import ClinicalStatement
 from ..core.allergen import service as allergen_service
+from ..auth.principal_cache import get_principal_cache, invalidate_principal
+from ..core.static_response_cache import get_static_response_cache, invalidate_static_responses
 
 router = APIRouter()
 
@@ -247,6 +249,7 @@ async def update_user(
         user.is_active = request.is_active
 
     db.commit()
+    invalidate_principal(user.id)
     return {"message": "사용자 정보가 수정되었습니다."}
 
 
@@ -275,6 +278,7 @@ async def update_user_role(
 
     user.role = request.role
     db.commit()
+    invalidate_principal(user.id)
 
     return {"message": f"역할이 '{request.role}'로 변경되었습니다."}
 
@@ -318,6 +322,14 @@ async def get_user_stats(
     }
 
 
+@router.get("/users/auth-cache/stats")
+async def get_auth_cache_stats(
+    current_user: User = Depends(require_super_admin),
+):
+    """인증 주체(principal) 캐시 적중률 통계"""
+    return get_principal_cache().get_stats()
+
+
 # ============================================================================
 # 논문 관리 (기본)
 # ============================================================================
@@ -636,6 +648,7 @@ async def create_allergen(
         raise HTTPException(status_code=409, detail=f"이미 존재하는 코드: {request['code']}")
 
     allergen = allergen_service.create_allergen(db, request)
+    invalidate_static_responses()
     return {"message": f"알러젠 '{allergen.code}' 추가 완료", "allergen": allergen.to_dict()}
 
 
@@ -664,6 +677,7 @@ async def update_allergen(
     allergen = allergen_service.update_allergen(db, code, request)
     if not allergen:
         raise HTTPException(status_code=404, detail="알러젠을 찾을 수 없습니다.")
+    invalidate_static_responses()
 
     return {"message": f"알러젠 '{code}' 수정 완료", "allergen": allergen.to_dict()}
 
@@ -679,6 +693,7 @@ async def delete_allergen(
 
     if not allergen_service.delete_allergen(db, code):
         raise HTTPException(status_code=404, detail="알러젠을 찾을 수 없습니다.")
+    invalidate_static_responses()
 
     return {"message": f"알러젠 '{code}' 삭제 완료"}
 
@@ -694,10 +709,32 @@ async def restore_allergen(
 
     if not allergen_service.restore_allergen(db, code):
         raise HTTPException(status_code=404, detail="알러젠을 찾을 수 없습니다.")
+    invalidate_static_responses()
 
     return {"message": f"알러젠 '{code}' 복원 완료"}
 
 
+@router.get("/reference-cache/stats")
+async def get_reference_cache_stats(
+    current_user: User = Depends(require_super_admin),
+):
+    """정적 참조 데이터 응답 캐시 통계 (알러젠 목록·등급 설명 등)"""
+    return get_static_response_cache().get_stats()
+
+
+@router.post("/reference-cache/invalidate")
+async def invalidate_reference_cache(
+    current_user: User = Depends(require_super_admin),
+):
+    """정적 참조 데이터 응답 캐시 초기화
+
+    알러젠 마스터 데이터를 DB 에서 직접 일괄 수정한 경우 호출합니다.
+    (관리자 알러젠 API 를 통한 수정은 자동으로 무효화됩니다.)
+    """
+    invalidated = invalidate_static_responses()
+    return {"message": f"캐시 {len(invalidated)}건 초기화 완료", "invalidated": invalidated}
+
+
 # ============================================================================
 # 경쟁사 뉴스 관리 (별도 라우터 include)
 # ============================================================================
@@ -3,11 +3,14 @@
 일반 사용자가 알러지 관련 질문을 하면
 수집된 논문 기반으로 AI 답변을 제공합니다.
 """
+import logging
 import os
 import time
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Optional
 
@@ -17,6 +20,10 @@ from slowapi.util import get_remote_address
 from ..data.allergen_prescription_db import get_allergen_list
 from ..observability.llmops import LLMOpsClient, StageReport
 from ..services.safety_gate import assess as safety_assess
+from ..core.static_response_cache import get_static_response_cache, static_payload
+from ..utils.sse import sse_event
+
+logger = logging.getLogger(__name__)
 
 limiter = Limiter(key_func=get_remote_address)
 
@@ -55,6 +62,28 @@ def _emergency_response(question: str, safety) -> dict:
     }
 
 
+def _report_rag_answer(
+    body: "ConsultRequest", t_start: datetime, duration_ms: int, result: dict, stream: bool = False,
+) -> None:
+    """LLMOps 보고 (fire-and-forget) — LLM 이 실제 호출된 RAG 경로만"""
+    _LLMOPS_CHAT.report(
+        run_id=f"{t_start.isoformat()}-{os.getpid()}-{id(body)}",
+        started_at=t_start,
+        ended_at=datetime.now(timezone.utc),
+        status="success",
+        stages=[StageReport(
+            name="rag_answer", model=_LLM_MODEL_NAME, duration_ms=duration_ms,
+        )],
+        metrics={
+            "question_length": len(body.question),
+            "source_count": len(result["sources"]),
+            "confidence": float(result["confidence"]),
+            "allergen": body.allergen,
+        },
+        extra={"engine": "rag", "stream": stream},
+    )
+
+
 class ConsultRequest(BaseModel):
     """AI 상담 질문 요청"""
     question: str = Field(..., min_length=2, max_length=500, description="질문 내용")
@@ -100,30 +129,15 @@ async def ask_question(request: Request, body: ConsultRequest):
     if rag.is_available and rag.document_count > 0:
         t_start = datetime.now(timezone.utc)
         t0 = time.monotonic()
-        result = rag.ask(
+        result = await run_in_threadpool(
+            rag.ask,
             question=body.question,
             allergen=body.allergen,
             n_context=body.max_citations,
         )
         duration_ms = int((time.monotonic() - t0) * 1000)
         if result["sources"]:
-            # LLMOps 보고 (fire-and-forget) — LLM 이 실제 호출된 RAG 경로만
-            _LLMOPS_CHAT.report(
-                run_id=f"{t_start.isoformat()}-{os.getpid()}-{id(body)}",
-                started_at=t_start,
-                ended_at=datetime.now(timezone.utc),
-                status="success",
-                stages=[StageReport(
-                    name="rag_answer", model=_LLM_MODEL_NAME, duration_ms=duration_ms,
-                )],
-                metrics={
-                    "question_length": len(body.question),
-                    "source_count": len(result["sources"]),
-                    "confidence": float(result["confidence"]),
-                    "allergen": body.allergen,
-                },
-                extra={"engine": "rag"},
-            )
+            _report_rag_answer(body, t_start, duration_ms, result)
             return {
                 "success": True,
                 "question": body.question,
@@ -209,7 +223,9 @@ async def ask_question_rag(request: Request, body: ConsultRequest):
         # RAG 미가용 시 기존 Q&A 엔진으로 fallback
         return await ask_question(request, body)
 
-    result = rag.ask(
+    # 검색 + LLM 호출은 블로킹 → 스레드풀에서 실행 (이벤트 루프 점유 방지)
+    result = await run_in_threadpool(
+        rag.ask,
         question=body.question,
         allergen=body.allergen,
         n_context=body.max_citations,
@@ -228,6 +244,74 @@ async def ask_question_rag(request: Request, body: ConsultRequest):
     }
 
 
+@router.post("/ask/rag/stream")
+@limiter.limit("10/minute")
+async def ask_question_rag_stream(request: Request, body: ConsultRequest):
+    """RAG 기반 알러지 AI 상담 질문 (Server-Sent Events 스트리밍)
+
+    검색이 끝나는 즉시 `sources` 이벤트로 참고 논문을 보내고,
+    LLM 답변은 `token` 이벤트로 생성되는 대로 전달합니다. 마지막에
+    `done` 이벤트로 전체 답변·신뢰도·가드레일 정보를 보냅니다.
+
+    응급 감지 또는 RAG 미가용 시에는 /ask 와 같은 응답 본문을
+    단일 `answer` 이벤트로 보낸 뒤 종료합니다.
+    """
+    safety = safety_assess(body.question)
+
+    from ..services.rag_service import get_rag_service
+
+    rag = get_rag_service()
+
+    if safety.is_emergency or not rag.is_available:
+        if safety.is_emergency:
+            payload = _emergency_response(body.question, safety)
+        else:
+            payload = await ask_question(request, body)
+
+        def single_event():
+            yield sse_event("answer", payload)
+
+        return StreamingResponse(single_event(), media_type="text/event-stream")
+
+    def event_stream():
+        # 동기 제너레이터 — StreamingResponse 가 스레드풀에서 순회 (이벤트 루프 비차단)
+        t_start = datetime.now(timezone.utc)
+        t0 = time.monotonic()
+        try:
+            for event, data in rag.ask_stream(
+                question=body.question,
+                allergen=body.allergen,
+                n_context=body.max_citations,
+            ):
+                if event == "done":
+                    if data["sources"]:
+                        _report_rag_answer(
+                            body, t_start, int((time.monotonic() - t0) * 1000), data, stream=True,
+                        )
+                    data = {
+                        "success": True,
+                        "question": body.question,
+                        **data,
+                        "source_count": len(data["sources"]),
+                        "engine": "rag",
+                        "safety": safety.to_dict(),
+                        "diagnosis_disclaimer": _DIAGNOSIS_DISCLAIMER,
+                    }
+                yield sse_event(event, data)
+        except Exception:
+            logger.exception("RAG 스트리밍 답변 생성 실패")
+            yield sse_event("error", {
+                "success": False,
+                "error": "답변 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
+            })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/rag/stats")
 async def get_rag_stats():
     """RAG 인덱스 통계"""
@@ -261,9 +345,8 @@ async def trigger_rag_indexing(request: Request, batch_size: int = 100):
         db.close()
 
 
-@router.get("/allergens")
-async def get_allergen_options():
-    """상담 가능한 알러젠 목록"""
+@static_payload("consult_allergens")
+def _allergen_options_payload() -> dict:
     allergen_list = get_allergen_list()
 
     food = [a for a in allergen_list if a["category"] == "food"]
@@ -275,3 +358,9 @@ async def get_allergen_options():
         "inhalant": inhalant,
         "total": len(allergen_list),
     }
+
+
+@router.get("/allergens")
+async def get_allergen_options(request: Request):
+    """상담 가능한 알러젠 목록"""
+    return await get_static_response_cache().serve(request, "consult_allergens")
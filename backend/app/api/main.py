@@ -8,34 +8,35 @@ FastAPI 기반 REST API 서버입니다.
     cd C:\GIT\AllergyInsight\backend
     uvicorn app.api.main:app --reload --port 9040
 """
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, Depends
+from fastapi import FastAPI, HTTPException, Query, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from pydantic import BaseModel, Field
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional, Any
 from datetime import datetime
 from functools import lru_cache
 import asyncio
 import logging
 import os
+import time
 
-from ..services import (
-    PaperSearchService,
-    QAEngine,
-    SymptomQAInterface,
-    BatchProcessor,
-    AllergenItem,
-    create_allergen_items,
-    SmartLoader,
-    PrescriptionEngine,
-    DiagnosisRepository,
-)
-from ..services.batch_processor import ProcessingStatus
-from ..data.allergen_prescription_db import get_allergen_list
 from ..models.prescription import GRADE_DESCRIPTIONS
+from ..core.static_response_cache import get_static_response_cache, static_payload
+from ..utils.sse import sse_event
+
+# 서비스 구현(PDF/HTTP 스택 등)은 첫 사용 시 import — 콜드 스타트 단축
+if TYPE_CHECKING:
+    from ..services import (
+        BatchProcessor,
+        DiagnosisRepository,
+        PaperSearchService,
+        PrescriptionEngine,
+        QAEngine,
+    )
 
 # Auth imports
 from ..auth.routes import router as auth_router
@@ -43,11 +44,6 @@ from ..auth.diagnosis_routes import router as diagnosis_router
 from ..auth.paper_routes import router as paper_router
 from ..auth.config import auth_settings
 from ..database.connection import engine, init_db, get_db, SessionLocal
-from ..database.seed_users import seed_users
-from ..database.seed_allergens import seed_allergens
-from ..database.seed_persona_newsletter import seed_persona_newsletter
-from ..database.normalize_grades import normalize_legacy_grades
-from ..database.normalize_core_source import normalize_core_source
 from ..config import settings
 from ..database.models import User
 from ..core.auth import require_auth
@@ -189,27 +185,32 @@ app.include_router(public_clinical_image_router, prefix="/api", tags=["Public Cl
 
 # 서비스 인스턴스 (lru_cache DI 패턴)
 @lru_cache(maxsize=1)
-def get_search_service() -> PaperSearchService:
+def get_search_service() -> "PaperSearchService":
+    from ..services.paper_search_service import PaperSearchService
     return PaperSearchService()
 
 
 @lru_cache(maxsize=1)
-def get_qa_engine() -> QAEngine:
+def get_qa_engine() -> "QAEngine":
+    from ..services.qa_engine import QAEngine
     return QAEngine()
 
 
 @lru_cache(maxsize=1)
-def get_batch_processor() -> BatchProcessor:
+def get_batch_processor() -> "BatchProcessor":
+    from ..services.batch_processor import BatchProcessor
     return BatchProcessor()
 
 
 @lru_cache(maxsize=1)
-def get_prescription_engine() -> PrescriptionEngine:
+def get_prescription_engine() -> "PrescriptionEngine":
+    from ..services.prescription_engine import PrescriptionEngine
     return PrescriptionEngine()
 
 
 @lru_cache(maxsize=1)
-def get_diagnosis_repository() -> DiagnosisRepository:
+def get_diagnosis_repository() -> "DiagnosisRepository":
+    from ..services.diagnosis_repository import DiagnosisRepository
     return DiagnosisRepository()
 
 
@@ -245,6 +246,9 @@ class SearchRequest(BaseModel):
     allergen: str = Field(..., description="알러지 항원 (예: peanut, milk)")
     include_cross_reactivity: bool = Field(True, description="교차 반응 포함 여부")
     max_results: int = Field(20, ge=1, le=100, description="최대 결과 수")
+    prefer_local: bool = Field(
+        False, description="로컬 전문 검색 결과가 max_results 이상이면 외부 API 생략",
+    )
 
 
 class QuestionRequest(BaseModel):
@@ -332,8 +336,17 @@ async def root():
 
 @app.get("/api/health")
 async def health_check():
-    """헬스 체크"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    """헬스 체크 (LLM 프로바이더별 서킷 브레이커 상태 포함)
+
+    LLM 장애는 키워드 Fallback 으로 흡수되므로 status 에는 반영하지 않습니다.
+    """
+    from ..services.llm_client_pool import get_llm_client_pool
+
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "llm_providers": get_llm_client_pool().breaker_states(),
+    }
 
 
 # =====================
@@ -348,24 +361,55 @@ async def search_papers(request: Request, body: SearchRequest):
 
     PubMed, Semantic Scholar, Europe PMC, OpenAlex에서 논문을 검색합니다.
     검색 결과는 자동으로 DB에 저장됩니다 (AUTO_SAVE_SEARCH 설정).
+
+    소스 호출은 이벤트 루프에서 비동기로 병렬 실행되며, PAPER_SEARCH_DEADLINE_S
+    안에 응답하지 않은 소스는 제외하고 부분 결과를 반환합니다 (errors 필드).
+
+    결과는 워커 간 공유 검색 캐시에 저장되며, 오래된(stale) 항목은 즉시 반환하고
+    백그라운드에서 갱신합니다 (cache_status: hit / stale / miss).
+
+    prefer_local 이면 로컬 전문 검색 색인을 먼저 조회하고, max_results 이상 찾으면
+    외부 API 없이 그 결과를 반환합니다 (cache_status: local).
     """
+    from ..services.search_result_cache import (
+        CACHE_LOCAL,
+        CACHE_MISS,
+        get_search_result_cache,
+        make_search_cache_key,
+    )
+
     service = get_search_service()
+    max_results_per_source = body.max_results // 2
 
-    # DB 세션 획득 (자동 저장 활성화 시)
-    db = None
-    if settings.AUTO_SAVE_SEARCH:
-        db = SessionLocal()
+    result = None
+    if body.prefer_local:
+        result = await asyncio.to_thread(_search_local_first, body.allergen, body.max_results)
 
-    try:
-        result = service.search_allergy(
-            allergen=body.allergen,
-            include_cross_reactivity=body.include_cross_reactivity,
-            max_results_per_source=body.max_results // 2,
-            db=db,
+    async def run_search():
+        # DB 세션 획득 (자동 저장 활성화 시)
+        db = SessionLocal() if settings.AUTO_SAVE_SEARCH else None
+        try:
+            return await service.search_allergy_async(
+                allergen=body.allergen,
+                include_cross_reactivity=body.include_cross_reactivity,
+                max_results_per_source=max_results_per_source,
+                db=db,
+            )
+        finally:
+            if db is not None:
+                db.close()
+
+    cache = get_search_result_cache()
+    if result is not None:
+        cache_status = CACHE_LOCAL
+    elif cache is None:
+        result, cache_status = await run_search(), CACHE_MISS
+    else:
+        key = make_search_cache_key(
+            body.allergen, body.include_cross_reactivity,
+            max_results_per_source, service.allergy_sources(),
         )
-    finally:
-        if db is not None:
-            db.close()
+        result, cache_status = await cache.afetch(key, body.allergen, run_search)
 
     # 통계 업데이트 (thread-safe)
     async with _stats_lock:
@@ -395,10 +439,35 @@ async def search_papers(request: Request, body: SearchRequest):
         "core_count": result.core_count,
         "downloadable_count": result.downloadable_count,
         "search_time_ms": round(result.search_time_ms, 2),
+        "errors": result.errors,
+        "cache_status": cache_status,
         "papers": [p.to_dict() for p in result.papers],
     }
 
 
+def _search_local_first(allergen: str, max_results: int):
+    """로컬 색인에서 max_results 이상 찾으면 UnifiedSearchResult 로 반환, 부족하면 None"""
+    from ..services.paper_mapper import PaperMapper
+    from ..services.paper_persistence_service import PaperPersistenceService
+    from ..services.paper_search_service import UnifiedSearchResult
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        rows = PaperPersistenceService().search_local(allergen, db, limit=max_results)
+        if len(rows) < max_results:
+            return None
+        papers = [PaperMapper.orm_to_dc(p) for p in rows]
+    finally:
+        db.close()
+    return UnifiedSearchResult(
+        papers=papers, pubmed_count=0, semantic_scholar_count=0,
+        total_unique=len(papers), query=allergen,
+        search_time_ms=(time.perf_counter() - started) * 1000,
+        downloadable_count=sum(1 for p in papers if p.pdf_url),
+    )
+
+
 @app.get("/api/search/history")
 async def get_search_history(
     limit: int = Query(50, ge=1, le=200),
@@ -437,6 +506,55 @@ async def get_search_history(
         db.close()
 
 
+@app.get("/api/search/local")
+def search_local_papers(
+    q: str = Query(..., min_length=1, description="검색어 (한/영)"),
+    allergen_code: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """
+    로컬 DB 논문 검색 (전문 검색 색인)
+
+    외부 API 를 호출하지 않고 저장된 논문을 관련도순으로 반환합니다.
+    제목/초록 일치 구간은 <mark> 로 강조한 발췌문을 함께 제공합니다.
+    결과가 부족할 때만 /api/search 로 외부 검색을 이어가는 1차 경로입니다.
+    동기 DB 조회이므로 일반 함수로 두어 스레드풀에서 실행합니다.
+    """
+    from ..database.paper_fulltext import highlight
+    from ..services.paper_persistence_service import PaperPersistenceService
+
+    db = SessionLocal()
+    try:
+        persistence = PaperPersistenceService()
+        papers = persistence.search_local(
+            q, db, allergen_code=allergen_code, limit=limit, offset=offset,
+        )
+        return {
+            "success": True,
+            "query": q,
+            "total": persistence.count_local(q, db, allergen_code=allergen_code),
+            "papers": [
+                {
+                    "id": p.id,
+                    "title": p.title,
+                    "title_kr": p.title_kr,
+                    "authors": p.authors,
+                    "journal": p.journal,
+                    "year": p.year,
+                    "doi": p.doi,
+                    "pmid": p.pmid,
+                    "url": p.url,
+                    "title_highlight": highlight(p.title, q) or highlight(p.title_kr, q),
+                    "abstract_highlight": highlight(p.abstract, q) or highlight(p.abstract_kr, q),
+                }
+                for p in papers
+            ],
+        }
+    finally:
+        db.close()
+
+
 @app.get("/api/search/{allergen}")
 @limiter.limit("30/minute")
 async def search_allergen(
@@ -506,12 +624,16 @@ async def get_predefined_questions(allergen: str = "peanut"):
 # =====================
 
 @app.post("/api/batch/search")
-async def batch_search(body: BatchSearchRequest, background_tasks: BackgroundTasks):
+async def batch_search(body: BatchSearchRequest):
     """
     배치 논문 검색
 
     여러 알러지 항원에 대해 동시에 검색을 수행합니다.
+    작업은 BatchProcessor 워커 풀 대기열에 등록되어 우선순위 순으로 처리되며,
+    상태는 저장소에 기록되어 서버 재시작 후에도 조회/재개됩니다.
     """
+    from ..services.batch_processor import create_allergen_items
+
     processor = get_batch_processor()
 
     # AllergenItem 생성
@@ -520,12 +642,8 @@ async def batch_search(body: BatchSearchRequest, background_tasks: BackgroundTas
     # 작업 생성
     job = processor.create_job(allergens, sort_by_priority=True)
 
-    # 백그라운드에서 처리
-    background_tasks.add_task(
-        processor.process_job_sync,
-        job,
-        body.include_cross_reactivity,
-    )
+    # 워커 풀에서 처리
+    processor.submit_job(job, body.include_cross_reactivity)
 
     return {
         "success": True,
@@ -573,6 +691,39 @@ async def get_batch_results(job_id: str):
     }
 
 
+@app.get("/api/batch/stream/{job_id}")
+async def stream_batch_progress(job_id: str, request: Request):
+    """
+    배치 작업 진행 스트림 (Server-Sent Events)
+
+    상태/결과를 폴링하지 않고, 항원 검색이 끝날 때마다 이벤트를 받습니다.
+
+    - `result`: 항원별 결과 (논문 목록 포함, 실패 시 error)
+    - `progress`: 진행 상태 (LoadingProgress)
+    - `ping`: 연결 유지
+    - `done`: 최종 상태 요약 후 스트림 종료
+
+    연결 시점까지 끝난 항원 결과를 먼저 보낸 뒤 이어서 전달합니다.
+    """
+    from ..services.progressive_loader import ProgressiveLoader
+
+    processor = get_batch_processor()
+    if not processor.get_job(job_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    loader = ProgressiveLoader(processor)
+
+    async def event_stream():
+        async for event, data in loader.stream_job_events(job_id, request.is_disconnected):
+            yield sse_event(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # =====================
 # 통계 API
 # =====================
@@ -587,6 +738,10 @@ async def get_stats():
     processor = get_batch_processor()
     cache_stats = processor.cache.get_stats()
 
+    from ..services.llm_response_cache import get_llm_response_cache
+    llm_cache = get_llm_response_cache()
+    llm_cache_stats = llm_cache.get_stats() if llm_cache is not None else None
+
     async with _stats_lock:
         stats_snapshot = {
             "total_searches": _collection_stats["total_searches"],
@@ -602,6 +757,7 @@ async def get_stats():
         "success": True,
         "stats": stats_snapshot,
         "cache": cache_stats,
+        "llm_cache": llm_cache_stats,
         "recent_searches": recent,
     }
 
@@ -662,9 +818,10 @@ async def reset_stats(request: Request, user: User = Depends(require_auth)):
 # 알러지 정보 API
 # =====================
 
-@app.get("/api/allergens")
-async def get_allergens():
-    """지원하는 알러지 항원 목록 (지식베이스 기반)"""
+@static_payload("allergens")
+def _allergens_payload() -> dict:
+    from ..data.allergen_prescription_db import get_allergen_list
+
     allergen_list = get_allergen_list()
 
     food = [a for a in allergen_list if a["category"] == "food"]
@@ -676,13 +833,21 @@ async def get_allergens():
     }
 
 
+@app.get("/api/allergens")
+async def get_allergens(request: Request):
+    """지원하는 알러지 항원 목록 (지식베이스 기반)
+
+    미리 직렬화된 응답을 ETag 와 함께 반환합니다 (static_response_cache).
+    """
+    return await get_static_response_cache().serve(request, "allergens")
+
+
 # =====================
 # SGTi 정보 API
 # =====================
 
-@app.get("/api/sgti/info")
-async def get_sgti_info():
-    """SGTi-Allergy Screen PLUS 제품 정보"""
+@static_payload("sgti_info")
+def _sgti_info_payload() -> dict:
     return {
         "product_name": "SGTi-Allergy Screen PLUS",
         "description": "다중 알러젠 체외진단 검사 키트",
@@ -708,9 +873,8 @@ async def get_sgti_info():
     }
 
 
-@app.get("/api/sgti/grades")
-async def get_grade_info():
-    """등급별 설명 정보 (MAST Class 0~4)"""
+@static_payload("sgti_grades")
+def _sgti_grades_payload() -> dict:
     return {
         "grades": GRADE_DESCRIPTIONS,
         "restriction_levels": {
@@ -723,6 +887,18 @@ async def get_grade_info():
     }
 
 
+@app.get("/api/sgti/info")
+async def get_sgti_info(request: Request):
+    """SGTi-Allergy Screen PLUS 제품 정보"""
+    return await get_static_response_cache().serve(request, "sgti_info")
+
+
+@app.get("/api/sgti/grades")
+async def get_grade_info(request: Request):
+    """등급별 설명 정보 (MAST Class 0~4)"""
+    return await get_static_response_cache().serve(request, "sgti_grades")
+
+
 # =====================
 # 진단 API
 # =====================
@@ -916,45 +1092,109 @@ async def list_prescriptions(
 # 앱 이벤트
 # =====================
 
+# 콜드 스타트 예산 — startup 단계별 소요 시간을 기록하고 합계가 넘으면 경고
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "3000"))
+
+
+def _with_session(fn, **kwargs):
+    """db 인자를 받는 정규화 함수 → 세션을 열고 닫는 인자 없는 단계"""
+    def run():
+        db = SessionLocal()
+        try:
+            return fn(db, **kwargs)
+        finally:
+            db.close()
+    return run
+
+
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 데이터베이스 초기화 및 시드 데이터 생성"""
-    init_db()
-    seed_users()  # 테스트 사용자 시딩
-    seed_allergens()  # 알러젠 마스터 데이터 시딩
-    seed_persona_newsletter()  # 뉴스레터 페르소나 카탈로그 시딩
+    """앱 시작 시 데이터베이스 초기화 및 시드 데이터 생성
+
+    시드/정규화 단계는 적용 버전이 바뀐 경우에만 실행합니다 (database.startup_steps).
+    단계별 소요 시간은 app.state.startup_timings 에 남기고, 합계가
+    STARTUP_BUDGET_MS 를 넘으면 경고합니다.
+    """
+    from time import perf_counter
+
+    from ..database import normalize_core_source, normalize_grades
+    from ..database import seed_allergens, seed_persona_newsletter, seed_users
+    from ..database.startup_steps import run_startup_step
+
+    log = logging.getLogger(__name__)
+    timings: dict[str, float] = {}
+    app.state.startup_timings = timings
+
+    def timed(name: str, fn, *args):
+        started = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[name] = round((perf_counter() - started) * 1000, 1)
+
+    timed("init_db", init_db)
+    for name, version, step in (
+        ("seed_users", seed_users.SEED_VERSION, seed_users.seed_users),  # 테스트 사용자
+        ("seed_allergens", seed_allergens.SEED_VERSION, seed_allergens.seed_allergens),  # 알러젠 마스터 데이터
+        (  # 뉴스레터 페르소나 카탈로그
+            "seed_persona_newsletter",
+            seed_persona_newsletter.SEED_VERSION,
+            # 실패를 자체 처리하고 0 을 반환 → False 로 알려 버전을 기록하지 않음
+            lambda: seed_persona_newsletter.seed_persona_newsletter() > 0,
+        ),
+    ):
+        timed(name, run_startup_step, name, version, step)
 
     # Phase 1: 레거시 grade 5/6 → 4 정규화 (idempotent)
-    _db = SessionLocal()
     try:
-        normalize_legacy_grades(_db)
+        timed(
+            "normalize_legacy_grades", run_startup_step, "normalize_legacy_grades",
+            normalize_grades.NORMALIZE_VERSION, _with_session(normalize_grades.normalize_legacy_grades),
+        )
     except Exception as e:
-        logging.getLogger(__name__).warning("grade 정규화 실패 (무시): %s", e)
-    finally:
-        _db.close()
+        log.warning("grade 정규화 실패 (무시): %s", e)
 
     # Step 1.C-002: CoreService 행 source enum 보정 (manual_upload → core)
-    _db = SessionLocal()
     try:
-        normalize_core_source(_db)
+        timed(
+            "normalize_core_source", run_startup_step, "normalize_core_source",
+            normalize_core_source.NORMALIZE_VERSION, _with_session(normalize_core_source.normalize_core_source, strict=True),
+        )
     except Exception as e:
-        logging.getLogger(__name__).warning("CORE source 정규화 실패 (무시): %s", e)
-    finally:
-        _db.close()
+        log.warning("CORE source 정규화 실패 (무시): %s", e)
 
     # Step 1.G-012: DomainPack preload (fail-fast 미적용 — Phase 1 마이그레이션 중)
     try:
         from ..core.domains import preload_packs
-        preload_packs(fatal=False)
+        timed("preload_packs", lambda: preload_packs(fatal=False))
+    except Exception as e:
+        log.warning("DomainPack preload 실패 (무시): %s", e)
+
+    # 정적 참조 데이터 응답 미리 직렬화 (알러젠 목록·등급 설명 등)
+    try:
+        timed("static_responses", get_static_response_cache().warm)
+    except Exception as e:
+        log.warning("정적 응답 캐시 준비 실패 (무시): %s", e)
+
+    # 배치 워커 풀 시작 (재시작 전 미완료 배치 작업 재개)
+    try:
+        timed("batch_processor", lambda: get_batch_processor().start())
     except Exception as e:
-        logging.getLogger(__name__).warning("DomainPack preload 실패 (무시): %s", e)
+        log.warning("배치 워커 풀 시작 실패 (무시): %s", e)
 
     # 스케줄러 초기화 (ENABLE_SCHEDULER=true일 때만)
     if os.getenv("ENABLE_SCHEDULER", "false").lower() == "true":
         from ..scheduler.scheduler_service import get_scheduler_service
         scheduler = get_scheduler_service()
-        scheduler.start()
-        logging.getLogger(__name__).info("뉴스 스케줄러 시작됨")
+        timed("scheduler", scheduler.start)
+        log.info("뉴스 스케줄러 시작됨")
+
+    total_ms = round(sum(timings.values()), 1)
+    slowest = ", ".join(f"{name}={ms:.0f}ms" for name, ms in sorted(timings.items(), key=lambda kv: -kv[1])[:3])
+    if total_ms > STARTUP_BUDGET_MS:
+        log.warning("startup 시간 예산 초과: %.0fms > %.0fms (%s)", total_ms, STARTUP_BUDGET_MS, slowest)
+    else:
+        log.info("startup 완료: %.0fms (%s)", total_ms, slowest)
 
 
 @app.on_event("shutdown")
@@ -970,12 +1210,38 @@ async def shutdown_event():
             pass
 
     for getter in [get_search_service, get_qa_engine, get_batch_processor]:
+        if getter.cache_info().currsize == 0:
+            continue  # 사용되지 않은 서비스는 종료를 위해 생성하지 않음
         try:
             instance = getter()
+            if hasattr(instance, "aclose"):
+                await instance.aclose()
             if hasattr(instance, "close"):
                 instance.close()
         except Exception:
             pass
+    # LLM 비동기 클라이언트 풀 (keep-alive 연결 + 백그라운드 이벤트 루프)
+    try:
+        from ..services.llm_client_pool import get_llm_client_pool
+        get_llm_client_pool().close()
+    except Exception:
+        pass
+    # 공유 검색 캐시 백그라운드 갱신 태스크
+    try:
+        from ..services.search_result_cache import get_search_result_cache
+        search_cache = get_search_result_cache()
+        if search_cache is not None:
+            search_cache.close()
+    except Exception:
+        pass
+    # 행동 로그 write-behind 큐 (남은 레코드 기록)
+    try:
+        from ..middleware.activity_log_writer import get_activity_log_writer
+        get_activity_log_writer().close()
+        get_activity_log_writer.cache_clear()
+    except Exception:
+        pass
+
     get_search_service.cache_clear()
     get_qa_engine.cache_clear()
     get_batch_processor.cache_clear()
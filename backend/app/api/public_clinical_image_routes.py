@@ -10,11 +10,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.clinical_image_models import ClinicalImage
-from ..database.connection import get_db
+from ..database.connection import get_async_db
 
 router = APIRouter(prefix="/public/clinical-images", tags=["Public Clinical Images"])
 
@@ -43,7 +43,7 @@ async def list_images(
     body_part: str | None = Query(None, max_length=50),
     limit: int = Query(24, ge=1, le=60),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """필터 조건으로 임상 이미지 목록 조회.
 
@@ -51,36 +51,39 @@ async def list_images(
     Phase 4 P4-PR1 단계에서는 시드 데이터가 비어 있을 수 있으며, 그때는
     빈 items + 안내 message 가 반환된다.
     """
-    query = db.query(ClinicalImage).filter(
+    filters = [
         ClinicalImage.is_active.is_(True),
         ClinicalImage.license.isnot(None),
         ClinicalImage.image_url.isnot(None),
-    )
+    ]
 
     if allergen:
-        query = query.filter(ClinicalImage.allergen_code == allergen.strip())
+        filters.append(ClinicalImage.allergen_code == allergen.strip())
 
     if symptom:
         like = f"%{symptom.strip()}%"
         # PostgreSQL JSON 부분 매칭은 단순 문자열 LIKE 로 대체 (캡션 + JSON 직렬화 둘 다 검사)
-        query = query.filter(or_(
+        filters.append(or_(
             ClinicalImage.caption_kr.ilike(like),
             ClinicalImage.caption_en.ilike(like),
         ))
 
     if severity:
-        query = query.filter(ClinicalImage.severity_level == severity)
+        filters.append(ClinicalImage.severity_level == severity)
 
     if body_part:
-        query = query.filter(ClinicalImage.body_part == body_part.strip())
+        filters.append(ClinicalImage.body_part == body_part.strip())
 
-    total = query.count()
-    rows = (
-        query.order_by(ClinicalImage.indexed_at.desc())
+    total = await db.scalar(
+        select(func.count()).select_from(ClinicalImage).where(*filters)
+    )
+    rows = (await db.scalars(
+        select(ClinicalImage)
+        .where(*filters)
+        .order_by(ClinicalImage.indexed_at.desc())
         .limit(limit)
         .offset(offset)
-        .all()
-    )
+    )).all()
 
     items = [r.to_dict() for r in rows]
 
@@ -102,12 +105,11 @@ async def list_images(
 
 
 @router.get("/{image_id}")
-async def get_image(image_id: int, db: Session = Depends(get_db)):
+async def get_image(image_id: int, db: AsyncSession = Depends(get_async_db)):
     """이미지 단건 조회 (라이선스/출처 상세)."""
-    img = (
-        db.query(ClinicalImage)
-        .filter(ClinicalImage.id == image_id, ClinicalImage.is_active.is_(True))
-        .first()
+    img = await db.scalar(
+        select(ClinicalImage)
+        .where(ClinicalImage.id == image_id, ClinicalImage.is_active.is_(True))
     )
     if not img:
         raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
@@ -11,10 +11,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.connection import get_db
+from ..database.connection import get_async_db
 from ..database.drug_models import DrugIngredient
 from ..services.drug_safety import (
     ALLERGY_ATC_PREFIXES,
@@ -23,6 +23,7 @@ from ..services.drug_safety import (
     list_allergy_categories,
     serialize_ingredient_public,
 )
+from ..core.static_response_cache import get_static_response_cache, static_payload
 
 router = APIRouter(prefix="/public/drugs", tags=["Public Drugs"])
 
@@ -57,12 +58,8 @@ async def list_drug_updates(
     }
 
 
-@router.get("/allergy-classes")
-async def list_allergy_classes():
-    """알러지 치료 약물의 ATC 약리군 카탈로그 (7개 그룹).
-
-    각 카테고리: atc_prefix, name_kr, name_en, description.
-    """
+@static_payload("public_drug_allergy_classes")
+def _allergy_classes_payload() -> dict:
     return {
         "success": True,
         "items": list_allergy_categories(),
@@ -71,6 +68,15 @@ async def list_allergy_classes():
     }
 
 
+@router.get("/allergy-classes")
+async def list_allergy_classes(request: Request):
+    """알러지 치료 약물의 ATC 약리군 카탈로그 (7개 그룹).
+
+    각 카테고리: atc_prefix, name_kr, name_en, description.
+    """
+    return await get_static_response_cache().serve(request, "public_drug_allergy_classes")
+
+
 @router.get("/search")
 @_limiter.limit("30/minute")
 async def search_ingredients(
@@ -80,33 +86,41 @@ async def search_ingredients(
     atc_prefix: str | None = Query(None, max_length=10, description="특정 ATC prefix 필터"),
     limit: int = Query(20, ge=1, le=50),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """약물 성분 검색.
 
     성분명(INN, 한·영 모두 inn 컬럼에 저장됨), RxNorm ID, ATC 코드 부분 일치.
     응답에는 제품 정보가 일절 포함되지 않으며, 성분 메타와 출처만 반환한다.
     """
-    query = db.query(DrugIngredient)
+    filters = []
 
     if q:
         like = f"%{q.strip()}%"
-        query = query.filter(or_(
+        filters.append(or_(
             DrugIngredient.inn.ilike(like),
             DrugIngredient.rxcui.ilike(like),
             DrugIngredient.atc_code.ilike(like),
         ))
 
     if atc_prefix:
-        query = query.filter(DrugIngredient.atc_code.ilike(f"{atc_prefix.strip().upper()}%"))
+        filters.append(DrugIngredient.atc_code.ilike(f"{atc_prefix.strip().upper()}%"))
     elif allergy_only:
         # 알러지 약리군 화이트리스트로 필터 (DB 레벨 OR)
-        query = query.filter(or_(*[
+        filters.append(or_(*[
             DrugIngredient.atc_code.ilike(f"{prefix}%") for prefix in ALLERGY_ATC_PREFIXES
         ]))
 
-    total = query.count()
-    rows = query.order_by(DrugIngredient.inn).limit(limit).offset(offset).all()
+    total = await db.scalar(
+        select(func.count()).select_from(DrugIngredient).where(*filters)
+    )
+    rows = (await db.scalars(
+        select(DrugIngredient)
+        .where(*filters)
+        .order_by(DrugIngredient.inn)
+        .limit(limit)
+        .offset(offset)
+    )).all()
 
     items = [serialize_ingredient_public(row) for row in rows]
 
@@ -128,7 +142,7 @@ async def search_ingredients(
 @router.get("/{identifier}")
 async def get_ingredient(
     identifier: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """성분 단건 조회. identifier 는 rxcui 또는 내부 id.
 
@@ -138,22 +152,14 @@ async def get_ingredient(
     ingredient: DrugIngredient | None = None
     if identifier.isdigit():
         # 숫자면 rxcui 우선, 없으면 id 로 재시도
-        ingredient = (
-            db.query(DrugIngredient)
-            .filter(DrugIngredient.rxcui == identifier)
-            .first()
+        ingredient = await db.scalar(
+            select(DrugIngredient).where(DrugIngredient.rxcui == identifier).limit(1)
         )
         if not ingredient:
-            ingredient = (
-                db.query(DrugIngredient)
-                .filter(DrugIngredient.id == int(identifier))
-                .first()
-            )
+            ingredient = await db.get(DrugIngredient, int(identifier))
     else:
-        ingredient = (
-            db.query(DrugIngredient)
-            .filter(DrugIngredient.inn.ilike(identifier))
-            .first()
+        ingredient = await db.scalar(
+            select(DrugIngredient).where(DrugIngredient.inn.ilike(identifier)).limit(1)
         )
 
     if not ingredient:
@@ -11,7 +11,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..data.allergen_prescription_db import (
     PHASE1_ACTIVE_ALLERGENS,
@@ -19,7 +20,7 @@ from ..data.allergen_prescription_db import (
     is_phase1_active,
 )
 from ..database.allergen_models import AllergenMaster
-from ..database.connection import get_db
+from ..database.connection import get_async_db
 from ..models.prescription import (
     GRADE_DESCRIPTIONS,
     MAST_MAX_GRADE,
@@ -27,6 +28,7 @@ from ..models.prescription import (
     normalize_grade,
 )
 from ..services.prescription_engine import PrescriptionEngine
+from ..core.static_response_cache import get_static_response_cache, static_payload
 
 router = APIRouter(prefix="/public/mast", tags=["Public MAST"])
 
@@ -52,9 +54,8 @@ class MastMatchRequest(BaseModel):
     )
 
 
-@router.get("/grades")
-async def list_grades():
-    """MAST Class 0~4 등급 설명 반환"""
+@static_payload("public_mast_grades")
+def _grades_payload() -> dict:
     return {
         "standard": "MAST (Multiple Allergen Simultaneous Test)",
         "range": "0-4",
@@ -63,21 +64,16 @@ async def list_grades():
     }
 
 
-@router.get("/allergens")
-async def list_active_allergens(db: Session = Depends(get_db)):
-    """Phase 1 활성 알러젠 목록 반환 (처방 데이터 보유 36종)
-
-    allergen_master 119종 중 식이/증상/교차반응 데이터가 채워진 알러젠만
-    노출한다. 각 항목은 마스터 테이블에서 한·영 정식 명칭을 보강해 반환.
-    """
+@static_payload("public_mast_allergens", requires_db=True)
+async def _active_allergens_payload(db: AsyncSession) -> dict:
     seed_items = get_phase1_active_list()
     seed_codes = [item["code"] for item in seed_items]
 
     master_map: dict[str, AllergenMaster] = {
         a.code: a
-        for a in db.query(AllergenMaster)
-        .filter(AllergenMaster.code.in_(seed_codes))
-        .all()
+        for a in await db.scalars(
+            select(AllergenMaster).where(AllergenMaster.code.in_(seed_codes))
+        )
     }
 
     items = []
@@ -98,12 +94,29 @@ async def list_active_allergens(db: Session = Depends(get_db)):
     }
 
 
+@router.get("/grades")
+async def list_grades(request: Request):
+    """MAST Class 0~4 등급 설명 반환"""
+    return await get_static_response_cache().serve(request, "public_mast_grades")
+
+
+@router.get("/allergens")
+async def list_active_allergens(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Phase 1 활성 알러젠 목록 반환 (처방 데이터 보유 36종)
+
+    allergen_master 119종 중 식이/증상/교차반응 데이터가 채워진 알러젠만
+    노출한다. 각 항목은 마스터 테이블에서 한·영 정식 명칭을 보강해 반환.
+    응답은 캐시되며 관리자 알러젠 수정 시 무효화된다 (static_response_cache).
+    """
+    return await get_static_response_cache().serve(request, "public_mast_allergens", db)
+
+
 @router.post("/match")
 @_limiter.limit("30/minute")
 async def match_allergen_grade(
     request: Request,
     body: MastMatchRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """병원 MAST 검사 등급 입력 → 알러젠별 정보 매칭
 
@@ -129,10 +142,8 @@ async def match_allergen_grade(
             ),
         )
 
-    allergen = (
-        db.query(AllergenMaster)
-        .filter(AllergenMaster.code == body.allergen_code)
-        .first()
+    allergen = await db.scalar(
+        select(AllergenMaster).where(AllergenMaster.code == body.allergen_code)
     )
     if not allergen:
         raise HTTPException(
@@ -2,28 +2,60 @@
 from typing import Optional, List
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database.connection import get_db
+from ..database.connection import get_async_db, get_db
 from ..database.models import User
 from ..database.organization_models import (
     UserRole,
+    Organization,
     OrganizationMember,
     HospitalPatient,
     HospitalPatientStatus,
 )
 from .jwt_handler import verify_token
+from .principal_cache import Principal, get_principal_cache
 
 security = HTTPBearer(auto_error=False)
 
 
 # ===== 기본 인증 의존성 =====
 
-async def get_current_user(
+async def _load_principal(db: AsyncSession, user_id: str, issued_at) -> Optional[Principal]:
+    """인증 주체 조회 — 캐시 미스면 비동기 세션으로 사용자 + 활성 멤버십 조회
+
+    요청마다 세션에 속하지 않은(detached) 새 객체로 복원되므로, 라우트의 동기
+    세션에서도 그대로 비교·`db.add()` 할 수 있습니다. 관계 속성(lazy load)은
+    사용할 수 없습니다.
+    """
+    cache = get_principal_cache()
+    principal = cache.get(int(user_id), issued_at)
+    if principal is not None:
+        return principal
+
+    user = await db.get(User, int(user_id))
+    if user is None:
+        return None
+    memberships = (await db.scalars(
+        select(OrganizationMember)
+        .where(
+            OrganizationMember.user_id == user.id,
+            OrganizationMember.is_active.is_(True),
+        )
+        .order_by(OrganizationMember.id)
+    )).all()
+    principal = Principal.from_models(user, memberships)
+    cache.put(principal, issued_at)
+    return principal
+
+
+async def get_principal(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
-) -> Optional[User]:
-    """Get current authenticated user (returns None if not authenticated)"""
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[Principal]:
+    """Get current principal (returns None if not authenticated)"""
     if not credentials:
         return None
 
@@ -37,14 +69,20 @@ async def get_current_user(
     if not user_id:
         return None
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    return user
+    return await _load_principal(db, user_id, payload.get("iat"))
+
 
+async def get_current_user(
+    principal: Optional[Principal] = Depends(get_principal)
+) -> Optional[User]:
+    """Get current authenticated user (returns None if not authenticated)"""
+    return principal.user() if principal else None
 
-async def require_auth(
+
+async def require_principal(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
     """Require authentication - raises 401 if not authenticated"""
     token = credentials.credentials
     payload = verify_token(token)
@@ -63,20 +101,25 @@ async def require_auth(
             detail="Invalid token payload",
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if not user:
+    principal = await _load_principal(db, user_id, payload.get("iat"))
+    if not principal:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is disabled",
         )
 
-    return user
+    return principal
+
+
+async def require_auth(principal: Principal = Depends(require_principal)) -> User:
+    """Require authentication - returns the current user"""
+    return principal.user()
 
 
 # ===== Legacy 권한 (하위 호환) =====
@@ -105,7 +148,7 @@ async def require_super_admin(user: User = Depends(require_auth)) -> User:
 
 async def require_hospital_staff(
     user: User = Depends(require_auth),
-    db: Session = Depends(get_db)
+    principal: Principal = Depends(require_principal)
 ) -> User:
     """Require hospital staff role (doctor, nurse, lab_tech, hospital_admin)"""
     if not user.is_staff():
@@ -114,13 +157,8 @@ async def require_hospital_staff(
             detail="Hospital staff access required",
         )
 
-    # 조직에 소속되어 있는지 확인
-    membership = db.query(OrganizationMember).filter(
-        OrganizationMember.user_id == user.id,
-        OrganizationMember.is_active == True
-    ).first()
-
-    if not membership:
+    # 조직에 소속되어 있는지 확인 (principal 캐시의 활성 멤버십)
+    if not principal.membership_values:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not affiliated with any organization",
@@ -176,6 +214,7 @@ class OrganizationContext:
         self.user = user
         self.membership = membership
         self.db = db
+        self._patient_access: dict[int, bool] = {}
 
     @property
     def organization_id(self) -> Optional[int]:
@@ -183,7 +222,8 @@ class OrganizationContext:
 
     @property
     def organization(self):
-        return self.membership.organization if self.membership else None
+        # membership 은 principal 캐시에서 복원된 detached 객체 → 조직은 요청 세션으로 조회
+        return self.db.get(Organization, self.membership.organization_id) if self.membership else None
 
     @property
     def role_in_org(self) -> Optional[str]:
@@ -194,6 +234,10 @@ class OrganizationContext:
         if not self.membership:
             return False
 
+        # 같은 요청 안에서 반복 확인 시 재사용
+        if patient_user_id in self._patient_access:
+            return self._patient_access[patient_user_id]
+
         # 해당 조직에 연결된 환자인지 확인
         hospital_patient = self.db.query(HospitalPatient).filter(
             HospitalPatient.organization_id == self.organization_id,
@@ -201,7 +245,8 @@ class OrganizationContext:
             HospitalPatient.status == HospitalPatientStatus.ACTIVE.value,
         ).first()
 
-        return hospital_patient is not None
+        self._patient_access[patient_user_id] = hospital_patient is not None
+        return self._patient_access[patient_user_id]
 
     def can_edit_diagnosis(self) -> bool:
         """진단 결과를 입력/수정할 수 있는지 확인"""
@@ -225,13 +270,11 @@ class OrganizationContext:
 
 async def get_org_context(
     user: User = Depends(require_auth),
+    principal: Principal = Depends(require_principal),
     db: Session = Depends(get_db)
 ) -> OrganizationContext:
     """Get organization context for current user"""
-    membership = db.query(OrganizationMember).filter(
-        OrganizationMember.user_id == user.id,
-        OrganizationMember.is_active == True
-    ).first()
+    membership = principal.primary_membership()
 
     return OrganizationContext(user=user, membership=membership, db=db)
 
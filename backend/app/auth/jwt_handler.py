@@ -8,13 +8,15 @@ from .config import auth_settings
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
+    now = datetime.now(timezone.utc)
 
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=auth_settings.jwt_expire_minutes)
+        expire = now + timedelta(minutes=auth_settings.jwt_expire_minutes)
 
-    to_encode.update({"exp": expire, "type": "access"})
+    # iat: principal 캐시 키 (user_id, iat) — 새 토큰은 항상 DB 에서 다시 조회
+    to_encode.update({"exp": expire, "iat": now, "type": "access"})
     encoded_jwt = jwt.encode(
         to_encode,
         auth_settings.jwt_secret_key,
@@ -2,10 +2,10 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 
 from ..database.connection import get_db
 from ..database.models import User, Paper, PaperAllergenLink
+from ..database.paper_fulltext import fulltext_ranking, ranked_page
 from .dependencies import require_auth, require_admin
 from .schemas import (
     PaperCreate, PaperUpdate, PaperResponse, PaperBrief,
@@ -157,29 +157,20 @@ async def list_papers(
     if verified_only:
         query = query.filter(Paper.is_verified == True)
 
-    # Search in title, title_kr, abstract
+    # Full-text search in title, title_kr, abstract, abstract_kr, authors (ranked)
+    ranking = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Paper.title.ilike(search_term),
-                Paper.title_kr.ilike(search_term),
-                Paper.abstract.ilike(search_term),
-                Paper.authors.ilike(search_term)
-            )
-        )
+        ranking = fulltext_ranking(db, search)
+        query = query.join(ranking, ranking.c.paper_id == Paper.id)
 
     # Get total count
     total = query.distinct().count()
 
     # Pagination
     offset = (page - 1) * size
-    papers = (
-        query.distinct()
-        .order_by(Paper.year.desc().nullslast(), Paper.id.desc())
-        .offset(offset)
-        .limit(size)
-        .all()
+    papers = ranked_page(
+        query, ranking, offset, size,
+        Paper.year.desc().nullslast(), Paper.id.desc(),
     )
 
     return PaperListResponse(
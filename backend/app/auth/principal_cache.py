@@ -0,0 +1,176 @@
+"""인증 주체(Principal) 캐시 — 프로세스 내 LRU + TTL
+
+인증이 필요한 요청마다 JWT 검증 후 User / OrganizationMember 를 다시 조회하던 것을
+짧은 TTL 동안 재사용합니다. 키는 (user_id, 토큰 iat) 이므로 재로그인으로 발급된
+새 토큰은 항상 DB 에서 다시 읽습니다.
+
+- 캐시에는 ORM 객체가 아닌 컬럼 값 스냅샷을 보관하고, 요청마다 세션에 속하지 않은
+  (detached) 새 객체로 복원합니다. 동시 요청이 같은 인스턴스를 공유하지 않습니다.
+- 사용자·역할·멤버십을 바꾸는 라우트(admin / organization)는 커밋 후
+  invalidate_user() 를 호출합니다. 다른 워커 프로세스에는 TTL 이 지나야 반영됩니다.
+
+환경 변수:
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: 보관 시간 (기본 30초, 0 이면 캐시 비활성화)
+    AUTH_PRINCIPAL_CACHE_SIZE: 최대 항목 수 (기본 10000)
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..database.models import User
+from ..database.organization_models import OrganizationMember
+
+DEFAULT_TTL_SECONDS = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+DEFAULT_MAX_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "10000"))
+
+
+def _snapshot(instance) -> dict:
+    """ORM 객체 → 컬럼 값 dict"""
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(type(instance)).column_attrs}
+
+
+def _restore(model, values: dict):
+    """컬럼 값 dict → detached ORM 객체 (세션에 add 하면 UPDATE 대상으로 붙음)"""
+    instance = inspect(model).class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(instance, key, value)
+    make_transient_to_detached(instance)
+    return instance
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증 주체 스냅샷 — 사용자 + 활성 조직 멤버십"""
+    user_id: int
+    is_active: bool
+    role: str
+    user_values: dict
+    membership_values: tuple[dict, ...]
+
+    @classmethod
+    def from_models(cls, user: User, memberships) -> "Principal":
+        return cls(
+            user_id=user.id,
+            is_active=bool(user.is_active),
+            role=user.role,
+            user_values=_snapshot(user),
+            membership_values=tuple(_snapshot(m) for m in memberships),
+        )
+
+    def user(self) -> User:
+        return _restore(User, self.user_values)
+
+    def memberships(self) -> list[OrganizationMember]:
+        return [_restore(OrganizationMember, values) for values in self.membership_values]
+
+    def primary_membership(self) -> Optional[OrganizationMember]:
+        if not self.membership_values:
+            return None
+        return _restore(OrganizationMember, self.membership_values[0])
+
+
+class PrincipalCache:
+    """(user_id, iat) → Principal LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[tuple, tuple[float, Principal]] = OrderedDict()
+        self._keys_by_user: dict[int, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.maxsize > 0
+
+    def get(self, user_id: int, issued_at) -> Optional[Principal]:
+        key = (user_id, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+    def put(self, principal: Principal, issued_at) -> None:
+        if not self.enabled:
+            return
+        key = (principal.user_id, issued_at)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(principal.user_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate_user(self, user_id: int) -> int:
+        """사용자의 모든 토큰 항목 제거 — 제거된 항목 수 반환"""
+        with self._lock:
+            keys = self._keys_by_user.pop(user_id, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            if keys:
+                self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _remove(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_principal_cache() -> PrincipalCache:
+    """PrincipalCache 싱글톤"""
+    return PrincipalCache()
+
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자·역할·멤버십 변경 후 호출 (커밋 이후)"""
+    get_principal_cache().invalidate_user(user_id)
@@ -16,6 +16,7 @@ from ..core.feature_flags import LEGACY_MODULES_ENABLED
 from .config import auth_settings
 from .jwt_handler import create_access_token
 from .dependencies import require_auth
+from .principal_cache import invalidate_principal
 from .schemas import (
     UserResponse, UserWithToken,
     SimpleRegisterRequest, SimpleRegisterResponse, SimpleLoginRequest,
@@ -142,6 +143,8 @@ async def google_verify(body: GoogleTokenRequest, db: Session = Depends(get_db))
     user.last_login_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(user)
+    # 역할이 바뀌었을 수 있으므로 기존 토큰의 캐시 항목도 무효화
+    invalidate_principal(user.id)
 
     # Create JWT token
     access_token = create_access_token(
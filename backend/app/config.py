@@ -59,6 +59,10 @@ class Settings:
     # timeout 처리될 위험. 운영 환경 proxy 안정도에 맞춰 튜닝.
     PAPER_SEARCH_SOURCE_TIMEOUT_S: int = 30
 
+    # 비동기 통합 검색 (search_async) 전체 deadline (초). 이 시간 안에 응답한
+    # source 결과만으로 부분 결과를 반환하고, 늦은 source 는 errors 에 기록.
+    PAPER_SEARCH_DEADLINE_S: float = 20.0
+
     # legacy AllergyNewsLetter SQLite 증분 동기화 (선택)
     # 미설정 시 job_newsletter_sync 가 graceful skip — os.path.exists("") = False
     NEWSLETTER_DB_PATH: str = ""
@@ -90,6 +94,9 @@ class Settings:
             PAPER_SEARCH_SOURCE_TIMEOUT_S=int(
                 os.getenv("PAPER_SEARCH_SOURCE_TIMEOUT_S", "30")
             ),
+            PAPER_SEARCH_DEADLINE_S=float(
+                os.getenv("PAPER_SEARCH_DEADLINE_S", "20")
+            ),
         )
 
 
@@ -4,6 +4,7 @@
 - auth: 인증 및 권한 관리
 - allergen: 알러젠 데이터베이스
 - feature_flags, pii_masking: 보조 유틸리티
+- static_response_cache: 정적 참조 데이터 응답 캐시 (api 라우트 · admin 무효화 공용)
 - sources: VerticalInsight Framework Layer 1 (Connector ABC + registry)
 - domains: DomainPack 로더 + 린터
 
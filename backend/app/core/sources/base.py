@@ -7,6 +7,7 @@ Vertical Insight Framework Layer 1 의 기반. 모든 외부 데이터 source 
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
@@ -122,6 +123,19 @@ class SourceConnector(ABC):
         """질의 실행. 구현체는 알 수 없는 kwargs 는 무시할 것."""
         ...
 
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        """search() 의 비동기 버전.
+
+        기본 구현은 동기 search() 를 워커 스레드에서 실행한다. httpx 등
+        비동기 클라이언트를 쓸 수 있는 구현체는 native 코루틴으로 override.
+        """
+        return await asyncio.to_thread(self.search, query, max_results, **kwargs)
+
     @abstractmethod
     def is_available(self) -> bool:
         """호출 가능 여부 (API 키·필수 설정 점검). False 시 registry 가 skip."""
@@ -130,6 +144,9 @@ class SourceConnector(ABC):
     def close(self) -> None:
         """리소스 정리 (httpx.Client 등). 기본 no-op."""
 
+    async def aclose(self) -> None:
+        """비동기 리소스 정리 (httpx.AsyncClient 등). 기본 no-op."""
+
     def __enter__(self) -> "SourceConnector":
         return self
 
@@ -10,9 +10,15 @@ paper 전용 search kwargs:
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import Any
 
-from app.core.sources.base import NormalizedDoc, SourceConnector, SourceKind
-from app.models.paper import Paper
+from app.core.sources.base import (
+    NormalizedDoc,
+    SourceConnector,
+    SourceKind,
+    SourceSearchResult,
+)
+from app.models.paper import Paper, PaperSearchResult
 
 
 class PaperSourceConnector(SourceConnector):
@@ -58,6 +64,29 @@ def paper_to_normalized(p: Paper) -> NormalizedDoc:
     )
 
 
+def legacy_to_search_result(
+    name: str,
+    query: str,
+    legacy: PaperSearchResult,
+    **meta: Any,
+) -> SourceSearchResult:
+    """legacy ``PaperSearchResult`` → ``SourceSearchResult`` 변환.
+
+    search() / search_async() 가 같은 결과 형태를 내도록 connector 공통으로 사용.
+    meta 에는 total_count / search_time_ms 외 connector 별 추가 정보를 넣는다.
+    """
+    return SourceSearchResult(
+        docs=[paper_to_normalized(p) for p in legacy.papers],
+        source=name,
+        query=query,
+        meta={
+            "total_count": legacy.total_count,
+            "search_time_ms": legacy.search_time_ms,
+            **meta,
+        },
+    )
+
+
 def normalized_to_paper(doc: NormalizedDoc) -> Paper:
     """``NormalizedDoc`` → 기존 ``Paper`` 역변환.
 
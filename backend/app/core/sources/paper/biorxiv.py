@@ -17,7 +17,7 @@ import logging
 from typing import Any
 
 from app.core.sources.base import SourceSearchResult
-from app.core.sources.paper.base import PaperSourceConnector, paper_to_normalized
+from app.core.sources.paper.base import PaperSourceConnector, legacy_to_search_result
 from app.core.sources.registry import register
 from app.services.biorxiv_service import BiorxivService
 
@@ -76,17 +76,38 @@ class BiorxivConnector(PaperSourceConnector):
             logger.warning("bioRxiv search 예외: query=%r err=%s", query, e)
             return SourceSearchResult.empty(self.name, query, error=str(e))
 
-        docs = [paper_to_normalized(p) for p in legacy.papers]
-        return SourceSearchResult(
-            docs=docs,
-            source=self.name,
-            query=query,
-            meta={
-                "total_count": legacy.total_count,
-                "search_time_ms": legacy.search_time_ms,
-                "mode": mode,
-            },
-        )
+        return legacy_to_search_result(self.name, query, legacy, mode=mode)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        date_from = kwargs.get("date_from")
+        date_to = kwargs.get("date_to")
+        server = kwargs.get("server", "medrxiv")
+        sort = kwargs.get("sort", "DATE")
+
+        try:
+            if date_from and date_to:
+                legacy = await self._service.collect_recent_async(
+                    date_from=date_from,
+                    date_to=date_to,
+                    server=server,
+                    max_results=max_results,
+                )
+                mode = "date_range"
+            else:
+                legacy = await self._service.search_async(
+                    query, max_results=max_results, sort=sort
+                )
+                mode = "keyword"
+        except Exception as e:
+            logger.warning("bioRxiv search 예외: query=%r err=%s", query, e)
+            return SourceSearchResult.empty(self.name, query, error=str(e))
+
+        return legacy_to_search_result(self.name, query, legacy, mode=mode)
 
     def get_pdf_url(self, source_id: str) -> str | None:
         return None
@@ -98,3 +119,6 @@ class BiorxivConnector(PaperSourceConnector):
                 client.close()
             except Exception:
                 pass
+
+    async def aclose(self) -> None:
+        await self._service.aclose()
@@ -11,7 +11,7 @@ import logging
 from typing import Any
 
 from app.core.sources.base import SourceSearchResult
-from app.core.sources.paper.base import PaperSourceConnector, paper_to_normalized
+from app.core.sources.paper.base import PaperSourceConnector, legacy_to_search_result
 from app.core.sources.registry import register
 from app.services.europe_pmc_service import EuropePMCService
 
@@ -51,16 +51,24 @@ class EuropePMCConnector(PaperSourceConnector):
             logger.warning("EPMC search 예외: query=%r err=%s", query, e)
             return SourceSearchResult.empty(self.name, query, error=str(e))
 
-        docs = [paper_to_normalized(p) for p in legacy.papers]
-        return SourceSearchResult(
-            docs=docs,
-            source=self.name,
-            query=query,
-            meta={
-                "total_count": legacy.total_count,
-                "search_time_ms": legacy.search_time_ms,
-            },
-        )
+        return legacy_to_search_result(self.name, query, legacy)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        sort = kwargs.get("sort", "RELEVANCE")
+        try:
+            legacy = await self._service.search_async(
+                query, max_results=max_results, sort=sort
+            )
+        except Exception as e:
+            logger.warning("EPMC search 예외: query=%r err=%s", query, e)
+            return SourceSearchResult.empty(self.name, query, error=str(e))
+
+        return legacy_to_search_result(self.name, query, legacy)
 
     def get_pdf_url(self, source_id: str) -> str | None:
         return None
@@ -72,3 +80,6 @@ class EuropePMCConnector(PaperSourceConnector):
                 client.close()
             except Exception:
                 pass
+
+    async def aclose(self) -> None:
+        await self._service.aclose()
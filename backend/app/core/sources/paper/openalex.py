@@ -13,7 +13,7 @@ import os
 from typing import Any
 
 from app.core.sources.base import SourceSearchResult
-from app.core.sources.paper.base import PaperSourceConnector, paper_to_normalized
+from app.core.sources.paper.base import PaperSourceConnector, legacy_to_search_result
 from app.core.sources.registry import register
 from app.services.openalex_service import OpenAlexService
 
@@ -57,18 +57,28 @@ class OpenAlexConnector(PaperSourceConnector):
             logger.warning("OpenAlex search 예외: query=%r err=%s", query, e)
             return SourceSearchResult.empty(self.name, query, error=str(e))
 
-        docs = [paper_to_normalized(p) for p in legacy.papers]
-        return SourceSearchResult(
-            docs=docs,
-            source=self.name,
-            query=query,
-            meta={
-                "total_count": legacy.total_count,
-                "search_time_ms": legacy.search_time_ms,
-                "concept_id": concept_id,
-            },
+        return legacy_to_search_result(
+            self.name, query, legacy, concept_id=concept_id,
         )
 
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        concept_id = kwargs.get("concept_id")
+        if concept_id:
+            # concept 검색은 사용 빈도가 낮아 동기 경로를 워커 스레드에서 재사용
+            return await super().search_async(query, max_results, **kwargs)
+        try:
+            legacy = await self._service.search_async(query, max_results=max_results)
+        except Exception as e:
+            logger.warning("OpenAlex search 예외: query=%r err=%s", query, e)
+            return SourceSearchResult.empty(self.name, query, error=str(e))
+
+        return legacy_to_search_result(self.name, query, legacy, concept_id=None)
+
     def get_pdf_url(self, source_id: str) -> str | None:
         return None
 
@@ -79,3 +89,6 @@ class OpenAlexConnector(PaperSourceConnector):
                 client.close()
             except Exception:
                 pass
+
+    async def aclose(self) -> None:
+        await self._service.aclose()
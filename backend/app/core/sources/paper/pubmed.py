@@ -12,7 +12,7 @@ import os
 from typing import Any
 
 from app.core.sources.base import SourceSearchResult
-from app.core.sources.paper.base import PaperSourceConnector, paper_to_normalized
+from app.core.sources.paper.base import PaperSourceConnector, legacy_to_search_result
 from app.core.sources.registry import register
 from app.services.pubmed_service import PubMedService
 
@@ -65,16 +65,30 @@ class PubMedConnector(PaperSourceConnector):
             logger.warning("PubMed search 예외: query=%r err=%s", query, e)
             return SourceSearchResult.empty(self.name, query, error=str(e))
 
-        docs = [paper_to_normalized(p) for p in legacy_result.papers]
-        return SourceSearchResult(
-            docs=docs,
-            source=self.name,
-            query=query,
-            meta={
-                "total_count": legacy_result.total_count,
-                "search_time_ms": legacy_result.search_time_ms,
-            },
-        )
+        return legacy_to_search_result(self.name, query, legacy_result)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        sort = kwargs.get("sort", "relevance")
+        min_date, max_date = self._resolve_date_range(kwargs)
+
+        try:
+            legacy_result = await self._service.search_async(
+                query=query,
+                max_results=max_results,
+                sort=sort,
+                min_date=min_date,
+                max_date=max_date,
+            )
+        except Exception as e:
+            logger.warning("PubMed search 예외: query=%r err=%s", query, e)
+            return SourceSearchResult.empty(self.name, query, error=str(e))
+
+        return legacy_to_search_result(self.name, query, legacy_result)
 
     def get_pdf_url(self, source_id: str) -> str | None:
         # PubMed 자체는 PDF URL 제공 안 함
@@ -88,6 +102,9 @@ class PubMedConnector(PaperSourceConnector):
             except Exception:
                 pass
 
+    async def aclose(self) -> None:
+        await self._service.aclose()
+
     # ───────── internals ─────────
 
     @staticmethod
@@ -3,22 +3,81 @@
 기존 ``app.services.semantic_scholar_service.SemanticScholarService`` 위임.
 PDF URL cross-lookup 을 지원 (``get_pdf_url``) — Step 1.D PDF 보강에서 활용.
 
+PDF 보강은 ``get_pdf_urls`` 로 PMID/DOI 혼합 id 를 paper/batch 1회 요청으로
+조회하며, "PDF 없음" 으로 확인된 id 는 negative cache 에 보관해 재조회하지 않는다.
+
+환경 변수:
+    S2_PDF_NEGATIVE_TTL_S: negative cache 유지 시간 (기본 7일)
+    S2_PDF_NEGATIVE_MAX_ENTRIES: negative cache 최대 항목 수 (기본 50000)
+
 WBS: P1-C-004
 """
 from __future__ import annotations
 
 import logging
 import os
-from typing import Any
+import threading
+import time
+from typing import Any, Callable, Optional
 
 from app.core.sources.base import SourceSearchResult
-from app.core.sources.paper.base import PaperSourceConnector, paper_to_normalized
+from app.core.sources.paper.base import PaperSourceConnector, legacy_to_search_result
 from app.core.sources.registry import register
 from app.services.semantic_scholar_service import SemanticScholarService
 
 logger = logging.getLogger(__name__)
 
 
+class PdfNegativeCache:
+    """PDF 미보유로 확인된 lookup id ("PMID:..." / "DOI:...") 의 TTL 캐시.
+
+    connector 인스턴스마다 새로 생성되는 registry 특성상 모듈 단위로 공유한다.
+    최대 항목 수 초과 시 가장 오래 저장된 항목부터 제거.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._clock = clock
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, lookup_id: str) -> bool:
+        with self._lock:
+            expires = self._expires.get(lookup_id)
+            if expires is None:
+                return False
+            if expires <= self._clock():
+                del self._expires[lookup_id]
+                return False
+            return True
+
+    def add(self, lookup_id: str) -> None:
+        with self._lock:
+            self._expires.pop(lookup_id, None)
+            self._expires[lookup_id] = self._clock() + self.ttl_s
+            while len(self._expires) > self.max_entries:
+                del self._expires[next(iter(self._expires))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+_NO_PDF_CACHE = PdfNegativeCache(
+    ttl_s=float(os.getenv("S2_PDF_NEGATIVE_TTL_S", str(7 * 24 * 3600))),
+    max_entries=int(os.getenv("S2_PDF_NEGATIVE_MAX_ENTRIES", "50000")),
+)
+
+
 @register("semantic_scholar")
 class SemanticScholarConnector(PaperSourceConnector):
     """Semantic Scholar connector.
@@ -59,16 +118,27 @@ class SemanticScholarConnector(PaperSourceConnector):
             logger.warning("S2 search 예외: query=%r err=%s", query, e)
             return SourceSearchResult.empty(self.name, query, error=str(e))
 
-        docs = [paper_to_normalized(p) for p in legacy.papers]
-        return SourceSearchResult(
-            docs=docs,
-            source=self.name,
-            query=query,
-            meta={
-                "total_count": legacy.total_count,
-                "search_time_ms": legacy.search_time_ms,
-            },
-        )
+        return legacy_to_search_result(self.name, query, legacy)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        **kwargs: Any,
+    ) -> SourceSearchResult:
+        try:
+            legacy = await self._service.search_async(
+                query,
+                max_results=max_results,
+                year_range=kwargs.get("year_range"),
+                open_access_only=kwargs.get("open_access_only", False),
+                fields_of_study=kwargs.get("fields_of_study"),
+            )
+        except Exception as e:
+            logger.warning("S2 search 예외: query=%r err=%s", query, e)
+            return SourceSearchResult.empty(self.name, query, error=str(e))
+
+        return legacy_to_search_result(self.name, query, legacy)
 
     def get_pdf_url(self, source_id: str) -> str | None:
         """source_id = S2 paperId 로 PDF URL 조회.
@@ -99,6 +169,64 @@ class SemanticScholarConnector(PaperSourceConnector):
             return None
         return paper.pdf_url if paper else None
 
+    def get_pdf_urls(self, lookup_ids: list[str]) -> dict[str, Optional[str]]:
+        """PMID/DOI 혼합 id 일괄 PDF 조회 — PaperSearchService PDF 보강에서 사용.
+
+        Args:
+            lookup_ids: "PMID:123" / "DOI:10.x/y" 형식 id 목록
+
+        Returns:
+            {lookup_id: pdf_url 또는 None}. None 은 PDF 없음이 확인된 id
+            (negative cache 포함). 요청 실패로 확인하지 못한 id 는 결과에서 제외.
+        """
+        result, pending = self._split_cached(lookup_ids)
+        if not pending:
+            return result
+        try:
+            urls = self._service.get_pdf_urls_batch(pending)
+        except Exception as e:
+            logger.warning("S2 paper/batch 실패: ids=%d err=%s", len(pending), e)
+            return result
+        return self._remember(pending, urls, result)
+
+    async def get_pdf_urls_async(self, lookup_ids: list[str]) -> dict[str, Optional[str]]:
+        """get_pdf_urls() 의 비동기 버전."""
+        result, pending = self._split_cached(lookup_ids)
+        if not pending:
+            return result
+        try:
+            urls = await self._service.get_pdf_urls_batch_async(pending)
+        except Exception as e:
+            logger.warning("S2 paper/batch 실패: ids=%d err=%s", len(pending), e)
+            return result
+        return self._remember(pending, urls, result)
+
+    @staticmethod
+    def _split_cached(
+        lookup_ids: list[str],
+    ) -> tuple[dict[str, Optional[str]], list[str]]:
+        """(negative cache 적중 결과, 조회 필요 id — 중복 제거·순서 유지)"""
+        result: dict[str, Optional[str]] = {}
+        pending: list[str] = []
+        for lookup_id in dict.fromkeys(lookup_ids):
+            if lookup_id in _NO_PDF_CACHE:
+                result[lookup_id] = None
+            else:
+                pending.append(lookup_id)
+        return result, pending
+
+    @staticmethod
+    def _remember(
+        pending: list[str],
+        urls: list[Optional[str]],
+        result: dict[str, Optional[str]],
+    ) -> dict[str, Optional[str]]:
+        for lookup_id, url in zip(pending, urls):
+            result[lookup_id] = url
+            if url is None:
+                _NO_PDF_CACHE.add(lookup_id)
+        return result
+
     def close(self) -> None:
         session = getattr(self._service, "session", None)
         if session is not None:
@@ -106,3 +234,6 @@ class SemanticScholarConnector(PaperSourceConnector):
                 session.close()
             except Exception:
                 pass
+
+    async def aclose(self) -> None:
+        await self._service.aclose()
@@ -0,0 +1,211 @@
+"""정적 참조 데이터 응답 캐시 — 미리 직렬화한 JSON + strong ETag
+
+알러젠 목록·등급 설명·약리군 카탈로그처럼 코드 상수나 마스터 테이블에서 만들어지는
+응답은 요청마다 같은 내용을 다시 조립·직렬화합니다. 이 모듈은 응답 본문을 이름별로
+한 번만 JSON bytes 로 만들어 두고, 내용 해시로 만든 strong ETag 와 Cache-Control
+헤더를 붙여 그대로 반환합니다. If-None-Match 가 일치하면 본문 없이 304 를 돌려줍니다.
+
+- 빌더는 @static_payload(name) 로 등록합니다. DB 가 필요 없는 빌더는 startup 에서
+  미리 만들어 두고(warm), DB 빌더는 첫 요청 때 라우트의 세션으로 만듭니다.
+- api 라우트와 admin 무효화 훅이 함께 쓰므로 app.core 에 둡니다 (admin → api 의존 방지).
+- DB 빌더 결과는 STATIC_RESPONSE_DB_TTL_SECONDS 가 지나면 다시 만듭니다. 같은
+  프로세스의 변경은 invalidate() (관리자 알러젠 수정, 캐시 초기화 API) 로 즉시
+  반영되고, 다른 워커 프로세스에는 TTL 이 지나야 반영됩니다.
+
+환경 변수:
+    STATIC_RESPONSE_MAX_AGE: 클라이언트 Cache-Control max-age (기본 300초)
+    STATIC_RESPONSE_DB_TTL_SECONDS: DB 빌더 결과 보관 시간 (기본 300초)
+"""
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = int(os.getenv("STATIC_RESPONSE_MAX_AGE", "300"))
+DEFAULT_DB_TTL_SECONDS = float(os.getenv("STATIC_RESPONSE_DB_TTL_SECONDS", "300"))
+
+# 이름 → (빌더, DB 세션 필요 여부)
+_BUILDERS: dict[str, tuple[Callable[..., Any], bool]] = {}
+
+
+def static_payload(name: str, *, requires_db: bool = False):
+    """정적 응답 빌더 등록 데코레이터 — 빌더는 dict 를 반환 (async 가능)
+
+    requires_db=True 면 빌더는 AsyncSession 하나를 인자로 받습니다.
+    """
+    def decorator(fn):
+        _BUILDERS[name] = (fn, requires_db)
+        return fn
+    return decorator
+
+
+def render_json(payload: Any) -> bytes:
+    """JSONResponse 와 같은 규칙으로 직렬화"""
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """미리 직렬화된 응답 본문"""
+    body: bytes
+    etag: str
+    expires_at: Optional[float] = None  # None 이면 invalidate() 전까지 유지
+
+    @classmethod
+    def from_payload(cls, payload: Any, expires_at: Optional[float] = None) -> "CachedResponse":
+        body = render_json(payload)
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', expires_at=expires_at)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110 약한 비교 — W/ 접두어 무시, * 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class StaticResponseCache:
+    """이름 → CachedResponse 캐시
+
+    Args:
+        max_age: Cache-Control max-age (초)
+        db_ttl_seconds: DB 빌더 결과 보관 시간 (0 이면 매 요청 다시 생성)
+        clock: 만료 판정용 시계 (테스트 주입)
+    """
+
+    def __init__(
+        self,
+        max_age: int = DEFAULT_MAX_AGE,
+        db_ttl_seconds: float = DEFAULT_DB_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_age = max_age
+        self.db_ttl_seconds = db_ttl_seconds
+        self.clock = clock
+        self._entries: dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._builds = 0
+        self._not_modified = 0
+        self._invalidations = 0
+
+    @property
+    def cache_control(self) -> str:
+        return f"public, max-age={self.max_age}"
+
+    # ───────── 조회 / 생성 ─────────
+
+    def _get(self, name: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= self.clock():
+                del self._entries[name]
+                return None
+            self._hits += 1
+            return entry
+
+    def _store(self, name: str, payload: Any, requires_db: bool) -> CachedResponse:
+        expires_at = self.clock() + self.db_ttl_seconds if requires_db else None
+        entry = CachedResponse.from_payload(payload, expires_at)
+        with self._lock:
+            self._entries[name] = entry
+            self._builds += 1
+        return entry
+
+    async def get_or_build(self, name: str, db=None) -> CachedResponse:
+        entry = self._get(name)
+        if entry is not None:
+            return entry
+        builder, requires_db = _BUILDERS[name]
+        payload = builder(db) if requires_db else builder()
+        if inspect.isawaitable(payload):
+            payload = await payload
+        return self._store(name, payload, requires_db)
+
+    def warm(self) -> list[str]:
+        """DB 가 필요 없는 동기 빌더를 미리 직렬화 (startup) — 생성한 이름 목록 반환
+
+        async 빌더는 첫 요청 때 get_or_build 로 만듭니다.
+        """
+        built = []
+        for name, (builder, requires_db) in list(_BUILDERS.items()):
+            if requires_db or inspect.iscoroutinefunction(builder) or name in self._entries:
+                continue
+            self._store(name, builder(), requires_db)
+            built.append(name)
+        return built
+
+    # ───────── 응답 ─────────
+
+    async def serve(self, request: Request, name: str, db=None) -> Response:
+        """캐시된 본문 응답 — If-None-Match 가 일치하면 304"""
+        entry = await self.get_or_build(name, db)
+        headers = {"ETag": entry.etag, "Cache-Control": self.cache_control}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            with self._lock:
+                self._not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    # ───────── 무효화 ─────────
+
+    def invalidate(self, names: Optional[Iterable[str]] = None) -> list[str]:
+        """지정한 이름(없으면 전체) 제거 — 실제로 제거된 이름 목록 반환"""
+        with self._lock:
+            targets = list(self._entries) if names is None else [n for n in names if n in self._entries]
+            for name in targets:
+                del self._entries[name]
+            self._invalidations += len(targets)
+        if targets:
+            logger.info(f"정적 응답 캐시 무효화: {', '.join(sorted(targets))}")
+        return targets
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "registered": sorted(_BUILDERS),
+                "cached": sorted(self._entries),
+                "hits": self._hits,
+                "builds": self._builds,
+                "not_modified": self._not_modified,
+                "invalidations": self._invalidations,
+                "max_age": self.max_age,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_static_response_cache() -> StaticResponseCache:
+    """StaticResponseCache 싱글톤"""
+    return StaticResponseCache()
+
+
+def invalidate_static_responses(names: Optional[Iterable[str]] = None) -> list[str]:
+    """참조 데이터 변경 후 호출 (관리자 알러젠 수정 등)"""
+    return get_static_response_cache().invalidate(names)
@@ -1,7 +1,10 @@
 # Database module
-from .connection import get_db, engine, Base
+from .connection import get_db, get_async_db, engine, Base
 from .models import User, DiagnosisKit, UserDiagnosis, Paper, PaperAllergenLink
 
+# 논문 전문 검색 색인 (papers DDL / Session flush 이벤트 등록)
+from . import paper_fulltext  # noqa: F401
+
 # Phase 1: Organization models
 from .organization_models import (
     UserRole,
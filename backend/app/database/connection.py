@@ -1,7 +1,7 @@
 """Database Connection"""
 import logging
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, make_url, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 logger = logging.getLogger(__name__)
@@ -48,6 +48,57 @@ def get_db():
         db.close()
 
 
+# 비동기 엔진 — 이벤트 루프를 막지 않아야 하는 읽기 위주 핫 경로용 (최초 사용 시 생성)
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def to_async_url(url: str) -> str:
+    """동기 DATABASE_URL → 비동기 드라이버 URL (postgresql → asyncpg, sqlite → aiosqlite)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise RuntimeError(f"비동기 드라이버를 지원하지 않는 DB 입니다: {backend}")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """비동기 엔진 (싱글톤)
+
+    동기 엔진과 별도 커넥션 풀을 사용하므로 풀 크기는 DB_ASYNC_POOL_SIZE /
+    DB_ASYNC_MAX_OVERFLOW 로 따로 조정합니다.
+    """
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_pool_kwargs = {}
+        if DATABASE_URL.startswith("postgresql"):
+            async_pool_kwargs = {
+                "pool_size": int(os.environ.get("DB_ASYNC_POOL_SIZE", "10")),
+                "max_overflow": int(os.environ.get("DB_ASYNC_MAX_OVERFLOW", "20")),
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,
+            }
+        _async_engine = create_async_engine(to_async_url(DATABASE_URL), **async_pool_kwargs)
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    """Get async database session"""
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database tables"""
     from . import models  # Import models to register them
@@ -60,6 +111,7 @@ def init_db():
     from . import allergen_models  # 알러젠 마스터 데이터
     from . import drug_models  # 약물/병태생리 — 학술 전용 알러지 Agent (allergen_master 이후 로드 필수)
     from . import strategic_intel_models  # 전략 인텔 — 기술 적합도/가설/주가 (내부용)
+    from . import startup_steps  # startup 시드/정규화 적용 버전
     from ..services.diagnosis_repository import StoredDiagnosisModel, StoredPrescriptionModel  # noqa: F401
     Base.metadata.create_all(bind=engine)
     run_migrations()
@@ -113,6 +165,8 @@ def run_migrations():
         ("published_at", "DATE"),  # Strategic Intel 모듈 — 정확한 발행일
         # B2a: abstract → 한국어 1~2문장 LLM 임상 함의 요약
         ("clinical_implication", "TEXT"),
+        # 근접 중복 검사용 제목 지문
+        ("title_fingerprint", "VARCHAR(40)"),
     ]
 
     with engine.begin() as conn:
@@ -145,9 +199,18 @@ def run_migrations():
             for idx_name, idx_def in [
                 ("idx_papers_source", "CREATE INDEX IF NOT EXISTS idx_papers_source ON papers (source)"),
                 ("idx_papers_source_id", "CREATE INDEX IF NOT EXISTS idx_papers_source_id ON papers (source_id)"),
+                ("ix_papers_title_fingerprint", "CREATE INDEX IF NOT EXISTS ix_papers_title_fingerprint ON papers (title_fingerprint)"),
+                ("idx_papers_s2_id", "CREATE INDEX IF NOT EXISTS idx_papers_s2_id ON papers (semantic_scholar_id)"),
+                ("idx_papers_doi_lower", "CREATE INDEX IF NOT EXISTS idx_papers_doi_lower ON papers (lower(doi))"),
+                ("idx_papers_title_lower", "CREATE INDEX IF NOT EXISTS idx_papers_title_lower ON papers (lower(title))"),
             ]:
                 conn.execute(text(idx_def))
 
+            # 전문 검색 색인 테이블 (기존 DB 최초 적용 시 전체 색인)
+            from .paper_fulltext import rebuild_paper_fulltext
+            if rebuild_paper_fulltext(conn, only_if_empty=True):
+                logger.info("Migration: paper_search_index 전문 검색 색인 생성")
+
         # competitor_news 테이블 마이그레이션: 관련성 컬럼 추가
         if _table_exists(conn, "competitor_news"):
             cn_new_columns = [
@@ -1,6 +1,6 @@
 """Database Models"""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Date, ForeignKey, JSON, Index, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Date, ForeignKey, JSON, Index, Text, func
 from sqlalchemy.orm import relationship
 from .connection import Base
 from ..utils.timezone import utc_now
@@ -178,6 +178,8 @@ class Paper(Base):
     citation_count = Column(Integer, nullable=True)
     keywords = Column(JSON, nullable=True)  # JSONB: ["keyword1", "keyword2"]
     last_synced_at = Column(DateTime, nullable=True)  # 마지막 동기화 시점
+    # 근접 중복 검사용 정규화 본 제목 지문 (utils.paper_fingerprint.title_fingerprint)
+    title_fingerprint = Column(String(40), nullable=True, index=True)
 
     # 정확한 발행일 (PubMed Article Date / S2 publicationDate 기반)
     # year만 있을 때보다 정밀한 trigger_date 산출에 사용 (Strategic Intel 모듈)
@@ -203,6 +205,10 @@ class Paper(Base):
         Index('idx_papers_type', 'paper_type'),
         Index('idx_papers_source', 'source'),
         Index('idx_papers_source_id', 'source_id'),
+        Index('idx_papers_s2_id', 'semantic_scholar_id'),
+        # 중복 검사 (lower(doi) / lower(title) 조회) 용 함수 인덱스
+        Index('idx_papers_doi_lower', func.lower(doi)),
+        Index('idx_papers_title_lower', func.lower(title)),
     )
 
 
@@ -273,3 +279,75 @@ class SearchHistory(Base):
         Index('idx_search_history_allergen', 'allergen_code'),
         Index('idx_search_history_created', 'created_at'),
     )
+
+
+class RagIndexState(Base):
+    """RAG 인덱스 상태 - ChromaDB에 인덱싱된 논문 워터마크
+
+    벡터 DB 메타데이터 전체 스캔 없이 미인덱싱 논문을 증분 조회하기 위한 테이블.
+    """
+    __tablename__ = "rag_index_state"
+
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True)
+
+    # 인덱싱된 텍스트(제목 + 초록/전문)의 SHA-256
+    content_hash = Column(String(64), nullable=False)
+    chunk_count = Column(Integer, nullable=False, default=0)
+
+    # 인덱싱 원문 종류: 'abstract', 'fulltext'
+    content_source = Column(String(20), nullable=False, default="abstract")
+
+    indexed_at = Column(DateTime, default=utc_now, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_rag_index_state_indexed_at', 'indexed_at'),
+        Index('idx_rag_index_state_source', 'content_source'),
+    )
+
+
+class RagAnswerCacheEntry(Base):
+    """RAG 답변 캐시 - (정규화 질문, 알러젠, 검색 청크 집합) 단위 LLM 답변 저장"""
+    __tablename__ = "rag_answer_cache"
+
+    # sha256(정규화 질문 | 알러젠 | 정렬된 청크 ID)
+    cache_key = Column(String(64), primary_key=True)
+
+    question = Column(Text, nullable=False)  # 정규화된 질문
+    allergen = Column(String(30), nullable=True)
+    chunk_ids = Column(JSON, nullable=False)  # ["paper_1_chunk_0", ...]
+
+    # 캐시된 ask() 결과
+    answer = Column(Text, nullable=False)
+    sources = Column(JSON, nullable=False)
+    confidence = Column(Float, nullable=False)
+
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    last_accessed_at = Column(DateTime, default=utc_now, nullable=False)
+
+    # Relationships
+    papers = relationship("RagAnswerCachePaper", cascade="all, delete-orphan")
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_rag_answer_cache_created', 'created_at'),
+        Index('idx_rag_answer_cache_accessed', 'last_accessed_at'),
+    )
+
+
+class RagAnswerCachePaper(Base):
+    """RAG 답변 캐시 ↔ 근거 논문 (재인덱싱 시 캐시 무효화용)"""
+    __tablename__ = "rag_answer_cache_papers"
+
+    cache_key = Column(
+        String(64),
+        ForeignKey("rag_answer_cache.cache_key", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    paper_id = Column(Integer, primary_key=True)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_rag_answer_cache_papers_paper', 'paper_id'),
+    )
@@ -7,6 +7,7 @@
 
 특성:
 - **Idempotent** — 매 startup 호출 안전, 보정 대상 0건이면 즉시 종료
+  (startup 에서는 NORMALIZE_VERSION 이 바뀐 경우에만 실행 — startup_steps)
 - **트랜잭션** — 한 번에 commit, 부분 적용 방지
 - **사용자 업로드 보존** — source_id 가 ``"core:"`` 가 아닌 manual_upload 행은
   손대지 않음 (실제 PDF 직접 업로드 데이터)
@@ -25,6 +26,9 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# startup "이미 적용됨" 검사용 — 보정 규칙을 바꾸면 올림
+NORMALIZE_VERSION = "1"
+
 # 안전을 위해 raw SQL — Paper ORM 의존 회피, 컬럼 변경 영향 최소화
 _COUNT_SQL = text(
     """
@@ -41,9 +45,13 @@ _UPDATE_SQL = text(
 )
 
 
-def normalize_core_source(db: Session) -> int:
+def normalize_core_source(db: Session, strict: bool = False) -> int:
     """CORE 행의 source enum 정규화. 변경된 행 수 반환.
 
+    Args:
+        strict: 사전 검사 실패(papers 테이블 부재 등)를 무시하지 않고 다시 던짐.
+            startup 단계에서는 True — 실패를 적용 완료로 기록하지 않기 위함.
+
     Returns:
         보정된 행 수 (0 이면 noop — 이미 정규화됐거나 CORE 데이터 없음).
     """
@@ -51,6 +59,9 @@ def normalize_core_source(db: Session) -> int:
         pending = db.execute(_COUNT_SQL).scalar() or 0
     except Exception as e:
         # papers 테이블 부재 (마이그레이션 미실행 환경) 등은 무시
+        if strict:
+            db.rollback()
+            raise
         logger.debug("normalize_core_source: 사전 검사 실패 (무시): %s", e)
         return 0
 
@@ -6,6 +6,7 @@ MAST Class 0~4로 등급 체계 마이그레이션됨에 따라, 기존 레거
 
 특성:
 - Idempotent — 5/6 값이 없으면 noop, 매 startup마다 호출해도 안전
+  (startup 에서는 NORMALIZE_VERSION 이 바뀐 경우에만 실행 — startup_steps)
 - 트랜잭션 — 한 번에 commit, 부분 적용 방지
 - 가시성 — 변경 건수 로깅, 정합화 완료 후에는 빠르게 종료
 
@@ -20,6 +21,9 @@ from .models import DiagnosisKit, UserDiagnosis
 
 logger = logging.getLogger(__name__)
 
+# startup "이미 적용됨" 검사용 — 정규화 규칙을 바꾸면 올림
+NORMALIZE_VERSION = "1"
+
 
 def _normalize_value(value: Any) -> Any:
     """grade 정수만 0~4로 클램프, 비정수는 그대로 반환."""
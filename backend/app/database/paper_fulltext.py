@@ -0,0 +1,316 @@
+"""논문 전문 검색 색인 — PostgreSQL tsvector(GIN) / SQLite FTS5
+
+제목(title, title_kr)과 본문(abstract, abstract_kr, authors)을 토큰화하여
+paper_search_index 에 유지합니다. 한글은 형태소 분석기 없이도 조사·어미가 붙은
+단어를 찾을 수 있도록 음절 bigram 으로 색인하고, 그 외 문자는 단어 단위로 색인합니다.
+토큰화는 파이썬에서 하므로 두 백엔드가 같은 규칙으로 검색됩니다.
+
+    - PostgreSQL: paper_search_index(paper_id, title_doc, body_doc, search_vector)
+      search_vector 는 'simple' 사전의 가중치 tsvector (제목 A / 본문 B) 생성 컬럼, GIN 인덱스
+    - SQLite: FTS5 가상 테이블 paper_search_index(title_doc, body_doc), rowid = papers.id
+
+색인은 Session after_flush 에서 갱신됩니다. ORM 을 거치지 않은 일괄 UPDATE 후에는
+rebuild_paper_fulltext() 로 다시 만듭니다.
+"""
+from __future__ import annotations
+
+import html
+import logging
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+from sqlalchemy import Float, Integer, event, inspect, text
+from sqlalchemy.orm import Session
+
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+INDEX_TABLE = "paper_search_index"
+
+# 색인 대상 컬럼 (이 중 하나라도 바뀌면 재색인)
+TITLE_FIELDS = ("title", "title_kr")
+BODY_FIELDS = ("abstract", "abstract_kr", "authors")
+
+# SQLite bm25 컬럼 가중치 (title_doc, body_doc)
+BM25_WEIGHTS = (10.0, 1.0)
+
+REBUILD_BATCH_SIZE = 500
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㆎ]+")
+
+
+# ───────── 토큰화 ─────────
+
+
+def _normalize(text: str) -> str:
+    """악센트 제거 + 소문자 (한글 음절은 NFC 로 다시 조합)"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return unicodedata.normalize("NFC", stripped).lower()
+
+
+def _split_word(word: str) -> list[tuple[str, bool]]:
+    """단어 → [(토큰, 한글 음절 1자 여부)] — 한글 구간은 bigram, 나머지는 그대로"""
+    pieces: list[tuple[str, bool]] = []
+    pos = 0
+    for m in _HANGUL_RE.finditer(word):
+        if m.start() > pos:
+            pieces.append((word[pos:m.start()], False))
+        run = m.group()
+        if len(run) == 1:
+            pieces.append((run, True))
+        else:
+            pieces.extend((run[i:i + 2], False) for i in range(len(run) - 1))
+        pos = m.end()
+    if pos < len(word):
+        pieces.append((word[pos:], False))
+    return pieces
+
+
+def fulltext_tokens(text: Optional[str]) -> list[str]:
+    """색인용 토큰 (한글 bigram + 단어)"""
+    return [
+        token
+        for word in _WORD_RE.findall(_normalize(text or ""))
+        for token, _ in _split_word(word)
+    ]
+
+
+def _query_terms(query: str) -> list[tuple[str, bool]]:
+    """검색어 → [(토큰, 접두 일치 여부)] (중복 제거, 순서 유지)
+
+    한글 bigram 은 정확 일치, 영문/숫자 단어와 한글 1음절은 접두 일치.
+    """
+    terms: dict[str, bool] = {}
+    for word in _WORD_RE.findall(_normalize(query)):
+        for token, single_hangul in _split_word(word):
+            prefix = single_hangul or not _HANGUL_RE.fullmatch(token)
+            terms.setdefault(token, prefix)
+    return list(terms.items())
+
+
+def _documents(paper) -> tuple[str, str]:
+    def doc(fields: Iterable[str]) -> str:
+        return " ".join(
+            token for field in fields for token in fulltext_tokens(getattr(paper, field, None))
+        )
+    return doc(TITLE_FIELDS), doc(BODY_FIELDS)
+
+
+# ───────── DDL ─────────
+
+
+def _is_sqlite(bind) -> bool:
+    return bind.dialect.name == "sqlite"
+
+
+def _create_statements(bind) -> list[str]:
+    if _is_sqlite(bind):
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} USING fts5("
+            "title_doc, body_doc, tokenize = 'unicode61 remove_diacritics 2')",
+        ]
+    return [
+        f"CREATE TABLE IF NOT EXISTS {INDEX_TABLE} ("
+        "paper_id INTEGER PRIMARY KEY REFERENCES papers(id) ON DELETE CASCADE, "
+        "title_doc TEXT NOT NULL DEFAULT '', "
+        "body_doc TEXT NOT NULL DEFAULT '', "
+        "search_vector TSVECTOR GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', title_doc), 'A') || "
+        "setweight(to_tsvector('simple', body_doc), 'B')) STORED)",
+        f"CREATE INDEX IF NOT EXISTS idx_{INDEX_TABLE}_vector "
+        f"ON {INDEX_TABLE} USING GIN (search_vector)",
+    ]
+
+
+@event.listens_for(Paper.__table__, "after_create")
+def _create_index_table(target, connection, **kw):
+    for stmt in _create_statements(connection):
+        connection.execute(text(stmt))
+
+
+@event.listens_for(Paper.__table__, "before_drop")
+def _drop_index_table(target, connection, **kw):
+    connection.execute(text(f"DROP TABLE IF EXISTS {INDEX_TABLE}"))
+
+
+# ───────── 색인 갱신 ─────────
+
+
+def _write_documents(connection, papers: list, stale_ids: list[int]) -> None:
+    """논문 문서 기록 + 기존 문서 삭제 (각각 executemany 1회)
+
+    stale_ids: 다시 쓰거나 지울 기존 문서의 paper_id (수정/삭제된 논문)
+    """
+    rows = []
+    for paper in papers:
+        title_doc, body_doc = _documents(paper)
+        rows.append({"paper_id": paper.id, "title_doc": title_doc, "body_doc": body_doc})
+
+    if _is_sqlite(connection):
+        if stale_ids:
+            connection.execute(
+                text(f"DELETE FROM {INDEX_TABLE} WHERE rowid = :paper_id"),
+                [{"paper_id": pid} for pid in stale_ids],
+            )
+        if rows:
+            connection.execute(
+                text(
+                    f"INSERT INTO {INDEX_TABLE} (rowid, title_doc, body_doc) "
+                    "VALUES (:paper_id, :title_doc, :body_doc)"
+                ),
+                rows,
+            )
+        return
+
+    # PostgreSQL: 삭제는 FK ON DELETE CASCADE 로 처리
+    if rows:
+        connection.execute(
+            text(
+                f"INSERT INTO {INDEX_TABLE} (paper_id, title_doc, body_doc) "
+                "VALUES (:paper_id, :title_doc, :body_doc) "
+                "ON CONFLICT (paper_id) DO UPDATE SET "
+                "title_doc = EXCLUDED.title_doc, body_doc = EXCLUDED.body_doc"
+            ),
+            rows,
+        )
+
+
+def _text_changed(paper) -> bool:
+    state = inspect(paper)
+    return any(
+        state.attrs[field].history.has_changes()
+        for field in TITLE_FIELDS + BODY_FIELDS
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_index(session: Session, flush_context) -> None:
+    added = [obj for obj in session.new if isinstance(obj, Paper)]
+    updated = [
+        obj for obj in session.dirty
+        if isinstance(obj, Paper) and _text_changed(obj)
+    ]
+    stale_ids = [obj.id for obj in updated]
+    stale_ids += [obj.id for obj in session.deleted if isinstance(obj, Paper)]
+    if added or stale_ids:
+        _write_documents(session.connection(), added + updated, stale_ids)
+
+
+def rebuild_paper_fulltext(connection, only_if_empty: bool = False) -> int:
+    """papers 전체로 색인 재생성 (ORM 밖에서 텍스트를 고친 뒤 / 기존 DB 최초 적용)
+
+    Returns:
+        색인한 논문 수 (only_if_empty 이고 색인이 이미 있으면 0)
+    """
+    for stmt in _create_statements(connection):
+        connection.execute(text(stmt))
+    if only_if_empty and connection.execute(text(f"SELECT 1 FROM {INDEX_TABLE} LIMIT 1")).first():
+        return 0
+
+    connection.execute(text(f"DELETE FROM {INDEX_TABLE}"))
+    columns = ("id",) + TITLE_FIELDS + BODY_FIELDS
+    result = connection.execute(text(f"SELECT {', '.join(columns)} FROM papers ORDER BY id"))
+    count = 0
+    while True:
+        batch = result.fetchmany(REBUILD_BATCH_SIZE)
+        if not batch:
+            break
+        _write_documents(connection, batch, [])
+        count += len(batch)
+    logger.info(f"논문 전문 색인 재생성: {count}건")
+    return count
+
+
+# ───────── 검색 ─────────
+
+
+def fulltext_ranking(db: Session, query: str, match_any: bool = False):
+    """검색어 → (paper_id, rank) 서브쿼리 — rank 가 클수록 관련도 높음
+
+    기본은 모든 토큰 일치(AND), match_any=True 면 하나 이상 일치(OR, 질문문 검색용).
+    검색 가능한 토큰이 없으면 결과가 없는 서브쿼리를 반환합니다.
+    """
+    terms = _query_terms(query)
+    columns = {"paper_id": Integer, "rank": Float}
+    if not terms:
+        return text("SELECT NULL AS paper_id, 0.0 AS rank WHERE 1 = 0").columns(**columns).subquery("fulltext")
+
+    if _is_sqlite(db.get_bind()):
+        expr = (" OR " if match_any else " AND ").join(
+            f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms
+        )
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        stmt = text(
+            f"SELECT rowid AS paper_id, -bm25({INDEX_TABLE}, {weights}) AS rank "
+            f"FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH :fts_query"
+        )
+    else:
+        expr = (" | " if match_any else " & ").join(
+            f"{token}:*" if prefix else token for token, prefix in terms
+        )
+        stmt = text(
+            "SELECT paper_id, ts_rank_cd(search_vector, to_tsquery('simple', :fts_query)) AS rank "
+            f"FROM {INDEX_TABLE} WHERE search_vector @@ to_tsquery('simple', :fts_query)"
+        )
+    return stmt.bindparams(fts_query=expr).columns(**columns).subquery("fulltext")
+
+
+def ranked_page(query, ranking, offset: int, limit: int, *default_order) -> list:
+    """DISTINCT 페이지 조회 — ranking 서브쿼리로 조인했으면 관련도순, 아니면 default_order
+
+    DISTINCT 와 함께 정렬하려면 rank 가 SELECT 목록에 있어야 하므로 열로 추가 후 벗겨냅니다.
+    """
+    if ranking is None:
+        return query.distinct().order_by(*default_order).offset(offset).limit(limit).all()
+    rows = (
+        query.add_columns(ranking.c.rank)
+        .distinct()
+        .order_by(ranking.c.rank.desc(), Paper.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+def highlight(
+    value: Optional[str],
+    query: str,
+    width: int = 200,
+    tags: tuple[str, str] = ("<mark>", "</mark>"),
+) -> Optional[str]:
+    """검색어 일치 구간을 강조한 발췌문 (HTML 이스케이프, 일치가 없으면 None)"""
+    if not value:
+        return None
+    terms = sorted((token for token, _ in _query_terms(query)), key=len, reverse=True)
+    if not terms:
+        return None
+
+    plain = re.sub(r"<[^>]+>", "", value)
+    folded = _normalize(plain)
+    if len(folded) != len(plain):  # 정규화로 길이가 바뀌면 소문자만 맞춤
+        folded = plain.lower()
+    pattern = re.compile("|".join(re.escape(t) for t in terms))
+    matches = list(pattern.finditer(folded))
+    if not matches:
+        return None
+
+    start = max(0, matches[0].start() - width // 4)
+    end = min(len(plain), start + width)
+    parts = ["…" if start > 0 else ""]
+    pos = start
+    for m in matches:
+        if m.start() < pos:
+            continue
+        if m.end() > end:
+            break
+        parts.append(html.escape(plain[pos:m.start()]))
+        parts.append(tags[0] + html.escape(plain[m.start():m.end()]) + tags[1])
+        pos = m.end()
+    parts.append(html.escape(plain[pos:end]))
+    parts.append("…" if end < len(plain) else "")
+    return "".join(parts)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from .connection import SessionLocal
 from .allergen_models import AllergenMaster
+from .startup_steps import fingerprint
 from ..data.allergen_master import ALLERGEN_MASTER_DB
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ CATEGORY_ORDER = {
     "fruit": 1600, "seed_nut": 1700,
 }
 
+# 없는 코드만 추가하므로 코드 목록이 바뀔 때만 다시 시딩
+SEED_VERSION = fingerprint(sorted(ALLERGEN_MASTER_DB))
+
 
 def seed_allergens():
     """알러젠 마스터 데이터를 DB에 시딩"""
@@ -10,6 +10,7 @@ import logging
 from sqlalchemy.orm import Session
 
 from .persona_newsletter_models import NewsletterPersona
+from .startup_steps import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +154,9 @@ _UPDATABLE_FIELDS = (
     "display_order",
 )
 
+# startup "이미 적용됨" 검사용 — 카탈로그를 고치면 다음 startup 에 다시 upsert
+SEED_VERSION = fingerprint(PERSONAS_V1)
+
 
 def seed_persona_newsletter(db: Session | None = None) -> int:
     """페르소나 카탈로그 시드 (idempotent upsert).
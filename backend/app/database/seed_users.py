@@ -6,6 +6,7 @@ import os
 
 from .connection import SessionLocal
 from .models import User
+from .startup_steps import fingerprint
 from .organization_models import (
     Organization, OrganizationMember, OrganizationStatus,
     HospitalPatient, HospitalPatientStatus
@@ -64,6 +65,9 @@ TEST_USERS = [
     },
 ]
 
+# startup "이미 적용됨" 검사용 — TEST_USERS 를 고치면 다음 startup 에 다시 시딩
+SEED_VERSION = fingerprint(TEST_USERS)
+
 
 def seed_users(db: Session = None):
     """Seed test users into database (development/local only)"""
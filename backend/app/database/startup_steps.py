@@ -0,0 +1,98 @@
+"""startup 시드/정규화 단계의 적용 버전 기록
+
+시더·정규화 함수는 모두 멱등이지만, 매 startup 마다 실행하면 테이블 전체 조회나
+bcrypt 해시처럼 비용이 큰 작업을 반복합니다. run_startup_step() 은 단계별로 마지막
+적용 버전을 startup_step_versions 테이블에 남기고, 버전이 같으면 PK 조회 1회로
+건너뜁니다.
+
+버전은 단계가 다루는 원본 데이터의 지문(fingerprint)이나 모듈 상수입니다. 시드
+데이터를 고치면 지문이 바뀌어 다음 startup 에서 자동으로 다시 적용됩니다.
+
+환경 변수:
+    STARTUP_FORCE_STEPS: 버전과 무관하게 모든 단계 실행 (기본 false)
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.orm import Session
+
+from .connection import Base
+from ..utils.timezone import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class StartupStepVersion(Base):
+    """startup 단계별 마지막 적용 버전"""
+    __tablename__ = "startup_step_versions"
+
+    name = Column(String(100), primary_key=True)
+    version = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+
+
+def fingerprint(*parts: Any) -> str:
+    """시드 원본 데이터 → 짧은 버전 문자열 (내용이 같으면 항상 같은 값)"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _force_all() -> bool:
+    return os.getenv("STARTUP_FORCE_STEPS", "false").lower() in ("1", "true", "yes", "on")
+
+
+def get_applied_version(db: Session, name: str) -> Optional[str]:
+    """기록된 적용 버전 (없거나 테이블이 아직 없으면 None)"""
+    try:
+        row = db.get(StartupStepVersion, name)
+    except Exception as e:
+        db.rollback()
+        logger.debug("startup 단계 버전 조회 실패 (실행으로 처리): %s", e)
+        return None
+    return row.version if row else None
+
+
+def run_startup_step(
+    name: str,
+    version: str,
+    step: Callable[[], Any],
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> bool:
+    """버전이 바뀐 경우에만 step() 실행 후 버전 기록 — 적용했으면 True
+
+    step() 이 예외를 던지거나 False 를 반환하면 (오류를 자체 처리하는 시더의 실패
+    보고) 버전을 기록하지 않으므로 다음 startup 에서 재시도합니다. 그 밖의 반환값
+    (None, 처리 건수 등)은 성공으로 봅니다.
+    """
+    if session_factory is None:
+        from .connection import SessionLocal
+        session_factory = SessionLocal
+
+    db = session_factory()
+    try:
+        if not _force_all() and get_applied_version(db, name) == version:
+            logger.debug("startup 단계 생략 (이미 적용): %s@%s", name, version)
+            return False
+
+        started = time.perf_counter()
+        applied = step()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if applied is False:
+            logger.warning("startup 단계 미적용 (다음 startup 에 재시도): %s@%s", name, version)
+            return False
+
+        try:
+            db.merge(StartupStepVersion(name=name, version=version, applied_at=utc_now()))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("startup 단계 버전 기록 실패 (다음 startup 에 재실행): %s: %s", name, e)
+        logger.info("startup 단계 적용: %s@%s (%.0fms)", name, version, elapsed_ms)
+        return True
+    finally:
+        db.close()
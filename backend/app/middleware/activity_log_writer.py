@@ -0,0 +1,195 @@
+"""행동 로그 write-behind 큐
+
+요청 경로에서는 로그 레코드(dict)를 메모리 큐에 넣기만 하고, 백그라운드 스레드가
+batch_size 건이 모이거나 flush_interval 이 지나면 한 번의 INSERT 로 기록합니다.
+
+- 큐는 크기 제한이 있어 DB 가 느려져도 메모리가 무한히 늘지 않습니다.
+  가득 차면 레코드를 버리고 dropped 카운터를 올립니다 (요청은 기다리지 않음).
+- 종료 시 close() 가 남은 레코드를 모두 기록한 뒤 스레드를 정리합니다.
+
+환경 변수:
+    ACTIVITY_LOG_BATCH_SIZE: 1회 INSERT 최대 건수 (기본 200)
+    ACTIVITY_LOG_FLUSH_MS: 최대 기록 지연 (기본 1000ms)
+    ACTIVITY_LOG_QUEUE_SIZE: 큐 최대 건수 (기본 10000)
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ..database.analytics_models import PatientActivityLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "200"))
+DEFAULT_FLUSH_MS = float(os.getenv("ACTIVITY_LOG_FLUSH_MS", "1000"))
+DEFAULT_QUEUE_SIZE = int(os.getenv("ACTIVITY_LOG_QUEUE_SIZE", "10000"))
+
+_STOP = object()
+
+
+@dataclass
+class ActivityLogStats:
+    """write-behind 큐 카운터"""
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0   # 큐가 가득 차 버린 레코드
+    failed: int = 0    # INSERT 실패로 잃은 레코드
+    batches: int = 0
+    pending: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ActivityLogWriter:
+    """PatientActivityLog 배치 기록기
+
+    Args:
+        session_factory: 세션 생성 함수 (None 이면 앱 SessionLocal)
+        batch_size: 1회 INSERT 최대 건수
+        flush_interval_ms: 첫 레코드가 들어온 뒤 기록까지 최대 대기 시간
+        max_queue: 큐 최대 건수 (초과분은 버림)
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_ms: float = DEFAULT_FLUSH_MS,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+    ):
+        if session_factory is None:
+            from ..database.connection import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stats = ActivityLogStats()
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    # ───────── 요청 경로 ─────────
+
+    def submit(self, record: dict) -> bool:
+        """레코드 등록 (블로킹 없음) — 큐가 가득 찼거나 종료 중이면 False"""
+        if self._closed:
+            with self._stats_lock:
+                self._stats.dropped += 1
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats.dropped += 1
+                dropped = self._stats.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(f"행동 로그 큐가 가득 차 레코드를 버렸습니다 (누적 {dropped}건)")
+            return False
+        with self._stats_lock:
+            self._stats.enqueued += 1
+        return True
+
+    def stats(self) -> ActivityLogStats:
+        with self._stats_lock:
+            snapshot = ActivityLogStats(**self._stats.to_dict())
+        snapshot.pending = self._queue.qsize()
+        return snapshot
+
+    # ───────── 백그라운드 기록 ─────────
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-log-writer", daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: list[dict]) -> None:
+        db = self.session_factory()
+        try:
+            db.execute(insert(PatientActivityLog), batch)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._stats_lock:
+                self._stats.failed += len(batch)
+            logger.warning(f"행동 로그 {len(batch)}건 저장 실패: {e}")
+            return
+        finally:
+            db.close()
+        with self._stats_lock:
+            self._stats.written += len(batch)
+            self._stats.batches += 1
+
+    # ───────── 종료 ─────────
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """지금까지 등록된 레코드를 모두 기록하고 기록기를 다시 대기 상태로"""
+        self._stop_thread(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 기록하고 종료 (이후 submit 은 버려짐)"""
+        self._closed = True
+        self._stop_thread(timeout)
+        stats = self.stats()
+        if stats.enqueued:
+            logger.info(
+                f"행동 로그 기록기 종료: 기록 {stats.written}건, 버림 {stats.dropped}건, "
+                f"실패 {stats.failed}건"
+            )
+
+    def _stop_thread(self, timeout: float) -> None:
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            # 큐가 가득 차 있어도 종료 신호는 반드시 전달
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("행동 로그 기록기가 제한 시간 내에 종료되지 않았습니다")
+
+
+@lru_cache(maxsize=1)
+def get_activity_log_writer() -> ActivityLogWriter:
+    """ActivityLogWriter 싱글톤 (종료 후에는 cache_clear() 로 새로 생성)"""
+    return ActivityLogWriter()
@@ -3,6 +3,7 @@
 Module C: 환자 인식 추적
 - API 호출을 자동으로 행동 로그로 기록
 - 비식별화: IP는 해시 처리
+- 기록은 write-behind 큐(activity_log_writer)로 넘겨 요청 경로에서 커밋하지 않음
 """
 import hashlib
 import logging
@@ -16,8 +17,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from ..database.connection import SessionLocal
-from ..database.analytics_models import PatientActivityLog
+from .activity_log_writer import get_activity_log_writer
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +60,41 @@ TRACKED_ROUTES = [
 ]
 
 
+def _compile_dispatch_table(routes) -> dict[str, tuple[re.Pattern, list[tuple[str, Optional[str]]]]]:
+    """TRACKED_ROUTES → 메서드별 단일 정규식 (이름 그룹 r{i} 로 어떤 패턴이 맞았는지 구분)
+
+    대체 패턴(|)은 왼쪽부터 시도하므로 목록 순서상 먼저 나온 패턴이 우선합니다.
+    """
+    grouped: dict[str, list[tuple[str, str, Optional[str]]]] = {}
+    for pattern, method, action_type, resource_type in routes:
+        grouped.setdefault(method, []).append((pattern, action_type, resource_type))
+
+    table = {}
+    for method, entries in grouped.items():
+        regex = re.compile("|".join(
+            f"(?P<r{i}>{pattern})" for i, (pattern, _, _) in enumerate(entries)
+        ))
+        table[method] = (regex, [(action, resource) for _, action, resource in entries])
+    return table
+
+
+_DISPATCH = _compile_dispatch_table(TRACKED_ROUTES)
+
+_RESOURCE_ID_RE = re.compile(r'/(\d+|[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12})(?:/\w+)?$')
+
+
+def match_tracked_route(method: str, path: str) -> Optional[tuple[str, Optional[str]]]:
+    """추적 대상이면 (action_type, resource_type), 아니면 None"""
+    entry = _DISPATCH.get(method)
+    if entry is None:
+        return None
+    regex, targets = entry
+    match = regex.match(path)
+    if match is None:
+        return None
+    return targets[int(match.lastgroup[1:])]
+
+
 def _hash_ip(ip: str) -> str:
     """IP 주소를 SHA-256 해시로 비식별화"""
     return hashlib.sha256(ip.encode()).hexdigest()[:16]
@@ -68,7 +103,7 @@ def _hash_ip(ip: str) -> str:
 def _extract_resource_id(path: str) -> Optional[str]:
     """URL 경로에서 리소스 ID 추출"""
     # /api/.../123 또는 /api/.../uuid-format
-    match = re.search(r'/(\d+|[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12})(?:/\w+)?$', path)
+    match = _RESOURCE_ID_RE.search(path)
     if match:
         return match.group(1)
     return None
@@ -85,21 +120,17 @@ class ActivityLoggerMiddleware(BaseHTTPMiddleware):
             return response
 
         # 추적 대상 확인
-        path = request.url.path
-        method = request.method
-
-        for pattern, target_method, action_type, resource_type in TRACKED_ROUTES:
-            if method == target_method and re.match(pattern, path):
-                try:
-                    self._log_activity(request, action_type, resource_type)
-                except Exception as e:
-                    logger.warning(f"Activity logging failed: {e}")
-                break
+        route = match_tracked_route(request.method, request.url.path)
+        if route is not None:
+            try:
+                self._log_activity(request, *route)
+            except Exception as e:
+                logger.warning(f"Activity logging failed: {e}")
 
         return response
 
     def _log_activity(self, request: Request, action_type: str, resource_type: Optional[str]):
-        """행동 로그를 DB에 기록"""
+        """행동 로그 레코드를 write-behind 큐에 등록"""
         # 사용자 ID 추출 (JWT에서)
         user_id = None
         if hasattr(request.state, "user_id"):
@@ -117,22 +148,13 @@ class ActivityLoggerMiddleware(BaseHTTPMiddleware):
         # 리소스 ID
         resource_id = _extract_resource_id(request.url.path)
 
-        # DB 저장
-        db = SessionLocal()
-        try:
-            log = PatientActivityLog(
-                user_id=user_id,
-                action_type=action_type,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                ip_hash=ip_hash,
-                user_agent=user_agent,
-                created_at=utc_now(),
-            )
-            db.add(log)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            logger.warning(f"Failed to save activity log: {e}")
-        finally:
-            db.close()
+        # 큐에 등록 (기록은 백그라운드에서 배치 INSERT)
+        get_activity_log_writer().submit({
+            "user_id": user_id,
+            "action_type": action_type,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "ip_hash": ip_hash,
+            "user_agent": user_agent,
+            "created_at": utc_now(),
+        })
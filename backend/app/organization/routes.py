@@ -24,6 +24,7 @@ from ..auth.dependencies import (
     require_org_context,
     OrganizationContext,
 )
+from ..auth.principal_cache import invalidate_principal
 from .schemas import (
     OrganizationCreate,
     OrganizationUpdate,
@@ -338,6 +339,7 @@ async def add_organization_member(
             existing.left_at = None
             db.commit()
             db.refresh(existing)
+            invalidate_principal(existing.user_id)
             return _member_to_response(existing)
 
     # 새 멤버 추가
@@ -357,6 +359,7 @@ async def add_organization_member(
 
     db.commit()
     db.refresh(member)
+    invalidate_principal(member.user_id)
 
     return _member_to_response(member)
 
@@ -398,6 +401,7 @@ async def update_organization_member(
 
     db.commit()
     db.refresh(member)
+    invalidate_principal(member.user_id)
 
     return _member_to_response(member)
 
@@ -431,6 +435,7 @@ async def remove_organization_member(
     member.is_active = False
     member.left_at = datetime.now(timezone.utc)
     db.commit()
+    invalidate_principal(member.user_id)
 
 
 # ===== Hospital Admin Registration =====
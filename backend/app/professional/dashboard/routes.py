@@ -5,11 +5,12 @@
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
 from pydantic import BaseModel
 
-from ...database import get_db
+from ...database import get_async_db, get_db
 from ...database.models import User, UserDiagnosis
 from ...database.organization_models import (
     Organization, OrganizationMember, HospitalPatient,
@@ -59,9 +60,16 @@ class AllergenStats(BaseModel):
 # Endpoints
 # ============================================================================
 
+async def _count(db: AsyncSession, model, *criteria) -> int:
+    """조건에 맞는 행 수 (COUNT 쿼리 1회)"""
+    return await db.scalar(
+        select(func.count()).select_from(model).where(*criteria)
+    )
+
+
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     org_ctx: OrganizationContext = Depends(get_organization_context)
 ):
     """병원 대시보드 통계"""
@@ -74,53 +82,56 @@ async def get_dashboard_stats(
     org_filter = [HospitalPatient.organization_id == org_id] if org_id else []
 
     # 환자 통계
-    total_patients = db.query(HospitalPatient).filter(
-        *org_filter
-    ).count()
+    total_patients = await _count(db, HospitalPatient, *org_filter)
 
-    active_patients = db.query(HospitalPatient).filter(
+    active_patients = await _count(
+        db, HospitalPatient,
         *org_filter,
         HospitalPatient.status == HospitalPatientStatus.ACTIVE
-    ).count()
+    )
 
-    pending_consent = db.query(HospitalPatient).filter(
+    pending_consent = await _count(
+        db, HospitalPatient,
         *org_filter,
         HospitalPatient.status == HospitalPatientStatus.PENDING_CONSENT
-    ).count()
+    )
 
     # 병원 환자들의 user_id 서브쿼리
-    patient_user_ids = db.query(HospitalPatient.patient_user_id).filter(
-        *org_filter
-    ).subquery()
+    patient_user_ids = select(HospitalPatient.patient_user_id).where(*org_filter)
 
     # 진단 통계
-    today_diagnoses = db.query(UserDiagnosis).filter(
+    today_diagnoses = await _count(
+        db, UserDiagnosis,
         UserDiagnosis.user_id.in_(patient_user_ids),
         func.date(UserDiagnosis.created_at) == today
-    ).count()
+    )
 
-    this_week_diagnoses = db.query(UserDiagnosis).filter(
+    this_week_diagnoses = await _count(
+        db, UserDiagnosis,
         UserDiagnosis.user_id.in_(patient_user_ids),
         UserDiagnosis.created_at >= datetime.combine(week_start, datetime.min.time())
-    ).count()
+    )
 
-    this_month_diagnoses = db.query(UserDiagnosis).filter(
+    this_month_diagnoses = await _count(
+        db, UserDiagnosis,
         UserDiagnosis.user_id.in_(patient_user_ids),
         UserDiagnosis.created_at >= datetime.combine(month_start, datetime.min.time())
-    ).count()
+    )
 
     # 최근 등록 환자 (5명)
-    recent_patients_query = db.query(HospitalPatient).filter(
-        *org_filter
-    ).order_by(HospitalPatient.created_at.desc()).limit(5).all()
+    recent_patients_query = (await db.scalars(
+        select(HospitalPatient).where(*org_filter)
+        .order_by(HospitalPatient.created_at.desc()).limit(5)
+    )).all()
 
     # 배치 로딩: 최근 환자 + 진단의 user_id를 한 번에 조회
     recent_patient_user_ids = [hp.patient_user_id for hp in recent_patients_query]
 
     # 최근 진단 (5건)
-    recent_diagnoses_query = db.query(UserDiagnosis).filter(
-        UserDiagnosis.user_id.in_(patient_user_ids)
-    ).order_by(UserDiagnosis.created_at.desc()).limit(5).all()
+    recent_diagnoses_query = (await db.scalars(
+        select(UserDiagnosis).where(UserDiagnosis.user_id.in_(patient_user_ids))
+        .order_by(UserDiagnosis.created_at.desc()).limit(5)
+    )).all()
 
     recent_diag_user_ids = [d.user_id for d in recent_diagnoses_query]
 
@@ -128,7 +139,7 @@ async def get_dashboard_stats(
     all_user_ids = set(recent_patient_user_ids + recent_diag_user_ids)
     users_map = {}
     if all_user_ids:
-        users = db.query(User).filter(User.id.in_(all_user_ids)).all()
+        users = await db.scalars(select(User).where(User.id.in_(all_user_ids)))
         users_map = {u.id: u for u in users}
 
     recent_patients = []
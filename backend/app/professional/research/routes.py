@@ -5,11 +5,11 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from pydantic import BaseModel, Field
 
 from ...database.connection import get_db
 from ...database.models import User, Paper, PaperAllergenLink
+from ...database.paper_fulltext import fulltext_ranking, ranked_page
 from ...core.auth import require_professional, require_admin
 from ...services.paper_link_extractor import get_extractor
 
@@ -102,18 +102,9 @@ async def search_papers(
     db: Session = Depends(get_db)
 ):
     """논문 검색"""
-    query = db.query(Paper)
-
-    # 텍스트 검색
-    search_term = f"%{request.query}%"
-    query = query.filter(
-        or_(
-            Paper.title.ilike(search_term),
-            Paper.title_kr.ilike(search_term),
-            Paper.abstract.ilike(search_term),
-            Paper.authors.ilike(search_term)
-        )
-    )
+    # 텍스트 검색 (전문 검색 색인: 제목/초록 한·영 + 저자, 관련도순)
+    ranking = fulltext_ranking(db, request.query)
+    query = db.query(Paper).join(ranking, ranking.c.paper_id == Paper.id)
 
     # 알러젠 필터
     if request.allergen_code:
@@ -143,9 +134,7 @@ async def search_papers(
 
     total = query.distinct().count()
     offset = (request.page - 1) * request.size
-    papers = query.distinct().order_by(
-        Paper.year.desc(), Paper.id.desc()
-    ).offset(offset).limit(request.size).all()
+    papers = ranked_page(query, ranking, offset, request.size)
 
     return PaperSearchResponse(
         items=papers,
@@ -190,21 +179,14 @@ async def list_papers(
     if verified_only:
         query = query.filter(Paper.is_verified == True)
 
+    ranking = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Paper.title.ilike(search_term),
-                Paper.title_kr.ilike(search_term),
-                Paper.abstract.ilike(search_term)
-            )
-        )
+        ranking = fulltext_ranking(db, search)
+        query = query.join(ranking, ranking.c.paper_id == Paper.id)
 
     total = query.distinct().count()
     offset = (page - 1) * size
-    papers = query.distinct().order_by(
-        Paper.year.desc(), Paper.id.desc()
-    ).offset(offset).limit(size).all()
+    papers = ranked_page(query, ranking, offset, size, Paper.year.desc(), Paper.id.desc())
 
     return PaperSearchResponse(
         items=papers,
@@ -431,14 +413,9 @@ async def ask_question(
     현재는 관련 논문 검색 기반의 단순 응답을 제공합니다.
     향후 LLM 기반 Q&A 시스템으로 확장 예정입니다.
     """
-    # 간단한 키워드 기반 논문 검색
-    search_term = f"%{request.question}%"
-    query = db.query(Paper).filter(
-        or_(
-            Paper.title.ilike(search_term),
-            Paper.title_kr.ilike(search_term),
-            Paper.abstract.ilike(search_term)
-        ),
+    # 질문 단어 중 하나라도 포함한 논문을 관련도순으로 검색
+    ranking = fulltext_ranking(db, request.question, match_any=True)
+    query = db.query(Paper).join(ranking, ranking.c.paper_id == Paper.id).filter(
         Paper.is_verified == True
     )
 
@@ -448,7 +425,7 @@ async def ask_question(
             PaperAllergenLink.allergen_code.in_(request.context_allergens)
         )
 
-    papers = query.order_by(Paper.year.desc()).limit(5).all()
+    papers = ranked_page(query, ranking, 0, 5)
 
     # 간단한 응답 생성
     if papers:
@@ -1,41 +1,47 @@
 # Services Module
-from .pubmed_service import PubMedService
-from .semantic_scholar_service import SemanticScholarService
-from .paper_search_service import PaperSearchService
-from .pdf_service import PDFService
-from .batch_processor import BatchProcessor, AllergenItem, BatchJob, create_allergen_items
-from .progressive_loader import ProgressiveLoader, SmartLoader, LoadingStrategy
-from .knowledge_extractor import KnowledgeExtractor
-from .qa_engine import QAEngine
-from .symptom_qa_interface import SymptomQAInterface
-from .prescription_engine import PrescriptionEngine
-from .diagnosis_repository import DiagnosisRepository, StoredDiagnosis, StoredPrescription
-from .naver_news_service import NaverNewsService
-from .google_news_service import GoogleNewsService
-from .competitor_news_service import CompetitorNewsService
+#
+# 이름을 처음 참조할 때 해당 서브모듈을 import 합니다 (PEP 562).
+# `from app.services import PaperSearchService` 는 그대로 동작하지만, 패키지 import
+# 만으로 PDF/HTTP 스택 등 무거운 의존성이 모두 로드되지는 않습니다.
+import importlib
 
-__all__ = [
-    "PubMedService",
-    "SemanticScholarService",
-    "PaperSearchService",
-    "PDFService",
-    "BatchProcessor",
-    "AllergenItem",
-    "BatchJob",
-    "create_allergen_items",
-    "ProgressiveLoader",
-    "SmartLoader",
-    "LoadingStrategy",
-    "KnowledgeExtractor",
-    "QAEngine",
-    "SymptomQAInterface",
+_EXPORTS = {
+    "PubMedService": ".pubmed_service",
+    "SemanticScholarService": ".semantic_scholar_service",
+    "PaperSearchService": ".paper_search_service",
+    "PDFService": ".pdf_service",
+    "BatchProcessor": ".batch_processor",
+    "AllergenItem": ".batch_processor",
+    "BatchJob": ".batch_processor",
+    "create_allergen_items": ".batch_processor",
+    "ProgressiveLoader": ".progressive_loader",
+    "SmartLoader": ".progressive_loader",
+    "LoadingStrategy": ".progressive_loader",
+    "KnowledgeExtractor": ".knowledge_extractor",
+    "QAEngine": ".qa_engine",
+    "SymptomQAInterface": ".symptom_qa_interface",
     # Prescription services
-    "PrescriptionEngine",
-    "DiagnosisRepository",
-    "StoredDiagnosis",
-    "StoredPrescription",
+    "PrescriptionEngine": ".prescription_engine",
+    "DiagnosisRepository": ".diagnosis_repository",
+    "StoredDiagnosis": ".diagnosis_repository",
+    "StoredPrescription": ".diagnosis_repository",
     # Competitor news services
-    "NaverNewsService",
-    "GoogleNewsService",
-    "CompetitorNewsService",
-]
+    "NaverNewsService": ".naver_news_service",
+    "GoogleNewsService": ".google_news_service",
+    "CompetitorNewsService": ".competitor_news_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,99 @@
+"""외부 학술 API 용 비동기 HTTP 클라이언트
+
+논문 검색 서비스들이 공유하는 ``httpx.AsyncClient`` 래퍼입니다.
+
+- 클라이언트는 첫 호출 시 생성되어 keep-alive 연결을 재사용합니다.
+- AsyncClient 의 연결 풀은 생성된 이벤트 루프에 묶이므로 루프마다 클라이언트를
+  따로 둡니다 (테스트·스케줄러의 asyncio.run 등). 각 클라이언트는 해당 루프가
+  종료될 때 (asyncio.run 의 shutdown_asyncgens) 그 루프 안에서 닫힙니다.
+- 429/5xx 응답은 동기 경로의 urllib3 Retry 와 같은 지수 백오프로 재시도합니다.
+"""
+import asyncio
+import logging
+import weakref
+from typing import AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncHttpClient:
+    """이벤트 루프별 지연 생성 httpx.AsyncClient + 재시도"""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        headers: Optional[dict] = None,
+        retries: int = 0,
+        backoff_factor: float = 1.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # 테스트에서 httpx.MockTransport 주입용
+        self.transport = transport
+        # 루프 → (클라이언트, 종료 훅). 루프가 GC 되면 항목도 사라짐
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+        client = httpx.AsyncClient(
+            timeout=self.timeout, headers=self.headers, transport=self.transport,
+        )
+        closer = self._close_on_loop_shutdown(loop, client)
+        self._clients[loop] = (client, closer)
+        # 첫 yield 까지 진행하면 루프의 async generator 목록에 등록됨
+        await closer.__anext__()
+        return client
+
+    async def _close_on_loop_shutdown(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient,
+    ) -> AsyncIterator[None]:
+        """루프 종료 시 loop.shutdown_asyncgens() 가 finally 를 실행해 클라이언트를 닫음"""
+        try:
+            yield
+        finally:
+            await client.aclose()
+            # 종료 훅이 루프를 참조하므로 항목을 지워야 루프가 GC 됨
+            entry = self._clients.get(loop)
+            if entry is not None and entry[0] is client:
+                del self._clients[loop]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """요청 실행 (RETRY_STATUSES 는 backoff_factor * 2^n 초 대기 후 재시도)"""
+        client = await self._get_client()
+        attempt = 0
+        while True:
+            resp = await client.request(method, url, **kwargs)
+            if resp.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                return resp
+            delay = self.backoff_factor * (2 ** attempt)
+            logger.debug("%s %s → %d, %.1f초 후 재시도", method, url, resp.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """현재 루프의 클라이언트 종료 (다른 루프의 클라이언트는 그 루프 종료 시 닫힘)"""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is None:
+            return
+        try:
+            await entry[1].aclose()
+        except Exception:
+            pass
@@ -0,0 +1,361 @@
+"""배치 작업 저장소 — BatchJob / SearchTask 상태 영속화
+
+백그라운드 배치 작업(병원 업로드 MAST 패널 등)의 작업·태스크 상태와 검색 결과를
+테이블에 기록하여, 서버가 재시작되어도 작업 조회와 미완료 태스크 재개가 가능합니다.
+
+소유권:
+    작업 행의 owner 는 처리 중인 프로세스 토큰, heartbeat_at 은 마지막 활동 시각입니다.
+    처리 프로세스는 주기적으로 heartbeat() 를 호출하고, lease 가 지난 미완료 작업은
+    다른 프로세스(또는 재시작된 프로세스)가 claim_orphaned_jobs() 로 조건부 UPDATE 하여
+    하나의 프로세스만 이어받습니다.
+
+환경 변수:
+    BATCH_JOB_STORE_BACKEND: "sqlite" (기본, 호스트 내 공유) 또는 "database" (앱 DB 테이블)
+    BATCH_JOB_STORE_PATH: sqlite 파일 경로 (기본 backend/data/batch_jobs.sqlite3, ":memory:" 가능)
+    BATCH_JOB_STORE_ENABLED: false 면 영속화 없이 메모리에서만 처리
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    delete,
+    select,
+    update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from .batch_processor import AllergenItem, BatchJob, ProcessingStatus, SearchTask
+from .paper_search_service import UnifiedSearchResult
+from .search_result_cache import _create_sqlite_engine
+
+logger = logging.getLogger(__name__)
+
+_BACKEND = os.getenv("BATCH_JOB_STORE_BACKEND", "sqlite").lower()
+_STORE_PATH = os.getenv(
+    "BATCH_JOB_STORE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "batch_jobs.sqlite3"),
+)
+_ENABLED = os.getenv("BATCH_JOB_STORE_ENABLED", "true").lower() == "true"
+
+# heartbeat 가 이 시간 이상 끊긴 미완료 작업은 다른 프로세스가 이어받음
+JOB_LEASE_SECONDS = 120.0
+
+_metadata = MetaData()
+
+batch_jobs_table = Table(
+    "batch_jobs",
+    _metadata,
+    Column("job_id", String(64), primary_key=True),
+    Column("include_cross_reactivity", Boolean, nullable=False, default=True),
+    Column("max_results", Integer, nullable=False),
+    Column("owner", String(100), nullable=True),
+    Column("created_at", Float, nullable=False),
+    Column("started_at", Float, nullable=True),
+    Column("completed_at", Float, nullable=True, index=True),
+    Column("heartbeat_at", Float, nullable=False),
+)
+
+batch_job_tasks_table = Table(
+    "batch_job_tasks",
+    _metadata,
+    Column("job_id", String(64), primary_key=True),
+    Column("task_id", String(100), primary_key=True),
+    Column("position", Integer, nullable=False),
+    Column("allergen", String(200), nullable=False),
+    Column("allergen_kr", String(200), nullable=False, default=""),
+    Column("grade", Integer, nullable=False, default=0),
+    Column("priority", Integer, nullable=False, default=0),
+    Column("category", String(50), nullable=False, default=""),
+    Column("status", String(20), nullable=False),
+    Column("result", Text, nullable=True),
+    Column("error", Text, nullable=True),
+    Column("retry_count", Integer, nullable=False, default=0),
+    Column("started_at", Float, nullable=True),
+    Column("completed_at", Float, nullable=True),
+)
+
+
+def _ts(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _dt(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+@dataclass
+class StoredJob:
+    """저장소에서 복원한 작업 + 처리 옵션"""
+    job: BatchJob
+    include_cross_reactivity: bool
+    max_results: int
+
+
+class BatchJobStore:
+    """SQLite 파일 또는 앱 DB 테이블 기반 배치 작업 저장소"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        owner: Optional[str] = None,
+        lease_seconds: float = JOB_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.engine = engine
+        self.owner = owner or f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        _metadata.create_all(engine, tables=[batch_jobs_table, batch_job_tasks_table])
+
+    @classmethod
+    def from_env(cls) -> "BatchJobStore":
+        """BATCH_JOB_STORE_BACKEND 에 따라 저장소 선택"""
+        if _BACKEND == "database":
+            from ..database.connection import engine
+            return cls(engine)
+        return cls(_create_sqlite_engine(_STORE_PATH))
+
+    # ───────── 기록 ─────────
+
+    def save_job(self, job: BatchJob, include_cross_reactivity: bool, max_results: int) -> None:
+        """새 작업과 전체 태스크 기록 (현재 프로세스 소유)"""
+        now = self._clock()
+        with self.engine.begin() as conn:
+            conn.execute(batch_jobs_table.insert().values(
+                job_id=job.job_id,
+                include_cross_reactivity=include_cross_reactivity,
+                max_results=max_results,
+                owner=self.owner,
+                created_at=_ts(job.created_at),
+                started_at=_ts(job.started_at),
+                completed_at=None,
+                heartbeat_at=now,
+            ))
+            conn.execute(batch_job_tasks_table.insert(), [
+                {
+                    "task_id": task.task_id,
+                    "job_id": job.job_id,
+                    "position": position,
+                    "allergen": task.allergen.name,
+                    "allergen_kr": task.allergen.name_kr,
+                    "grade": task.allergen.grade,
+                    "priority": task.allergen.priority,
+                    "category": task.allergen.category,
+                    "status": task.status.value,
+                    "retry_count": task.retry_count,
+                }
+                for position, task in enumerate(job.tasks)
+            ])
+
+    def save_task(self, job: BatchJob, task: SearchTask) -> None:
+        """태스크 상태/결과 기록 + 작업 heartbeat (작업이 끝났으면 완료 시각도 기록)"""
+        payload = json.dumps(task.result.to_dict(), ensure_ascii=False) if task.result else None
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    update(batch_job_tasks_table)
+                    .where(
+                        batch_job_tasks_table.c.job_id == job.job_id,
+                        batch_job_tasks_table.c.task_id == task.task_id,
+                    )
+                    .values(
+                        status=task.status.value,
+                        result=payload,
+                        error=task.error,
+                        retry_count=task.retry_count,
+                        started_at=_ts(task.started_at),
+                        completed_at=_ts(task.completed_at),
+                    )
+                )
+                conn.execute(
+                    update(batch_jobs_table)
+                    .where(batch_jobs_table.c.job_id == job.job_id)
+                    .values(
+                        started_at=_ts(job.started_at),
+                        completed_at=_ts(job.completed_at),
+                        heartbeat_at=self._clock(),
+                    )
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"배치 태스크 상태 저장 실패 ({task.task_id}): {e}")
+
+    def mark_completed(self, job: BatchJob) -> None:
+        """작업 완료 시각 기록 (태스크 없이 끝난 작업용)"""
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    update(batch_jobs_table)
+                    .where(batch_jobs_table.c.job_id == job.job_id)
+                    .values(completed_at=_ts(job.completed_at), heartbeat_at=self._clock())
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"배치 작업 완료 기록 실패 ({job.job_id}): {e}")
+
+    def heartbeat(self) -> int:
+        """현재 프로세스가 처리 중인 미완료 작업의 lease 연장"""
+        t = batch_jobs_table
+        try:
+            with self.engine.begin() as conn:
+                return conn.execute(
+                    update(t)
+                    .where(t.c.owner == self.owner, t.c.completed_at.is_(None))
+                    .values(heartbeat_at=self._clock())
+                ).rowcount or 0
+        except SQLAlchemyError as e:
+            logger.warning(f"배치 작업 heartbeat 실패: {e}")
+            return 0
+
+    # ───────── 조회 / 재개 ─────────
+
+    def _load_tasks(self, conn, job_id: str) -> list[SearchTask]:
+        t = batch_job_tasks_table
+        tasks = []
+        for row in conn.execute(select(t).where(t.c.job_id == job_id).order_by(t.c.position)):
+            result = None
+            if row.result:
+                try:
+                    result = UnifiedSearchResult.from_dict(json.loads(row.result))
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning(f"배치 태스크 결과 복원 실패 ({row.task_id}): {e}")
+            tasks.append(SearchTask(
+                task_id=row.task_id,
+                allergen=AllergenItem(
+                    name=row.allergen,
+                    name_kr=row.allergen_kr,
+                    grade=row.grade,
+                    priority=row.priority,
+                    category=row.category,
+                ),
+                status=ProcessingStatus(row.status),
+                result=result,
+                error=row.error,
+                started_at=_dt(row.started_at),
+                completed_at=_dt(row.completed_at),
+                retry_count=row.retry_count,
+            ))
+        return tasks
+
+    def _to_stored(self, conn, row) -> StoredJob:
+        job = BatchJob(
+            job_id=row.job_id,
+            tasks=self._load_tasks(conn, row.job_id),
+            created_at=_dt(row.created_at),
+            started_at=_dt(row.started_at),
+            completed_at=_dt(row.completed_at),
+        )
+        return StoredJob(job, row.include_cross_reactivity, row.max_results)
+
+    def load_job(self, job_id: str) -> Optional[StoredJob]:
+        """작업 조회 (없으면 None)"""
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(batch_jobs_table).where(batch_jobs_table.c.job_id == job_id)
+                ).first()
+                return self._to_stored(conn, row) if row is not None else None
+        except SQLAlchemyError as e:
+            logger.warning(f"배치 작업 조회 실패 ({job_id}): {e}")
+            return None
+
+    def claim_orphaned_jobs(self) -> list[StoredJob]:
+        """lease 가 지난 미완료 작업을 현재 프로세스로 이전 (조건부 UPDATE)
+
+        처리 중(in_progress)이던 태스크는 대기(pending)로 되돌립니다.
+        """
+        t = batch_jobs_table
+        now = self._clock()
+        claimed = []
+        try:
+            with self.engine.connect() as conn:
+                candidates = conn.execute(
+                    select(t.c.job_id, t.c.owner).where(
+                        t.c.completed_at.is_(None),
+                        t.c.heartbeat_at < now - self.lease_seconds,
+                        t.c.owner.is_(None) | (t.c.owner != self.owner),
+                    ).order_by(t.c.created_at)
+                ).all()
+            for job_id, previous_owner in candidates:
+                with self.engine.begin() as conn:
+                    owner_matches = (
+                        t.c.owner.is_(None) if previous_owner is None else t.c.owner == previous_owner
+                    )
+                    won = conn.execute(
+                        update(t)
+                        .where(t.c.job_id == job_id, owner_matches, t.c.completed_at.is_(None))
+                        .values(owner=self.owner, heartbeat_at=now)
+                    ).rowcount
+                    if won != 1:
+                        continue
+                    conn.execute(
+                        update(batch_job_tasks_table)
+                        .where(
+                            batch_job_tasks_table.c.job_id == job_id,
+                            batch_job_tasks_table.c.status == ProcessingStatus.IN_PROGRESS.value,
+                        )
+                        .values(status=ProcessingStatus.PENDING.value, started_at=None)
+                    )
+                    row = conn.execute(select(t).where(t.c.job_id == job_id)).one()
+                    claimed.append(self._to_stored(conn, row))
+        except SQLAlchemyError as e:
+            logger.warning(f"미완료 배치 작업 재개 실패: {e}")
+        return claimed
+
+    # ───────── 정리 ─────────
+
+    def purge_completed(self, older_than_seconds: float) -> int:
+        """완료 후 지정 시간이 지난 작업과 태스크 삭제
+
+        Returns:
+            삭제된 작업 수
+        """
+        t = batch_jobs_table
+        cutoff = self._clock() - older_than_seconds
+        try:
+            with self.engine.begin() as conn:
+                job_ids = list(conn.execute(
+                    select(t.c.job_id).where(t.c.completed_at.isnot(None), t.c.completed_at < cutoff)
+                ).scalars())
+                if not job_ids:
+                    return 0
+                conn.execute(delete(batch_job_tasks_table).where(batch_job_tasks_table.c.job_id.in_(job_ids)))
+                conn.execute(delete(t).where(t.c.job_id.in_(job_ids)))
+                return len(job_ids)
+        except SQLAlchemyError as e:
+            logger.warning(f"완료 배치 작업 정리 실패: {e}")
+            return 0
+
+
+# 싱글톤
+_job_store: Optional[BatchJobStore] = None
+_job_store_lock = threading.Lock()
+
+
+def get_batch_job_store() -> Optional[BatchJobStore]:
+    """BatchJobStore 싱글톤 (비활성화 또는 초기화 실패 시 None)"""
+    global _job_store
+    if not _ENABLED:
+        return None
+    with _job_store_lock:
+        if _job_store is None:
+            try:
+                _job_store = BatchJobStore.from_env()
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning(f"배치 작업 저장소 초기화 실패 (메모리에서만 처리): {e}")
+                return None
+        return _job_store
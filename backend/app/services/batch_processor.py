@@ -8,9 +8,10 @@
    - 양성 등급이 높은 항원부터 처리
    - 임상적 중요도에 따른 우선순위
 
-2. **배치 단위 처리**
-   - 한 번에 5-10개 항원씩 처리
-   - API Rate Limit 준수
+2. **고정 크기 워커 풀**
+   - 백그라운드 작업은 우선순위 큐(AllergenItem.priority)에 태스크 단위로 등록
+   - BATCH_MAX_WORKERS 개의 워커 스레드가 동시 업로드 전체를 나눠 처리
+   - API Rate Limit 은 워커 전체가 공유하는 호출 간격으로 준수 (캐시 히트는 제외)
 
 3. **캐싱 활용**
    - 이미 검색한 항원은 캐시에서 반환
@@ -19,8 +20,15 @@
 4. **비동기 처리**
    - 백그라운드에서 점진적 처리
    - 실시간 진행 상태 제공
+
+5. **작업 영속화**
+   - 작업/태스크 상태를 batch_job_store 테이블에 기록 → 재시작 후 미완료 태스크 재개
+   - 완료 후 BATCH_JOB_RETENTION_HOURS 가 지난 작업은 메모리/저장소에서 제거
 """
 import asyncio
+import itertools
+import logging
+import os
 import time
 import hashlib
 import json
@@ -36,6 +44,8 @@ from queue import PriorityQueue
 from ..models.paper import Paper, PaperSource
 from .paper_search_service import PaperSearchService, UnifiedSearchResult
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessingStatus(str, Enum):
     """처리 상태"""
@@ -71,6 +81,18 @@ class SearchTask:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     retry_count: int = 0
+    # 상태 변경 알림 (소속 BatchJob 의 카운터 갱신용)
+    _on_status_change: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name != "status":
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get("status")
+        object.__setattr__(self, name, value)
+        listener = self.__dict__.get("_on_status_change")
+        if listener is not None and old != value:
+            listener(self, old, value)
 
     @property
     def duration_ms(self) -> float:
@@ -82,12 +104,43 @@ class SearchTask:
 
 @dataclass
 class BatchJob:
-    """배치 작업"""
+    """배치 작업
+
+    상태별 태스크 수는 태스크 상태가 바뀔 때마다 갱신되므로
+    진행률/상태 요약 조회는 태스크 수와 무관하게 O(1) 입니다.
+    """
     job_id: str
     tasks: list[SearchTask]
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # 가장 최근에 처리를 시작한 (처리 중인) 항원
+    current_allergen: Optional[str] = field(default=None, init=False)
+    _status_counts: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _counts_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self):
+        self._status_counts = {status: 0 for status in ProcessingStatus}
+        for task in self.tasks:
+            self._status_counts[task.status] += 1
+            task._on_status_change = self._on_task_status_change
+            if task.status == ProcessingStatus.IN_PROGRESS:
+                self.current_allergen = task.allergen.name
+
+    def _on_task_status_change(self, task: SearchTask, old: ProcessingStatus, new: ProcessingStatus):
+        with self._counts_lock:
+            self._status_counts[old] -= 1
+            self._status_counts[new] += 1
+            if new == ProcessingStatus.IN_PROGRESS:
+                self.current_allergen = task.allergen.name
+            elif self.current_allergen == task.allergen.name:
+                self.current_allergen = None
+
+    def count(self, *statuses: ProcessingStatus) -> int:
+        """상태별 태스크 수 합계"""
+        return sum(self._status_counts[s] for s in statuses)
 
     @property
     def total_count(self) -> int:
@@ -95,12 +148,11 @@ class BatchJob:
 
     @property
     def completed_count(self) -> int:
-        return sum(1 for t in self.tasks
-                   if t.status in [ProcessingStatus.COMPLETED, ProcessingStatus.CACHED])
+        return self.count(ProcessingStatus.COMPLETED, ProcessingStatus.CACHED)
 
     @property
     def failed_count(self) -> int:
-        return sum(1 for t in self.tasks if t.status == ProcessingStatus.FAILED)
+        return self.count(ProcessingStatus.FAILED)
 
     @property
     def progress_percent(self) -> float:
@@ -110,10 +162,7 @@ class BatchJob:
 
     @property
     def is_completed(self) -> bool:
-        return all(t.status in [ProcessingStatus.COMPLETED,
-                                ProcessingStatus.CACHED,
-                                ProcessingStatus.FAILED]
-                   for t in self.tasks)
+        return self.count(ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS) == 0
 
     def get_status_summary(self) -> dict:
         """상태 요약"""
@@ -122,12 +171,9 @@ class BatchJob:
             "total": self.total_count,
             "completed": self.completed_count,
             "failed": self.failed_count,
-            "in_progress": sum(1 for t in self.tasks
-                              if t.status == ProcessingStatus.IN_PROGRESS),
-            "pending": sum(1 for t in self.tasks
-                          if t.status == ProcessingStatus.PENDING),
-            "cached": sum(1 for t in self.tasks
-                         if t.status == ProcessingStatus.CACHED),
+            "in_progress": self.count(ProcessingStatus.IN_PROGRESS),
+            "pending": self.count(ProcessingStatus.PENDING),
+            "cached": self.count(ProcessingStatus.CACHED),
             "progress_percent": round(self.progress_percent, 1),
             "is_completed": self.is_completed,
         }
@@ -202,14 +248,36 @@ class SimpleCache:
             }
 
 
+class _RateLimiter:
+    """API 호출 간 최소 간격 보장 (워커 전체 공유)"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+
 class BatchProcessor:
     """배치 프로세서 - 단계적 논문 검색"""
 
     # 기본 설정
-    DEFAULT_BATCH_SIZE = 5           # 한 번에 처리할 항원 수
-    DEFAULT_DELAY_BETWEEN_BATCHES = 2.0  # 배치 간 대기 시간 (초)
+    DEFAULT_BATCH_SIZE = 5           # 진행 콜백 간격 (태스크 수)
+    DEFAULT_DELAY_BETWEEN_BATCHES = 2.0  # batch_size 회 API 호출당 최소 소요 시간 (초)
     DEFAULT_MAX_RETRIES = 2          # 최대 재시도 횟수
     DEFAULT_RESULTS_PER_ALLERGEN = 10  # 항원당 검색 결과 수
+    DEFAULT_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))  # 백그라운드 워커 스레드 수
+    DEFAULT_JOB_RETENTION_HOURS = float(os.getenv("BATCH_JOB_RETENTION_HOURS", "6"))  # 완료 작업 보관
+    MAINTENANCE_INTERVAL_SECONDS = 30.0  # heartbeat / 고아 작업 재개 / 만료 작업 정리 주기
 
     def __init__(
         self,
@@ -217,15 +285,42 @@ class BatchProcessor:
         cache_ttl_hours: int = 24,
         batch_size: int = DEFAULT_BATCH_SIZE,
         delay_between_batches: float = DEFAULT_DELAY_BETWEEN_BATCHES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        job_store=None,
+        job_retention_hours: float = DEFAULT_JOB_RETENTION_HOURS,
     ):
         self.search_service = search_service or PaperSearchService()
-        self.cache = SimpleCache(ttl_hours=cache_ttl_hours)
+        # 공유 검색 캐시 (워커 간 공유 + stale-while-revalidate), 비활성화 시 프로세스 메모리 캐시
+        from .search_result_cache import get_search_result_cache
+        self.cache = get_search_result_cache() or SimpleCache(ttl_hours=cache_ttl_hours)
         self.batch_size = batch_size
         self.delay_between_batches = delay_between_batches
-
-        # 작업 저장소
+        self._rate_limiter = _RateLimiter(delay_between_batches / max(batch_size, 1))
+
+        # 작업 저장소 (메모리 + 영속 저장소, 비활성화 시 메모리만)
+        if job_store is None:
+            from .batch_job_store import get_batch_job_store
+            job_store = get_batch_job_store()
+        self.job_store = job_store
+        self.job_retention = timedelta(hours=job_retention_hours)
         self._jobs: dict[str, BatchJob] = {}
         self._lock = threading.Lock()
+        self._job_finished = threading.Condition(self._lock)
+
+        # 워커 풀 (첫 submit_job / start 시 생성)
+        self.max_workers = max(max_workers, 1)
+        self._queue: PriorityQueue = PriorityQueue()
+        self._seq = itertools.count()
+        self._task_seq = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        # 대기열에 있는 작업의 처리 옵션 / 남은 태스크 수 / 콜백 / 구독자 / 완료 순 태스크 (완료 시 제거)
+        self._job_options: dict[str, tuple[bool, int]] = {}
+        self._job_remaining: dict[str, int] = {}
+        self._job_callbacks: dict[str, tuple[Optional[Callable], Optional[Callable]]] = {}
+        self._job_subscribers: dict[str, list[Callable]] = {}
+        self._job_finished_tasks: dict[str, list[SearchTask]] = {}
+        self._callback_lock = threading.Lock()
 
         # 콜백
         self._progress_callback: Optional[Callable[[BatchJob], None]] = None
@@ -242,7 +337,7 @@ class BatchProcessor:
 
     def _generate_task_id(self, allergen: str) -> str:
         """태스크 ID 생성"""
-        return f"task_{allergen.lower()}_{int(time.time() * 1000)}"
+        return f"task_{allergen.lower()}_{int(time.time() * 1000)}_{next(self._task_seq)}"
 
     def create_job(
         self,
@@ -278,11 +373,240 @@ class BatchProcessor:
             tasks=tasks,
         )
 
+        self._evict_expired_jobs()
         with self._lock:
             self._jobs[job.job_id] = job
 
         return job
 
+    # ───────── 워커 풀 ─────────
+
+    def start(self):
+        """워커 풀 + 관리 스레드 시작 (이미 시작됐으면 무시)
+
+        관리 스레드는 시작 직후와 MAINTENANCE_INTERVAL_SECONDS 마다 heartbeat,
+        고아 작업(재시작 전 미완료) 재개, 만료 작업 정리를 수행합니다.
+        """
+        with self._lock:
+            if self._threads or self._stop.is_set():
+                return
+            self._threads = [
+                threading.Thread(target=self._worker_loop, name=f"batch-worker-{i}", daemon=True)
+                for i in range(self.max_workers)
+            ]
+            self._threads.append(
+                threading.Thread(target=self._maintenance_loop, name="batch-maintenance", daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def submit_job(
+        self,
+        job: BatchJob,
+        include_cross_reactivity: bool = True,
+        max_results_per_allergen: int = DEFAULT_RESULTS_PER_ALLERGEN,
+        on_progress: Optional[Callable[[BatchJob], None]] = None,
+        on_complete: Optional[Callable[[BatchJob], None]] = None,
+    ) -> BatchJob:
+        """
+        배치 작업을 워커 풀 대기열에 등록 (논블로킹)
+
+        태스크는 AllergenItem.priority (동률이면 등급, 등록 순) 순으로 처리되며
+        동시에 올라온 다른 작업의 태스크와 같은 큐를 공유합니다.
+
+        Args:
+            job: 배치 작업
+            include_cross_reactivity: 교차 반응 포함 여부
+            max_results_per_allergen: 항원당 최대 결과 수
+            on_progress: 태스크 1개 완료마다 호출
+            on_complete: 작업 전체 완료 시 1회 호출
+
+        Returns:
+            BatchJob: 등록된 배치 작업
+        """
+        if self.job_store is not None:
+            try:
+                self.job_store.save_job(job, include_cross_reactivity, max_results_per_allergen)
+            except Exception as e:
+                logger.warning(f"배치 작업 저장 실패 (메모리에서만 처리): {job.job_id}: {e}")
+        self._enqueue(job, include_cross_reactivity, max_results_per_allergen, on_progress, on_complete)
+        return job
+
+    def _enqueue(
+        self,
+        job: BatchJob,
+        include_cross_reactivity: bool,
+        max_results: int,
+        on_progress: Optional[Callable[[BatchJob], None]] = None,
+        on_complete: Optional[Callable[[BatchJob], None]] = None,
+    ):
+        pending = [t for t in job.tasks if t.status == ProcessingStatus.PENDING]
+        with self._lock:
+            self._jobs[job.job_id] = job
+            if pending:
+                self._job_options[job.job_id] = (include_cross_reactivity, max_results)
+                self._job_remaining[job.job_id] = len(pending)
+                self._job_callbacks[job.job_id] = (on_progress, on_complete)
+                self._job_subscribers[job.job_id] = []
+                self._job_finished_tasks[job.job_id] = []
+
+        if not pending:
+            # 재개한 작업이 이미 모두 처리된 경우 (완료 기록 직전 중단)
+            job.completed_at = job.completed_at or datetime.now()
+            if self.job_store is not None:
+                self.job_store.mark_completed(job)
+            if on_complete:
+                on_complete(job)
+            return
+
+        self.start()
+        for task in pending:
+            self._queue.put((-task.allergen.priority, -task.allergen.grade, next(self._seq), job.job_id, task))
+
+    def _worker_loop(self):
+        while True:
+            _, _, _, job_id, task = self._queue.get()
+            if job_id is None:  # 종료 신호
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+                options = self._job_options.get(job_id)
+            if job is None or options is None:
+                continue
+            if job.started_at is None:
+                job.started_at = datetime.now()
+
+            try:
+                self._process_single_task(task, *options)
+            except Exception as e:
+                logger.exception(f"배치 태스크 처리 실패: {task.task_id}")
+                task.error = str(e)
+                task.status = ProcessingStatus.FAILED
+                task.completed_at = datetime.now()
+            self._on_task_done(job, task)
+
+    def _on_task_done(self, job: BatchJob, task: SearchTask):
+        """태스크 완료 처리 — 상태 저장, 진행 콜백/구독자 알림, 작업 완료 시 1회 완료 처리
+
+        콜백은 태스크 완료 순서대로 직렬 호출되며, 완료 콜백은 항상 마지막입니다.
+        """
+        with self._callback_lock:
+            with self._lock:
+                self._job_remaining[job.job_id] -= 1
+                finished = self._job_remaining[job.job_id] == 0
+                if finished:
+                    job.completed_at = datetime.now()
+                on_progress, on_complete = self._job_callbacks[job.job_id]
+                subscribers = list(self._job_subscribers[job.job_id])
+                self._job_finished_tasks[job.job_id].append(task)
+
+            if self.job_store is not None:
+                self.job_store.save_task(job, task)
+
+            notifications = [(on_progress or self._progress_callback, (job,))]
+            notifications += [(subscriber, (job, task)) for subscriber in subscribers]
+            if finished:
+                notifications.append((on_complete, (job,)))
+                notifications += [(subscriber, (job, None)) for subscriber in subscribers]
+            for callback, args in notifications:
+                if callback is None:
+                    continue
+                try:
+                    callback(*args)
+                except Exception:
+                    logger.exception(f"배치 작업 콜백 실패: {job.job_id}")
+
+        if finished:
+            with self._job_finished:
+                for registry in (
+                    self._job_options, self._job_remaining, self._job_callbacks,
+                    self._job_subscribers, self._job_finished_tasks,
+                ):
+                    registry.pop(job.job_id, None)
+                self._job_finished.notify_all()
+
+    def subscribe(
+        self, job_id: str, callback: Callable[[BatchJob, Optional[SearchTask]], None],
+    ) -> Optional[list[SearchTask]]:
+        """처리 중인 작업의 태스크 완료 이벤트 구독
+
+        callback(job, task) 는 태스크가 끝날 때마다 워커 스레드에서 호출되고,
+        작업 전체가 끝나면 마지막으로 callback(job, None) 이 호출됩니다.
+
+        Returns:
+            구독 시점까지 끝난 태스크 목록 (완료 순) — 이후 이벤트와 중복되지 않음.
+            이 프로세스의 워커 풀에서 처리 중인 작업이 아니면 None.
+        """
+        with self._callback_lock, self._lock:
+            if job_id not in self._job_subscribers:
+                return None
+            self._job_subscribers[job_id].append(callback)
+            return list(self._job_finished_tasks[job_id])
+
+    def unsubscribe(self, job_id: str, callback: Callable) -> None:
+        """구독 해제 (이미 끝난 작업이면 무시)"""
+        with self._lock:
+            subscribers = self._job_subscribers.get(job_id)
+            if subscribers and callback in subscribers:
+                subscribers.remove(callback)
+
+    def wait_for_job(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """대기열에 등록된 작업이 끝날 때까지 대기
+
+        Returns:
+            완료 여부 (timeout 초과 시 False)
+        """
+        with self._job_finished:
+            return self._job_finished.wait_for(
+                lambda: job_id not in self._job_options, timeout=timeout,
+            )
+
+    def _maintenance_loop(self):
+        while True:
+            try:
+                self._maintain()
+            except Exception:
+                logger.exception("배치 작업 관리 실패")
+            if self._stop.wait(self.MAINTENANCE_INTERVAL_SECONDS):
+                return
+
+    def _maintain(self):
+        if self.job_store is not None:
+            self.job_store.heartbeat()
+            self.resume_pending_jobs()
+        self._evict_expired_jobs(purge_store=True)
+
+    def resume_pending_jobs(self) -> int:
+        """다른(종료된) 프로세스가 남긴 미완료 작업을 이어받아 대기열에 등록
+
+        Returns:
+            재개한 작업 수
+        """
+        if self.job_store is None:
+            return 0
+        stored_jobs = self.job_store.claim_orphaned_jobs()
+        for stored in stored_jobs:
+            remaining = sum(1 for t in stored.job.tasks if t.status == ProcessingStatus.PENDING)
+            logger.info(f"미완료 배치 작업 재개: {stored.job.job_id} (남은 태스크 {remaining}개)")
+            self._enqueue(stored.job, stored.include_cross_reactivity, stored.max_results)
+        return len(stored_jobs)
+
+    def _evict_expired_jobs(self, purge_store: bool = False) -> int:
+        """완료 후 보관 기간이 지난 작업 제거 (메모리, purge_store 면 저장소도)"""
+        cutoff = datetime.now() - self.job_retention
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.completed_at is not None and job.completed_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        if purge_store and self.job_store is not None:
+            self.job_store.purge_completed(self.job_retention.total_seconds())
+        return len(expired)
+
+    # ───────── 동기 / 비동기 직접 처리 ─────────
+
     def process_job_sync(
         self,
         job: BatchJob,
@@ -290,7 +614,7 @@ class BatchProcessor:
         max_results_per_allergen: int = DEFAULT_RESULTS_PER_ALLERGEN,
     ) -> BatchJob:
         """
-        배치 작업 동기 처리 (블로킹)
+        배치 작업 동기 처리 (블로킹, 호출 스레드에서 처리)
 
         Args:
             job: 배치 작업
@@ -317,13 +641,45 @@ class BatchProcessor:
             if self._progress_callback:
                 self._progress_callback(job)
 
-            # 배치 간 대기 (Rate Limit 방지)
-            if i + self.batch_size < len(job.tasks):
-                time.sleep(self.delay_between_batches)
-
         job.completed_at = datetime.now()
         return job
 
+    def _cache_key(self, allergen: str, include_cross: bool, max_results: int) -> str:
+        from .search_result_cache import make_search_cache_key
+        return make_search_cache_key(
+            allergen, include_cross, max_results, self.search_service.allergy_sources(),
+        )
+
+    def _cache_get(
+        self, allergen: str, include_cross: bool, max_results: int,
+    ) -> Optional[UnifiedSearchResult]:
+        """캐시 조회 (공유 캐시의 stale 항목은 반환 후 백그라운드 갱신)"""
+        if isinstance(self.cache, SimpleCache):
+            return self.cache.get(allergen, include_cross)
+
+        key = self._cache_key(allergen, include_cross, max_results)
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        if cached.stale:
+            self.cache.refresh_in_background(
+                key, allergen,
+                lambda: self.search_service.search_allergy(
+                    allergen=allergen,
+                    include_cross_reactivity=include_cross,
+                    max_results_per_source=max_results,
+                ),
+            )
+        return cached.result
+
+    def _cache_set(
+        self, allergen: str, include_cross: bool, max_results: int, result: UnifiedSearchResult,
+    ):
+        if isinstance(self.cache, SimpleCache):
+            self.cache.set(allergen, include_cross, result)
+        else:
+            self.cache.put(self._cache_key(allergen, include_cross, max_results), allergen, result)
+
     def _process_single_task(
         self,
         task: SearchTask,
@@ -337,14 +693,15 @@ class BatchProcessor:
         allergen_name = task.allergen.name
 
         # 1. 캐시 확인
-        cached = self.cache.get(allergen_name, include_cross_reactivity)
+        cached = self._cache_get(allergen_name, include_cross_reactivity, max_results)
         if cached:
             task.result = cached
             task.status = ProcessingStatus.CACHED
             task.completed_at = datetime.now()
             return
 
-        # 2. API 검색
+        # 2. API 검색 (워커 전체 공유 호출 간격)
+        self._rate_limiter.acquire()
         try:
             result = self.search_service.search_allergy(
                 allergen=allergen_name,
@@ -357,7 +714,7 @@ class BatchProcessor:
             task.completed_at = datetime.now()
 
             # 캐시에 저장
-            self.cache.set(allergen_name, include_cross_reactivity, result)
+            self._cache_set(allergen_name, include_cross_reactivity, max_results, result)
 
         except Exception as e:
             task.error = str(e)
@@ -408,10 +765,6 @@ class BatchProcessor:
             if self._progress_callback:
                 self._progress_callback(job)
 
-            # 배치 간 대기
-            if i + self.batch_size < len(job.tasks):
-                await asyncio.sleep(self.delay_between_batches)
-
         job.completed_at = datetime.now()
         return job
 
@@ -433,9 +786,13 @@ class BatchProcessor:
         )
 
     def get_job(self, job_id: str) -> Optional[BatchJob]:
-        """작업 조회"""
+        """작업 조회 (메모리에 없으면 저장소 — 재시작 전 / 다른 워커 프로세스의 작업)"""
         with self._lock:
-            return self._jobs.get(job_id)
+            job = self._jobs.get(job_id)
+        if job is None and self.job_store is not None:
+            stored = self.job_store.load_job(job_id)
+            job = stored.job if stored else None
+        return job
 
     def get_job_status(self, job_id: str) -> Optional[dict]:
         """작업 상태 조회"""
@@ -444,23 +801,34 @@ class BatchProcessor:
             return job.get_status_summary()
         return None
 
+    @staticmethod
+    def task_result(task: SearchTask) -> dict:
+        """항원별 결과 (get_completed_results 항목 형식)"""
+        return {
+            "allergen": task.allergen.name,
+            "allergen_kr": task.allergen.name_kr,
+            "grade": task.allergen.grade,
+            "papers": [p.to_dict() for p in task.result.papers] if task.result else [],
+            "total_found": task.result.total_unique if task.result else 0,
+            "from_cache": task.status == ProcessingStatus.CACHED,
+        }
+
     def get_completed_results(self, job: BatchJob) -> list[dict]:
         """완료된 결과만 반환"""
-        results = []
-        for task in job.tasks:
-            if task.status in [ProcessingStatus.COMPLETED, ProcessingStatus.CACHED]:
-                results.append({
-                    "allergen": task.allergen.name,
-                    "allergen_kr": task.allergen.name_kr,
-                    "grade": task.allergen.grade,
-                    "papers": [p.to_dict() for p in task.result.papers] if task.result else [],
-                    "total_found": task.result.total_unique if task.result else 0,
-                    "from_cache": task.status == ProcessingStatus.CACHED,
-                })
-        return results
+        return [
+            self.task_result(task) for task in job.tasks
+            if task.status in [ProcessingStatus.COMPLETED, ProcessingStatus.CACHED]
+        ]
 
     def close(self):
-        """리소스 정리"""
+        """리소스 정리 (대기 중인 태스크는 저장소에 남아 다음 실행에서 재개)"""
+        self._stop.set()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put((float("-inf"), 0, next(self._seq), None, None))
+        for thread in threads:
+            thread.join(timeout=1.0)
         self.search_service.close()
 
 
@@ -14,6 +14,7 @@ from typing import Optional
 import httpx
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class BiorxivService:
 
     def __init__(self):
         self._client: Optional[httpx.Client] = None
+        self._async_http = AsyncHttpClient(timeout=30.0)
 
     def _get_client(self) -> httpx.Client:
         if self._client is None:
@@ -61,32 +63,60 @@ class BiorxivService:
         papers = []
         try:
             # Europe PMC에서 프리프린트만 필터링
-            epmc_query = f"({query}) AND (SRC:PPR)"
-
             resp = client.get(
                 f"{self.EPMC_BASE_URL}/search",
-                params={
-                    "query": epmc_query,
-                    "format": "json",
-                    "pageSize": min(max_results, 100),
-                    "sort": sort,
-                    "resultType": "core",
-                },
+                params=self._search_params(query, max_results, sort),
             )
             resp.raise_for_status()
-            data = resp.json()
+            papers = self._parse_epmc_results(resp.json())
+        except Exception as e:
+            logger.error(f"bioRxiv/medRxiv 검색 실패: {e}")
 
-            results = data.get("resultList", {}).get("result", [])
-            for item in results:
-                paper = self._parse_epmc_result(item)
-                if paper:
-                    papers.append(paper)
+        return self._search_result(papers, query, start_time)
 
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        sort: str = "DATE",
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전"""
+        start_time = time.time()
+
+        papers = []
+        try:
+            resp = await self._async_http.get(
+                f"{self.EPMC_BASE_URL}/search",
+                params=self._search_params(query, max_results, sort),
+            )
+            resp.raise_for_status()
+            papers = self._parse_epmc_results(resp.json())
         except Exception as e:
             logger.error(f"bioRxiv/medRxiv 검색 실패: {e}")
 
-        elapsed = (time.time() - start_time) * 1000
+        return self._search_result(papers, query, start_time)
+
+    @staticmethod
+    def _search_params(query: str, max_results: int, sort: str) -> dict:
+        return {
+            "query": f"({query}) AND (SRC:PPR)",
+            "format": "json",
+            "pageSize": min(max_results, 100),
+            "sort": sort,
+            "resultType": "core",
+        }
 
+    def _parse_epmc_results(self, data: dict) -> list[Paper]:
+        papers = []
+        for item in data.get("resultList", {}).get("result", []):
+            paper = self._parse_epmc_result(item)
+            if paper:
+                papers.append(paper)
+        return papers
+
+    @staticmethod
+    def _search_result(papers: list[Paper], query: str, start_time: float) -> PaperSearchResult:
+        elapsed = (time.time() - start_time) * 1000
         return PaperSearchResult(
             papers=papers,
             total_count=len(papers),
@@ -109,6 +139,15 @@ class BiorxivService:
         query = f'"{allergen} allergy" OR "{allergen} hypersensitivity"'
         return self.search(query, max_results=max_results, sort="DATE")
 
+    async def search_allergy_async(
+        self,
+        allergen: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search_allergy() 의 비동기 버전"""
+        query = f'"{allergen} allergy" OR "{allergen} hypersensitivity"'
+        return await self.search_async(query, max_results=max_results, sort="DATE")
+
     def collect_recent(
         self,
         date_from: str,
@@ -138,23 +177,37 @@ class BiorxivService:
                     f"{self.BIORXIV_API_URL}/{server}/{date_from}/{date_to}/{cursor}",
                 )
                 resp.raise_for_status()
-                data = resp.json()
-
-                collection = data.get("collection", [])
-                if not collection:
+                cursor = self._collect_page(resp.json(), server, cursor, papers, max_results)
+                if cursor is None:
                     break
 
-                for item in collection:
-                    if len(papers) >= max_results:
-                        break
-                    paper = self._parse_biorxiv_result(item, server)
-                    if paper:
-                        papers.append(paper)
-
-                # bioRxiv API는 30개씩 반환
-                total = data.get("messages", [{}])[0].get("total", 0)
-                cursor += 30
-                if cursor >= total:
+        except Exception as e:
+            logger.error(
+                f"bioRxiv/medRxiv 수집 실패 ({server}, {date_from}~{date_to}): {e}"
+            )
+
+        return self._search_result(papers, f"{server}:{date_from}~{date_to}", start_time)
+
+    async def collect_recent_async(
+        self,
+        date_from: str,
+        date_to: str,
+        server: str = "medrxiv",
+        max_results: int = 50,
+    ) -> PaperSearchResult:
+        """collect_recent() 의 비동기 버전"""
+        start_time = time.time()
+
+        papers = []
+        cursor = 0
+        try:
+            while len(papers) < max_results:
+                resp = await self._async_http.get(
+                    f"{self.BIORXIV_API_URL}/{server}/{date_from}/{date_to}/{cursor}",
+                )
+                resp.raise_for_status()
+                cursor = self._collect_page(resp.json(), server, cursor, papers, max_results)
+                if cursor is None:
                     break
 
         except Exception as e:
@@ -162,15 +215,32 @@ class BiorxivService:
                 f"bioRxiv/medRxiv 수집 실패 ({server}, {date_from}~{date_to}): {e}"
             )
 
-        elapsed = (time.time() - start_time) * 1000
+        return self._search_result(papers, f"{server}:{date_from}~{date_to}", start_time)
 
-        return PaperSearchResult(
-            papers=papers,
-            total_count=len(papers),
-            query=f"{server}:{date_from}~{date_to}",
-            source=PaperSource.BIORXIV_MEDRXIV,
-            search_time_ms=round(elapsed, 1),
-        )
+    def _collect_page(
+        self,
+        data: dict,
+        server: str,
+        cursor: int,
+        papers: list[Paper],
+        max_results: int,
+    ) -> Optional[int]:
+        """bioRxiv details 페이지를 papers 에 추가하고 다음 cursor 반환 (마지막이면 None)"""
+        collection = data.get("collection", [])
+        if not collection:
+            return None
+
+        for item in collection:
+            if len(papers) >= max_results:
+                break
+            paper = self._parse_biorxiv_result(item, server)
+            if paper:
+                papers.append(paper)
+
+        # bioRxiv API는 30개씩 반환
+        total = data.get("messages", [{}])[0].get("total", 0)
+        cursor += 30
+        return None if cursor >= total else cursor
 
     def _parse_epmc_result(self, item: dict) -> Optional[Paper]:
         """Europe PMC 프리프린트 결과를 Paper 모델로 변환"""
@@ -290,3 +360,7 @@ class BiorxivService:
         if self._client:
             self._client.close()
             self._client = None
+
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
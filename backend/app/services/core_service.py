@@ -6,6 +6,7 @@ API 키 미설정 시 서비스 자동 비활성화.
 
 API 문서: https://api.core.ac.uk/docs/v3
 """
+import asyncio
 import logging
 import os
 import time
@@ -14,6 +15,7 @@ from typing import Optional
 import httpx
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,10 @@ class CoreService:
         self.api_key = api_key or os.getenv("CORE_API_KEY")
         self._client: Optional[httpx.Client] = None
         self._last_request_time = 0.0
+        self._async_http = AsyncHttpClient(
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else None,
+        )
 
     @property
     def is_available(self) -> bool:
@@ -50,6 +56,15 @@ class CoreService:
             time.sleep(0.12 - elapsed)
         self._last_request_time = time.time()
 
+    async def _await_rate_limit(self):
+        """_wait_for_rate_limit() 의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        now = time.time()
+        # 다음 요청 슬롯을 먼저 예약해 동시 호출끼리도 간격 유지
+        slot = max(now, self._last_request_time + 0.12)
+        self._last_request_time = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     def search(
         self,
         query: str,
@@ -67,39 +82,73 @@ class CoreService:
         start_time = time.time()
         client = self._get_client()
 
-        papers = []
         if not client:
-            return PaperSearchResult(
-                papers=[], total_count=0, query=query,
-                source=PaperSource.CORE, search_time_ms=0,
-            )
+            return self._search_result([], 0, query, start_time)
 
+        papers, total = [], 0
         try:
             self._wait_for_rate_limit()
             resp = client.post(
                 f"{self.BASE_URL}/search/works",
-                json={
-                    "q": query,
-                    "limit": min(max_results, 100),
-                    "scroll": False,
-                },
+                json=self._search_body(query, max_results),
             )
             resp.raise_for_status()
-            data = resp.json()
+            papers, total = self._parse_results(resp.json())
+        except Exception as e:
+            logger.error(f"CORE 검색 실패: {e}")
+
+        return self._search_result(papers, total, query, start_time)
 
-            for item in data.get("results", []):
-                paper = self._parse_result(item)
-                if paper:
-                    papers.append(paper)
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전"""
+        start_time = time.time()
+
+        if not self.is_available:
+            return self._search_result([], 0, query, start_time)
 
+        papers, total = [], 0
+        try:
+            await self._await_rate_limit()
+            resp = await self._async_http.post(
+                f"{self.BASE_URL}/search/works",
+                json=self._search_body(query, max_results),
+            )
+            resp.raise_for_status()
+            papers, total = self._parse_results(resp.json())
         except Exception as e:
             logger.error(f"CORE 검색 실패: {e}")
 
-        elapsed = (time.time() - start_time) * 1000
+        return self._search_result(papers, total, query, start_time)
 
+    @staticmethod
+    def _search_body(query: str, max_results: int) -> dict:
+        return {
+            "q": query,
+            "limit": min(max_results, 100),
+            "scroll": False,
+        }
+
+    def _parse_results(self, data: dict) -> tuple[list[Paper], int]:
+        """search/works 응답 → (논문 목록, 전체 건수)"""
+        papers = []
+        for item in data.get("results", []):
+            paper = self._parse_result(item)
+            if paper:
+                papers.append(paper)
+        return papers, (data.get("totalHits", len(papers)) if papers else 0)
+
+    @staticmethod
+    def _search_result(
+        papers: list[Paper], total: int, query: str, start_time: float,
+    ) -> PaperSearchResult:
+        elapsed = (time.time() - start_time) * 1000
         return PaperSearchResult(
             papers=papers,
-            total_count=data.get("totalHits", len(papers)) if papers else 0,
+            total_count=total,
             query=query,
             source=PaperSource.CORE,
             search_time_ms=round(elapsed, 1),
@@ -114,6 +163,15 @@ class CoreService:
         query = f'("{allergen} allergy" OR "{allergen} hypersensitivity")'
         return self.search(query, max_results=max_results)
 
+    async def search_allergy_async(
+        self,
+        allergen: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search_allergy() 의 비동기 버전"""
+        query = f'("{allergen} allergy" OR "{allergen} hypersensitivity")'
+        return await self.search_async(query, max_results=max_results)
+
     def get_fulltext(self, core_id: str) -> Optional[str]:
         """전문(Full-text) 조회
 
@@ -184,3 +242,7 @@ class CoreService:
         if self._client:
             self._client.close()
             self._client = None
+
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
@@ -13,6 +13,7 @@ from datetime import datetime
 import httpx
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class EuropePMCService:
 
     def __init__(self):
         self._client: Optional[httpx.Client] = None
+        self._async_http = AsyncHttpClient(timeout=30.0)
 
     def _get_client(self) -> httpx.Client:
         if self._client is None:
@@ -53,28 +55,58 @@ class EuropePMCService:
         try:
             resp = client.get(
                 f"{self.BASE_URL}/search",
-                params={
-                    "query": query,
-                    "format": "json",
-                    "pageSize": min(max_results, 100),
-                    "sort": sort,
-                    "resultType": "core",
-                },
+                params=self._search_params(query, max_results, sort),
             )
             resp.raise_for_status()
-            data = resp.json()
+            papers = self._parse_results(resp.json())
+        except Exception as e:
+            logger.error(f"Europe PMC 검색 실패: {e}")
 
-            results = data.get("resultList", {}).get("result", [])
-            for item in results:
-                paper = self._parse_result(item)
-                if paper:
-                    papers.append(paper)
+        return self._search_result(papers, query, start_time)
 
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        sort: str = "RELEVANCE",
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전"""
+        start_time = time.time()
+
+        papers = []
+        try:
+            resp = await self._async_http.get(
+                f"{self.BASE_URL}/search",
+                params=self._search_params(query, max_results, sort),
+            )
+            resp.raise_for_status()
+            papers = self._parse_results(resp.json())
         except Exception as e:
             logger.error(f"Europe PMC 검색 실패: {e}")
 
-        elapsed = (time.time() - start_time) * 1000
+        return self._search_result(papers, query, start_time)
 
+    @staticmethod
+    def _search_params(query: str, max_results: int, sort: str) -> dict:
+        return {
+            "query": query,
+            "format": "json",
+            "pageSize": min(max_results, 100),
+            "sort": sort,
+            "resultType": "core",
+        }
+
+    def _parse_results(self, data: dict) -> list[Paper]:
+        papers = []
+        for item in data.get("resultList", {}).get("result", []):
+            paper = self._parse_result(item)
+            if paper:
+                papers.append(paper)
+        return papers
+
+    @staticmethod
+    def _search_result(papers: list[Paper], query: str, start_time: float) -> PaperSearchResult:
+        elapsed = (time.time() - start_time) * 1000
         return PaperSearchResult(
             papers=papers,
             total_count=len(papers),
@@ -94,8 +126,21 @@ class EuropePMCService:
             allergen: 알러젠 이름 (예: "peanut")
             max_results: 최대 결과 수
         """
-        query = f'("{allergen} allergy" OR "{allergen} hypersensitivity") AND (SRC:MED OR SRC:PMC)'
-        return self.search(query, max_results=max_results, sort="DATE")
+        return self.search(self._allergy_query(allergen), max_results=max_results, sort="DATE")
+
+    async def search_allergy_async(
+        self,
+        allergen: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search_allergy() 의 비동기 버전"""
+        return await self.search_async(
+            self._allergy_query(allergen), max_results=max_results, sort="DATE",
+        )
+
+    @staticmethod
+    def _allergy_query(allergen: str) -> str:
+        return f'("{allergen} allergy" OR "{allergen} hypersensitivity") AND (SRC:MED OR SRC:PMC)'
 
     def get_fulltext(self, source: str, ext_id: str) -> Optional[str]:
         """전문(Full-text) XML 조회
@@ -181,3 +226,7 @@ class EuropePMCService:
         if self._client:
             self._client.close()
             self._client = None
+
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
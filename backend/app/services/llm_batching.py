@@ -0,0 +1,126 @@
+"""LLM 다건 배치 프롬프트 유틸리티
+
+N개 항목을 하나의 구조화 프롬프트(JSON 배열 출력)로 묶어 RPM 슬롯당 처리량을 높입니다.
+배치 크기는 프로바이더 컨텍스트 창과 최대 출력 토큰에 맞춰 항목 길이 기준으로 결정합니다.
+
+환경 변수:
+    GEMINI_CONTEXT_TOKENS / GEMINI_MAX_OUTPUT_TOKENS (기본 1048576 / 8192)
+    LOCAL_LLM_CONTEXT_TOKENS / LOCAL_LLM_MAX_OUTPUT_TOKENS (기본 8192 / 4096)
+    LLM_BATCH_MAX_ITEMS: 배치당 최대 항목 수 (기본 20)
+"""
+import json
+import os
+import re
+from typing import Callable
+
+from .llm_client_pool import PROVIDER_GEMINI, PROVIDER_LOCAL
+
+# 영문/한국어 혼합 텍스트의 보수적 문자/토큰 비율
+_CHARS_PER_TOKEN = 3
+# 컨텍스트 창 중 프롬프트+출력에 쓸 비율 (나머지는 시스템 프롬프트·추정 오차 여유분)
+_CONTEXT_UTILIZATION = 0.8
+
+_CONTEXT_LIMITS = {
+    PROVIDER_GEMINI: (
+        int(os.getenv("GEMINI_CONTEXT_TOKENS", "1048576")),
+        int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS", "8192")),
+    ),
+    PROVIDER_LOCAL: (
+        int(os.getenv("LOCAL_LLM_CONTEXT_TOKENS", "8192")),
+        int(os.getenv("LOCAL_LLM_MAX_OUTPUT_TOKENS", "4096")),
+    ),
+}
+MAX_BATCH_ITEMS = int(os.getenv("LLM_BATCH_MAX_ITEMS", "20"))
+
+_OBJECT_RE = re.compile(r"\{[^{}]*\}", re.DOTALL)
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 수 기반 토큰 수 추정"""
+    return len(text or "") // _CHARS_PER_TOKEN + 1
+
+
+def plan_batches(
+    texts: list[str],
+    provider: str,
+    output_tokens: Callable[[str], int],
+    prompt_overhead_tokens: int = 400,
+    max_items: int = MAX_BATCH_ITEMS,
+) -> list[list[int]]:
+    """항목 인덱스를 컨텍스트 창 안에 들어가는 배치로 분할 (입력 순서 유지)
+
+    Args:
+        texts: 항목별 입력 텍스트
+        provider: PROVIDER_GEMINI | PROVIDER_LOCAL
+        output_tokens: 항목별 예상 출력 토큰 수
+        prompt_overhead_tokens: 지시문/형식 설명 토큰 수
+        max_items: 배치당 최대 항목 수
+
+    Returns:
+        [[item_index, ...], ...]
+    """
+    context, max_output = _CONTEXT_LIMITS.get(provider, _CONTEXT_LIMITS[PROVIDER_LOCAL])
+    input_budget = int(context * _CONTEXT_UTILIZATION) - prompt_overhead_tokens
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used_in = used_out = 0
+    for i, text in enumerate(texts):
+        tokens_in = estimate_tokens(text) + 10  # 항목 구분자/ID
+        tokens_out = output_tokens(text)
+        fits = (
+            len(current) < max_items
+            and used_in + tokens_in + used_out + tokens_out <= input_budget
+            and used_out + tokens_out <= max_output
+        )
+        if current and not fits:
+            batches.append(current)
+            current, used_in, used_out = [], 0, 0
+        current.append(i)
+        used_in += tokens_in
+        used_out += tokens_out
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_max_tokens(provider: str, texts: list[str], output_tokens: Callable[[str], int]) -> int:
+    """배치 응답용 max_tokens (예상 출력 + 여유분, 프로바이더 상한 이내)"""
+    _, max_output = _CONTEXT_LIMITS.get(provider, _CONTEXT_LIMITS[PROVIDER_LOCAL])
+    return min(max_output, sum(output_tokens(t) for t in texts) + 100)
+
+
+def parse_json_items(response: str, id_key: str = "id") -> dict[int, dict]:
+    """JSON 배열 응답 → {id: item}
+
+    배열 전체 파싱이 실패하면(잘린 응답, 코드블록, 중간 오류 등)
+    개별 객체 단위로 파싱해 살릴 수 있는 항목만 반환합니다.
+    """
+    if not response:
+        return {}
+
+    items: list = []
+    start, end = response.find("["), response.rfind("]") + 1
+    if start >= 0 and end > start:
+        try:
+            parsed = json.loads(response[start:end])
+            if isinstance(parsed, list):
+                items = parsed
+        except ValueError:
+            items = []
+    if not items:
+        for match in _OBJECT_RE.finditer(response):
+            try:
+                items.append(json.loads(match.group(0)))
+            except ValueError:
+                continue
+
+    result: dict[int, dict] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            result[int(item[id_key])] = item
+        except (KeyError, TypeError, ValueError):
+            continue
+    return result
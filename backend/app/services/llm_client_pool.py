@@ -0,0 +1,492 @@
+"""비동기 LLM HTTP 클라이언트 풀
+
+프로바이더(Gemini / 로컬 LLM)별로 keep-alive httpx.AsyncClient 를 공유하고,
+동시 요청 수(세마포어)와 요청 속도(토큰 버킷: RPM + RPD)를 제한합니다.
+
+모든 코루틴은 전용 백그라운드 이벤트 루프 스레드에서 실행됩니다.
+- 동기 호출자(스케줄러 Job, 서비스 메서드): run() 으로 블로킹 호출
+- 비동기 호출자(async 라우트): await arun() — 호출 측 이벤트 루프를 막지 않음
+- 스트리밍 응답: stream_lines() 를 iterate() 로 동기 이터레이터로 받음
+  (스트림이 끝날 때까지 동시성 슬롯 유지, 시작 시 토큰 1개 소비)
+
+환경 변수:
+    GEMINI_RPM: Gemini 분당 요청 한도 (기본 10, 0 = 무제한)
+    GEMINI_RPD: Gemini 일일 요청 한도 (기본 1000, 0 = 무제한)
+    GEMINI_MAX_CONCURRENCY: Gemini 동시 요청 수 (기본 4)
+    LOCAL_LLM_RPM / LOCAL_LLM_RPD: 로컬 LLM 요청 한도 (기본 0 = 무제한)
+    LOCAL_LLM_MAX_CONCURRENCY: 로컬 LLM 동시 요청 수 (기본 2)
+    LLM_BREAKER_FAILURE_THRESHOLD: 서킷 OPEN 전환 실패 횟수 (기본 3)
+    LLM_BREAKER_WINDOW_SECONDS: 실패 집계 구간 (기본 60초)
+    LLM_BREAKER_COOLDOWN_SECONDS: OPEN 유지 시간, 이후 HALF_OPEN 시험 요청 허용 (기본 30초)
+    LLM_BREAKER_HALF_OPEN_CALLS: HALF_OPEN 동시 시험 요청 수 (기본 1)
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROVIDER_GEMINI = "gemini"
+PROVIDER_LOCAL = "local"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+_PROVIDER_DEFAULTS = {
+    PROVIDER_GEMINI: {
+        "rpm": _env_int("GEMINI_RPM", 10),
+        "rpd": _env_int("GEMINI_RPD", 1000),
+        "max_concurrency": _env_int("GEMINI_MAX_CONCURRENCY", 4),
+    },
+    PROVIDER_LOCAL: {
+        "rpm": _env_int("LOCAL_LLM_RPM", 0),
+        "rpd": _env_int("LOCAL_LLM_RPD", 0),
+        "max_concurrency": _env_int("LOCAL_LLM_MAX_CONCURRENCY", 2),
+    },
+}
+
+
+_BREAKER_DEFAULTS = {
+    "failure_threshold": _env_int("LLM_BREAKER_FAILURE_THRESHOLD", 3),
+    "window_seconds": _env_int("LLM_BREAKER_WINDOW_SECONDS", 60),
+    "cooldown_seconds": _env_int("LLM_BREAKER_COOLDOWN_SECONDS", 30),
+    "half_open_max_calls": _env_int("LLM_BREAKER_HALF_OPEN_CALLS", 1),
+}
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class DailyQuotaExceeded(Exception):
+    """프로바이더 일일 요청 한도(RPD) 소진"""
+
+
+class TokenBucket:
+    """분당 요청 수(RPM) 토큰 버킷 + 일일 요청 수(RPD) 카운터
+
+    RPM 토큰이 없으면 다음 토큰이 채워질 때까지 대기하고,
+    RPD 를 다 쓰면 UTC 자정까지 DailyQuotaExceeded 를 발생시킵니다.
+    429 응답 시 penalize() 로 모든 대기자를 Retry-After 만큼 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        rpd: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.rpm = max(rpm, 0)
+        self.rpd = max(rpd, 0)
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._tokens = float(self.rpm)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._day = self._today()
+        self._used_today = 0
+
+    def _today(self) -> int:
+        return int(self._wall_clock() // 86400)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.rpm:
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(float(self.rpm), self._tokens + elapsed * self.rpm / 60.0)
+        self._updated = now
+
+    def _check_daily(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+        if self.rpd and self._used_today >= self.rpd:
+            raise DailyQuotaExceeded(f"일일 요청 한도 {self.rpd}회 소진")
+
+    def delay(self) -> float:
+        """지금 요청하려면 기다려야 하는 시간(초). 0 이면 즉시 토큰 소비."""
+        self._check_daily()
+        self._refill()
+        wait = max(self._blocked_until - self._clock(), 0.0)
+        if wait > 0:
+            return wait
+        if self.rpm and self._tokens < 1.0:
+            return (1.0 - self._tokens) * 60.0 / self.rpm
+        if self.rpm:
+            self._tokens -= 1.0
+        self._used_today += 1
+        return 0.0
+
+    async def acquire(self) -> None:
+        """토큰 1개 획득 (필요 시 asyncio.sleep 으로 대기)"""
+        while True:
+            wait = self.delay()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Rate Limit(429) 응답 후 seconds 동안 신규 요청 보류"""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def get_stats(self) -> dict:
+        self._refill()
+        return {
+            "rpm": self.rpm,
+            "rpd": self.rpd,
+            "tokens": round(self._tokens, 2),
+            "used_today": self._used_today,
+        }
+
+
+class ProviderLimiter:
+    """프로바이더별 동시성 세마포어 + 토큰 버킷"""
+
+    def __init__(self, name: str, rpm: int = 0, rpd: int = 0, max_concurrency: int = 4):
+        self.name = name
+        self.max_concurrency = max(max_concurrency, 1)
+        self.bucket = TokenBucket(rpm=rpm, rpd=rpd)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 풀 이벤트 루프 안에서 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """동시성 슬롯 + 토큰 확보 (블록이 끝날 때 슬롯 반환)"""
+        async with self._get_semaphore():
+            await self.bucket.acquire()
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """동시성 슬롯 + 토큰을 확보한 뒤 call 실행"""
+        async with self.slot():
+            return await call()
+
+    def get_stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            **self.bucket.get_stats(),
+        }
+
+
+class CircuitBreaker:
+    """프로바이더 서킷 브레이커 (CLOSED → OPEN → HALF_OPEN → CLOSED)
+
+    - CLOSED: window_seconds 안에 failure_threshold 회 실패하면 OPEN
+    - OPEN: cooldown_seconds 동안 요청 차단 (타임아웃 대기 없이 즉시 Fallback)
+    - HALF_OPEN: 쿨다운 후 half_open_max_calls 개 시험 요청만 허용,
+      성공하면 CLOSED, 실패하면 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        window_seconds: float = 60.0,
+        cooldown_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(failure_threshold, 1)
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = max(half_open_max_calls, 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = BREAKER_CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._trials = 0
+        self._last_error: Optional[str] = None
+        self._open_count = 0
+
+    def _current_state(self) -> str:
+        """쿨다운 경과 시 OPEN → HALF_OPEN (lock 보유 상태에서 호출)"""
+        if self._state == BREAKER_OPEN and self._clock() - self._opened_at >= self.cooldown_seconds:
+            self._state = BREAKER_HALF_OPEN
+            self._trials = 0
+            logger.info(f"[{self.name}] 서킷 HALF_OPEN — 시험 요청 허용")
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (HALF_OPEN 이면 시험 요청 슬롯 소비)"""
+        with self._lock:
+            state = self._current_state()
+            if state == BREAKER_CLOSED:
+                return True
+            if state == BREAKER_HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """결과 판정 없이 끝난 시험 요청 슬롯 반환 (요청 전 일일 한도 소진 등)"""
+        with self._lock:
+            if self._state == BREAKER_HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != BREAKER_CLOSED:
+                logger.info(f"[{self.name}] 서킷 CLOSED — 프로바이더 복구")
+            self._state = BREAKER_CLOSED
+            self._failures.clear()
+            self._trials = 0
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            if error is not None:
+                self._last_error = f"{type(error).__name__}: {error}"[:200]
+            if self._current_state() == BREAKER_HALF_OPEN:
+                self._open(now)
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_seconds:
+                self._failures.popleft()
+            if self._state == BREAKER_CLOSED and len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def trip(self, error: Optional[str] = None) -> None:
+        """즉시 OPEN (헬스 체크 실패 등)"""
+        with self._lock:
+            if error:
+                self._last_error = error[:200]
+            self._open(self._clock())
+
+    def _open(self, now: float) -> None:
+        self._state = BREAKER_OPEN
+        self._opened_at = now
+        self._failures.clear()
+        self._trials = 0
+        self._open_count += 1
+        logger.warning(
+            f"[{self.name}] 서킷 OPEN — {self.cooldown_seconds:.0f}초간 요청 차단 "
+            f"(최근 오류: {self._last_error})"
+        )
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == BREAKER_OPEN:
+                retry_in = max(self.cooldown_seconds - (self._clock() - self._opened_at), 0.0)
+            return {
+                "state": state,
+                "recent_failures": len(self._failures),
+                "open_count": self._open_count,
+                "retry_in_seconds": round(retry_in, 1),
+                "last_error": self._last_error,
+            }
+
+
+class LLMClientPool:
+    """백그라운드 이벤트 루프 + 프로바이더별 AsyncClient/Limiter"""
+
+    def __init__(self, limits: Optional[dict[str, dict]] = None):
+        self._limits = {**_PROVIDER_DEFAULTS, **(limits or {})}
+        self._limiters: dict[str, ProviderLimiter] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # --- 이벤트 루프 ---
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="llm-client-pool", daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """코루틴을 풀 루프에서 실행하고 결과를 기다림 (동기 호출자용)"""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("LLMClientPool.run() 은 풀 이벤트 루프 안에서 호출할 수 없습니다")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def arun(self, coro: Awaitable[T]) -> T:
+        """코루틴을 풀 루프에서 실행하고 await (비동기 호출자용)"""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    # --- 프로바이더 리소스 (풀 루프 안에서만 사용) ---
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        if provider not in self._limiters:
+            self._limiters[provider] = ProviderLimiter(provider, **self._limits.get(provider, {}))
+        return self._limiters[provider]
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        """프로바이더 서킷 브레이커 (스레드 안전, 루프 밖에서도 사용 가능)"""
+        with self._lock:
+            if provider not in self._breakers:
+                self._breakers[provider] = CircuitBreaker(provider, **_BREAKER_DEFAULTS)
+            return self._breakers[provider]
+
+    def breaker_states(self) -> dict:
+        """헬스 체크용 프로바이더별 서킷 상태"""
+        return {
+            name: self.breaker(name).get_stats() for name in (PROVIDER_GEMINI, PROVIDER_LOCAL)
+        }
+
+    def client(self, provider: str, headers: Optional[dict] = None) -> httpx.AsyncClient:
+        """keep-alive 연결 풀을 공유하는 프로바이더별 AsyncClient"""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            size = self.limiter(provider).max_concurrency
+            client = httpx.AsyncClient(
+                headers=headers,
+                timeout=120.0,
+                limits=httpx.Limits(
+                    max_connections=size * 2,
+                    max_keepalive_connections=size,
+                ),
+            )
+            self._clients[provider] = client
+        return client
+
+    async def request(
+        self,
+        provider: str,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        limited: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """프로바이더 한도 안에서 HTTP 요청
+
+        Args:
+            limited: False 면 토큰/슬롯 없이 호출 (헬스 체크 등)
+        """
+        client = self.client(provider, headers)
+        if not limited:
+            return await client.request(method, url, **kwargs)
+        return await self.limiter(provider).run(
+            lambda: client.request(method, url, **kwargs)
+        )
+
+    async def stream_lines(
+        self,
+        provider: str,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """프로바이더 한도 안에서 스트리밍 요청 — 응답 본문을 줄 단위로 전달
+
+        스트림을 다 읽거나 닫을 때까지 동시성 슬롯을 잡고 있습니다.
+        """
+        client = self.client(provider, headers)
+        async with self.limiter(provider).slot():
+            async with client.stream(method, url, **kwargs) as resp:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    yield line
+
+    def iterate(self, agen: AsyncIterator[T]) -> Iterator[T]:
+        """비동기 제너레이터를 풀 루프에서 실행하며 동기 이터레이터로 전달
+
+        소비자가 중간에 멈추면 (close) 풀 루프에서 제너레이터를 닫아 연결/슬롯을 반환합니다.
+        """
+        async def next_item() -> T:
+            return await agen.__anext__()
+
+        async def close() -> None:
+            await agen.aclose()
+
+        try:
+            while True:
+                try:
+                    item = self.run(next_item())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            self.run(close())
+
+    def get_stats(self) -> dict:
+        return {
+            name: {**limiter.get_stats(), "breaker": self.breaker(name).get_stats()}
+            for name, limiter in self._limiters.items()
+        }
+
+    async def _aclose_clients(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+    def close(self) -> None:
+        """클라이언트 종료 + 루프 정지"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._aclose_clients(), loop).result(timeout=10)
+        except Exception as e:
+            logger.warning(f"LLM 클라이언트 종료 실패: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+        self._limiters = {}
+
+
+# 싱글톤
+_client_pool: Optional[LLMClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """LLMClientPool 싱글톤"""
+    global _client_pool
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = LLMClientPool()
+        return _client_pool
@@ -0,0 +1,217 @@
+"""결정적 LLM 작업 응답 캐시
+
+같은 작업·프롬프트 버전·모델·입력이면 LLM을 다시 호출하지 않고
+저장된 응답을 반환합니다 (잡 재시도, 재처리, 백필, 출처만 다른 동일 제목/초록).
+
+키: sha256(작업명 | 프롬프트 버전 | 모델 체인 | max_tokens | 시스템 프롬프트 | 프롬프트)
+저장소: SQLite 파일 — 같은 호스트의 워커/스케줄러 프로세스가 공유
+
+환경 변수:
+    LLM_CACHE_PATH: 캐시 파일 경로 (기본 backend/data/llm_cache.sqlite3, ":memory:" 가능)
+    LLM_CACHE_TTL_DAYS: 항목 유효 기간 (기본 30일)
+    LLM_CACHE_MAX_ENTRIES: 최대 항목 수 (기본 50000, 초과 시 최근 미사용 순 제거)
+    LLM_CACHE_ENABLED: false 면 캐시 비활성화
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "llm_cache.sqlite3"),
+)
+_TTL_DAYS = float(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key TEXT PRIMARY KEY,
+    task TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (last_accessed_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_task ON llm_cache (task);
+"""
+
+
+def make_cache_key(
+    task: str,
+    version: str,
+    model: str,
+    prompt: str,
+    system_prompt: str = "",
+    max_tokens: int = 0,
+) -> str:
+    """캐시 키 생성"""
+    raw = "\x1f".join([task, version, model, str(max_tokens), system_prompt, prompt])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 기반 영속 LLM 응답 캐시 (TTL + LRU 용량 제한)"""
+
+    def __init__(
+        self,
+        path: str = _CACHE_PATH,
+        ttl_days: float = _TTL_DAYS,
+        max_entries: int = _MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self._clock = clock
+        if path != ":memory:":
+            path = os.path.abspath(path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10.0)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    def get(self, key: str, task: str = "") -> Optional[str]:
+        """캐시된 응답 조회 (만료 항목은 미스 처리 후 삭제)"""
+        now = self._clock()
+        response = None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] >= self.ttl_seconds:
+                    self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                    self._conn.commit()
+                elif row is not None:
+                    self._conn.execute(
+                        "UPDATE llm_cache SET hit_count = hit_count + 1, last_accessed_at = ? "
+                        "WHERE cache_key = ?",
+                        (now, key),
+                    )
+                    self._conn.commit()
+                    response = row[0]
+            except sqlite3.Error as e:
+                logger.warning(f"LLM 캐시 조회 실패: {e}")
+
+            counter = self._misses if response is None else self._hits
+            counter[task] = counter.get(task, 0) + 1
+        return response
+
+    def put(self, key: str, task: str, model: str, response: str) -> None:
+        """응답 저장 + 용량 초과분 LRU 제거"""
+        now = self._clock()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache "
+                    "(cache_key, task, model, response, hit_count, created_at, last_accessed_at) "
+                    "VALUES (?, ?, ?, ?, 0, ?, ?)",
+                    (key, task, model, response, now, now),
+                )
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.warning(f"LLM 캐시 저장 실패: {e}")
+
+    def _evict(self) -> int:
+        """max_entries 초과 시 마지막 접근이 오래된 항목부터 제거 (lock 보유 상태에서 호출)"""
+        total = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        overflow = total - self.max_entries
+        if overflow <= 0:
+            return 0
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM llm_cache ORDER BY last_accessed_at ASC LIMIT ?)",
+            (overflow,),
+        )
+        return overflow
+
+    def purge_expired(self) -> int:
+        """TTL 지난 항목 일괄 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        cutoff = self._clock() - self.ttl_seconds
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM llm_cache WHERE created_at <= ?", (cutoff,))
+            self._conn.commit()
+        return cur.rowcount
+
+    def clear(self, task: Optional[str] = None) -> None:
+        """캐시 삭제 (task 지정 시 해당 작업만)"""
+        with self._lock:
+            if task:
+                self._conn.execute("DELETE FROM llm_cache WHERE task = ?", (task,))
+            else:
+                self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def get_stats(self) -> dict:
+        """히트/미스 카운터 (프로세스 단위, 작업별) + 저장 항목 수"""
+        with self._lock:
+            hits, misses = dict(self._hits), dict(self._misses)
+            try:
+                entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.warning(f"LLM 캐시 통계 조회 실패: {e}")
+                entries = 0
+
+        def rate(h: int, m: int) -> float:
+            return round(h / (h + m), 4) if h + m else 0.0
+
+        total_hits, total_misses = sum(hits.values()), sum(misses.values())
+        return {
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_rate": rate(total_hits, total_misses),
+            "by_task": {
+                task: {
+                    "hits": hits.get(task, 0),
+                    "misses": misses.get(task, 0),
+                    "hit_rate": rate(hits.get(task, 0), misses.get(task, 0)),
+                }
+                for task in sorted(set(hits) | set(misses))
+            },
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_days": self.ttl_seconds / 86400,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """LLMResponseCache 싱글톤 (비활성화 또는 초기화 실패 시 None)"""
+    global _response_cache
+    if not _ENABLED:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = LLMResponseCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM 캐시 초기화 실패 (캐시 없이 동작): {e}")
+                return None
+        return _response_cache
@@ -131,15 +131,15 @@ class NewsPipelineService:
             logger.info("분석할 기사가 없습니다")
             return 0
 
+        # LLM 호출은 프로바이더 동시성/RPM 한도 안에서 병렬 실행
+        analyses = self.ollama_service.analyze_articles(
+            [(article.title, article.description or "") for article in articles]
+        )
+
         analyzed = 0
         irrelevant = 0
-        for article in articles:
+        for article, analysis in zip(articles, analyses):
             try:
-                analysis = self.ollama_service.analyze_article(
-                    title=article.title,
-                    description=article.description or "",
-                )
-
                 # 관련성 판정
                 relevance = analysis.get("relevance_score", 1.0)
                 article.relevance_score = relevance
@@ -12,15 +12,33 @@ Gemini(클라우드) 또는 로컬 LLM(MLX/Ollama)을 용도별로 분리 운영
     LLM_MODEL: 로컬 LLM 모델명
     OLLAMA_HOST: (하위 호환) Ollama 호스트 URL
     OLLAMA_MODEL: (하위 호환) Ollama 모델명
+
+HTTP 호출은 스트리밍을 포함해 모두 llm_client_pool 의 비동기 클라이언트 풀에서
+실행됩니다 (프로바이더별 keep-alive, 동시성 세마포어, RPM/RPD 토큰 버킷).
+동기 메서드(_chat, _chat_stream 등)는 풀 이벤트 루프에 코루틴을 넘기는 얇은 래퍼입니다.
 """
+import asyncio
+import json
 import os
 import logging
-import time
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import httpx
 
 from ..models.news_category import NewsCategoryType, classify_by_keywords
+from .llm_client_pool import (
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    PROVIDER_GEMINI,
+    PROVIDER_LOCAL,
+    CircuitBreaker,
+    DailyQuotaExceeded,
+    LLMClientPool,
+    get_llm_client_pool,
+)
+from .llm_batching import batch_max_tokens, estimate_tokens, parse_json_items, plan_batches
+from .llm_response_cache import get_llm_response_cache
+from .llm_response_cache import make_cache_key as make_llm_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +100,6 @@ class OllamaService:
         self.api_url = api_url or resolved_url
         self.model = model or resolved_model
         self._available: Optional[bool] = None
-        self._client: Optional[httpx.Client] = None
 
         # Gemini 설정
         gemini_key, gemini_url, gemini_model = _resolve_gemini_config()
@@ -90,56 +107,115 @@ class OllamaService:
         self._gemini_url = gemini_url
         self._gemini_model = gemini_model
         self._gemini_available: Optional[bool] = None
-        self._gemini_client: Optional[httpx.Client] = None
 
         # 용도별 프로바이더 설정
         self._news_provider = os.getenv("NEWS_LLM_PROVIDER", "gemini")
         self._rag_provider = os.getenv("RAG_LLM_PROVIDER", "gemini")
 
-    def _get_client(self) -> httpx.Client:
-        """로컬 LLM httpx 클라이언트 (lazy 초기화)"""
-        if self._client is None:
-            self._client = httpx.Client(timeout=120.0)
-        return self._client
-
-    def _get_gemini_client(self) -> httpx.Client:
-        """Gemini httpx 클라이언트 (lazy 초기화)"""
-        if self._gemini_client is None:
-            self._gemini_client = httpx.Client(
-                timeout=60.0,
-                headers={"Authorization": f"Bearer {self._gemini_api_key}"},
+    def _get_pool(self) -> LLMClientPool:
+        """비동기 LLM 클라이언트 풀 (프로바이더별 keep-alive + 동시성/속도 제한)"""
+        return get_llm_client_pool()
+
+    async def _aprobe_local(self) -> bool:
+        try:
+            resp = await self._get_pool().request(
+                PROVIDER_LOCAL, "GET", f"{self.api_url}/models", limited=False, timeout=5.0,
+            )
+            return resp.status_code == 200
+        except Exception as e:
+            logger.warning(f"로컬 LLM 연결 실패 ({self.api_url}): {e}. Fallback 모드로 동작합니다.")
+            return False
+
+    async def _aprobe_gemini(self) -> bool:
+        if not self._gemini_api_key:
+            logger.info("GEMINI_API_KEY 미설정. Gemini 비활성화.")
+            return False
+        try:
+            resp = await self._get_pool().request(
+                PROVIDER_GEMINI, "GET", f"{self._gemini_url}/models",
+                headers=self._gemini_headers(), limited=False, timeout=10.0,
             )
-        return self._gemini_client
+            return resp.status_code == 200
+        except Exception as e:
+            logger.warning(f"Gemini API 연결 실패: {e}")
+            return False
+
+    def _provider_ready(self, provider: str, probed: Optional[bool]) -> bool:
+        """초기 헬스 체크 결과 + 서킷 상태로 사용 가능 여부 판정
+
+        - OPEN: 쿨다운 중 → 사용 불가 (타임아웃 없이 즉시 Fallback)
+        - HALF_OPEN: 쿨다운 경과 → 시험 요청 허용
+        - CLOSED: 헬스 체크 결과
+        """
+        state = self._get_pool().breaker(provider).state
+        if state == BREAKER_OPEN:
+            return False
+        if state == BREAKER_HALF_OPEN:
+            return True
+        return bool(probed)
+
+    def _record_probe(self, provider: str, ok: bool) -> bool:
+        if not ok:
+            self._get_pool().breaker(provider).trip("헬스 체크 실패")
+        return ok
+
+    async def _ais_available(self) -> bool:
+        if self._available is None:
+            self._available = self._record_probe(PROVIDER_LOCAL, await self._aprobe_local())
+        return self._provider_ready(PROVIDER_LOCAL, self._available)
+
+    async def _ais_gemini_available(self) -> bool:
+        if not self._gemini_api_key:
+            return False
+        if self._gemini_available is None:
+            self._gemini_available = self._record_probe(PROVIDER_GEMINI, await self._aprobe_gemini())
+        return self._provider_ready(PROVIDER_GEMINI, self._gemini_available)
 
     @property
     def is_available(self) -> bool:
-        """로컬 LLM 서버 사용 가능 여부"""
+        """로컬 LLM 서버 사용 가능 여부 (헬스 체크 1회 + 서킷 상태)"""
         if self._available is None:
-            try:
-                client = self._get_client()
-                resp = client.get(f"{self.api_url}/models", timeout=5.0)
-                self._available = resp.status_code == 200
-            except Exception as e:
-                logger.warning(f"로컬 LLM 연결 실패 ({self.api_url}): {e}. Fallback 모드로 동작합니다.")
-                self._available = False
-        return self._available
+            self._available = self._record_probe(
+                PROVIDER_LOCAL, self._get_pool().run(self._aprobe_local()),
+            )
+        return self._provider_ready(PROVIDER_LOCAL, self._available)
 
     @property
     def is_gemini_available(self) -> bool:
-        """Gemini API 사용 가능 여부"""
-        if self._gemini_available is None:
-            if not self._gemini_api_key:
+        """Gemini API 사용 가능 여부 (헬스 체크 1회 + 서킷 상태)"""
+        if not self._gemini_api_key:
+            if self._gemini_available is None:
                 logger.info("GEMINI_API_KEY 미설정. Gemini 비활성화.")
                 self._gemini_available = False
-            else:
-                try:
-                    client = self._get_gemini_client()
-                    resp = client.get(f"{self._gemini_url}/models", timeout=10.0)
-                    self._gemini_available = resp.status_code == 200
-                except Exception as e:
-                    logger.warning(f"Gemini API 연결 실패: {e}")
-                    self._gemini_available = False
-        return self._gemini_available
+            return False
+        if self._gemini_available is None:
+            self._gemini_available = self._record_probe(
+                PROVIDER_GEMINI, self._get_pool().run(self._aprobe_gemini()),
+            )
+        return self._provider_ready(PROVIDER_GEMINI, self._gemini_available)
+
+    @staticmethod
+    def _record_outcome(breaker: CircuitBreaker, error: Optional[BaseException]) -> None:
+        """호출 결과를 서킷 브레이커에 반영
+
+        연결 오류/타임아웃/5xx/응답 형식 오류만 장애로 집계합니다.
+        429·4xx 는 서버가 응답한 것이므로 정상, 일일 한도 소진은 판정 없음.
+        """
+        if error is None:
+            breaker.record_success()
+        elif isinstance(error, DailyQuotaExceeded):
+            breaker.release()
+        elif (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code < 500
+            and error.response.status_code != 408
+        ):
+            breaker.record_success()
+        else:
+            breaker.record_failure(error)
+
+    def _gemini_headers(self) -> dict:
+        return {"Authorization": f"Bearer {self._gemini_api_key}"}
 
     # 알러지/면역학 도메인 시스템 프롬프트 (Phase 1.G-008 폴백)
     # 1차: DomainPack 의 prompts.system 슬롯 (domains/allergy/prompts/system.md).
@@ -172,14 +248,9 @@ class OllamaService:
         """SYSTEM_PROMPT 를 동적으로 해석 — DomainPack 우선, fallback 보존."""
         return self._resolve_prompt("system", self._SYSTEM_PROMPT_FALLBACK)
 
-    def _chat_gemini(self, prompt: str, max_tokens: int = 500) -> Optional[str]:
-        """Gemini API 호출 (OpenAI 호환)"""
-        if not self.is_gemini_available:
-            return None
-
-        client = self._get_gemini_client()
-        payload = {
-            "model": self._gemini_model,
+    def _chat_payload(self, model: str, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": model,
             "messages": [
                 {"role": "system", "content": self.SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
@@ -188,95 +259,333 @@ class OllamaService:
             "max_tokens": max_tokens,
         }
 
+    @staticmethod
+    def _retry_after(resp: httpx.Response, default: float = 5.0) -> float:
+        """429 응답의 Retry-After(초) — 없거나 형식 오류면 default"""
         try:
-            resp = client.post(
-                f"{self._gemini_url}/chat/completions",
-                json=payload,
-                timeout=60.0,
+            return max(float(resp.headers.get("retry-after", default)), 0.0)
+        except ValueError:
+            return default
+
+    async def _achat_gemini(self, prompt: str, max_tokens: int = 500) -> Optional[str]:
+        """Gemini API 호출 (OpenAI 호환, 풀 이벤트 루프에서 실행)
+
+        429 응답이면 Retry-After 만큼 Gemini 토큰 버킷 전체를 보류한 뒤 1회 재시도합니다.
+        일일 한도(RPD) 소진 시 호출하지 않고 None 을 반환합니다 (로컬 Fallback).
+        """
+        if not await self._ais_gemini_available():
+            return None
+
+        pool = self._get_pool()
+        breaker = pool.breaker(PROVIDER_GEMINI)
+        if not breaker.allow_request():
+            return None
+        payload = self._chat_payload(self._gemini_model, prompt, max_tokens)
+
+        async def post() -> httpx.Response:
+            resp = await pool.request(
+                PROVIDER_GEMINI, "POST", f"{self._gemini_url}/chat/completions",
+                headers=self._gemini_headers(), json=payload, timeout=60.0,
             )
             resp.raise_for_status()
-            data = resp.json()
-            return data["choices"][0]["message"]["content"].strip()
+            return resp
+
+        async def complete() -> str:
+            resp = await post()
+            content = resp.json()["choices"][0]["message"]["content"].strip()
+            self._record_outcome(breaker, None)
+            self._gemini_available = True
+            return content
+
+        try:
+            return await complete()
+        except DailyQuotaExceeded as e:
+            self._record_outcome(breaker, e)
+            logger.warning(f"Gemini {e}. 로컬 LLM으로 Fallback합니다.")
         except httpx.HTTPStatusError as e:
+            self._record_outcome(breaker, e)
             if e.response.status_code == 429:
-                logger.warning("Gemini Rate Limit 초과. 5초 대기 후 재시도합니다.")
-                time.sleep(5)
-                try:
-                    resp = client.post(
-                        f"{self._gemini_url}/chat/completions",
-                        json=payload,
-                        timeout=60.0,
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-                    return data["choices"][0]["message"]["content"].strip()
-                except Exception as retry_err:
-                    logger.warning(f"Gemini 재시도 실패: {retry_err}")
+                delay = self._retry_after(e.response)
+                logger.warning(f"Gemini Rate Limit 초과. {delay:.0f}초 보류 후 재시도합니다.")
+                pool.limiter(PROVIDER_GEMINI).bucket.penalize(delay)
+                if breaker.allow_request():
+                    try:
+                        return await complete()
+                    except Exception as retry_err:
+                        self._record_outcome(breaker, retry_err)
+                        logger.warning(f"Gemini 재시도 실패: {retry_err}")
             else:
                 logger.warning(f"Gemini API 오류: {e}")
         except Exception as e:
+            self._record_outcome(breaker, e)
             logger.warning(f"Gemini 호출 실패: {e}")
-            self._gemini_available = False
 
         return None
 
-    def _chat_local(self, prompt: str, max_tokens: int = 500, max_retries: int = 2) -> Optional[str]:
-        """로컬 LLM chat/completions 호출"""
-        if not self.is_available:
+    async def _achat_local(self, prompt: str, max_tokens: int = 500, max_retries: int = 2) -> Optional[str]:
+        """로컬 LLM chat/completions 호출 (풀 이벤트 루프에서 실행)"""
+        if not await self._ais_available():
             return None
 
-        client = self._get_client()
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.3,
-            "max_tokens": max_tokens,
-        }
+        pool = self._get_pool()
+        breaker = pool.breaker(PROVIDER_LOCAL)
+        payload = self._chat_payload(self.model, prompt, max_tokens)
 
         for attempt in range(max_retries):
+            if not breaker.allow_request():
+                break
             try:
-                resp = client.post(
-                    f"{self.api_url}/chat/completions",
-                    json=payload,
-                    timeout=120.0,
+                resp = await pool.request(
+                    PROVIDER_LOCAL, "POST", f"{self.api_url}/chat/completions",
+                    json=payload, timeout=120.0,
                 )
                 resp.raise_for_status()
                 data = resp.json()
-                return data["choices"][0]["message"]["content"].strip()
+                content = data["choices"][0]["message"]["content"].strip()
+                self._record_outcome(breaker, None)
+                self._available = True
+                return content
             except Exception as e:
+                self._record_outcome(breaker, e)
                 logger.warning(f"로컬 LLM 호출 실패 (시도 {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    self._available = False
 
         return None
 
-    def _chat(self, prompt: str, max_tokens: int = 500, max_retries: int = 2, provider: str = "news") -> Optional[str]:
+    def _uses_gemini(self, provider: str) -> bool:
+        """용도별 프로바이더 결정 (provider == "local"이면 항상 로컬)"""
+        if provider == "news":
+            return self._news_provider == "gemini"
+        if provider == "rag":
+            return self._rag_provider == "gemini"
+        return False
+
+    async def _achat(
+        self, prompt: str, max_tokens: int = 500, max_retries: int = 2, provider: str = "news",
+    ) -> Optional[str]:
+        """용도별 LLM 호출 코루틴 (Gemini 우선 → 로컬 Fallback)"""
+        if self._uses_gemini(provider):
+            result = await self._achat_gemini(prompt, max_tokens)
+            if result:
+                return result
+            logger.info("Gemini 응답 실패. 로컬 LLM으로 Fallback합니다.")
+
+        return await self._achat_local(prompt, max_tokens, max_retries)
+
+    def _chat_gemini(self, prompt: str, max_tokens: int = 500) -> Optional[str]:
+        """Gemini API 호출 (동기 래퍼)"""
+        return self._get_pool().run(self._achat_gemini(prompt, max_tokens))
+
+    def _chat_local(self, prompt: str, max_tokens: int = 500, max_retries: int = 2) -> Optional[str]:
+        """로컬 LLM 호출 (동기 래퍼)"""
+        return self._get_pool().run(self._achat_local(prompt, max_tokens, max_retries))
+
+    # 응답 캐시 대상 작업별 프롬프트 버전 — 템플릿/파서 의미가 바뀌면 올려서 기존 캐시 무효화
+    _PROMPT_VERSIONS = {
+        "analyze_article": "1",
+        "extract_allergens": "1",
+        "extract_treatments": "1",
+        "extract_epidemiology": "1",
+        "clinical_implication": "1",
+        "translate": "1",
+    }
+
+    def _model_chain(self, provider: str) -> str:
+        """용도별 호출 모델 체인 (캐시 키용)"""
+        if self._uses_gemini(provider):
+            return f"{self._gemini_model}>{self.model}"
+        return self.model
+
+    def _cache_key(self, cache_task: str, prompt: str, max_tokens: int, provider: str) -> str:
+        return make_llm_cache_key(
+            cache_task,
+            self._PROMPT_VERSIONS.get(cache_task, "1"),
+            self._model_chain(provider),
+            prompt,
+            system_prompt=self.SYSTEM_PROMPT,
+            max_tokens=max_tokens,
+        )
+
+    def _chat(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        max_retries: int = 2,
+        provider: str = "news",
+        cache_task: Optional[str] = None,
+    ) -> Optional[str]:
         """용도별 LLM 호출 (Gemini 우선 → 로컬 Fallback)
 
+        풀 이벤트 루프에서 _achat() 을 실행하는 동기 래퍼입니다.
+        여러 스레드에서 동시에 호출해도 프로바이더별 동시성/속도 한도를 공유합니다.
+
         Args:
             prompt: 프롬프트
             max_tokens: 최대 토큰 수
             max_retries: 로컬 LLM 재시도 횟수
             provider: 용도 ("news" | "rag" | "local")
+            cache_task: 결정적 작업명 — 지정 시 응답 캐시 조회/저장
         """
-        # 프로바이더 결정
-        use_gemini = False
-        if provider == "news":
-            use_gemini = self._news_provider == "gemini"
-        elif provider == "rag":
-            use_gemini = self._rag_provider == "gemini"
-        # provider == "local"이면 항상 로컬 사용
+        cache = get_llm_response_cache() if cache_task else None
+        if cache is not None:
+            key = self._cache_key(cache_task, prompt, max_tokens, provider)
+            cached = cache.get(key, cache_task)
+            if cached is not None:
+                return cached
 
-        if use_gemini:
-            result = self._chat_gemini(prompt, max_tokens)
-            if result:
-                return result
-            logger.info("Gemini 응답 실패. 로컬 LLM으로 Fallback합니다.")
+        result = self._get_pool().run(self._achat(prompt, max_tokens, max_retries, provider))
 
-        return self._chat_local(prompt, max_tokens, max_retries)
+        if cache is not None and result:
+            cache.put(key, cache_task, self._model_chain(provider), result)
+        return result
+
+    def _chat_many(
+        self,
+        prompts: list[str],
+        max_tokens: int = 500,
+        provider: str = "news",
+        cache_task: Optional[str] = None,
+    ) -> list[Optional[str]]:
+        """여러 프롬프트 동시 호출 (순서 보존, 프로바이더 한도 안에서 병렬)
+
+        cache_task 지정 시 캐시 히트는 LLM 호출 없이 채우고 미스만 호출합니다.
+        """
+        if not prompts:
+            return []
+
+        results: list[Optional[str]] = [None] * len(prompts)
+        cache = get_llm_response_cache() if cache_task else None
+        keys: list[Optional[str]] = [None] * len(prompts)
+        pending = []
+        for i, prompt in enumerate(prompts):
+            if cache is not None:
+                keys[i] = self._cache_key(cache_task, prompt, max_tokens, provider)
+                results[i] = cache.get(keys[i], cache_task)
+            if results[i] is None:
+                pending.append(i)
+
+        async def gather() -> list:
+            return await asyncio.gather(
+                *(self._achat(prompts[i], max_tokens, provider=provider) for i in pending),
+                return_exceptions=True,
+            )
+
+        if pending:
+            model = self._model_chain(provider)
+            for i, result in zip(pending, self._get_pool().run(gather())):
+                if isinstance(result, BaseException):
+                    continue
+                results[i] = result
+                if cache is not None and result:
+                    cache.put(keys[i], cache_task, model, result)
+        return results
+
+    @staticmethod
+    def _iter_sse_deltas(lines: Iterable[str]) -> Iterator[str]:
+        """OpenAI 호환 스트리밍 응답(SSE) 줄에서 content 델타만 추출"""
+        for line in lines:
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            try:
+                chunk = json.loads(data)
+                delta = chunk["choices"][0].get("delta") or {}
+            except (ValueError, KeyError, IndexError):
+                continue
+            content = delta.get("content")
+            if content:
+                yield content
+
+    def _stream_completion(
+        self,
+        provider: str,
+        url: str,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        timeout: float,
+        headers: Optional[dict] = None,
+    ) -> Iterator[str]:
+        """chat/completions 스트리밍 호출 (stream=True, 풀의 동시성/속도 한도 적용)"""
+        payload = {**self._chat_payload(model, prompt, max_tokens), "stream": True}
+        pool = self._get_pool()
+        lines = pool.iterate(pool.stream_lines(
+            provider, "POST", f"{url}/chat/completions",
+            headers=headers, json=payload, timeout=timeout,
+        ))
+        try:
+            yield from self._iter_sse_deltas(lines)
+        finally:
+            lines.close()
+
+    def _stream_gemini(self, prompt: str, max_tokens: int = 500) -> Iterator[str]:
+        """Gemini API 스트리밍 호출 (OpenAI 호환)"""
+        if not self.is_gemini_available:
+            return
+        yield from self._stream_completion(
+            PROVIDER_GEMINI, self._gemini_url, self._gemini_model,
+            prompt, max_tokens, timeout=60.0, headers=self._gemini_headers(),
+        )
+
+    def _stream_local(self, prompt: str, max_tokens: int = 500) -> Iterator[str]:
+        """로컬 LLM 스트리밍 호출"""
+        if not self.is_available:
+            return
+        yield from self._stream_completion(
+            PROVIDER_LOCAL, self.api_url, self.model,
+            prompt, max_tokens, timeout=120.0,
+        )
+
+    def _chat_stream(self, prompt: str, max_tokens: int = 500, provider: str = "news") -> Iterator[str]:
+        """용도별 LLM 스트리밍 호출 (Gemini 우선 → 로컬 Fallback)
+
+        첫 토큰을 받기 전에 실패하면 다음 프로바이더로 넘어가고,
+        토큰 전송 중 끊기면 그때까지의 응답으로 종료합니다.
+
+        Args:
+            prompt: 프롬프트
+            max_tokens: 최대 토큰 수
+            provider: 용도 ("news" | "rag" | "local")
+
+        Yields:
+            응답 텍스트 조각
+        """
+        backends = []
+        if self._uses_gemini(provider):
+            backends.append(("Gemini", PROVIDER_GEMINI, self._stream_gemini))
+        backends.append(("로컬 LLM", PROVIDER_LOCAL, self._stream_local))
+
+        pool = self._get_pool()
+        for name, key, stream in backends:
+            breaker = pool.breaker(key)
+            if not breaker.allow_request():
+                logger.info(f"{name} 서킷 OPEN. 다음 프로바이더로 Fallback합니다.")
+                continue
+            started = False
+            recorded = False
+            try:
+                for delta in stream(prompt, max_tokens):
+                    started = True
+                    yield delta
+            except Exception as e:
+                self._record_outcome(breaker, e)
+                recorded = True
+                logger.warning(f"{name} 스트리밍 실패: {e}")
+                if started:
+                    return
+                continue
+            finally:
+                # 정상 종료: 토큰을 받았으면 성공, 아니면(미가용 등) 판정 없이 슬롯 반환.
+                # 소비자가 중간에 스트림을 닫은 경우도 여기서 정리된다.
+                if not recorded:
+                    if started:
+                        self._record_outcome(breaker, None)
+                    else:
+                        breaker.release()
+            if started:
+                return
+            logger.info(f"{name} 스트리밍 응답 없음. 다음 프로바이더로 Fallback합니다.")
 
     def _chat_long(self, prompt: str, provider: str = "news") -> Optional[str]:
         """긴 응답용 호출 (max_tokens 확장)"""
@@ -407,8 +716,162 @@ class OllamaService:
         관련성/요약/중요도/카테고리를 단일 프롬프트로 한 번에 분석합니다.
         통합 호출 실패 시 개별 메서드 Fallback으로 전환합니다.
         """
+        result = self._chat(
+            self._analysis_prompt(title, description),
+            max_tokens=500, provider="news", cache_task="analyze_article",
+        )
+        return self._analysis_result(result, title, description)
+
+    # 배치 분석 항목당 예상 출력 토큰 (점수 2개 + 카테고리 + 2-3문장 요약)
+    _ANALYSIS_OUTPUT_TOKENS = 250
+
+    def analyze_articles(self, articles: list[tuple[str, str]]) -> list[dict]:
+        """여러 기사 배치 분석 — N건을 JSON 배열 프롬프트 하나로 묶어 호출
+
+        1. 항목별 캐시 히트는 LLM 호출 없이 사용
+        2. 미스는 컨텍스트 창에 맞춘 배치로 묶어 동시 호출
+        3. 배치 응답에서 누락/파싱 실패한 항목만 단건 analyze 로 재시도
+
+        Args:
+            articles: [(title, description)]
+
+        Returns:
+            입력 순서와 같은 analyze_article() 결과 리스트
+        """
+        if not articles:
+            return []
+
+        cache = get_llm_response_cache()
+        singles = [self._analysis_prompt(title, description) for title, description in articles]
+        keys = [self._cache_key("analyze_article", p, 500, "news") for p in singles]
+
+        results: list[Optional[dict]] = [None] * len(articles)
+        pending = []
+        for i, key in enumerate(keys):
+            cached = cache.get(key, "analyze_article") if cache is not None else None
+            parsed = self._parse_analysis_response(cached) if cached else None
+            if parsed:
+                results[i] = parsed
+            else:
+                pending.append(i)
+
+        if len(pending) > 1:
+            backend = self._batch_backend("news")
+            texts = [f"{articles[i][0]}\n{articles[i][1] or ''}" for i in pending]
+            output_tokens = lambda text: self._ANALYSIS_OUTPUT_TOKENS  # noqa: E731
+            batches = [
+                [pending[j] for j in batch]
+                for batch in plan_batches(texts, backend, output_tokens)
+            ]
+            multi = [batch for batch in batches if len(batch) > 1]
+            responses = self._chat_many(
+                [self._batch_analysis_prompt([articles[i] for i in batch]) for batch in multi],
+                max_tokens=max(
+                    (batch_max_tokens(backend, [""] * len(b), output_tokens) for b in multi),
+                    default=500,
+                ),
+                provider="news",
+            )
+            model = self._model_chain("news")
+            for batch, response in zip(multi, responses):
+                items = parse_json_items(response or "")
+                for pos, i in enumerate(batch, 1):
+                    parsed = self._batch_analysis_item(items.get(pos))
+                    if parsed is None:
+                        continue
+                    results[i] = parsed
+                    if cache is not None:
+                        cache.put(keys[i], "analyze_article", model, self._format_analysis(parsed))
+            logger.info(
+                f"배치 분석: {len(pending)}건 → {len(multi)}회 호출 "
+                f"(누락 {sum(1 for i in pending if results[i] is None)}건 단건 재시도)"
+            )
+
+        # 단건 처리: 배치 대상이 1건이거나 배치 응답에서 누락된 항목
+        retry = [i for i in pending if results[i] is None]
+        if retry:
+            responses = self._chat_many(
+                [singles[i] for i in retry], max_tokens=500, provider="news",
+                cache_task="analyze_article",
+            )
+            for i, response in zip(retry, responses):
+                results[i] = self._analysis_result(response, *articles[i])
+
+        return results
+
+    def _batch_backend(self, provider: str) -> str:
+        """배치 크기 산정에 쓸 실제 호출 프로바이더"""
+        if self._uses_gemini(provider) and self.is_gemini_available:
+            return PROVIDER_GEMINI
+        return PROVIDER_LOCAL
+
+    def _batch_analysis_prompt(self, articles: list[tuple[str, str]]) -> str:
+        """다건 통합 분석 프롬프트 (JSON 배열 출력)"""
         categories = ", ".join([c.value for c in NewsCategoryType])
-        prompt = (
+        blocks = "\n\n".join(
+            f"[{i}]\n제목: {title}\n내용: {description or '(내용 없음)'}"
+            for i, (title, description) in enumerate(articles, 1)
+        )
+        return (
+            f"다음 {len(articles)}개 뉴스 기사를 각각 분석하세요.\n\n"
+            "=== 분석 항목 ===\n"
+            "- relevance: 알러지/체외진단(IVD)/면역학/진단키트 산업과의 관련성 (0.0~1.0 숫자)\n"
+            "  1.0 직접 관련 (알러지 진단, IVD 제품, 면역치료) / "
+            "0.5 간접 관련 (체외진단 기업의 일반 사업 뉴스) / "
+            "0.0 무관 (주식 투자분석, 일반 경제뉴스)\n"
+            "- summary: 한국어 2-3문장 요약 (핵심 내용만 간결하게)\n"
+            "- importance: 체외진단/알러지 산업 중요도 (0.0~1.0 숫자). "
+            "규제 변화, 신제품, M&A, 큰 투자 → 높은 점수 / 일반 홍보/이벤트 → 낮은 점수\n"
+            f"- category: 다음 중 하나 → {categories}\n\n"
+            f"=== 기사 ===\n{blocks}\n\n"
+            "=== 응답 형식 ===\n"
+            "기사마다 객체 하나씩, 기사 번호를 id 로 하는 JSON 배열만 출력하세요.\n"
+            '[{"id": 1, "relevance": 0.8, "summary": "요약", "importance": 0.6, "category": "market"}]'
+        )
+
+    def _batch_analysis_item(self, item: Optional[dict]) -> Optional[dict]:
+        """배치 응답 항목 → analyze_article() 결과 형식 (필수 필드 누락 시 None)"""
+        if not item:
+            return None
+        try:
+            relevance = max(0.0, min(1.0, float(item["relevance"])))
+            summary = str(item["summary"]).strip()
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not summary:
+            return None
+
+        try:
+            importance = max(0.0, min(1.0, float(item.get("importance", 0.3))))
+        except (TypeError, ValueError):
+            importance = 0.3
+        category = "general"
+        cat_val = str(item.get("category") or "").lower()
+        for cat in NewsCategoryType:
+            if cat.value in cat_val:
+                category = cat.value
+                break
+        return {
+            "relevance_score": relevance,
+            "summary": summary,
+            "importance_score": importance,
+            "category": category,
+        }
+
+    @staticmethod
+    def _format_analysis(result: dict) -> str:
+        """분석 결과 → 단건 응답 형식 (단건 캐시 키에 저장해 analyze_article 과 공유)"""
+        return (
+            f"RELEVANCE: {result['relevance_score']}\n"
+            f"SUMMARY: {result['summary']}\n"
+            f"IMPORTANCE: {result['importance_score']}\n"
+            f"CATEGORY: {result['category']}"
+        )
+
+    def _analysis_prompt(self, title: str, description: str) -> str:
+        """통합 분석 프롬프트"""
+        categories = ", ".join([c.value for c in NewsCategoryType])
+        return (
             "다음 뉴스 기사를 분석하여 아래 4개 항목을 정확히 답하세요.\n"
             "각 항목을 한 줄씩, 라벨과 값만 출력하세요. 다른 설명은 불필요합니다.\n\n"
             f"제목: {title}\n"
@@ -430,7 +893,8 @@ class OllamaService:
             "CATEGORY: (카테고리명)"
         )
 
-        result = self._chat(prompt, max_tokens=500, provider="news")
+    def _analysis_result(self, result: Optional[str], title: str, description: str) -> dict:
+        """통합 분석 응답 → 결과 dict (파싱 실패 시 키워드 Fallback)"""
         if result:
             parsed = self._parse_analysis_response(result)
             if parsed:
@@ -521,7 +985,7 @@ class OllamaService:
             '응답 형식(JSON만): [{"allergen": "peanut", "category": "treatment", "relevance": 0.8}]'
         )
 
-        result = self._chat(prompt, provider="local")
+        result = self._chat(prompt, provider="local", cache_task="extract_allergens")
         if result:
             try:
                 import json
@@ -607,7 +1071,7 @@ class OllamaService:
             '"confidence": 0.0~1.0, "source_text": "근거가 된 초록 문장"}]'
         )
 
-        result = self._chat(prompt, provider="local")
+        result = self._chat(prompt, provider="local", cache_task="extract_treatments")
         if result:
             try:
                 import json
@@ -712,7 +1176,7 @@ class OllamaService:
         prompt = template.format(title=title, abstract=abstract[:3000])
 
         try:
-            raw = self._chat(prompt, max_tokens=200, provider="news")
+            raw = self._chat(prompt, max_tokens=200, provider="news", cache_task="clinical_implication")
         except Exception as e:
             logger.warning(f"clinical_implication LLM 호출 실패: {e}")
             return None
@@ -768,7 +1232,7 @@ class OllamaService:
             '"confidence": 0.0~1.0, "source_text": "근거 문장"}]'
         )
 
-        result = self._chat(prompt, provider="local")
+        result = self._chat(prompt, provider="local", cache_task="extract_epidemiology")
         if result:
             try:
                 import json
@@ -909,14 +1373,105 @@ class OllamaService:
 
         return min(1.0, score)
 
+    # --- 한국어 번역 ---
+
+    @staticmethod
+    def _translate_prompt(text: str) -> str:
+        return (
+            "Translate the following English text into natural Korean. "
+            "Output ONLY the translation, nothing else.\n\n"
+            f"{text}\n\n"
+            "한국어 번역:"
+        )
+
+    @staticmethod
+    def _translate_output_tokens(text: str) -> int:
+        # 한국어 출력은 같은 내용의 영문보다 토큰을 더 씀
+        return estimate_tokens(text) * 2 + 20
+
+    def translate(self, text: str) -> Optional[str]:
+        """영문 → 한국어 단건 번역 (로컬 LLM)"""
+        return self._chat(self._translate_prompt(text), provider="local", cache_task="translate")
+
+    def translate_many(self, texts: list[str]) -> list[Optional[str]]:
+        """영문 → 한국어 배치 번역 (로컬 LLM)
+
+        항목별 캐시 확인 후, 미스만 컨텍스트 창에 맞춘 JSON 배열 프롬프트로 묶어 호출합니다.
+        배치 응답에서 누락/파싱 실패한 항목은 단건 번역으로 재시도합니다.
+        """
+        if not texts:
+            return []
+
+        cache = get_llm_response_cache()
+        keys = [self._cache_key("translate", self._translate_prompt(t), 500, "local") for t in texts]
+        results: list[Optional[str]] = [None] * len(texts)
+        pending = []
+        for i, (text, key) in enumerate(zip(texts, keys)):
+            if not text:
+                continue
+            results[i] = cache.get(key, "translate") if cache is not None else None
+            if results[i] is None:
+                pending.append(i)
+
+        if len(pending) > 1:
+            batches = [
+                [pending[j] for j in batch]
+                for batch in plan_batches(
+                    [texts[i] for i in pending], PROVIDER_LOCAL, self._translate_output_tokens,
+                )
+            ]
+            multi = [batch for batch in batches if len(batch) > 1]
+            responses = self._chat_many(
+                [self._batch_translate_prompt([texts[i] for i in batch]) for batch in multi],
+                max_tokens=max(
+                    (
+                        batch_max_tokens(
+                            PROVIDER_LOCAL, [texts[i] for i in b], self._translate_output_tokens,
+                        )
+                        for b in multi
+                    ),
+                    default=500,
+                ),
+                provider="local",
+            )
+            for batch, response in zip(multi, responses):
+                items = parse_json_items(response or "")
+                for pos, i in enumerate(batch, 1):
+                    translated = str((items.get(pos) or {}).get("ko") or "").strip()
+                    if not translated:
+                        continue
+                    results[i] = translated
+                    if cache is not None:
+                        cache.put(keys[i], "translate", self._model_chain("local"), translated)
+            logger.info(f"배치 번역: {len(pending)}건 → {len(multi)}회 호출")
+
+        retry = [i for i in pending if results[i] is None]
+        if retry:
+            responses = self._chat_many(
+                [self._translate_prompt(texts[i]) for i in retry],
+                provider="local", cache_task="translate",
+            )
+            for i, response in zip(retry, responses):
+                results[i] = response
+
+        return results
+
+    @staticmethod
+    def _batch_translate_prompt(texts: list[str]) -> str:
+        """다건 번역 프롬프트 (JSON 배열 출력)"""
+        blocks = "\n\n".join(f"[{i}]\n{text}" for i, text in enumerate(texts, 1))
+        return (
+            f"Translate each of the following {len(texts)} English texts into natural Korean.\n"
+            "Return ONLY a JSON array with one object per text, using the text number as id. "
+            "Escape quotes and newlines inside strings.\n"
+            '[{"id": 1, "ko": "한국어 번역"}]\n\n'
+            f"=== Texts ===\n{blocks}"
+        )
+
     def close(self):
-        """리소스 정리"""
-        if self._client:
-            self._client.close()
-            self._client = None
-        if self._gemini_client:
-            self._gemini_client.close()
-            self._gemini_client = None
+        """리소스 정리 — HTTP 클라이언트는 LLMClientPool 소유이므로 헬스 체크 결과만 초기화"""
+        self._available = None
+        self._gemini_available = None
 
 
 # 싱글톤
@@ -947,12 +1502,16 @@ def ollama_translate(text: str) -> Optional[str]:
     Returns:
         한국어 번역문 또는 None (실패 시)
     """
-    service = get_ollama_service()
+    return get_ollama_service().translate(text)
 
-    prompt = (
-        "Translate the following English text into natural Korean. "
-        "Output ONLY the translation, nothing else.\n\n"
-        f"{text}\n\n"
-        "한국어 번역:"
-    )
-    return service._chat(prompt, provider="local")
+
+def ollama_translate_many(texts: list[str]) -> list[Optional[str]]:
+    """여러 영문 텍스트를 배치 프롬프트로 한국어 번역 (스케줄러 korean_translation Job에서 사용)
+
+    Args:
+        texts: 번역할 영문 텍스트 리스트
+
+    Returns:
+        입력 순서와 같은 한국어 번역문 리스트 (실패 항목은 None)
+    """
+    return get_ollama_service().translate_many(texts)
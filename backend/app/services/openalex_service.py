@@ -14,6 +14,7 @@ from datetime import datetime
 import httpx
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +33,15 @@ class OpenAlexService:
         "hypersensitivity": "C2779134260",
     }
 
+    _SELECT_FIELDS = (
+        "id,doi,title,authorships,publication_year,"
+        "primary_location,cited_by_count,abstract_inverted_index,"
+        "keywords,open_access,concepts"
+    )
+
     def __init__(self, email: Optional[str] = None):
         self._client: Optional[httpx.Client] = None
+        self._async_http = AsyncHttpClient(timeout=30.0)
         # polite pool: 이메일 제공 시 rate limit 완화
         self.email = email
 
@@ -61,31 +69,56 @@ class OpenAlexService:
 
         papers = []
         try:
-            params = {
-                "search": query,
-                "per_page": min(max_results, 50),
-                "sort": "relevance_score:desc",
-                "select": "id,doi,title,authorships,publication_year,"
-                          "primary_location,cited_by_count,abstract_inverted_index,"
-                          "keywords,open_access,concepts",
-            }
-            if self.email:
-                params["mailto"] = self.email
-
-            resp = client.get(f"{self.BASE_URL}/works", params=params)
+            resp = client.get(f"{self.BASE_URL}/works", params=self._search_params(query, max_results))
             resp.raise_for_status()
-            data = resp.json()
+            papers = self._parse_results(resp.json())
+        except Exception as e:
+            logger.error(f"OpenAlex 검색 실패: {e}")
 
-            for item in data.get("results", []):
-                paper = self._parse_result(item)
-                if paper:
-                    papers.append(paper)
+        return self._search_result(papers, query, start_time)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전"""
+        start_time = time.time()
 
+        papers = []
+        try:
+            resp = await self._async_http.get(
+                f"{self.BASE_URL}/works", params=self._search_params(query, max_results),
+            )
+            resp.raise_for_status()
+            papers = self._parse_results(resp.json())
         except Exception as e:
             logger.error(f"OpenAlex 검색 실패: {e}")
 
-        elapsed = (time.time() - start_time) * 1000
+        return self._search_result(papers, query, start_time)
 
+    def _search_params(self, query: str, max_results: int) -> dict:
+        params = {
+            "search": query,
+            "per_page": min(max_results, 50),
+            "sort": "relevance_score:desc",
+            "select": self._SELECT_FIELDS,
+        }
+        if self.email:
+            params["mailto"] = self.email
+        return params
+
+    def _parse_results(self, data: dict) -> list[Paper]:
+        papers = []
+        for item in data.get("results", []):
+            paper = self._parse_result(item)
+            if paper:
+                papers.append(paper)
+        return papers
+
+    @staticmethod
+    def _search_result(papers: list[Paper], query: str, start_time: float) -> PaperSearchResult:
+        elapsed = (time.time() - start_time) * 1000
         return PaperSearchResult(
             papers=papers,
             total_count=len(papers),
@@ -108,6 +141,14 @@ class OpenAlexService:
         query = f"{allergen} allergy"
         return self.search(query, max_results=max_results)
 
+    async def search_allergy_async(
+        self,
+        allergen: str,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search_allergy() 의 비동기 버전"""
+        return await self.search_async(f"{allergen} allergy", max_results=max_results)
+
     def search_by_concept(
         self,
         concept_id: str,
@@ -128,21 +169,14 @@ class OpenAlexService:
                 "filter": f"concepts.id:https://openalex.org/{concept_id}",
                 "per_page": min(max_results, 50),
                 "sort": "cited_by_count:desc",
-                "select": "id,doi,title,authorships,publication_year,"
-                          "primary_location,cited_by_count,abstract_inverted_index,"
-                          "keywords,open_access,concepts",
+                "select": self._SELECT_FIELDS,
             }
             if self.email:
                 params["mailto"] = self.email
 
             resp = client.get(f"{self.BASE_URL}/works", params=params)
             resp.raise_for_status()
-            data = resp.json()
-
-            for item in data.get("results", []):
-                paper = self._parse_result(item)
-                if paper:
-                    papers.append(paper)
+            papers = self._parse_results(resp.json())
 
         except Exception as e:
             logger.error(f"OpenAlex Concept 검색 실패: {e}")
@@ -248,3 +282,7 @@ class OpenAlexService:
         if self._client:
             self._client.close()
             self._client = None
+
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
@@ -0,0 +1,246 @@
+"""논문 알러젠 링크 백필 — 스트리밍 + 프로세스 풀 추출 + 체크포인트 커밋
+
+키워드 사전이 바뀐 뒤 전체 논문의 PaperAllergenLink 를 다시 만드는 작업입니다.
+
+    1. papers 를 id 순으로 yield_per 스트리밍 (읽기 전용 세션)
+    2. chunk_size 단위로 ProcessPoolExecutor 에 추출 분산 (동시 작업 수 제한)
+    3. commit_every 건마다 쓰기 세션에서 링크 배치 INSERT → 커밋 → 체크포인트 저장
+
+체크포인트(JSON 파일)에는 마지막으로 커밋된 paper_id 가 기록되어, 중단 후 다시
+실행하면 그 다음 논문부터 이어서 처리합니다. 배치는 멱등이라(replace 면 자동 추출
+링크를 지우고 다시 쓰고, 아니면 이미 있는 링크를 건너뜀) 커밋 직후 중단되어
+같은 배치를 다시 처리해도 중복 링크가 생기지 않습니다.
+
+읽기 스트림이 열린 채로 쓰기 세션이 커밋하므로, SQLite 에서는 WAL 모드가 필요합니다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ..database.models import Paper, PaperAllergenLink
+from .paper_link_extractor import extract_links_chunk
+
+logger = logging.getLogger(__name__)
+
+AUTO_NOTE_PREFIX = "Auto-extracted: "
+
+
+@dataclass
+class BackfillStats:
+    """백필 진행 상황 (체크포인트 파일 내용과 동일)"""
+    last_paper_id: int = 0
+    papers: int = 0
+    links_added: int = 0
+    elapsed_s: float = 0.0
+    updated_at: Optional[str] = None
+
+    @property
+    def papers_per_sec(self) -> float:
+        return self.papers / self.elapsed_s if self.elapsed_s else 0.0
+
+
+class LinkBackfillCheckpoint:
+    """JSON 파일 체크포인트 (원자적 교체)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> BackfillStats:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return BackfillStats(**json.load(f))
+        except FileNotFoundError:
+            return BackfillStats()
+        except (ValueError, TypeError) as e:
+            logger.warning(f"체크포인트 파일을 읽을 수 없어 처음부터 시작합니다 ({self.path}): {e}")
+            return BackfillStats()
+
+    def save(self, stats: BackfillStats) -> None:
+        stats.updated_at = datetime.now().isoformat()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(stats), f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class PaperLinkBackfill:
+    """논문 링크 백필 실행기
+
+    Args:
+        session_factory: 세션 생성 함수 (읽기/쓰기 세션을 따로 엽니다)
+        workers: 추출 프로세스 수 (0 이면 현재 프로세스에서 추출)
+        chunk_size: 프로세스 풀 작업 1건당 논문 수 (yield_per 크기와 동일)
+        commit_every: 커밋(체크포인트) 1회당 논문 수
+        replace_existing: 기존 자동 추출 링크를 지우고 다시 생성
+        checkpoint: 체크포인트 (None 이면 이어하기 없이 처음부터)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        workers: int = 0,
+        chunk_size: int = 200,
+        commit_every: int = 2000,
+        replace_existing: bool = False,
+        checkpoint: Optional[LinkBackfillCheckpoint] = None,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.commit_every = max(commit_every, chunk_size)
+        self.replace_existing = replace_existing
+        self.checkpoint = checkpoint
+
+    # ───────── 입력 스트림 ─────────
+
+    def _iter_chunks(self, db: Session, after_id: int, limit: Optional[int]) -> Iterator[list[dict]]:
+        """id 순 논문 스트림 → chunk_size 단위 dict 목록"""
+        query = (
+            db.query(Paper.id, Paper.title, Paper.abstract, Paper.keywords)
+            .filter(Paper.id > after_id, Paper.abstract.isnot(None))
+            .order_by(Paper.id)
+            .yield_per(self.chunk_size)
+        )
+        if limit:
+            query = query.limit(limit)
+
+        chunk: list[dict] = []
+        for row in query:
+            chunk.append({
+                "id": row.id,
+                "title": row.title or "",
+                "abstract": row.abstract or "",
+                "keywords": row.keywords if isinstance(row.keywords, list) else None,
+            })
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _iter_results(self, chunks: Iterator[list[dict]]) -> Iterator[dict]:
+        """청크별 추출 결과를 입력 순서대로 반환 (프로세스 풀은 동시 작업 수 제한)"""
+        if self.workers <= 0:
+            for chunk in chunks:
+                yield extract_links_chunk(chunk)
+            return
+
+        max_pending = self.workers * 2
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(extract_links_chunk, chunk))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    # ───────── 기록 ─────────
+
+    def _write_batch(self, db: Session, results: dict) -> int:
+        """배치 1개 기록 (커밋은 호출자) — 추가된 링크 수 반환"""
+        paper_ids = list(results)
+        if self.replace_existing:
+            db.query(PaperAllergenLink).filter(
+                PaperAllergenLink.paper_id.in_(paper_ids),
+                PaperAllergenLink.note.like(f"{AUTO_NOTE_PREFIX}%"),
+            ).delete(synchronize_session=False)
+        existing: set[tuple] = set(
+            db.query(
+                PaperAllergenLink.paper_id,
+                PaperAllergenLink.allergen_code,
+                PaperAllergenLink.link_type,
+                PaperAllergenLink.specific_item,
+            ).filter(PaperAllergenLink.paper_id.in_(paper_ids))
+        )
+
+        rows = []
+        for paper_id, links in results.items():
+            for link in links:
+                key = (paper_id, link.allergen_code, link.link_type, link.specific_item)
+                if key in existing:
+                    continue
+                existing.add(key)
+                rows.append({
+                    "paper_id": paper_id,
+                    "allergen_code": link.allergen_code,
+                    "link_type": link.link_type,
+                    "specific_item": link.specific_item,
+                    "relevance_score": link.relevance_score,
+                    "note": f"{AUTO_NOTE_PREFIX}{link.matched_keyword}",
+                })
+        if rows:
+            db.execute(insert(PaperAllergenLink), rows)
+        return len(rows)
+
+    def _commit(self, results: dict, stats: BackfillStats, started: float, resumed_elapsed: float) -> None:
+        db = self.session_factory()
+        try:
+            stats.links_added += self._write_batch(db, results)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        stats.papers += len(results)
+        stats.last_paper_id = max(results)
+        stats.elapsed_s = resumed_elapsed + (time.monotonic() - started)
+        if self.checkpoint is not None:
+            self.checkpoint.save(stats)
+        logger.info(
+            f"링크 백필 진행: 논문 {stats.papers}건 (~id {stats.last_paper_id}), "
+            f"링크 +{stats.links_added}, {stats.papers_per_sec:.1f} papers/sec"
+        )
+
+    # ───────── 실행 ─────────
+
+    def run(self, limit: Optional[int] = None) -> BackfillStats:
+        """백필 실행 (체크포인트가 있으면 이어서)
+
+        Args:
+            limit: 이번 실행에서 처리할 최대 논문 수
+        """
+        stats = self.checkpoint.load() if self.checkpoint is not None else BackfillStats()
+        if stats.last_paper_id:
+            logger.info(f"체크포인트에서 이어서 시작: paper_id > {stats.last_paper_id}")
+        resumed_elapsed = stats.elapsed_s
+        started = time.monotonic()
+
+        reader = self.session_factory()
+        try:
+            batch: dict = {}
+            for chunk_result in self._iter_results(
+                self._iter_chunks(reader, stats.last_paper_id, limit)
+            ):
+                batch.update(chunk_result)
+                if len(batch) >= self.commit_every:
+                    self._commit(batch, stats, started, resumed_elapsed)
+                    batch = {}
+            if batch:
+                self._commit(batch, stats, started, resumed_elapsed)
+        finally:
+            reader.close()
+
+        stats.elapsed_s = resumed_elapsed + (time.monotonic() - started)
+        logger.info(
+            f"링크 백필 완료: 논문 {stats.papers}건, 링크 +{stats.links_added}, "
+            f"{stats.elapsed_s:.1f}s ({stats.papers_per_sec:.1f} papers/sec)"
+        )
+        return stats
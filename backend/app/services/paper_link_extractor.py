@@ -2,6 +2,10 @@
 
 논문 Abstract와 Title에서 키워드를 분석하여
 PaperAllergenLink의 specific_item을 자동 추출합니다.
+
+알러젠/증상/회피식품/대체식품/환경관리/논문타입 사전을 하나의 단어 단위
+Aho–Corasick 오토마톤(utils.keyword_automaton)으로 합쳐, 논문당 텍스트를
+한 번만 훑습니다 (단어 경계 일치, 마지막 단어 복수형 허용).
 """
 import re
 from typing import List, Dict, Optional, Tuple
@@ -15,6 +19,7 @@ from ..data.paper_keywords import (
     MANAGEMENT_KEYWORDS,
     PAPER_TYPE_KEYWORDS,
 )
+from ..utils.keyword_automaton import KeywordAutomaton, tokenize
 
 
 @dataclass
@@ -51,6 +56,12 @@ class PaperLinkExtractor:
         "bee_venom": ["bee venom", "hymenoptera", "api m"],
     }
 
+    # 이 위치 안에서 일치하면 (제목 또는 초록 앞부분) 관련도 가산
+    LEAD_WINDOW = 200
+
+    # 교차반응 관련 문구 (어간 일치라 오토마톤 대신 정규식)
+    CROSS_PATTERN = re.compile(r"cross[- ]?react|cross[- ]?sensitiz|co[- ]?sensitiz|cross[- ]?allerg")
+
     def __init__(self):
         # 키워드를 소문자로 정규화
         self._symptom_keywords = {k.lower(): v for k, v in SYMPTOM_KEYWORDS.items()}
@@ -59,6 +70,56 @@ class PaperLinkExtractor:
         self._management_keywords = {k.lower(): v for k, v in MANAGEMENT_KEYWORDS.items()}
         self._paper_type_keywords = {k.lower(): v for k, v in PAPER_TYPE_KEYWORDS.items()}
 
+        # 모든 사전을 하나의 오토마톤으로 (payload: (분류, 키워드))
+        self._automaton: KeywordAutomaton[Tuple[str, str]] = KeywordAutomaton()
+        for allergen_code, allergen_keywords in self.ALLERGEN_KEYWORDS.items():
+            for kw in allergen_keywords:
+                self._automaton.add(kw, ("allergen", kw.lower()))
+        for category, keyword_map in (
+            ("symptom", self._symptom_keywords),
+            ("avoid_food", self._avoid_food_keywords),
+            ("substitute", self._substitute_keywords),
+            ("management", self._management_keywords),
+            ("paper_type", self._paper_type_keywords),
+        ):
+            for kw in keyword_map:
+                self._automaton.add(kw, (category, kw))
+        self._automaton.build()
+        # 사전 순서 (같은 specific_item 중 먼저 정의된 키워드 우선 — 기존 동작 유지)
+        self._keyword_order = {
+            payload: index
+            for index, payload in enumerate(
+                [("allergen", kw.lower()) for kws in self.ALLERGEN_KEYWORDS.values() for kw in kws]
+                + [("symptom", kw) for kw in self._symptom_keywords]
+                + [("avoid_food", kw) for kw in self._avoid_food_keywords]
+                + [("substitute", kw) for kw in self._substitute_keywords]
+                + [("management", kw) for kw in self._management_keywords]
+                + [("paper_type", kw) for kw in self._paper_type_keywords]
+            )
+        }
+
+    def _scan(self, text: str) -> Dict[Tuple[str, str], bool]:
+        """텍스트 1회 순회 → {(분류, 키워드): 첫 일치가 앞부분(LEAD_WINDOW)에 있는지}"""
+        words = tokenize(text)
+        # 앞부분 창의 단어 수 (창 경계에 걸쳐 잘린 단어는 제외)
+        lead_words = len(tokenize(text[:self.LEAD_WINDOW]))
+        if text[self.LEAD_WINDOW - 1:self.LEAD_WINDOW + 1].isalnum():
+            lead_words -= 1
+
+        found: Dict[Tuple[str, str], bool] = {}
+        for hit in self._automaton.find_all_words(words):
+            if hit.payload not in found:
+                found[hit.payload] = hit.end <= lead_words
+        return found
+
+    def _matches(self, found: Dict[Tuple[str, str], bool], category: str) -> List[Tuple[str, bool]]:
+        """분류별 일치 키워드 (사전 순서) — [(키워드, 앞부분 여부)]"""
+        order = self._keyword_order
+        return sorted(
+            ((kw, lead) for (cat, kw), lead in found.items() if cat == category),
+            key=lambda item: order[(category, item[0])],
+        )
+
     def extract_links(
         self,
         title: str,
@@ -82,31 +143,27 @@ class PaperLinkExtractor:
         if keywords:
             text += " " + " ".join(keywords).lower()
 
+        found = self._scan(text)
         extracted_links = []
 
         # 1. 관련 알러젠 찾기
-        allergens = self._detect_allergens(text, target_allergen)
+        allergens = self._detect_allergens(found, target_allergen)
 
         for allergen_code in allergens:
             # 2. 증상 추출
-            symptom_links = self._extract_symptoms(text, allergen_code)
-            extracted_links.extend(symptom_links)
+            extracted_links.extend(self._extract_symptoms(found, allergen_code))
 
             # 3. 회피 식품 추출
-            avoid_links = self._extract_avoid_foods(text, allergen_code)
-            extracted_links.extend(avoid_links)
+            extracted_links.extend(self._extract_avoid_foods(found, allergen_code))
 
             # 4. 대체 식품 추출
-            substitute_links = self._extract_substitutes(text, allergen_code)
-            extracted_links.extend(substitute_links)
+            extracted_links.extend(self._extract_substitutes(found, allergen_code))
 
             # 5. 환경 관리 추출 (흡입성 알러젠)
-            management_links = self._extract_management(text, allergen_code)
-            extracted_links.extend(management_links)
+            extracted_links.extend(self._extract_management(found, allergen_code))
 
         # 6. 교차반응 추출
-        cross_links = self._extract_cross_reactivity(text, allergens)
-        extracted_links.extend(cross_links)
+        extracted_links.extend(self._extract_cross_reactivity(text, allergens))
 
         # 중복 제거 및 정렬
         extracted_links = self._deduplicate_links(extracted_links)
@@ -116,115 +173,95 @@ class PaperLinkExtractor:
 
     def _detect_allergens(
         self,
-        text: str,
+        found: Dict[Tuple[str, str], bool],
         target_allergen: Optional[str] = None
     ) -> List[str]:
         """텍스트에서 알러젠 감지"""
         if target_allergen:
             return [target_allergen]
 
-        detected = []
-        for allergen_code, keywords in self.ALLERGEN_KEYWORDS.items():
-            for kw in keywords:
-                if kw.lower() in text:
-                    detected.append(allergen_code)
-                    break
-
-        return list(set(detected))
+        return [
+            allergen_code
+            for allergen_code, keywords in self.ALLERGEN_KEYWORDS.items()
+            if any(("allergen", kw.lower()) in found for kw in keywords)
+        ]
 
-    def _extract_symptoms(self, text: str, allergen_code: str) -> List[ExtractedLink]:
+    def _extract_symptoms(self, found: Dict[Tuple[str, str], bool], allergen_code: str) -> List[ExtractedLink]:
         """증상 키워드 추출"""
         links = []
 
-        for en_keyword, kr_name in self._symptom_keywords.items():
-            if en_keyword in text:
-                # 관련도 계산: 제목에 있으면 더 높은 점수
-                relevance = 75
-                if en_keyword in text[:200]:  # 제목 또는 초록 앞부분
-                    relevance = 90
+        for en_keyword, in_lead in self._matches(found, "symptom"):
+            # 아나필락시스는 응급으로 분류
+            link_type = "emergency" if "anaphyla" in en_keyword else "symptom"
 
-                # 아나필락시스는 응급으로 분류
-                link_type = "emergency" if "anaphyla" in en_keyword else "symptom"
-
-                links.append(ExtractedLink(
-                    allergen_code=allergen_code,
-                    link_type=link_type,
-                    specific_item=kr_name,
-                    relevance_score=relevance,
-                    matched_keyword=en_keyword,
-                ))
+            links.append(ExtractedLink(
+                allergen_code=allergen_code,
+                link_type=link_type,
+                specific_item=self._symptom_keywords[en_keyword],
+                # 관련도 계산: 제목 또는 초록 앞부분에 있으면 더 높은 점수
+                relevance_score=90 if in_lead else 75,
+                matched_keyword=en_keyword,
+            ))
 
         return links
 
-    def _extract_avoid_foods(self, text: str, allergen_code: str) -> List[ExtractedLink]:
+    def _extract_avoid_foods(self, found: Dict[Tuple[str, str], bool], allergen_code: str) -> List[ExtractedLink]:
         """회피 식품 키워드 추출"""
         links = []
 
-        for en_keyword, (kr_name, related_allergen) in self._avoid_food_keywords.items():
+        for en_keyword, in_lead in self._matches(found, "avoid_food"):
+            kr_name, related_allergen = self._avoid_food_keywords[en_keyword]
             if related_allergen != allergen_code:
                 continue
 
-            if en_keyword in text:
-                relevance = 70
-                if en_keyword in text[:200]:
-                    relevance = 85
-
-                links.append(ExtractedLink(
-                    allergen_code=allergen_code,
-                    link_type="dietary",
-                    specific_item=kr_name,
-                    relevance_score=relevance,
-                    matched_keyword=en_keyword,
-                ))
+            links.append(ExtractedLink(
+                allergen_code=allergen_code,
+                link_type="dietary",
+                specific_item=kr_name,
+                relevance_score=85 if in_lead else 70,
+                matched_keyword=en_keyword,
+            ))
 
         return links
 
-    def _extract_substitutes(self, text: str, allergen_code: str) -> List[ExtractedLink]:
+    def _extract_substitutes(self, found: Dict[Tuple[str, str], bool], allergen_code: str) -> List[ExtractedLink]:
         """대체 식품 키워드 추출"""
         links = []
 
-        for en_keyword, (kr_name, related_allergen) in self._substitute_keywords.items():
+        for en_keyword, in_lead in self._matches(found, "substitute"):
+            kr_name, related_allergen = self._substitute_keywords[en_keyword]
             if related_allergen != allergen_code:
                 continue
 
-            if en_keyword in text:
-                relevance = 70
-                if en_keyword in text[:200]:
-                    relevance = 85
-
-                links.append(ExtractedLink(
-                    allergen_code=allergen_code,
-                    link_type="substitute",
-                    specific_item=kr_name,
-                    relevance_score=relevance,
-                    matched_keyword=en_keyword,
-                ))
+            links.append(ExtractedLink(
+                allergen_code=allergen_code,
+                link_type="substitute",
+                specific_item=kr_name,
+                relevance_score=85 if in_lead else 70,
+                matched_keyword=en_keyword,
+            ))
 
         return links
 
-    def _extract_management(self, text: str, allergen_code: str) -> List[ExtractedLink]:
+    def _extract_management(self, found: Dict[Tuple[str, str], bool], allergen_code: str) -> List[ExtractedLink]:
         """환경 관리 키워드 추출"""
         links = []
 
-        for en_keyword, (kr_name, related_allergen) in self._management_keywords.items():
+        for en_keyword, in_lead in self._matches(found, "management"):
+            kr_name, related_allergen = self._management_keywords[en_keyword]
             if related_allergen != allergen_code and related_allergen != "general":
                 continue
 
-            if en_keyword in text:
-                relevance = 75
-                if en_keyword in text[:200]:
-                    relevance = 90
+            # 에피펜/에피네프린은 응급으로 분류
+            link_type = "emergency" if related_allergen == "general" else "management"
 
-                # 에피펜/에피네프린은 응급으로 분류
-                link_type = "emergency" if related_allergen == "general" else "management"
-
-                links.append(ExtractedLink(
-                    allergen_code=allergen_code,
-                    link_type=link_type,
-                    specific_item=kr_name,
-                    relevance_score=relevance,
-                    matched_keyword=en_keyword,
-                ))
+            links.append(ExtractedLink(
+                allergen_code=allergen_code,
+                link_type=link_type,
+                specific_item=kr_name,
+                relevance_score=90 if in_lead else 75,
+                matched_keyword=en_keyword,
+            ))
 
         return links
 
@@ -236,17 +273,7 @@ class PaperLinkExtractor:
         """교차반응 키워드 추출"""
         links = []
 
-        # 교차반응 관련 문구 감지
-        cross_patterns = [
-            r"cross[- ]?react",
-            r"cross[- ]?sensitiz",
-            r"co[- ]?sensitiz",
-            r"cross[- ]?allerg",
-        ]
-
-        has_cross_mention = any(re.search(p, text) for p in cross_patterns)
-
-        if has_cross_mention:
+        if self.CROSS_PATTERN.search(text):
             for allergen in allergens:
                 links.append(ExtractedLink(
                     allergen_code=allergen,
@@ -273,18 +300,18 @@ class PaperLinkExtractor:
 
     def detect_paper_type(self, title: str, abstract: str) -> str:
         """논문 타입 감지"""
-        text = f"{title} {abstract}".lower()
-
-        for keyword, paper_type in self._paper_type_keywords.items():
-            if keyword in text:
-                return paper_type
+        matches = self._matches(self._scan(f"{title} {abstract}".lower()), "paper_type")
+        if matches:
+            return self._paper_type_keywords[matches[0][0]]
 
         return "research"  # 기본값
 
     def extract_links_batch(
         self,
         papers: List[Dict],
-        target_allergen: Optional[str] = None
+        target_allergen: Optional[str] = None,
+        workers: int = 0,
+        chunk_size: int = 200,
     ) -> Dict[str, List[ExtractedLink]]:
         """
         여러 논문에서 일괄 추출
@@ -292,10 +319,24 @@ class PaperLinkExtractor:
         Args:
             papers: [{"id": ..., "title": ..., "abstract": ..., "keywords": [...]}]
             target_allergen: 특정 알러젠만 대상
+            workers: 2 이상이면 chunk_size 단위로 나눠 프로세스 풀에서 추출
+            chunk_size: 프로세스 풀 작업 1건당 논문 수
 
         Returns:
             {paper_id: [ExtractedLink, ...]}
         """
+        if workers > 1 and len(papers) > chunk_size:
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunks = [papers[i:i + chunk_size] for i in range(0, len(papers), chunk_size)]
+            results = {}
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for chunk_result in pool.map(
+                    extract_links_chunk, chunks, [target_allergen] * len(chunks)
+                ):
+                    results.update(chunk_result)
+            return results
+
         results = {}
 
         for paper in papers:
@@ -321,3 +362,11 @@ def get_extractor() -> PaperLinkExtractor:
     if _extractor_instance is None:
         _extractor_instance = PaperLinkExtractor()
     return _extractor_instance
+
+
+def extract_links_chunk(
+    papers: List[Dict],
+    target_allergen: Optional[str] = None,
+) -> Dict[str, List[ExtractedLink]]:
+    """프로세스 풀 작업 단위 — 워커 프로세스마다 추출기(오토마톤)는 한 번만 생성"""
+    return get_extractor().extract_links_batch(papers, target_allergen)
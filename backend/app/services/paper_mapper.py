@@ -5,6 +5,7 @@
 from datetime import datetime
 from typing import Optional
 
+from ..utils.paper_fingerprint import title_fingerprint
 from ..utils.timezone import utc_now
 from ..models.paper import Paper as PaperDC, PaperSource
 from ..database.models import Paper as PaperORM
@@ -38,6 +39,7 @@ class PaperMapper:
             pmid=pmid,
             doi=paper_dc.doi,
             title=paper_dc.title,
+            title_fingerprint=title_fingerprint(paper_dc.title),
             authors=authors_str,
             journal=paper_dc.journal,
             year=paper_dc.year,
@@ -137,6 +139,11 @@ class PaperMapper:
             orm.published_at = dc.published_at
             updated = True
 
+        # 제목 지문 보강 (컬럼 추가 이전 레코드)
+        if orm.title and not orm.title_fingerprint:
+            orm.title_fingerprint = title_fingerprint(orm.title)
+            updated = True
+
         if updated:
             orm.last_synced_at = utc_now()
 
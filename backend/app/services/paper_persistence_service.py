@@ -4,18 +4,159 @@
 """
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import func, insert
 
 from ..models.paper import Paper as PaperDC, PaperSource
 from ..database.models import Paper as PaperORM, PaperAllergenLink, SearchHistory
+from ..utils.paper_fingerprint import EMPTY_KEY, PaperFingerprint, title_fingerprint
 from .paper_mapper import PaperMapper
 from .paper_link_extractor import get_extractor
 
 logger = logging.getLogger(__name__)
 
+# 중복 후보 조회 시 IN 절 1회당 최대 값 개수 (DB 바인드 파라미터 한도 대비)
+LOOKUP_CHUNK_SIZE = 500
+
+# 제목 지문 1개당 검증할 최대 후보 수
+FINGERPRINT_CANDIDATE_LIMIT = 20
+
+
+def _chunks(values: list, size: int):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _first_per_key(db: Session, column, values: list, limit: int):
+    """column IN values 인 레코드 중 값마다 id 순 앞 limit 건"""
+    ranked = (
+        db.query(
+            PaperORM.id.label("paper_id"),
+            func.row_number().over(partition_by=column, order_by=PaperORM.id).label("rank"),
+        )
+        .filter(column.in_(values))
+        .subquery()
+    )
+    return (
+        db.query(PaperORM)
+        .join(ranked, PaperORM.id == ranked.c.paper_id)
+        .filter(ranked.c.rank <= limit)
+        .order_by(PaperORM.id)
+    )
+
+
+class _DuplicateLookup:
+    """save_papers_bulk 용 중복 후보 색인
+
+    키 종류별(DOI, PMID, S2 ID, 제목 지문, 소문자 제목) 1회 조회로 후보 레코드를
+    미리 가져온 뒤, 메모리에서 find_duplicate 와 같은 우선순위로 판정합니다.
+    논문 1건은 첫 일치에서 멈추는 find_duplicate 가 더 적은 조회로 끝납니다.
+    일괄 저장 중 새로 추가한 레코드도 등록하여 같은 배치 안의 중복도 묶습니다.
+    """
+
+    def __init__(self):
+        self.by_doi: dict[str, PaperORM] = {}
+        self.by_pmid: dict[str, PaperORM] = {}
+        self.by_s2_id: dict[str, PaperORM] = {}
+        self.by_fingerprint: dict[str, list[PaperORM]] = {}
+        self.by_title: dict[str, PaperORM] = {}
+
+    @classmethod
+    def prefetch(
+        cls,
+        papers: Iterable[PaperDC],
+        db: Session,
+        chunk_size: int = LOOKUP_CHUNK_SIZE,
+    ) -> "_DuplicateLookup":
+        dois, pmids, s2_ids, fingerprints, titles = set(), set(), set(), set(), set()
+        for paper_dc in papers:
+            if paper_dc.doi:
+                dois.add(paper_dc.doi.lower())
+            if paper_dc.source == PaperSource.PUBMED and paper_dc.source_id:
+                pmids.add(paper_dc.source_id)
+            if paper_dc.source == PaperSource.SEMANTIC_SCHOLAR and paper_dc.source_id:
+                s2_ids.add(paper_dc.source_id)
+            if paper_dc.title:
+                fingerprint = title_fingerprint(paper_dc.title)
+                if fingerprint != EMPTY_KEY:
+                    fingerprints.add(fingerprint)
+                titles.add(paper_dc.title.lower().strip())
+
+        lookup = cls()
+        # lower(doi) / lower(title) 는 함수 인덱스(idx_papers_doi_lower, idx_papers_title_lower) 사용
+        for column, values in (
+            (func.lower(PaperORM.doi), dois),
+            (PaperORM.pmid, pmids),
+            (PaperORM.semantic_scholar_id, s2_ids),
+        ):
+            for chunk in _chunks(sorted(values), chunk_size):
+                for paper_orm in db.query(PaperORM).filter(column.in_(chunk)).order_by(PaperORM.id):
+                    lookup.add(paper_orm)
+
+        # 제목 키는 값마다 후보 수를 SQL 에서 제한 (흔한 제목이 수천 행을 끌어오지 않도록)
+        for column, values, limit in (
+            (PaperORM.title_fingerprint, fingerprints, FINGERPRINT_CANDIDATE_LIMIT),
+            (func.lower(PaperORM.title), titles, 1),
+        ):
+            for chunk in _chunks(sorted(values), chunk_size):
+                for paper_orm in _first_per_key(db, column, chunk, limit):
+                    lookup.add(paper_orm)
+        return lookup
+
+    def add(self, paper_orm: PaperORM) -> None:
+        if paper_orm.doi:
+            self.by_doi.setdefault(paper_orm.doi.lower(), paper_orm)
+        if paper_orm.pmid:
+            self.by_pmid.setdefault(paper_orm.pmid, paper_orm)
+        if paper_orm.semantic_scholar_id:
+            self.by_s2_id.setdefault(paper_orm.semantic_scholar_id, paper_orm)
+        if paper_orm.title_fingerprint:
+            candidates = self.by_fingerprint.setdefault(paper_orm.title_fingerprint, [])
+            if paper_orm not in candidates and len(candidates) < FINGERPRINT_CANDIDATE_LIMIT:
+                candidates.append(paper_orm)
+        if paper_orm.title:
+            self.by_title.setdefault(paper_orm.title.lower(), paper_orm)
+
+    def match(self, paper_dc: PaperDC) -> Optional[PaperORM]:
+        """DOI → PMID → S2 ID → 제목 지문 근접 중복 → 제목 정확 일치"""
+        if paper_dc.doi and paper_dc.doi.lower() in self.by_doi:
+            return self.by_doi[paper_dc.doi.lower()]
+
+        if paper_dc.source == PaperSource.PUBMED and paper_dc.source_id in self.by_pmid:
+            return self.by_pmid[paper_dc.source_id]
+
+        if paper_dc.source == PaperSource.SEMANTIC_SCHOLAR and paper_dc.source_id in self.by_s2_id:
+            return self.by_s2_id[paper_dc.source_id]
+
+        if not paper_dc.title:
+            return None
+
+        fingerprint = PaperFingerprint.from_paper(paper_dc)
+        existing = _match_fingerprint(paper_dc, fingerprint, self.by_fingerprint.get(fingerprint.main_key, ()))
+        if existing:
+            return existing
+
+        # 지문 컬럼이 비어 있는 이전 레코드
+        return self.by_title.get(paper_dc.title.lower().strip())
+
+
+def _match_fingerprint(
+    paper_dc: PaperDC,
+    fingerprint: PaperFingerprint,
+    candidates: Iterable[PaperORM],
+) -> Optional[PaperORM]:
+    """제목 지문 후보 중 근접 중복 — 검색 결과 병합과 같은 PaperFingerprint 규칙,
+    다른 DOI 를 가진 레코드는 제외"""
+    for candidate in candidates:
+        if paper_dc.doi and candidate.doi and candidate.doi.lower() != paper_dc.doi.lower():
+            continue
+        if fingerprint.matches(PaperFingerprint.from_paper(candidate)):
+            return candidate
+    return None
+
 
 class PaperPersistenceService:
     """검색 결과 DB 영속화 서비스"""
@@ -41,16 +182,7 @@ class PaperPersistenceService:
         Returns:
             새로 저장된 논문 수
         """
-        new_count = 0
-
-        for paper_dc in results.papers:
-            try:
-                saved = self.save_paper(paper_dc, db, allergen_code=allergen_code)
-                if saved:
-                    new_count += 1
-            except Exception as e:
-                logger.warning(f"논문 저장 실패 (title={paper_dc.title[:50]}): {e}")
-                continue
+        new_count = self.save_papers_bulk(results.papers, db, allergen_code=allergen_code)
 
         # SearchHistory 레코드 생성
         history = SearchHistory(
@@ -76,6 +208,88 @@ class PaperPersistenceService:
         )
         return new_count
 
+    def save_papers_bulk(
+        self,
+        papers: list[PaperDC],
+        db: Session,
+        allergen_code: Optional[str] = None,
+    ) -> int:
+        """논문 목록 일괄 저장 (중복 검사 포함)
+
+        키 종류별 1회 조회로 기존 레코드를 미리 가져와 메모리에서 신규/갱신을 나누고,
+        신규 논문과 알러젠 링크는 배치 INSERT 로 기록합니다.
+        동시 저장 등으로 일괄 기록이 실패하면 논문 단위 save_paper 로 재시도합니다.
+
+        Returns:
+            새로 저장된 논문 수
+        """
+        if not papers:
+            return 0
+
+        try:
+            with db.begin_nested():
+                return self._save_papers_bulk(papers, db, allergen_code)
+        except SQLAlchemyError as e:
+            logger.warning(f"일괄 저장 실패, 논문 단위로 재시도 ({len(papers)}건): {e}")
+
+        new_count = 0
+        for paper_dc in papers:
+            try:
+                with db.begin_nested():
+                    if self.save_paper(paper_dc, db, allergen_code=allergen_code):
+                        new_count += 1
+            except Exception as e:
+                logger.warning(f"논문 저장 실패 (title={paper_dc.title[:50]}): {e}")
+        return new_count
+
+    def _save_papers_bulk(
+        self,
+        papers: list[PaperDC],
+        db: Session,
+        allergen_code: Optional[str],
+    ) -> int:
+        lookup = _DuplicateLookup.prefetch(papers, db)
+
+        new_papers: list[tuple[PaperORM, PaperDC]] = []
+        for paper_dc in papers:
+            existing = lookup.match(paper_dc)
+            if existing is not None:
+                # 기존 논문 (또는 같은 배치에서 먼저 추가된 논문) 정보 갱신
+                PaperMapper.update_orm_from_dc(existing, paper_dc)
+                continue
+
+            paper_orm = PaperMapper.dc_to_orm(paper_dc)
+            paper_orm.paper_type = self._extractor.detect_paper_type(
+                paper_dc.title, paper_dc.abstract or ""
+            )
+            lookup.add(paper_orm)
+            new_papers.append((paper_orm, paper_dc))
+
+        db.add_all([paper_orm for paper_orm, _ in new_papers])
+        db.flush()  # 신규 논문 배치 INSERT + 갱신 UPDATE, paper_orm.id 생성
+
+        link_rows = [
+            {
+                "paper_id": paper_orm.id,
+                "allergen_code": link.allergen_code,
+                "link_type": link.link_type,
+                "specific_item": link.specific_item,
+                "relevance_score": link.relevance_score,
+                "note": f"Auto-extracted: {link.matched_keyword}",
+            }
+            for paper_orm, paper_dc in new_papers
+            for link in self._extractor.extract_links(
+                title=paper_dc.title,
+                abstract=paper_dc.abstract or "",
+                keywords=paper_dc.keywords,
+                target_allergen=allergen_code,
+            )
+        ]
+        if link_rows:
+            db.execute(insert(PaperAllergenLink), link_rows)
+
+        return len(new_papers)
+
     def save_paper(
         self,
         paper_dc: PaperDC,
@@ -129,7 +343,10 @@ class PaperPersistenceService:
         return True
 
     def find_duplicate(self, paper_dc: PaperDC, db: Session) -> Optional[PaperORM]:
-        """중복 논문 검사 (DOI → PMID → S2 ID → 제목 유사도)"""
+        """중복 논문 검사 (DOI → PMID → S2 ID → 제목 지문 근접 중복 → 제목 정확 일치)
+
+        키 순서대로 조회하고 첫 일치에서 반환합니다 (대부분 DOI 조회 1회로 끝남).
+        """
 
         # 1. DOI로 검색
         if paper_dc.doi:
@@ -155,15 +372,23 @@ class PaperPersistenceService:
             if existing:
                 return existing
 
-        # 4. 제목 유사도 (정확 일치)
-        if paper_dc.title:
-            existing = db.query(PaperORM).filter(
-                func.lower(PaperORM.title) == paper_dc.title.lower().strip()
-            ).first()
+        if not paper_dc.title:
+            return None
+
+        # 4. 제목 지문 (정규화 본 제목 인덱스로 후보 조회 → 연도/제1저자/Jaccard 검증)
+        fingerprint = PaperFingerprint.from_paper(paper_dc)
+        if fingerprint.main_key != EMPTY_KEY:
+            candidates = db.query(PaperORM).filter(
+                PaperORM.title_fingerprint == fingerprint.main_key
+            ).order_by(PaperORM.id).limit(FINGERPRINT_CANDIDATE_LIMIT).all()
+            existing = _match_fingerprint(paper_dc, fingerprint, candidates)
             if existing:
                 return existing
 
-        return None
+        # 5. 제목 정확 일치 (지문 컬럼이 비어 있는 이전 레코드)
+        return db.query(PaperORM).filter(
+            func.lower(PaperORM.title) == paper_dc.title.lower().strip()
+        ).first()
 
     def search_local(
         self,
@@ -173,10 +398,10 @@ class PaperPersistenceService:
         limit: int = 20,
         offset: int = 0,
     ) -> list[PaperORM]:
-        """로컬 DB에서 논문 검색
+        """로컬 DB에서 논문 검색 (전문 검색 색인, 관련도순)
 
         Args:
-            query: 검색어
+            query: 검색어 (비어 있으면 최신순 목록)
             db: DB 세션
             allergen_code: 알러젠 코드 필터
             limit: 최대 결과 수
@@ -185,6 +410,37 @@ class PaperPersistenceService:
         Returns:
             ORM Paper 목록
         """
+        from ..database.paper_fulltext import fulltext_ranking
+
+        q = self._local_query(db, allergen_code)
+
+        # 텍스트 검색 (제목 + 초록, 한/영)
+        if query:
+            ranking = fulltext_ranking(db, query)
+            q = q.join(ranking, ranking.c.paper_id == PaperORM.id).order_by(
+                ranking.c.rank.desc(), PaperORM.id.desc()
+            )
+        else:
+            q = q.order_by(PaperORM.year.desc().nullslast(), PaperORM.id.desc())
+        return q.offset(offset).limit(limit).all()
+
+    def count_local(
+        self,
+        query: str,
+        db: Session,
+        allergen_code: Optional[str] = None,
+    ) -> int:
+        """``search_local()`` 과 같은 조건의 전체 결과 수 (페이지 무관)"""
+        from ..database.paper_fulltext import fulltext_ranking
+
+        q = self._local_query(db, allergen_code)
+        if query:
+            ranking = fulltext_ranking(db, query)
+            q = q.join(ranking, ranking.c.paper_id == PaperORM.id)
+        return q.count()
+
+    @staticmethod
+    def _local_query(db: Session, allergen_code: Optional[str]):
         q = db.query(PaperORM)
 
         # 알러젠 코드 필터
@@ -192,19 +448,7 @@ class PaperPersistenceService:
             q = q.join(PaperAllergenLink).filter(
                 PaperAllergenLink.allergen_code == allergen_code
             )
-
-        # 텍스트 검색 (제목 + 초록)
-        if query:
-            search_term = f"%{query}%"
-            q = q.filter(
-                or_(
-                    PaperORM.title.ilike(search_term),
-                    PaperORM.abstract.ilike(search_term),
-                )
-            )
-
-        q = q.order_by(PaperORM.year.desc().nullslast(), PaperORM.id.desc())
-        return q.offset(offset).limit(limit).all()
+        return q
 
     def get_search_history(
         self,
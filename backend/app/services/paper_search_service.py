@@ -6,27 +6,33 @@ PDF 다운로드 링크를 보강합니다.
 
 Step 1.D 리팩토링:
 - 6 hardcoded source instantiation → ``registry.all_of_kind(SourceKind.PAPER)``
-- PDF 보강 → ``SemanticScholarConnector.get_pdf_url_by_pmid/doi`` cross-lookup
+- PDF 보강 → ``SemanticScholarConnector.get_pdf_urls`` (paper/batch 일괄 조회) cross-lookup
 - 부분 실패 가시화 → ``UnifiedSearchResult.errors`` dict
 
+비동기 경로 (``search_async`` / ``search_allergy_async``):
+- 모든 source 를 하나의 이벤트 루프에서 native 코루틴으로 동시 호출
+- ``PAPER_SEARCH_DEADLINE_S`` 안에 응답한 source 만으로 부분 결과 반환,
+  늦은 source 는 취소 후 ``errors`` 에 기록
+
 알러지 특화 query 빌더 (``search_allergy``) 는 도메인 로직이므로 Phase 1.G
 DomainPack 으로 이관 예정. 그 전까지는 legacy ``*Service.search_allergy*``
 메서드를 그대로 호출한다.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Awaitable, Optional
 
 from sqlalchemy.orm import Session
 
 from ..config import settings
 # Layer 1 (registry-based)
 from ..core.sources import registry
-from ..core.sources.base import SourceKind
+from ..core.sources.base import SourceKind, SourceSearchResult
 from ..core.sources.paper.base import (
     PaperSourceConnector,
     normalized_to_paper,
@@ -51,6 +57,7 @@ from .openalex_service import OpenAlexService
 from .biorxiv_service import BiorxivService
 from .core_service import CoreService
 from ..models.paper import Paper, PaperSource
+from ..utils.paper_fingerprint import NearDuplicateIndex, PaperFingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +112,14 @@ class UnifiedSearchResult:
             "errors": dict(self.errors),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "UnifiedSearchResult":
+        """``to_dict()`` 결과에서 복원 (검색 결과 캐시용)"""
+        data = data.copy()
+        data["papers"] = [Paper.from_dict(p) for p in data.get("papers", [])]
+        data["errors"] = dict(data.get("errors") or {})
+        return cls(**data)
+
 
 class PaperSearchService:
     """통합 논문 검색 서비스 (registry 기반).
@@ -172,28 +187,9 @@ class PaperSearchService:
             selected, query, max_results_per_source
         )
 
-        if merge_duplicates:
-            all_papers = self._merge_duplicates(all_papers)
-
-        if enrich_pdf_links:
-            all_papers = self._enrich_pdf_links(all_papers)
+        all_papers = self._merge_and_enrich(all_papers, merge_duplicates, enrich_pdf_links)
 
-        downloadable = sum(1 for p in all_papers if p.pdf_url)
-
-        result = UnifiedSearchResult(
-            papers=all_papers,
-            pubmed_count=counts.get("pubmed", 0),
-            semantic_scholar_count=counts.get("semantic_scholar", 0),
-            europe_pmc_count=counts.get("europe_pmc", 0),
-            openalex_count=counts.get("openalex", 0),
-            biorxiv_count=counts.get("biorxiv", 0),
-            core_count=counts.get("core", 0),
-            total_unique=len(all_papers),
-            downloadable_count=downloadable,
-            query=query,
-            search_time_ms=(time.time() - start_time) * 1000,
-            errors=errors,
-        )
+        result = self._build_result(all_papers, counts, errors, query, start_time)
 
         if db is not None:
             self._maybe_persist(result, db)
@@ -247,21 +243,32 @@ class PaperSearchService:
                 errors[name] = f"{type(e).__name__}: {e}"
                 continue
 
-            # Connector 내부에서 잡힌 부분 실패도 가시화
-            if res.has_error:
-                errors[name] = res.meta.get("error", "unknown")
+            self._collect_source_result(name, res, all_papers, counts, errors)
 
-            # NormalizedDoc → Paper 역변환
-            for doc in res.docs:
-                try:
-                    all_papers.append(normalized_to_paper(doc))
-                except Exception as e:
-                    logger.debug("normalized_to_paper 실패 (skip): %s", e)
+        return all_papers, counts, errors
 
-            # total_count 우선, 없으면 docs 개수
-            counts[name] = res.meta.get("total_count", res.count)
+    @staticmethod
+    def _collect_source_result(
+        name: str,
+        res: SourceSearchResult,
+        all_papers: list[Paper],
+        counts: dict[str, int],
+        errors: dict[str, str],
+    ) -> None:
+        """단일 connector 결과 → Paper 목록/count/error 누적."""
+        # Connector 내부에서 잡힌 부분 실패도 가시화
+        if res.has_error:
+            errors[name] = res.meta.get("error", "unknown")
 
-        return all_papers, counts, errors
+        # NormalizedDoc → Paper 역변환
+        for doc in res.docs:
+            try:
+                all_papers.append(normalized_to_paper(doc))
+            except Exception as e:
+                logger.debug("normalized_to_paper 실패 (skip): %s", e)
+
+        # total_count 우선, 없으면 docs 개수
+        counts[name] = res.meta.get("total_count", res.count)
 
     # ───────── 알러지 특화 검색 (legacy path, Phase 1.G 이관 예정) ─────────
 
@@ -317,59 +324,239 @@ class PaperSearchService:
                 logger.warning("%s.search_allergy 예외: %s", name, e)
                 errors[name] = f"{type(e).__name__}: {e}"
 
-        all_papers = self._merge_duplicates(all_papers)
-        all_papers = self._enrich_pdf_links(all_papers)
-        downloadable = sum(1 for p in all_papers if p.pdf_url)
+        all_papers = self._merge_and_enrich(all_papers)
+
+        result = self._build_result(
+            all_papers, counts, errors,
+            self._allergy_query_label(allergen, include_cross_reactivity),
+            start_time,
+        )
+
+        if db is not None:
+            self._maybe_persist(result, db, allergen_code=allergen)
+
+        return result
+
+    def allergy_sources(self) -> list[str]:
+        """``search_allergy*`` 가 호출하는 source 이름 목록 (CORE 는 API 키가 있을 때만)"""
+        names = ["pubmed", "semantic_scholar", "europe_pmc", "openalex", "biorxiv"]
+        if self.core.is_available:
+            names.append("core")
+        return names
+
+    @staticmethod
+    def _allergy_query_label(allergen: str, include_cross_reactivity: bool) -> str:
+        return (
+            f"{allergen} allergy"
+            + (" cross-reactivity" if include_cross_reactivity else "")
+        )
+
+    # ───────── 비동기 검색 (단일 이벤트 루프 fan-out) ─────────
+
+    async def search_async(
+        self,
+        query: str,
+        max_results_per_source: int = 20,
+        sources: Optional[list[str]] = None,
+        merge_duplicates: bool = True,
+        enrich_pdf_links: bool = True,
+        db: Optional[Session] = None,
+        deadline_s: Optional[float] = None,
+    ) -> UnifiedSearchResult:
+        """``search()`` 의 비동기 버전.
+
+        Connector 의 ``search_async`` 를 동시에 실행하고, ``deadline_s``
+        (기본 ``settings.PAPER_SEARCH_DEADLINE_S``) 안에 끝난 source 결과만
+        모아 반환한다. 미응답 source 는 취소되고 ``errors`` 에 기록된다.
+        """
+        start_time = time.time()
+        deadline = self._deadline(deadline_s)
+
+        selected = self._select_connectors(sources)
+        outcomes, errors = await self._gather_within_deadline(
+            {c.name: c.search_async(query, max_results_per_source) for c in selected},
+            deadline,
+        )
+
+        all_papers: list[Paper] = []
+        counts: dict[str, int] = {}
+        for name, res in outcomes.items():
+            self._collect_source_result(name, res, all_papers, counts, errors)
 
-        result = UnifiedSearchResult(
-            papers=all_papers,
+        all_papers = await self._merge_and_enrich_async(
+            all_papers, deadline - (time.time() - start_time),
+            merge_duplicates, enrich_pdf_links,
+        )
+
+        result = self._build_result(all_papers, counts, errors, query, start_time)
+
+        if db is not None:
+            await asyncio.to_thread(self._maybe_persist, result, db)
+
+        return result
+
+    async def search_allergy_async(
+        self,
+        allergen: str,
+        include_cross_reactivity: bool = True,
+        max_results_per_source: int = 20,
+        db: Optional[Session] = None,
+        deadline_s: Optional[float] = None,
+    ) -> UnifiedSearchResult:
+        """``search_allergy()`` 의 비동기 버전 (deadline 내 부분 결과 반환)."""
+        start_time = time.time()
+        deadline = self._deadline(deadline_s)
+
+        calls: dict[str, Awaitable[Any]] = {
+            "pubmed": self.pubmed.search_allergy_papers_async(
+                allergen, include_cross_reactivity, max_results_per_source,
+            ),
+            "semantic_scholar": self.semantic_scholar.search_allergy_papers_async(
+                allergen, include_cross_reactivity, max_results_per_source,
+            ),
+            "europe_pmc": self.europe_pmc.search_allergy_async(
+                allergen, max_results_per_source,
+            ),
+            "openalex": self.openalex.search_allergy_async(
+                allergen, max_results_per_source,
+            ),
+            "biorxiv": self.biorxiv.search_allergy_async(
+                allergen, max_results_per_source,
+            ),
+        }
+        if self.core.is_available:
+            calls["core"] = self.core.search_allergy_async(
+                allergen, max_results_per_source,
+            )
+
+        outcomes, errors = await self._gather_within_deadline(calls, deadline)
+
+        all_papers: list[Paper] = []
+        counts: dict[str, int] = {}
+        for name, r in outcomes.items():
+            all_papers.extend(r.papers)
+            counts[name] = r.total_count
+
+        all_papers = await self._merge_and_enrich_async(
+            all_papers, deadline - (time.time() - start_time),
+        )
+
+        result = self._build_result(
+            all_papers, counts, errors,
+            self._allergy_query_label(allergen, include_cross_reactivity),
+            start_time,
+        )
+
+        if db is not None:
+            await asyncio.to_thread(
+                self._maybe_persist, result, db, allergen_code=allergen,
+            )
+
+        return result
+
+    @staticmethod
+    def _deadline(deadline_s: Optional[float]) -> float:
+        return settings.PAPER_SEARCH_DEADLINE_S if deadline_s is None else deadline_s
+
+    @staticmethod
+    async def _gather_within_deadline(
+        calls: dict[str, Awaitable[Any]],
+        deadline: float,
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """source 별 코루틴을 동시에 실행하고 deadline 안에 끝난 결과만 반환.
+
+        Returns:
+            (source 이름 → 결과, source 이름 → 에러 메시지). 결과 dict 는
+            ``calls`` 의 순서를 유지한다 (중복 병합 시 우선순위 고정).
+        """
+        tasks = {name: asyncio.ensure_future(c) for name, c in calls.items()}
+        if not tasks:
+            return {}, {}
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=max(deadline, 0))
+        for task in pending:
+            task.cancel()
+        if pending:
+            # 취소 완료까지 대기 — 연결 반환 등 정리 보장
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning("%s 검색 deadline(%.1fs) 초과 — 부분 결과로 진행", name, deadline)
+                errors[name] = f"TimeoutError: deadline {deadline:g}s exceeded"
+            elif task.exception() is not None:
+                e = task.exception()
+                logger.warning("%s 비동기 검색 예외: %s", name, e)
+                errors[name] = f"{type(e).__name__}: {e}"
+            else:
+                results[name] = task.result()
+        return results, errors
+
+    def _build_result(
+        self,
+        papers: list[Paper],
+        counts: dict[str, int],
+        errors: dict[str, str],
+        query: str,
+        start_time: float,
+    ) -> UnifiedSearchResult:
+        return UnifiedSearchResult(
+            papers=papers,
             pubmed_count=counts.get("pubmed", 0),
             semantic_scholar_count=counts.get("semantic_scholar", 0),
             europe_pmc_count=counts.get("europe_pmc", 0),
             openalex_count=counts.get("openalex", 0),
             biorxiv_count=counts.get("biorxiv", 0),
             core_count=counts.get("core", 0),
-            total_unique=len(all_papers),
-            downloadable_count=downloadable,
-            query=(
-                f"{allergen} allergy"
-                + (" cross-reactivity" if include_cross_reactivity else "")
-            ),
+            total_unique=len(papers),
+            downloadable_count=sum(1 for p in papers if p.pdf_url),
+            query=query,
             search_time_ms=(time.time() - start_time) * 1000,
             errors=errors,
         )
 
-        if db is not None:
-            self._maybe_persist(result, db, allergen_code=allergen)
-
-        return result
-
     # ───────── 중복 제거 / PDF 보강 ─────────
 
     def _merge_duplicates(self, papers: list[Paper]) -> list[Paper]:
-        """DOI 기반 중복 제거 및 정보 병합 (변경 없음)."""
+        """DOI 일치 또는 근접 중복 지문(제목 MinHash/LSH + 연도 + 제1저자)으로 병합.
+
+        서로 다른 DOI 를 가진 논문은 제목이 비슷해도 병합하지 않는다
+        (프리프린트와 게재본 등 별도 레코드).
+        """
         doi_map: dict[str, Paper] = {}
-        title_map: dict[str, Paper] = {}
+        index: NearDuplicateIndex[Paper] = NearDuplicateIndex()
         unique_papers = []
 
         for paper in papers:
-            if paper.doi:
-                doi_lower = paper.doi.lower()
-                if doi_lower in doi_map:
-                    self._merge_paper_info(doi_map[doi_lower], paper)
-                    continue
+            doi_lower = paper.doi.lower() if paper.doi else None
+            if doi_lower and doi_lower in doi_map:
+                self._merge_paper_info(doi_map[doi_lower], paper)
+                continue
+
+            fingerprint = PaperFingerprint.from_paper(paper)
+            match = index.find(
+                fingerprint,
+                accept=lambda other: not (
+                    doi_lower and other.doi and other.doi.lower() != doi_lower
+                ),
+            )
+            if match is not None:
+                self._merge_paper_info(match, paper)
+                if doi_lower:
+                    doi_map.setdefault(doi_lower, match)
+                continue
+
+            index.add(fingerprint, paper)
+            if doi_lower:
                 doi_map[doi_lower] = paper
-                unique_papers.append(paper)
-            else:
-                title_key = paper.title.lower().strip()[:100]
-                if title_key in title_map:
-                    self._merge_paper_info(title_map[title_key], paper)
-                    continue
-                title_map[title_key] = paper
-                unique_papers.append(paper)
+            unique_papers.append(paper)
         return unique_papers
 
     def _merge_paper_info(self, target: Paper, source: Paper) -> None:
+        if not target.doi and source.doi:
+            target.doi = source.doi
         if not target.pdf_url and source.pdf_url:
             target.pdf_url = source.pdf_url
         if source.citation_count and (
@@ -386,24 +573,98 @@ class PaperSearchService:
     def _enrich_pdf_links(self, papers: list[Paper]) -> list[Paper]:
         """PDF URL 미보유 논문에 대해 S2 connector 로 cross-lookup.
 
-        Step 1.D-002: 기존 ``self.semantic_scholar.get_paper_by_pmid/doi`` 직접
-        호출 → ``self._s2_connector.get_pdf_url_by_pmid/doi`` ABC 메서드로 위임.
+        PMID/DOI 혼합 id 를 ``get_pdf_urls`` (paper/batch) 1회 요청으로 조회한다.
         S2 connector 가 없거나 미가용이면 보강 skip.
         """
-        if self._s2_connector is None:
-            return papers
+        return self._merge_and_enrich(papers, merge=False)
+
+    def _merge_and_enrich(
+        self,
+        papers: list[Paper],
+        merge: bool = True,
+        enrich: bool = True,
+    ) -> list[Paper]:
+        """중복 병합과 PDF 일괄 조회를 동시에 수행.
+
+        조회 id 는 병합 전 목록에서 뽑아 executor 로 먼저 요청하고, 그동안
+        병합을 진행한 뒤 결과를 병합된 논문에 반영한다.
+        """
+        future = None
+        if enrich and self._s2_connector is not None:
+            lookup_ids = self._pdf_lookup_ids(papers)
+            if lookup_ids:
+                future = self._executor.submit(self._s2_connector.get_pdf_urls, lookup_ids)
+
+        if merge:
+            papers = self._merge_duplicates(papers)
+
+        if future is not None:
+            try:
+                found = future.result(timeout=settings.PAPER_SEARCH_SOURCE_TIMEOUT_S)
+            except Exception as e:
+                logger.warning("PDF 일괄 조회 실패 — 보강 없이 진행: %s", e)
+                found = {}
+            self._apply_pdf_links(papers, found)
+        return papers
+
+    async def _merge_and_enrich_async(
+        self,
+        papers: list[Paper],
+        budget_s: float,
+        merge: bool = True,
+        enrich: bool = True,
+    ) -> list[Paper]:
+        """``_merge_and_enrich`` 의 비동기 버전.
+
+        PDF 조회 코루틴과 병합(워커 스레드)을 함께 진행하고, 남은 deadline
+        안에 조회가 끝나지 않으면 보강 없이 반환한다.
+        """
+        lookup = None
+        if enrich and self._s2_connector is not None:
+            lookup_ids = self._pdf_lookup_ids(papers)
+            if lookup_ids:
+                lookup = asyncio.ensure_future(
+                    self._s2_connector.get_pdf_urls_async(lookup_ids)
+                )
+
+        if merge:
+            papers = await asyncio.to_thread(self._merge_duplicates, papers)
+
+        if lookup is not None:
+            try:
+                found = await asyncio.wait_for(lookup, timeout=max(budget_s, 0))
+            except asyncio.TimeoutError:
+                logger.info("PDF 보강 deadline 초과 — 보강 없이 반환 (%d건)", len(papers))
+                found = {}
+            except Exception as e:
+                logger.warning("PDF 일괄 조회 실패 — 보강 없이 진행: %s", e)
+                found = {}
+            self._apply_pdf_links(papers, found)
+        return papers
 
+    @staticmethod
+    def _pdf_lookup_id(paper: Paper) -> Optional[str]:
+        """S2 paper/batch 조회 id (PubMed 는 PMID 우선, 그 외 DOI)."""
+        if paper.source == PaperSource.PUBMED and paper.source_id:
+            return f"PMID:{paper.source_id}"
+        if paper.doi:
+            return f"DOI:{paper.doi}"
+        return None
+
+    @classmethod
+    def _pdf_lookup_ids(cls, papers: list[Paper]) -> list[str]:
+        """PDF URL 미보유 논문의 조회 id (중복 제거, 순서 유지)."""
+        ids = (cls._pdf_lookup_id(p) for p in papers if not p.pdf_url)
+        return list(dict.fromkeys(i for i in ids if i))
+
+    @classmethod
+    def _apply_pdf_links(cls, papers: list[Paper], found: dict[str, Optional[str]]) -> None:
         for paper in papers:
             if paper.pdf_url:
                 continue
-            pdf_url: Optional[str] = None
-            if paper.source == PaperSource.PUBMED and paper.source_id:
-                pdf_url = self._s2_connector.get_pdf_url_by_pmid(paper.source_id)
-            elif paper.doi:
-                pdf_url = self._s2_connector.get_pdf_url_by_doi(paper.doi)
+            pdf_url = found.get(cls._pdf_lookup_id(paper) or "")
             if pdf_url:
                 paper.pdf_url = pdf_url
-        return papers
 
     # ───────── 기타 ─────────
 
@@ -442,3 +703,19 @@ class PaperSearchService:
             except Exception:
                 pass
         self._executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트 정리 (search_async 경로) — 이벤트 루프 안에서 호출."""
+        for conn in self._connectors.values():
+            try:
+                await conn.aclose()
+            except Exception:
+                pass
+        for svc in (
+            self.pubmed, self.semantic_scholar, self.europe_pmc,
+            self.openalex, self.biorxiv, self.core,
+        ):
+            try:
+                await svc.aclose()
+            except Exception:
+                pass
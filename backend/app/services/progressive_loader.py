@@ -10,19 +10,19 @@
    - 가장 중요한 항원 3-5개 우선 처리
 
 2. **점진적 로딩 (Progressive Loading)**
-   - 나머지 항원은 백그라운드에서 처리
-   - SSE/WebSocket으로 실시간 업데이트
+   - 나머지 항원은 BatchProcessor 워커 풀에서 처리 (작업마다 스레드를 만들지 않음)
+   - 태스크 완료 이벤트를 구독하여 SSE 로 진행률 + 항원별 결과를 즉시 전달
+     (stream_job_events, GET /api/batch/stream/{job_id})
 
 3. **온디맨드 로딩 (On-Demand Loading)**
    - 사용자가 특정 항원 클릭 시 상세 정보 로딩
    - Lazy Loading 패턴
 """
 import asyncio
-import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Callable, AsyncGenerator, Generator
+from typing import Optional, Callable, AsyncGenerator, Awaitable, Generator
 from enum import Enum
 from queue import Queue
 import json
@@ -37,6 +37,12 @@ from .batch_processor import (
 )
 from .paper_search_service import UnifiedSearchResult
 
+# SSE 스트림: 이벤트가 없을 때 연결 유지 신호 간격 / 다른 프로세스 작업 조회 간격
+STREAM_KEEPALIVE_SECONDS = 15.0
+STREAM_POLL_SECONDS = 2.0
+
+_FINISHED_STATUSES = (ProcessingStatus.COMPLETED, ProcessingStatus.CACHED, ProcessingStatus.FAILED)
+
 
 class LoadingStrategy(str, Enum):
     """로딩 전략"""
@@ -95,10 +101,6 @@ class ProgressiveLoader:
     ):
         self.processor = batch_processor or BatchProcessor()
 
-        # 이벤트 큐 (SSE용)
-        self._event_queues: dict[str, Queue] = {}
-        self._background_jobs: dict[str, threading.Thread] = {}
-
     def load_immediate(
         self,
         allergens: list[AllergenItem],
@@ -174,75 +176,40 @@ class ProgressiveLoader:
         allergens: list[AllergenItem],
         include_cross_reactivity: bool,
     ) -> str:
-        """백그라운드 작업 시작"""
+        """백그라운드 작업 시작 (BatchProcessor 워커 풀에 등록)"""
         job = self.processor.create_job(allergens, sort_by_priority=True)
-
-        # 이벤트 큐 생성
-        self._event_queues[job.job_id] = Queue()
-
-        # 진행 콜백 설정
-        def on_progress(job: BatchJob):
-            progress = self._calculate_progress(job)
-            self._event_queues[job.job_id].put(progress)
-
-        self.processor.set_progress_callback(on_progress)
-
-        # 백그라운드 스레드 시작
-        thread = threading.Thread(
-            target=self._background_process,
-            args=(job, include_cross_reactivity),
-            daemon=True,
-        )
-        self._background_jobs[job.job_id] = thread
-        thread.start()
-
+        self.processor.submit_job(job, include_cross_reactivity=include_cross_reactivity)
         return job.job_id
 
-    def _background_process(
-        self,
-        job: BatchJob,
-        include_cross_reactivity: bool,
-    ):
-        """백그라운드 처리 실행"""
-        try:
-            self.processor.process_job_sync(
-                job,
-                include_cross_reactivity=include_cross_reactivity,
-            )
-        finally:
-            # 완료 이벤트 전송
-            if job.job_id in self._event_queues:
-                progress = self._calculate_progress(job)
-                self._event_queues[job.job_id].put(progress)
-                self._event_queues[job.job_id].put(None)  # 종료 신호
-
     def _calculate_progress(self, job: BatchJob) -> LoadingProgress:
-        """진행 상태 계산"""
-        in_progress_task = None
-        for task in job.tasks:
-            if task.status == ProcessingStatus.IN_PROGRESS:
-                in_progress_task = task
-                break
-
-        remaining = sum(1 for t in job.tasks
-                       if t.status in [ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS])
-        estimated_remaining = remaining * self.AVG_SEARCH_TIME_SEC
+        """진행 상태 계산 (BatchJob 상태 카운터 사용 — 태스크를 순회하지 않음)"""
+        remaining = job.count(ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS)
 
         return LoadingProgress(
             job_id=job.job_id,
-            total=len(job.tasks),
-            loaded=sum(1 for t in job.tasks if t.status == ProcessingStatus.COMPLETED),
-            cached=sum(1 for t in job.tasks if t.status == ProcessingStatus.CACHED),
-            failed=sum(1 for t in job.tasks if t.status == ProcessingStatus.FAILED),
-            current_allergen=in_progress_task.allergen.name if in_progress_task else None,
-            estimated_remaining_seconds=estimated_remaining,
+            total=job.total_count,
+            loaded=job.count(ProcessingStatus.COMPLETED),
+            cached=job.count(ProcessingStatus.CACHED),
+            failed=job.count(ProcessingStatus.FAILED),
+            current_allergen=job.current_allergen,
+            estimated_remaining_seconds=remaining * self.AVG_SEARCH_TIME_SEC,
         )
 
+    def _task_event(self, task: SearchTask) -> dict:
+        """항원별 결과 이벤트 (실패 태스크는 papers 없이 error 포함)"""
+        return {
+            **self.processor.task_result(task),
+            "task_id": task.task_id,
+            "status": task.status.value,
+            "error": task.error,
+        }
+
     def get_progress_stream(self, job_id: str) -> Generator[LoadingProgress, None, None]:
         """
-        진행 상태 스트림 (Generator)
+        진행 상태 스트림 (Generator, 블로킹)
 
-        SSE(Server-Sent Events) 구현에 사용합니다.
+        태스크가 끝날 때마다 진행 상태를 반환하고 작업이 끝나면 종료합니다.
+        HTTP 로는 stream_job_events (SSE) 를 사용합니다.
 
         Args:
             job_id: 작업 ID
@@ -250,16 +217,108 @@ class ProgressiveLoader:
         Yields:
             LoadingProgress: 진행 상태
         """
-        if job_id not in self._event_queues:
+        job = self.processor.get_job(job_id)
+        if job is None:
+            return
+
+        queue: Queue = Queue()
+        finished = self.processor.subscribe(job_id, lambda job, task: queue.put(task is None))
+        if finished is None:  # 이미 끝났거나 이 프로세스에서 처리 중이 아님
+            yield self._calculate_progress(job)
+            return
+
+        if finished:
+            yield self._calculate_progress(job)
+        while not queue.get():  # True = 작업 종료
+            yield self._calculate_progress(job)
+
+    async def stream_job_events(
+        self,
+        job_id: str,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncGenerator[tuple[str, dict], None]:
+        """
+        작업 진행 이벤트 스트림 (SSE 용, 이벤트 구동)
+
+        구독 시점까지 끝난 태스크를 먼저 보낸 뒤, 워커 풀에서 태스크가 끝날 때마다
+        바로 이벤트를 보냅니다. 이 프로세스에서 처리 중인 작업이 아니면
+        (다른 워커 프로세스 / 재시작 직후) 저장소를 STREAM_POLL_SECONDS 간격으로 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+            is_disconnected: 클라이언트 연결 종료 확인 (유휴 시 확인)
+
+        Yields:
+            (이벤트, 데이터):
+                ("progress", LoadingProgress.to_dict())
+                ("result", 항원별 결과 — 완료/캐시/실패)
+                ("ping", {}) — 연결 유지
+                ("done", 작업 상태 요약) — 마지막 이벤트
+        """
+        job = self.processor.get_job(job_id)
+        if job is None:
             return
 
-        queue = self._event_queues[job_id]
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        def on_event(job: BatchJob, task: Optional[SearchTask]):
+            loop.call_soon_threadsafe(events.put_nowait, task)
 
+        finished = self.processor.subscribe(job_id, on_event)
+        if finished is None:
+            async for event in self._poll_job_events(job_id, is_disconnected):
+                yield event
+            return
+
+        try:
+            yield "progress", self._calculate_progress(job).to_dict()
+            for task in finished:
+                yield "result", self._task_event(task)
+            while True:
+                try:
+                    task = await asyncio.wait_for(events.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    yield "ping", {}
+                    continue
+                if task is None:
+                    yield "done", job.get_status_summary()
+                    return
+                yield "result", self._task_event(task)
+                yield "progress", self._calculate_progress(job).to_dict()
+        finally:
+            self.processor.unsubscribe(job_id, on_event)
+
+    async def _poll_job_events(
+        self,
+        job_id: str,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]],
+    ) -> AsyncGenerator[tuple[str, dict], None]:
+        """저장소 조회 기반 스트림 (이 프로세스 워커 풀 밖의 작업)"""
+        sent: set[str] = set()
+        first = True
         while True:
-            progress = queue.get()
-            if progress is None:  # 종료 신호
-                break
-            yield progress
+            job = await asyncio.to_thread(self.processor.get_job, job_id)
+            if job is None:
+                return
+            new_tasks = [
+                t for t in job.tasks
+                if t.status in _FINISHED_STATUSES and t.task_id not in sent
+            ]
+            for task in new_tasks:
+                sent.add(task.task_id)
+                yield "result", self._task_event(task)
+            if new_tasks or first:
+                yield "progress", self._calculate_progress(job).to_dict()
+                first = False
+            if job.is_completed:
+                yield "done", job.get_status_summary()
+                return
+            if is_disconnected is not None and await is_disconnected():
+                return
+            await asyncio.sleep(STREAM_POLL_SECONDS)
 
     def get_background_results(self, job_id: str) -> Optional[list[dict]]:
         """
@@ -5,12 +5,14 @@ E-utilities API를 통해 무료로 논문 검색 및 메타데이터를 가져
 
 API 문서: https://www.ncbi.nlm.nih.gov/books/NBK25497/
 """
+import io
 import time
 import logging
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import IO, Iterator, Optional
 from datetime import date, datetime
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -18,6 +20,7 @@ from urllib3.util.retry import Retry
 logger = logging.getLogger(__name__)
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 
 class PubMedService:
@@ -25,6 +28,9 @@ class PubMedService:
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 
+    # history server(WebEnv) 기반 efetch 1회당 논문 수
+    EFETCH_PAGE_SIZE = 200
+
     def __init__(self, api_key: Optional[str] = None, email: Optional[str] = None):
         """
         Args:
@@ -46,6 +52,12 @@ class PubMedService:
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
+        # 비동기 경로 (search_async) — 동일 헤더·재시도 정책
+        self._async_http = AsyncHttpClient(
+            timeout=60.0,
+            headers={"User-Agent": "AllergyInsight/1.0 (Research Tool)"},
+            retries=3,
+        )
 
     def _build_params(self, **kwargs) -> dict:
         """기본 파라미터 구성"""
@@ -80,21 +92,7 @@ class PubMedService:
         start_time = time.time()
 
         # 1단계: esearch로 논문 ID 목록 검색
-        search_params = self._build_params(
-            db="pubmed",
-            term=query,
-            retmax=max_results,
-            retmode="json",
-            sort=sort,
-            usehistory="y",  # 대용량 결과 처리용
-        )
-
-        if min_date:
-            search_params["mindate"] = min_date
-        if max_date:
-            search_params["maxdate"] = max_date
-            search_params["datetype"] = "pdat"  # publication date
-
+        search_params = self._esearch_params(query, max_results, sort, min_date, max_date)
         try:
             search_response = self.session.get(
                 f"{self.BASE_URL}/esearch.fcgi",
@@ -105,30 +103,184 @@ class PubMedService:
             search_data = search_response.json()
         except requests.RequestException as e:
             logger.warning(f"PubMed search failed: {query} - {e}")
-            return PaperSearchResult(
-                papers=[],
-                total_count=0,
-                query=query,
-                source=PaperSource.PUBMED,
-                search_time_ms=(time.time() - start_time) * 1000,
+            return self._search_result([], 0, query, start_time)
+
+        id_list, total_count = self._parse_esearch(search_data)
+        if not id_list:
+            return self._search_result([], 0, query, start_time)
+
+        # 2단계: efetch로 논문 상세 정보 가져오기
+        # (한 페이지를 넘으면 WebEnv 로 나눠 받아 응답 크기를 제한)
+        webenv, query_key = self._parse_history(search_data)
+        if webenv and len(id_list) > self.EFETCH_PAGE_SIZE:
+            papers = list(self._iter_history(webenv, query_key, len(id_list)))
+        else:
+            papers = self._fetch_paper_details(id_list)
+        return self._search_result(papers, total_count, query, start_time)
+
+    def iter_search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        sort: str = "relevance",
+        min_date: Optional[str] = None,
+        max_date: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Paper]:
+        """
+        PubMed 검색 결과를 스트리밍으로 순회 (벌크 수집용)
+
+        esearch 는 ID 목록 없이 history server(WebEnv/query_key)에 결과를 등록하고,
+        efetch 를 retstart/retmax 창 단위로 호출하여 각 응답을 iterparse 로 읽는 즉시
+        Paper 를 yield 합니다. 결과 건수와 무관하게 메모리 사용량이 한 논문 수준으로 유지됩니다.
+
+        Args:
+            query: 검색 쿼리
+            max_results: 최대 결과 수 (None 이면 전체)
+            sort: 정렬 방식 ("relevance", "pub_date")
+            min_date: 최소 발행일 (YYYY/MM/DD)
+            max_date: 최대 발행일 (YYYY/MM/DD)
+            page_size: efetch 1회당 논문 수 (기본 EFETCH_PAGE_SIZE)
+
+        Yields:
+            Paper: 파싱된 논문 (esearch 정렬 순서)
+        """
+        search_params = self._esearch_params(query, 0, sort, min_date, max_date)
+        try:
+            search_response = self.session.get(
+                f"{self.BASE_URL}/esearch.fcgi",
+                params=search_params,
+                timeout=30,
             )
+            search_response.raise_for_status()
+            search_data = search_response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"PubMed search failed: {query} - {e}")
+            return
 
+        _, total_count = self._parse_esearch(search_data)
+        webenv, query_key = self._parse_history(search_data)
+        if not webenv or not total_count:
+            return
+
+        total = total_count if max_results is None else min(total_count, max_results)
+        yield from self._iter_history(webenv, query_key, total, page_size)
+
+    @staticmethod
+    def _parse_history(search_data: dict) -> tuple[Optional[str], Optional[str]]:
+        """esearch JSON → (WebEnv, query_key)"""
         result = search_data.get("esearchresult", {})
-        id_list = result.get("idlist", [])
-        total_count = int(result.get("count", 0))
+        return result.get("webenv"), result.get("querykey")
 
-        if not id_list:
-            return PaperSearchResult(
-                papers=[],
-                total_count=0,
-                query=query,
-                source=PaperSource.PUBMED,
-                search_time_ms=(time.time() - start_time) * 1000,
+    def _iter_history(
+        self,
+        webenv: str,
+        query_key: str,
+        total: int,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Paper]:
+        """history server 결과를 retstart/retmax 창 단위로 efetch → Paper 스트림"""
+        page_size = page_size or self.EFETCH_PAGE_SIZE
+        for retstart in range(0, total, page_size):
+            if retstart:
+                # NCBI 요청 제한 (API 키 없으면 3회/초, 있으면 10회/초)
+                time.sleep(0.1 if self.api_key else 0.34)
+            retmax = min(page_size, total - retstart)
+            params = self._build_params(
+                db="pubmed",
+                WebEnv=webenv,
+                query_key=query_key,
+                retstart=retstart,
+                retmax=retmax,
+                retmode="xml",
+                rettype="abstract",
             )
+            try:
+                fetch_response = self.session.get(
+                    f"{self.BASE_URL}/efetch.fcgi",
+                    params=params,
+                    timeout=60,
+                    stream=True,
+                )
+            except requests.RequestException as e:
+                logger.warning(f"PubMed fetch failed (retstart={retstart}, retmax={retmax}): {e}")
+                continue
+            # 응답 본문은 소켓에서 읽는 대로 파싱 (전체를 메모리에 올리지 않음)
+            try:
+                fetch_response.raise_for_status()
+                fetch_response.raw.decode_content = True
+                yield from self._iter_pubmed_xml(fetch_response.raw)
+            except (requests.RequestException, ET.ParseError) as e:
+                logger.warning(f"PubMed fetch failed (retstart={retstart}, retmax={retmax}): {e}")
+            finally:
+                fetch_response.close()
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        sort: str = "relevance",
+        min_date: Optional[str] = None,
+        max_date: Optional[str] = None,
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전 (esearch → efetch 를 이벤트 루프에서 실행)"""
+        start_time = time.time()
 
-        # 2단계: efetch로 논문 상세 정보 가져오기
-        papers = self._fetch_paper_details(id_list)
+        search_params = self._esearch_params(query, max_results, sort, min_date, max_date)
+        try:
+            search_response = await self._async_http.get(
+                f"{self.BASE_URL}/esearch.fcgi",
+                params=search_params,
+                timeout=30,
+            )
+            search_response.raise_for_status()
+            search_data = search_response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"PubMed search failed: {query} - {e}")
+            return self._search_result([], 0, query, start_time)
+
+        id_list, total_count = self._parse_esearch(search_data)
+        if not id_list:
+            return self._search_result([], 0, query, start_time)
 
+        papers = await self._fetch_paper_details_async(id_list)
+        return self._search_result(papers, total_count, query, start_time)
+
+    def _esearch_params(
+        self,
+        query: str,
+        max_results: int,
+        sort: str,
+        min_date: Optional[str],
+        max_date: Optional[str],
+    ) -> dict:
+        """esearch 요청 파라미터"""
+        search_params = self._build_params(
+            db="pubmed",
+            term=query,
+            retmax=max_results,
+            retmode="json",
+            sort=sort,
+            usehistory="y",  # 대용량 결과 처리용
+        )
+
+        if min_date:
+            search_params["mindate"] = min_date
+        if max_date:
+            search_params["maxdate"] = max_date
+            search_params["datetype"] = "pdat"  # publication date
+        return search_params
+
+    @staticmethod
+    def _parse_esearch(search_data: dict) -> tuple[list[str], int]:
+        """esearch JSON → (PMID 목록, 전체 건수)"""
+        result = search_data.get("esearchresult", {})
+        return result.get("idlist", []), int(result.get("count", 0))
+
+    @staticmethod
+    def _search_result(
+        papers: list[Paper], total_count: int, query: str, start_time: float,
+    ) -> PaperSearchResult:
         return PaperSearchResult(
             papers=papers,
             total_count=total_count,
@@ -147,17 +299,10 @@ class PubMedService:
         Returns:
             list[Paper]: 논문 목록
         """
-        fetch_params = self._build_params(
-            db="pubmed",
-            id=",".join(pmids),
-            retmode="xml",
-            rettype="abstract",
-        )
-
         try:
             fetch_response = self.session.get(
                 f"{self.BASE_URL}/efetch.fcgi",
-                params=fetch_params,
+                params=self._efetch_params(pmids),
                 timeout=60,
             )
             fetch_response.raise_for_status()
@@ -166,6 +311,29 @@ class PubMedService:
             logger.warning(f"PubMed fetch failed for {len(pmids)} papers: {e}")
             return []
 
+    async def _fetch_paper_details_async(self, pmids: list[str]) -> list[Paper]:
+        """_fetch_paper_details() 의 비동기 버전"""
+        try:
+            fetch_response = await self._async_http.get(
+                f"{self.BASE_URL}/efetch.fcgi",
+                params=self._efetch_params(pmids),
+                timeout=60,
+            )
+            fetch_response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"PubMed fetch failed for {len(pmids)} papers: {e}")
+            return []
+        return self._parse_pubmed_xml(fetch_response.text)
+
+    def _efetch_params(self, pmids: list[str]) -> dict:
+        """efetch 요청 파라미터"""
+        return self._build_params(
+            db="pubmed",
+            id=",".join(pmids),
+            retmode="xml",
+            rettype="abstract",
+        )
+
     def _parse_pubmed_xml(self, xml_content: str) -> list[Paper]:
         """
         PubMed XML 응답 파싱
@@ -176,22 +344,36 @@ class PubMedService:
         Returns:
             list[Paper]: 파싱된 논문 목록
         """
-        papers = []
-
         try:
-            root = ET.fromstring(xml_content)
+            return list(self._iter_pubmed_xml(io.BytesIO(xml_content.encode("utf-8"))))
         except ET.ParseError:
-            return papers
+            return []
+
+    def _iter_pubmed_xml(self, source: IO[bytes]) -> Iterator[Paper]:
+        """
+        PubMed XML 스트림을 iterparse 로 순회하며 논문 단위로 파싱
 
-        for article in root.findall(".//PubmedArticle"):
+        PubmedArticle 요소가 닫힐 때마다 Paper 를 만들고 루트에서 떼어내므로
+        이미 처리한 논문의 트리는 메모리에 남지 않습니다.
+
+        Raises:
+            ET.ParseError: XML 이 손상된 경우 (그 전까지의 논문은 이미 yield 됨)
+        """
+        root = None
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if root is None:
+                root = elem
+                continue
+            if event != "end" or elem.tag != "PubmedArticle":
+                continue
             try:
-                paper = self._parse_article(article)
-                if paper:
-                    papers.append(paper)
+                paper = self._parse_article(elem)
             except Exception:
-                continue
-
-        return papers
+                paper = None
+            # 처리한 논문 제거 (PubmedArticle 은 PubmedArticleSet 의 직계 자식)
+            root.clear()
+            if paper:
+                yield paper
 
     def _parse_article(self, article: ET.Element) -> Optional[Paper]:
         """단일 논문 XML 파싱"""
@@ -383,7 +565,26 @@ class PubMedService:
         Returns:
             PaperSearchResult: 검색 결과
         """
-        # 알러지 특화 검색 쿼리 구성
+        return self.search(
+            self._allergy_query(allergen, include_cross_reactivity),
+            max_results=max_results,
+        )
+
+    async def search_allergy_papers_async(
+        self,
+        allergen: str,
+        include_cross_reactivity: bool = True,
+        max_results: int = 20,
+    ) -> PaperSearchResult:
+        """search_allergy_papers() 의 비동기 버전"""
+        return await self.search_async(
+            self._allergy_query(allergen, include_cross_reactivity),
+            max_results=max_results,
+        )
+
+    @staticmethod
+    def _allergy_query(allergen: str, include_cross_reactivity: bool) -> str:
+        """알러지 특화 검색 쿼리 구성"""
         query_parts = [
             f'"{allergen}"[Title/Abstract]',
             'allergy[Title/Abstract] OR allergic[Title/Abstract] OR hypersensitivity[Title/Abstract]',
@@ -397,5 +598,8 @@ class PubMedService:
         query = f"({query_parts[0]}) AND ({query_parts[1]})"
         if include_cross_reactivity:
             query = f"{query} AND ({query_parts[2]})"
+        return query
 
-        return self.search(query, max_results=max_results)
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
@@ -0,0 +1,301 @@
+"""RAG 답변 캐시
+
+동일한 질문이 같은 논문 청크로 검색되면 LLM을 다시 호출하지 않고
+저장된 답변을 반환합니다.
+
+키: sha256(정규화 질문 | 알러젠 | 정렬된 검색 청크 ID)
+- TTL: RAG_ANSWER_CACHE_TTL_HOURS (기본 72시간)
+- 용량: RAG_ANSWER_CACHE_MAX_ENTRIES (기본 5000건, 초과 시 최근 미사용 순 제거)
+- 무효화: 근거 논문이 재인덱싱되면 해당 논문을 참조한 답변 삭제
+- 접근 기록: 히트 카운터/마지막 접근 시각은 메모리에 모았다가
+  RAG_ANSWER_CACHE_HIT_FLUSH 건마다 (또는 저장·LRU 제거 직전에) 한 번에 반영
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import bindparam
+
+from ..utils.timezone import utc_now
+
+logger = logging.getLogger(__name__)
+
+_TTL_HOURS = float(os.getenv("RAG_ANSWER_CACHE_TTL_HOURS", "72"))
+_MAX_ENTRIES = int(os.getenv("RAG_ANSWER_CACHE_MAX_ENTRIES", "5000"))
+_HIT_FLUSH = int(os.getenv("RAG_ANSWER_CACHE_HIT_FLUSH", "50"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.~…]+$")
+
+
+def normalize_question(question: str) -> str:
+    """질문 정규화 (유니코드 NFKC, 소문자, 공백 축약, 끝 문장부호 제거)"""
+    text = unicodedata.normalize("NFKC", question or "").lower()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+def make_cache_key(question: str, allergen: Optional[str], chunk_ids: list[str]) -> str:
+    """캐시 키 생성"""
+    raw = "|".join([
+        normalize_question(question),
+        (allergen or "").strip().lower(),
+        ",".join(sorted(chunk_ids)),
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class RagAnswerCache:
+    """rag_answer_cache 테이블 기반 영속 답변 캐시"""
+
+    def __init__(
+        self,
+        ttl_hours: float = _TTL_HOURS,
+        max_entries: int = _MAX_ENTRIES,
+        hit_flush: int = _HIT_FLUSH,
+    ):
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+        self.hit_flush = hit_flush
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # cache_key → (미반영 히트 수, 마지막 접근 시각)
+        self._pending_hits: dict[str, tuple[int, datetime]] = {}
+        self._pending_count = 0
+
+    def _is_expired(self, entry) -> bool:
+        created_at = entry.created_at
+        if created_at.tzinfo is None:  # SQLite 는 naive 로 반환
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at < utc_now() - self.ttl
+
+    def get(
+        self,
+        db,
+        question: str,
+        allergen: Optional[str],
+        chunk_ids: list[str],
+    ) -> Optional[dict]:
+        """캐시된 ask() 결과 조회 (만료 항목은 미스 처리 후 삭제)"""
+        from ..database.models import RagAnswerCacheEntry
+
+        key = make_cache_key(question, allergen, chunk_ids)
+        entry = None
+        try:
+            entry = db.get(RagAnswerCacheEntry, key)
+            if entry is not None and self._is_expired(entry):
+                db.delete(entry)
+                db.commit()
+                entry = None
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"RAG 답변 캐시 조회 실패: {e}")
+            entry = None
+
+        if entry is not None and self._record_hit(key):
+            self.flush_hits(db)
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if entry is None:
+            return None
+        return {
+            "answer": entry.answer,
+            "sources": entry.sources,
+            "confidence": entry.confidence,
+        }
+
+    def _record_hit(self, key: str) -> bool:
+        """히트를 메모리에 기록 — 반영 주기에 도달하면 True"""
+        with self._lock:
+            count, _ = self._pending_hits.get(key, (0, None))
+            self._pending_hits[key] = (count + 1, utc_now())
+            self._pending_count += 1
+            return self._pending_count >= self.hit_flush
+
+    def flush_hits(self, db) -> int:
+        """모아 둔 히트 카운터/마지막 접근 시각을 UPDATE 1회(executemany)로 반영
+
+        Returns:
+            반영한 캐시 항목 수
+        """
+        from ..database.models import RagAnswerCacheEntry
+
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            self._pending_count = 0
+        if not pending:
+            return 0
+
+        table = RagAnswerCacheEntry.__table__
+        stmt = (
+            table.update()
+            .where(table.c.cache_key == bindparam("key"))
+            .values(
+                hit_count=table.c.hit_count + bindparam("hits"),
+                last_accessed_at=bindparam("accessed_at"),
+            )
+        )
+        try:
+            db.execute(stmt, [
+                {"key": key, "hits": hits, "accessed_at": accessed_at}
+                for key, (hits, accessed_at) in pending.items()
+            ])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"RAG 답변 캐시 접근 기록 반영 실패: {e}")
+            return 0
+        return len(pending)
+
+    def put(
+        self,
+        db,
+        question: str,
+        allergen: Optional[str],
+        chunk_ids: list[str],
+        result: dict,
+        paper_ids: list[int],
+    ) -> None:
+        """ask() 결과 저장 + 용량 초과분 LRU 제거"""
+        from ..database.models import RagAnswerCacheEntry, RagAnswerCachePaper
+
+        key = make_cache_key(question, allergen, chunk_ids)
+        try:
+            existing = db.get(RagAnswerCacheEntry, key)
+            if existing is not None:
+                db.delete(existing)
+                db.flush()
+
+            now = utc_now()
+            entry = RagAnswerCacheEntry(
+                cache_key=key,
+                question=normalize_question(question),
+                allergen=allergen,
+                chunk_ids=sorted(chunk_ids),
+                answer=result["answer"],
+                sources=result["sources"],
+                confidence=result["confidence"],
+                hit_count=0,
+                created_at=now,
+                last_accessed_at=now,
+            )
+            entry.papers = [
+                RagAnswerCachePaper(cache_key=key, paper_id=pid)
+                for pid in sorted({pid for pid in paper_ids if pid is not None})
+            ]
+            db.add(entry)
+            db.commit()
+            self.flush_hits(db)  # LRU 판정 전에 최근 접근 시각 반영
+            self._evict(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"RAG 답변 캐시 저장 실패: {e}")
+
+    def _evict(self, db) -> int:
+        """max_entries 초과 시 마지막 접근이 오래된 항목부터 제거"""
+        from ..database.models import RagAnswerCacheEntry
+
+        total = db.query(RagAnswerCacheEntry).count()
+        overflow = total - self.max_entries
+        if overflow <= 0:
+            return 0
+
+        stale_keys = [
+            row.cache_key
+            for row in db.query(RagAnswerCacheEntry.cache_key)
+            .order_by(RagAnswerCacheEntry.last_accessed_at.asc())
+            .limit(overflow)
+            .all()
+        ]
+        self._delete_keys(db, stale_keys)
+        db.commit()
+        return len(stale_keys)
+
+    @staticmethod
+    def _delete_keys(db, keys: list[str]) -> None:
+        from ..database.models import RagAnswerCacheEntry, RagAnswerCachePaper
+
+        if not keys:
+            return
+        db.query(RagAnswerCachePaper).filter(
+            RagAnswerCachePaper.cache_key.in_(keys)
+        ).delete(synchronize_session=False)
+        db.query(RagAnswerCacheEntry).filter(
+            RagAnswerCacheEntry.cache_key.in_(keys)
+        ).delete(synchronize_session=False)
+
+    def invalidate_papers(self, db, paper_ids: list[int]) -> int:
+        """재인덱싱된 논문을 근거로 한 답변 삭제 (커밋은 호출자 책임)
+
+        Returns:
+            삭제된 캐시 항목 수
+        """
+        from ..database.models import RagAnswerCachePaper
+
+        if not paper_ids:
+            return 0
+
+        keys = [
+            row.cache_key
+            for row in db.query(RagAnswerCachePaper.cache_key)
+            .filter(RagAnswerCachePaper.paper_id.in_(paper_ids))
+            .distinct()
+            .all()
+        ]
+        self._delete_keys(db, keys)
+        if keys:
+            logger.info(f"RAG 답변 캐시 무효화: {len(keys)}건 (논문 {len(paper_ids)}건 재인덱싱)")
+        return len(keys)
+
+    def clear(self, db) -> None:
+        """전체 캐시 삭제 (커밋은 호출자 책임)"""
+        from ..database.models import RagAnswerCacheEntry, RagAnswerCachePaper
+
+        db.query(RagAnswerCachePaper).delete(synchronize_session=False)
+        db.query(RagAnswerCacheEntry).delete(synchronize_session=False)
+
+    def get_stats(self, db) -> dict:
+        """히트/미스 카운터 (프로세스 단위) + 저장 항목 수"""
+        from ..database.models import RagAnswerCacheEntry
+
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+
+        entries = 0
+        try:
+            entries = db.query(RagAnswerCacheEntry).count()
+        except Exception as e:
+            logger.warning(f"RAG 답변 캐시 통계 조회 실패: {e}")
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+        }
+
+
+# 싱글톤
+_answer_cache: Optional[RagAnswerCache] = None
+
+
+def get_answer_cache() -> RagAnswerCache:
+    """RagAnswerCache 싱글톤"""
+    global _answer_cache
+    if _answer_cache is None:
+        _answer_cache = RagAnswerCache()
+    return _answer_cache
@@ -0,0 +1,225 @@
+"""RAG 렉시컬(BM25) 사이드카 인덱스
+
+ChromaDB 컬렉션과 동일한 청크를 SQLite FTS5 테이블에 보관해
+키워드 기반 BM25 검색과 알러젠별 포스팅 리스트를 제공합니다.
+
+테이블:
+    chunk_meta       — chunk_id, paper_id, 표시용 메타데이터 (rowid = FTS rowid)
+    chunk_fts        — FTS5(title, text), bm25() 랭킹
+    chunk_allergens  — (allergen, chunk_id) 포스팅 리스트
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_QUERY_TOKENS = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunk_meta (
+    rowid INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    paper_id INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    year INTEGER NOT NULL DEFAULT 0,
+    doi TEXT NOT NULL DEFAULT '',
+    allergens TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_chunk_meta_paper ON chunk_meta (paper_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunk_fts USING fts5(
+    title, text, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS chunk_allergens (
+    allergen TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    PRIMARY KEY (allergen, chunk_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_chunk_allergens_chunk ON chunk_allergens (chunk_id);
+"""
+
+
+def _fts_query(text: str) -> Optional[str]:
+    """자유 텍스트 → FTS5 OR 쿼리 (토큰별 인용으로 문법 오류 방지)"""
+    tokens = []
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        if len(token) < 2 or token in tokens:
+            continue
+        tokens.append(token)
+        if len(tokens) >= _MAX_QUERY_TOKENS:
+            break
+    if not tokens:
+        return None
+    return " OR ".join(f'"{t}"' for t in tokens)
+
+
+class LexicalIndex:
+    """SQLite FTS5 기반 BM25 + 알러젠 포스팅 리스트"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def count(self) -> int:
+        """저장된 청크 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunk_meta").fetchone()[0]
+
+    @property
+    def is_ready(self) -> bool:
+        return self.count() > 0
+
+    def _delete_papers(self, paper_ids: list[int]) -> None:
+        """논문 청크 삭제 (lock 보유 상태에서 호출)"""
+        for start in range(0, len(paper_ids), 500):
+            batch = paper_ids[start:start + 500]
+            marks = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT rowid, chunk_id FROM chunk_meta WHERE paper_id IN ({marks})",
+                batch,
+            ).fetchall()
+            if not rows:
+                continue
+            self._conn.executemany(
+                "DELETE FROM chunk_fts WHERE rowid = ?", [(r[0],) for r in rows]
+            )
+            self._conn.executemany(
+                "DELETE FROM chunk_allergens WHERE chunk_id = ?", [(r[1],) for r in rows]
+            )
+            self._conn.execute(
+                f"DELETE FROM chunk_meta WHERE paper_id IN ({marks})", batch
+            )
+
+    def replace_papers(
+        self,
+        paper_ids: list[int],
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """논문 청크 교체 (ChromaDB upsert와 같은 입력)"""
+        with self._lock:
+            try:
+                self._delete_papers(paper_ids)
+                for chunk_id, document, meta in zip(ids, documents, metadatas):
+                    cur = self._conn.execute(
+                        "INSERT INTO chunk_meta "
+                        "(chunk_id, paper_id, title, year, doi, allergens) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            chunk_id,
+                            meta["paper_id"],
+                            meta.get("title", ""),
+                            meta.get("year") or 0,
+                            meta.get("doi", ""),
+                            meta.get("allergens", ""),
+                        ),
+                    )
+                    self._conn.execute(
+                        "INSERT INTO chunk_fts (rowid, title, text) VALUES (?, ?, ?)",
+                        (cur.lastrowid, meta.get("title", ""), document),
+                    )
+                    codes = {c for c in (meta.get("allergens") or "").split(",") if c}
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO chunk_allergens (allergen, chunk_id) "
+                        "VALUES (?, ?)",
+                        [(code, chunk_id) for code in codes],
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM chunk_fts")
+            self._conn.execute("DELETE FROM chunk_allergens")
+            self._conn.execute("DELETE FROM chunk_meta")
+            self._conn.commit()
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        allergen: Optional[str] = None,
+    ) -> list[dict]:
+        """BM25 검색
+
+        Returns:
+            [{"chunk_id", "paper_id", "title", "text", "bm25", "year", "doi", "allergens"}]
+            (bm25 는 클수록 관련도 높음)
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT m.chunk_id, m.paper_id, m.title, f.text, -bm25(chunk_fts) AS rank_score, "
+            "m.year, m.doi, m.allergens "
+            "FROM chunk_fts f JOIN chunk_meta m ON m.rowid = f.rowid "
+        )
+        params: list = []
+        if allergen:
+            sql += "JOIN chunk_allergens a ON a.chunk_id = m.chunk_id AND a.allergen = ? "
+            params.append(allergen)
+        sql += "WHERE chunk_fts MATCH ? ORDER BY bm25(chunk_fts) LIMIT ?"
+        params.extend([match, n_results])
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"렉시컬 검색 실패: {e}")
+            return []
+
+        return [
+            {
+                "chunk_id": row[0],
+                "paper_id": row[1],
+                "title": row[2],
+                "text": row[3],
+                "bm25": round(row[4], 4),
+                "year": row[5],
+                "doi": row[6],
+                "allergens": row[7],
+            }
+            for row in rows
+        ]
+
+    def has_allergen(self, allergen: str) -> bool:
+        """알러젠 포스팅 리스트 존재 여부"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM chunk_allergens WHERE allergen = ? LIMIT 1", (allergen,)
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = 60) -> dict[str, float]:
+    """Reciprocal Rank Fusion: score(d) = Σ 1 / (k + rank)
+
+    Args:
+        rankings: 각 검색기의 순위 리스트 (ID, 1위부터)
+        k: 순위 완화 상수 (기본 60)
+
+    Returns:
+        {id: fused_score}
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, 1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return scores
@@ -6,9 +6,13 @@ ChromaDB 벡터 DB + 로컬 LLM을 사용한 논문 기반 시맨틱 검색 및
     논문 DB (PostgreSQL) → 텍스트 청킹 → ChromaDB 임베딩 저장
     사용자 질문 → ChromaDB 유사 검색 → 관련 논문 컨텍스트 → LLM 답변 생성
 """
+import hashlib
 import logging
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .rag_lexical_index import reciprocal_rank_fusion
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,17 @@ _COLLECTION_NAME = "allergy_papers"
 _CHUNK_SIZE = 800
 _CHUNK_OVERLAP = 100
 _MIN_RELEVANCE_SCORE = 0.4  # 최소 관련도 임계값 (40% 미만 논문 제외)
+# 벌크 인덱싱 시 한 번의 upsert(=임베딩 호출)에 담을 청크 수
+_UPSERT_BATCH_SIZE = int(os.getenv("RAG_UPSERT_BATCH_SIZE", "512"))
+
+# 하이브리드 검색 (BM25 사이드카 + 벡터, Reciprocal Rank Fusion)
+_LEXICAL_INDEX_PATH = os.getenv(
+    "RAG_LEXICAL_INDEX_PATH",
+    os.path.join(_CHROMA_PERSIST_DIR, "lexical_index.sqlite3"),
+)
+_RRF_K = 60
+_CANDIDATE_MULTIPLIER = 3  # 검색기별 후보 수 = n_results × 배수
+_ALLERGEN_META_PREFIX = "allergen_"  # 알러젠별 bool 메타데이터 (where 필터용)
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +82,42 @@ def _chunk_text(text: str, chunk_size: int = _CHUNK_SIZE, overlap: int = _CHUNK_
     return chunks
 
 
+@contextmanager
+def _db_session(db=None):
+    """주어진 세션을 그대로 쓰거나, 없으면 임시 세션을 열고 닫음"""
+    if db is not None:
+        yield db
+        return
+
+    from ..database.connection import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _cosine_similarity(a, b) -> float:
+    """코사인 유사도 (numpy 비의존)"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(y * y for y in b) ** 0.5
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _allergen_meta(allergen_codes: Optional[list[str]]) -> dict:
+    """알러젠 코드 → {"allergen_peanut": True, ...} (ChromaDB where 필터용)"""
+    return {f"{_ALLERGEN_META_PREFIX}{code}": True for code in (allergen_codes or []) if code}
+
+
+def _content_hash(text: str) -> str:
+    """인덱싱 원문의 SHA-256 (재인덱싱 필요 여부 판단용)"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
 class RAGService:
     """논문 기반 RAG 서비스"""
 
@@ -74,6 +125,8 @@ class RAGService:
         self._client = None
         self._collection = None
         self._available: Optional[bool] = None
+        self._embedding_fn = None
+        self._lexical = None
 
     def _get_collection(self):
         """ChromaDB 컬렉션 (lazy 초기화)"""
@@ -86,10 +139,22 @@ class RAGService:
             persist_dir = os.path.abspath(_CHROMA_PERSIST_DIR)
             os.makedirs(persist_dir, exist_ok=True)
 
+            # 쿼리 임베딩을 직접 계산해 하이브리드 검색에서 재사용 (컬렉션 기본값과 동일 모델)
+            collection_kwargs = {}
+            try:
+                from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+                self._embedding_fn = DefaultEmbeddingFunction()
+                collection_kwargs["embedding_function"] = self._embedding_fn
+            except Exception as e:
+                logger.warning(f"임베딩 함수 초기화 실패 (쿼리 텍스트 검색 사용): {e}")
+                self._embedding_fn = None
+
             self._client = chromadb.PersistentClient(path=persist_dir)
             self._collection = self._client.get_or_create_collection(
                 name=_COLLECTION_NAME,
                 metadata={"hnsw:space": "cosine"},
+                **collection_kwargs,
             )
             self._available = True
             logger.info(
@@ -102,6 +167,30 @@ class RAGService:
 
         return self._collection
 
+    def _get_lexical_index(self):
+        """BM25 사이드카 인덱스 (lazy 초기화, 실패 시 None → 벡터 검색만 사용)"""
+        if self._lexical is not None:
+            return self._lexical
+
+        try:
+            from .rag_lexical_index import LexicalIndex
+
+            self._lexical = LexicalIndex(os.path.abspath(_LEXICAL_INDEX_PATH))
+        except Exception as e:
+            logger.warning(f"렉시컬 인덱스 초기화 실패: {e}")
+            self._lexical = None
+        return self._lexical
+
+    def _embed_query(self, text: str) -> Optional[list[float]]:
+        """쿼리 임베딩 (임베딩 함수 미가용 시 None)"""
+        if self._embedding_fn is None:
+            return None
+        try:
+            return [float(x) for x in self._embedding_fn([text])[0]]
+        except Exception as e:
+            logger.warning(f"쿼리 임베딩 실패: {e}")
+            return None
+
     @property
     def is_available(self) -> bool:
         if self._available is None or self._available is False:
@@ -125,6 +214,8 @@ class RAGService:
         allergen_codes: Optional[list[str]] = None,
         year: Optional[int] = None,
         doi: Optional[str] = None,
+        db=None,
+        content_source: str = "abstract",
     ) -> int:
         """논문을 벡터 DB에 인덱싱
 
@@ -135,57 +226,348 @@ class RAGService:
             allergen_codes: 관련 알러젠 코드 리스트
             year: 발행 연도
             doi: DOI
+            db: SQLAlchemy 세션 (지정 시 rag_index_state 워터마크 갱신, 커밋은 호출자 책임)
+            content_source: 인덱싱 원문 종류 ('abstract' 또는 'fulltext')
 
         Returns:
             인덱싱된 청크 수
         """
+        indexed = self.index_papers(
+            [{
+                "paper_id": paper_id,
+                "title": title,
+                "abstract": abstract,
+                "allergen_codes": allergen_codes,
+                "year": year,
+                "doi": doi,
+            }],
+            db=db,
+            content_source=content_source,
+        )
+        return indexed.get(paper_id, 0)
+
+    def index_papers(
+        self,
+        papers: list[dict],
+        db=None,
+        content_source: str = "abstract",
+        batch_size: Optional[int] = None,
+    ) -> dict[int, int]:
+        """여러 논문을 모아 벡터 DB에 벌크 인덱싱
+
+        논문별 get/delete/add 대신 기존 청크를 한 번에 삭제하고,
+        모든 논문의 청크를 batch_size 단위 upsert(임베딩 호출)로 기록합니다.
+        db 가 지정되면 워터마크의 content_hash/content_source 가 같은 논문은
+        임베딩하지 않고 건너뜁니다.
+
+        Args:
+            papers: [{"paper_id", "title", "abstract", "allergen_codes", "year", "doi"}]
+            db: SQLAlchemy 세션 (지정 시 rag_index_state 워터마크 갱신, 커밋은 호출자 책임)
+            content_source: 인덱싱 원문 종류 ('abstract' 또는 'fulltext')
+            batch_size: upsert 1회당 청크 수 (기본: RAG_UPSERT_BATCH_SIZE)
+
+        Returns:
+            {paper_id: 인덱싱된 청크 수} (청크가 없거나 변경 없는 논문은 제외)
+        """
         col = self._get_collection()
-        if not col:
-            return 0
+        if not col or not papers:
+            return {}
+
+        batch_size = batch_size or _UPSERT_BATCH_SIZE
+        states = (
+            self._load_index_states(db, [p["paper_id"] for p in papers])
+            if db is not None else {}
+        )
+        unchanged: set[int] = set()
+
+        ids: list[str] = []
+        documents: list[str] = []
+        metadatas: list[dict] = []
+        chunk_counts: dict[int, int] = {}
+        content_hashes: dict[int, str] = {}
 
-        # 기존 인덱스 삭제 (재인덱싱 방지)
+        for paper in papers:
+            paper_id = paper["paper_id"]
+            title = paper["title"]
+            abstract = paper.get("abstract")
+            allergen_codes = paper.get("allergen_codes")
+
+            # 텍스트 구성: 제목 + 초록
+            full_text = f"{title}\n\n{abstract}" if abstract else title
+            content_hash = _content_hash(full_text)
+            state = states.get(paper_id)
+            if (
+                state is not None
+                and state.content_hash == content_hash
+                and state.content_source == content_source
+            ):
+                unchanged.add(paper_id)
+                continue
+
+            chunks = _chunk_text(full_text)
+            if not chunks:
+                continue
+
+            # 메타데이터 구성
+            base_meta = {
+                "paper_id": paper_id,
+                "title": title[:200],
+                "year": paper.get("year") or 0,
+                "doi": paper.get("doi") or "",
+                "allergens": ",".join(allergen_codes) if allergen_codes else "",
+                **_allergen_meta(allergen_codes),
+            }
+
+            for i, chunk in enumerate(chunks):
+                ids.append(f"paper_{paper_id}_chunk_{i}")
+                documents.append(chunk)
+                metadatas.append({**base_meta, "chunk_index": i})
+
+            chunk_counts[paper_id] = len(chunks)
+            content_hashes[paper_id] = content_hash
+
+        paper_ids = [p["paper_id"] for p in papers if p["paper_id"] not in unchanged]
+        if not paper_ids:
+            return {}
+
+        # 기존 인덱스 삭제 (청크 수가 줄어든 재인덱싱 시 잔여 청크 방지)
         try:
-            existing = col.get(where={"paper_id": paper_id})
-            if existing and existing["ids"]:
-                col.delete(ids=existing["ids"])
+            if len(paper_ids) == 1:
+                col.delete(where={"paper_id": paper_ids[0]})
+            else:
+                col.delete(where={"paper_id": {"$in": paper_ids}})
         except Exception:
             pass
 
-        # 텍스트 구성: 제목 + 초록
-        full_text = f"{title}\n\n{abstract}" if abstract else title
-        chunks = _chunk_text(full_text)
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            col.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+            )
+
+        lexical = self._get_lexical_index()
+        if lexical is not None:
+            try:
+                lexical.replace_papers(paper_ids, ids, documents, metadatas)
+            except Exception as e:
+                logger.warning(f"렉시컬 인덱스 갱신 실패: {e}")
 
-        if not chunks:
+        if db is not None:
+            from .rag_answer_cache import get_answer_cache
+
+            self._record_index_states(
+                db,
+                {pid: (content_hashes[pid], count) for pid, count in chunk_counts.items()},
+                content_source,
+                states,
+            )
+            get_answer_cache().invalidate_papers(db, paper_ids)
+
+        return chunk_counts
+
+    @staticmethod
+    def _load_allergen_codes(db, paper_ids: list[int]) -> dict[int, list[str]]:
+        """논문별 알러젠 코드 일괄 조회"""
+        from ..database.models import PaperAllergenLink
+
+        codes: dict[int, list[str]] = {pid: [] for pid in paper_ids}
+        if not paper_ids:
+            return codes
+
+        rows = (
+            db.query(PaperAllergenLink.paper_id, PaperAllergenLink.allergen_code)
+            .filter(PaperAllergenLink.paper_id.in_(paper_ids))
+            .all()
+        )
+        for paper_id, allergen_code in rows:
+            codes[paper_id].append(allergen_code)
+        return codes
+
+    @staticmethod
+    def _load_index_states(db, paper_ids: list[int]) -> dict:
+        """논문별 rag_index_state 일괄 조회 (IN 절 1000건 단위)"""
+        from ..database.models import RagIndexState
+
+        states = {}
+        for start in range(0, len(paper_ids), 1000):
+            rows = (
+                db.query(RagIndexState)
+                .filter(RagIndexState.paper_id.in_(paper_ids[start:start + 1000]))
+                .all()
+            )
+            states.update((state.paper_id, state) for state in rows)
+        return states
+
+    @classmethod
+    def _record_index_states(
+        cls,
+        db,
+        entries: dict[int, tuple[str, int]],
+        content_source: str = "abstract",
+        states: Optional[dict] = None,
+    ) -> None:
+        """rag_index_state 워터마크 일괄 upsert (flush/commit은 호출자 책임)
+
+        Args:
+            entries: {paper_id: (content_hash, chunk_count)}
+            states: 미리 조회한 기존 워터마크 (없으면 IN 조회 1회)
+        """
+        from ..database.models import RagIndexState
+        from ..utils.timezone import utc_now
+
+        if states is None:
+            states = cls._load_index_states(db, list(entries))
+        now = utc_now()
+        for paper_id, (content_hash, chunk_count) in entries.items():
+            state = states.get(paper_id)
+            if state is None:
+                state = RagIndexState(paper_id=paper_id)
+                db.add(state)
+            state.content_hash = content_hash
+            state.chunk_count = chunk_count
+            state.content_source = content_source
+            state.indexed_at = now
+
+    def _bootstrap_index_state(self, db, col) -> int:
+        """워터마크 테이블이 비어 있고 컬렉션에 기존 청크가 있으면 1회 동기화
+
+        워터마크 도입 이전에 구축된 컬렉션을 재인덱싱 없이 이어받기 위한 것으로,
+        rag_index_state 가 한 번 채워지면 이후 실행에서는 메타데이터 스캔을 하지 않는다.
+
+        Returns:
+            등록된 논문 수
+        """
+        from sqlalchemy import func
+
+        from ..database.models import Paper as PaperORM
+        from ..database.models import RagIndexState
+
+        if db.query(func.count(RagIndexState.paper_id)).scalar():
+            return 0
+        if col.count() == 0:
             return 0
 
-        # 메타데이터 구성
-        base_meta = {
-            "paper_id": paper_id,
-            "title": title[:200],
-            "year": year or 0,
-            "doi": doi or "",
-            "allergens": ",".join(allergen_codes) if allergen_codes else "",
-        }
+        chunk_counts: dict[int, int] = {}
+        try:
+            all_meta = col.get(include=["metadatas"])
+            for meta in (all_meta.get("metadatas") or []):
+                if meta and "paper_id" in meta:
+                    pid = meta["paper_id"]
+                    chunk_counts[pid] = chunk_counts.get(pid, 0) + 1
+        except Exception as e:
+            logger.warning(f"RAG 워터마크 초기화 실패: {e}")
+            return 0
+
+        registered = 0
+        paper_ids = list(chunk_counts)
+        for start in range(0, len(paper_ids), 1000):
+            rows = (
+                db.query(PaperORM.id, PaperORM.title, PaperORM.abstract)
+                .filter(PaperORM.id.in_(paper_ids[start:start + 1000]))
+                .all()
+            )
+            entries = {}
+            for pid, title, abstract in rows:
+                full_text = f"{title}\n\n{abstract}" if abstract else title
+                entries[pid] = (_content_hash(full_text), chunk_counts[pid])
+            # 워터마크 테이블이 비어 있는 상태이므로 기존 행 조회 생략
+            self._record_index_states(db, entries, states={})
+            registered += len(entries)
+        db.commit()
+
+        logger.info(f"RAG 워터마크 초기화: 기존 인덱스 {registered}건 등록")
+        return registered
 
-        ids = []
-        documents = []
-        metadatas = []
+    @staticmethod
+    def _lexical_synced(lexical, col) -> bool:
+        """BM25 사이드카가 컬렉션의 모든 청크를 담고 있는지 (청크 수 비교)
+
+        초기 동기화가 중간에 끊기면 사이드카 청크 수가 컬렉션보다 적게 남는다.
+        이 상태에서는 알러젠 bool 메타데이터도 일부 청크에만 있으므로
+        알러젠 사전 필터를 쓰면 안 된다.
+        """
+        return lexical.count() >= col.count()
+
+    def _bootstrap_lexical_index(self, col, page_size: int = 5000) -> int:
+        """BM25 사이드카가 컬렉션보다 청크가 적으면 (비어 있거나 이전 동기화가 중단됨) 동기화
+
+        기존 청크에 알러젠별 bool 메타데이터도 함께 채워 넣는다 (임베딩 재계산 없음).
+        논문 단위 교체이므로 중단된 동기화를 처음부터 다시 실행해도 안전하다.
+
+        Returns:
+            동기화된 청크 수
+        """
+        lexical = self._get_lexical_index()
+        if lexical is None or col.count() == 0 or self._lexical_synced(lexical, col):
+            return 0
+
+        synced = 0
+        offset = 0
+        try:
+            while True:
+                page = col.get(
+                    include=["documents", "metadatas"], limit=page_size, offset=offset,
+                )
+                ids = page.get("ids") or []
+                if not ids:
+                    break
 
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"paper_{paper_id}_chunk_{i}"
-            ids.append(chunk_id)
-            documents.append(chunk)
-            metadatas.append({**base_meta, "chunk_index": i})
+                metadatas = []
+                for meta in page.get("metadatas") or []:
+                    codes = [c for c in (meta.get("allergens") or "").split(",") if c]
+                    metadatas.append({**meta, **_allergen_meta(codes)})
 
-        col.add(ids=ids, documents=documents, metadatas=metadatas)
-        return len(chunks)
+                col.update(ids=ids, metadatas=metadatas)
+                paper_ids = list({m["paper_id"] for m in metadatas})
+                lexical.replace_papers(paper_ids, ids, page.get("documents") or [], metadatas)
 
-    def index_papers_from_db(self, db, batch_size: int = 100) -> dict:
+                synced += len(ids)
+                offset += len(ids)
+        except Exception as e:
+            logger.warning(f"렉시컬 인덱스 초기화 실패: {e}")
+            lexical.clear()
+            return 0
+
+        logger.info(f"렉시컬 인덱스 초기화: 기존 청크 {synced}개 동기화")
+        return synced
+
+    def reset_index(self, db) -> None:
+        """컬렉션과 워터마크를 모두 비움 (전체 재구축용)"""
+        from ..database.models import RagIndexState
+
+        col = self._get_collection()
+        if col is not None and self._client is not None:
+            try:
+                self._client.delete_collection(_COLLECTION_NAME)
+            except Exception as e:
+                logger.warning(f"RAG 컬렉션 삭제 중 오류 (무시): {e}")
+            self._collection = None
+            self._available = None
+
+        from .rag_answer_cache import get_answer_cache
+
+        lexical = self._get_lexical_index()
+        if lexical is not None:
+            lexical.clear()
+
+        db.query(RagIndexState).delete(synchronize_session=False)
+        get_answer_cache().clear(db)
+        db.commit()
+
+    def index_papers_from_db(
+        self,
+        db,
+        batch_size: int = 100,
+        upsert_batch_size: Optional[int] = None,
+    ) -> dict:
         """PostgreSQL papers 테이블에서 미인덱싱 논문을 벡터 DB에 배치 인덱싱
 
         Args:
             db: SQLAlchemy 세션
             batch_size: 한 번에 처리할 논문 수
+            upsert_batch_size: upsert 1회당 청크 수 (기본: RAG_UPSERT_BATCH_SIZE)
 
         Returns:
             {"indexed": int, "skipped": int, "total_chunks": int}
@@ -194,56 +576,50 @@ class RAGService:
         if not col:
             return {"indexed": 0, "skipped": 0, "total_chunks": 0}
 
+        from sqlalchemy import func
+
         from ..database.models import Paper as PaperORM
-        from ..database.models import PaperAllergenLink
+        from ..database.models import RagIndexState
 
-        # 이미 인덱싱된 paper_id 조회
-        indexed_ids = set()
-        try:
-            all_meta = col.get(include=["metadatas"])
-            for meta in (all_meta.get("metadatas") or []):
-                if meta and "paper_id" in meta:
-                    indexed_ids.add(meta["paper_id"])
-        except Exception:
-            pass
+        self._bootstrap_index_state(db, col)
+        self._bootstrap_lexical_index(col)
+
+        # 이미 인덱싱된 논문 수 (워터마크 테이블 기준)
+        skipped = db.query(func.count(RagIndexState.paper_id)).scalar() or 0
 
-        # 미인덱싱 논문 조회
-        query = (
+        # 미인덱싱 논문 조회 (워터마크에 없는 논문만)
+        papers = (
             db.query(PaperORM)
+            .outerjoin(RagIndexState, RagIndexState.paper_id == PaperORM.id)
+            .filter(RagIndexState.paper_id.is_(None))
             .filter(PaperORM.abstract.isnot(None))
             .filter(PaperORM.abstract != "")
+            .order_by(PaperORM.created_at.desc())
+            .limit(batch_size)
+            .all()
         )
 
-        if indexed_ids:
-            query = query.filter(~PaperORM.id.in_(indexed_ids))
-
-        papers = query.order_by(PaperORM.created_at.desc()).limit(batch_size).all()
-
-        indexed = 0
-        total_chunks = 0
+        allergen_codes = self._load_allergen_codes(db, [p.id for p in papers])
+        chunk_counts = self.index_papers(
+            [
+                {
+                    "paper_id": paper.id,
+                    "title": paper.title,
+                    "abstract": paper.abstract,
+                    "allergen_codes": allergen_codes[paper.id],
+                    "year": paper.year,
+                    "doi": paper.doi,
+                }
+                for paper in papers
+            ],
+            db=db,
+            batch_size=upsert_batch_size,
+        )
+        indexed = len(chunk_counts)
+        total_chunks = sum(chunk_counts.values())
 
-        for paper in papers:
-            # 알러젠 코드 조회
-            links = (
-                db.query(PaperAllergenLink.allergen_code)
-                .filter(PaperAllergenLink.paper_id == paper.id)
-                .all()
-            )
-            allergen_codes = [link.allergen_code for link in links]
-
-            chunks = self.index_paper(
-                paper_id=paper.id,
-                title=paper.title,
-                abstract=paper.abstract,
-                allergen_codes=allergen_codes,
-                year=paper.year,
-                doi=paper.doi,
-            )
-            if chunks > 0:
-                indexed += 1
-                total_chunks += chunks
+        db.commit()
 
-        skipped = len(indexed_ids)
         logger.info(
             f"RAG 인덱싱 완료: {indexed}건 신규, {skipped}건 기존, "
             f"총 {total_chunks}개 청크"
@@ -275,10 +651,15 @@ class RAGService:
             return {"enriched": 0, "failed": 0}
 
         from ..database.models import Paper as PaperORM
+        from ..database.models import RagIndexState
 
-        # DOI가 있고 abstract가 짧은 논문 (Full-text 보강 대상)
+        self._bootstrap_index_state(db, col)
+
+        # abstract로만 인덱싱된, DOI가 있는 논문 (Full-text 보강 대상)
         papers = (
             db.query(PaperORM)
+            .join(RagIndexState, RagIndexState.paper_id == PaperORM.id)
+            .filter(RagIndexState.content_source == "abstract")
             .filter(PaperORM.doi.isnot(None))
             .filter(PaperORM.doi != "")
             .filter(PaperORM.abstract.isnot(None))
@@ -287,8 +668,9 @@ class RAGService:
             .all()
         )
 
-        enriched = 0
         failed = 0
+        allergen_codes = self._load_allergen_codes(db, [p.id for p in papers])
+        fulltext_papers: list[dict] = []
 
         for paper in papers:
             try:
@@ -307,25 +689,15 @@ class RAGService:
                     failed += 1
                     continue
 
-                # Full-text로 재인덱싱 (기존 abstract 대신)
-                from ..database.models import PaperAllergenLink
-                links = (
-                    db.query(PaperAllergenLink.allergen_code)
-                    .filter(PaperAllergenLink.paper_id == paper.id)
-                    .all()
-                )
-                allergen_codes = [link.allergen_code for link in links]
-
-                chunks = self.index_paper(
-                    paper_id=paper.id,
-                    title=paper.title,
-                    abstract=fulltext[:10000],  # Full-text 최대 10,000자
-                    allergen_codes=allergen_codes,
-                    year=paper.year,
-                    doi=paper.doi,
-                )
-                if chunks > 0:
-                    enriched += 1
+                # Full-text로 재인덱싱 (기존 abstract 대신) — 아래에서 일괄 처리
+                fulltext_papers.append({
+                    "paper_id": paper.id,
+                    "title": paper.title,
+                    "abstract": fulltext[:10000],  # Full-text 최대 10,000자
+                    "allergen_codes": allergen_codes[paper.id],
+                    "year": paper.year,
+                    "doi": paper.doi,
+                })
 
             except Exception as e:
                 logger.warning(f"Full-text 보강 실패 (paper_id={paper.id}): {e}")
@@ -333,6 +705,19 @@ class RAGService:
 
         core.close()
 
+        enriched = 0
+        if fulltext_papers:
+            try:
+                chunk_counts = self.index_papers(
+                    fulltext_papers, db=db, content_source="fulltext"
+                )
+                db.commit()
+                enriched = len(chunk_counts)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Full-text 재인덱싱 실패: {e}")
+                failed += len(fulltext_papers)
+
         logger.info(f"Full-text 보강 완료: {enriched}/{len(papers)}건")
         return {"enriched": enriched, "failed": failed}
 
@@ -342,7 +727,11 @@ class RAGService:
         n_results: int = 5,
         allergen_filter: Optional[str] = None,
     ) -> list[dict]:
-        """시맨틱 검색
+        """하이브리드 검색 (벡터 + BM25, Reciprocal Rank Fusion)
+
+        BM25 사이드카가 준비되어 있으면 벡터·렉시컬 후보를 RRF로 결합하고,
+        알러젠 필터는 사이드카 동기화가 끝났으면 두 검색기 모두에서 사전 필터로 적용합니다.
+        사이드카 미준비 시 기존 벡터 검색(알러젠명을 쿼리에 덧붙임)으로 동작합니다.
 
         Args:
             query: 검색 쿼리
@@ -350,39 +739,59 @@ class RAGService:
             allergen_filter: 특정 알러젠으로 필터링
 
         Returns:
-            [{"paper_id", "title", "text", "score", "year", "allergens"}]
+            [{"chunk_id", "paper_id", "title", "text", "score", "year", "allergens",
+              "lexical_score", "fused_score"}]
+            score 는 벡터 코사인 유사도 (관련도 임계값 비교용), 정렬은 fused_score 기준
         """
         col = self._get_collection()
         if not col or col.count() == 0:
             return []
 
+        lexical = self._get_lexical_index()
+        hybrid = lexical is not None and lexical.is_ready
+
         where_filter = None
+        dense_query = query
+        lexical_allergen = None
         if allergen_filter:
-            # allergens 필드는 "peanut" 또는 "peanut,milk" 형태의 쉼표 구분 문자열
-            # ChromaDB에서는 문서 텍스트로 필터링하는 것이 더 정확하므로
-            # where_document 대신 allergens 메타데이터에서 직접 매칭
-            # 단일 알러젠이면 정확 매칭, 복합이면 포함 여부 확인 불가하므로
-            # 쿼리 텍스트에 알러젠을 추가하여 관련성을 높임
-            query = f"{allergen_filter} {query}"
+            # 사전 필터는 사이드카 동기화(알러젠 메타데이터 backfill)가 끝난 뒤에만 사용
+            if hybrid and self._lexical_synced(lexical, col) and lexical.has_allergen(allergen_filter):
+                where_filter = {f"{_ALLERGEN_META_PREFIX}{allergen_filter}": True}
+                lexical_allergen = allergen_filter
+            else:
+                # 포스팅 리스트가 없으면 (사이드카 미준비/미등록 알러젠)
+                # 쿼리 텍스트에 알러젠을 추가하여 관련성을 높임
+                dense_query = f"{allergen_filter} {query}"
+
+        n_candidates = n_results * _CANDIDATE_MULTIPLIER if hybrid else n_results
+        query_embedding = self._embed_query(dense_query)
 
         try:
-            results = col.query(
-                query_texts=[query],
-                n_results=n_results,
-                where=where_filter,
-            )
+            if query_embedding is not None:
+                results = col.query(
+                    query_embeddings=[query_embedding],
+                    n_results=n_candidates,
+                    where=where_filter,
+                )
+            else:
+                results = col.query(
+                    query_texts=[dense_query],
+                    n_results=n_candidates,
+                    where=where_filter,
+                )
         except Exception as e:
             logger.warning(f"ChromaDB 검색 실패: {e}")
             return []
 
-        items = []
+        dense_items = []
         if results and results["ids"] and results["ids"][0]:
             for i, doc_id in enumerate(results["ids"][0]):
                 meta = results["metadatas"][0][i] if results["metadatas"] else {}
                 distance = results["distances"][0][i] if results["distances"] else 1.0
                 score = max(0.0, 1.0 - distance)  # cosine distance → similarity
 
-                items.append({
+                dense_items.append({
+                    "chunk_id": doc_id,
                     "paper_id": meta.get("paper_id"),
                     "title": meta.get("title", ""),
                     "text": results["documents"][0][i] if results["documents"] else "",
@@ -392,27 +801,58 @@ class RAGService:
                     "allergens": meta.get("allergens", ""),
                 })
 
-        return items
+        if not hybrid:
+            return dense_items[:n_results]
 
-    def ask(
+        lexical_items = lexical.search(query, n_results=n_candidates, allergen=lexical_allergen)
+
+        fused = reciprocal_rank_fusion(
+            [
+                [item["chunk_id"] for item in dense_items],
+                [item["chunk_id"] for item in lexical_items],
+            ],
+            k=_RRF_K,
+        )
+
+        items = {item["chunk_id"]: {**item, "lexical_score": 0.0} for item in dense_items}
+        lexical_only = []
+        for item in lexical_items:
+            if item["chunk_id"] in items:
+                items[item["chunk_id"]]["lexical_score"] = item["bm25"]
+                continue
+            hit = {k: v for k, v in item.items() if k != "bm25"}
+            items[item["chunk_id"]] = {**hit, "score": 0.0, "lexical_score": item["bm25"]}
+            lexical_only.append(item["chunk_id"])
+
+        ranked = sorted(items.values(), key=lambda r: fused[r["chunk_id"]], reverse=True)
+        top = ranked[:n_results]
+        for item in top:
+            item["fused_score"] = round(fused[item["chunk_id"]], 6)
+
+        # 렉시컬로만 찾은 청크는 저장된 임베딩으로 벡터 유사도를 보충
+        missing = [item["chunk_id"] for item in top if item["chunk_id"] in lexical_only]
+        if missing and query_embedding is not None:
+            try:
+                stored = col.get(ids=missing, include=["embeddings"])
+                for chunk_id, embedding in zip(stored["ids"], stored["embeddings"]):
+                    sim = max(0.0, _cosine_similarity(query_embedding, embedding))
+                    items[chunk_id]["score"] = round(sim, 4)
+            except Exception as e:
+                logger.warning(f"렉시컬 결과 벡터 점수 조회 실패: {e}")
+
+        return top
+
+    def _retrieve_context(
         self,
         question: str,
-        allergen: Optional[str] = None,
-        n_context: int = 5,
-    ) -> dict:
-        """RAG 기반 질의응답
-
-        Args:
-            question: 사용자 질문
-            allergen: 알러젠 필터 (선택)
-            n_context: 컨텍스트로 사용할 논문 청크 수
+        allergen: Optional[str],
+        n_context: int,
+    ) -> tuple[list[dict], bool]:
+        """관련 논문 검색 + 최소 관련도 필터링
 
         Returns:
-            {"answer": str, "sources": list, "confidence": float}
+            (search_results, has_strong_context)
         """
-        from .ollama_service import get_ollama_service
-
-        # 1) 관련 논문 검색 + 최소 관련도 필터링
         raw_results = self.search(
             query=question,
             n_results=n_context * 2,  # 필터링 여유분 확보
@@ -425,8 +865,15 @@ class RAGService:
         has_strong_context = len(search_results) > 0 and any(
             r["score"] >= 0.6 for r in search_results
         )
+        return search_results, has_strong_context
 
-        # 2) 컨텍스트 구성
+    @staticmethod
+    def _build_answer_prompt(
+        question: str,
+        search_results: list[dict],
+        has_strong_context: bool,
+    ) -> str:
+        """컨텍스트 구성 + 컨텍스트 충분 여부에 따른 프롬프트 생성"""
         context_parts = []
         if search_results:
             for i, result in enumerate(search_results, 1):
@@ -436,24 +883,9 @@ class RAGService:
                 )
         context = "\n\n".join(context_parts)
 
-        # 3) LLM 답변 생성
-        llm = get_ollama_service()
-        if not llm.is_available and not llm.is_gemini_available:
-            if not search_results:
-                return {
-                    "answer": "관련 논문을 찾을 수 없습니다. 다른 질문을 시도해 주세요.",
-                    "sources": [],
-                    "confidence": 0.0,
-                }
-            return {
-                "answer": "LLM 서버에 연결할 수 없어 검색 결과만 표시합니다.",
-                "sources": search_results,
-                "confidence": 0.3,
-            }
-
         # 논문 컨텍스트 충분 여부에 따라 프롬프트 전략 분기
         if has_strong_context:
-            prompt = (
+            return (
                 f"{_SYSTEM_GUARDRAILS}\n\n"
                 "아래 학술 논문 자료를 참고해 질문에 답변하세요. 본 답변은 진단이 아니라\n"
                 "논문에 보고된 유사 사례를 매칭·요약하는 정보 제공입니다.\n"
@@ -467,52 +899,47 @@ class RAGService:
                 f"=== 질문 ===\n{question}\n\n"
                 "=== 답변 ==="
             )
-        else:
-            # 논문 컨텍스트가 부족하거나 없을 때: 일반 의학 지식으로 보완
-            context_section = (
-                f"\n\n=== 참고 논문 (관련도 낮음) ===\n{context}\n"
-                if context else ""
-            )
-            prompt = (
-                f"{_SYSTEM_GUARDRAILS}\n\n"
-                "아래 질문에 대해 일반적으로 알려진 알러지·면역학 지식을 토대로\n"
-                "정보를 매칭·정리해 보여주세요. 본 답변은 진단이 아닙니다.\n"
-                "규칙:\n"
-                "- 반드시 한국어로만 답변하세요\n"
-                "- 의학 용어는 한국어 표기 우선, 영문 약어 괄호 병기\n"
-                "- 일반적으로 알려진 의학 지식을 바탕으로 구체적이고 유용한 정보를 제공하세요\n"
-                f"- 답변 마지막에 다음 문구를 그대로 포함하세요: \"{_DIAGNOSIS_DISCLAIMER}\"\n"
-                f"{context_section}\n"
-                f"=== 질문 ===\n{question}\n\n"
-                "=== 답변 ==="
-            )
-
-        answer = llm._chat(prompt, max_tokens=1000, provider="rag")
 
-        # 4) 답변 품질 검증 — "답변 불가" 패턴 감지 시 보완 프롬프트로 재시도
-        if answer and self._is_insufficient_answer(answer):
-            retry_prompt = (
-                f"{_SYSTEM_GUARDRAILS}\n\n"
-                "이전 답변이 충분하지 않았습니다. 논문 자료가 부족하더라도 일반적으로\n"
-                "알려진 알러지 지식을 활용해 도움이 되는 정보를 매칭·정리해 보여주세요.\n"
-                "본 답변은 진단이 아닌 정보 매칭입니다.\n"
-                "규칙:\n"
-                "- 반드시 한국어로만 답변하세요\n"
-                "- 의학 용어는 한국어 표기 우선, 영문 약어 괄호 병기\n"
-                "- 일반적으로 알려진 증상·원인·대처법을 구체적으로 설명하되, '진단합니다',\n"
-                "  '당신은 ~입니다' 류 단정 표현은 사용하지 마세요\n"
-                f"- 답변 마지막에 다음 문구를 그대로 포함하세요: \"{_DIAGNOSIS_DISCLAIMER}\"\n\n"
-                f"=== 질문 ===\n{question}\n\n"
-                "=== 답변 ==="
-            )
-            retry_answer = llm._chat(retry_prompt, max_tokens=1000, provider="rag")
-            if retry_answer and not self._is_insufficient_answer(retry_answer):
-                answer = retry_answer
+        # 논문 컨텍스트가 부족하거나 없을 때: 일반 의학 지식으로 보완
+        context_section = (
+            f"\n\n=== 참고 논문 (관련도 낮음) ===\n{context}\n"
+            if context else ""
+        )
+        return (
+            f"{_SYSTEM_GUARDRAILS}\n\n"
+            "아래 질문에 대해 일반적으로 알려진 알러지·면역학 지식을 토대로\n"
+            "정보를 매칭·정리해 보여주세요. 본 답변은 진단이 아닙니다.\n"
+            "규칙:\n"
+            "- 반드시 한국어로만 답변하세요\n"
+            "- 의학 용어는 한국어 표기 우선, 영문 약어 괄호 병기\n"
+            "- 일반적으로 알려진 의학 지식을 바탕으로 구체적이고 유용한 정보를 제공하세요\n"
+            f"- 답변 마지막에 다음 문구를 그대로 포함하세요: \"{_DIAGNOSIS_DISCLAIMER}\"\n"
+            f"{context_section}\n"
+            f"=== 질문 ===\n{question}\n\n"
+            "=== 답변 ==="
+        )
 
-        if not answer:
-            answer = "답변을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
+    @staticmethod
+    def _build_retry_prompt(question: str) -> str:
+        """'답변 불가' 응답 시 일반 지식 보완 프롬프트"""
+        return (
+            f"{_SYSTEM_GUARDRAILS}\n\n"
+            "이전 답변이 충분하지 않았습니다. 논문 자료가 부족하더라도 일반적으로\n"
+            "알려진 알러지 지식을 활용해 도움이 되는 정보를 매칭·정리해 보여주세요.\n"
+            "본 답변은 진단이 아닌 정보 매칭입니다.\n"
+            "규칙:\n"
+            "- 반드시 한국어로만 답변하세요\n"
+            "- 의학 용어는 한국어 표기 우선, 영문 약어 괄호 병기\n"
+            "- 일반적으로 알려진 증상·원인·대처법을 구체적으로 설명하되, '진단합니다',\n"
+            "  '당신은 ~입니다' 류 단정 표현은 사용하지 마세요\n"
+            f"- 답변 마지막에 다음 문구를 그대로 포함하세요: \"{_DIAGNOSIS_DISCLAIMER}\"\n\n"
+            f"=== 질문 ===\n{question}\n\n"
+            "=== 답변 ==="
+        )
 
-        # 5) 신뢰도 계산
+    @staticmethod
+    def _compute_confidence(search_results: list[dict], has_strong_context: bool) -> float:
+        """검색 관련도 기반 신뢰도"""
         if search_results:
             avg_score = sum(r["score"] for r in search_results) / len(search_results)
             confidence = min(1.0, avg_score * 1.2)
@@ -520,9 +947,12 @@ class RAGService:
                 confidence = min(confidence, 0.5)  # 보완 답변은 최대 50%
         else:
             confidence = 0.35  # 논문 없이 일반 지식으로 답변
+        return round(confidence, 3)
 
-        # 6) 소스 정보
-        sources = [
+    @staticmethod
+    def _format_sources(search_results: list[dict]) -> list[dict]:
+        """응답용 소스 정보"""
+        return [
             {
                 "paper_id": r["paper_id"],
                 "title": r["title"],
@@ -533,12 +963,153 @@ class RAGService:
             for r in search_results
         ]
 
-        return {
+    def ask(
+        self,
+        question: str,
+        allergen: Optional[str] = None,
+        n_context: int = 5,
+        db=None,
+    ) -> dict:
+        """RAG 기반 질의응답
+
+        같은 질문이 같은 논문 청크로 검색되면 LLM 호출 없이 답변 캐시를 반환합니다.
+
+        Args:
+            question: 사용자 질문
+            allergen: 알러젠 필터 (선택)
+            n_context: 컨텍스트로 사용할 논문 청크 수
+            db: SQLAlchemy 세션 (답변 캐시용, 미지정 시 내부에서 생성)
+
+        Returns:
+            {"answer": str, "sources": list, "confidence": float}
+        """
+        from .ollama_service import get_ollama_service
+        from .rag_answer_cache import get_answer_cache
+
+        # 1) 관련 논문 검색 + 최소 관련도 필터링
+        search_results, has_strong_context = self._retrieve_context(
+            question, allergen, n_context
+        )
+
+        cache = get_answer_cache()
+        chunk_ids = [r["chunk_id"] for r in search_results]
+        with _db_session(db) as session:
+            cached = cache.get(session, question, allergen, chunk_ids)
+        if cached is not None:
+            return cached
+
+        # 2) LLM 답변 생성
+        llm = get_ollama_service()
+        if not llm.is_available and not llm.is_gemini_available:
+            if not search_results:
+                return {
+                    "answer": "관련 논문을 찾을 수 없습니다. 다른 질문을 시도해 주세요.",
+                    "sources": [],
+                    "confidence": 0.0,
+                }
+            return {
+                "answer": "LLM 서버에 연결할 수 없어 검색 결과만 표시합니다.",
+                "sources": search_results,
+                "confidence": 0.3,
+            }
+
+        prompt = self._build_answer_prompt(question, search_results, has_strong_context)
+        answer = llm._chat(prompt, max_tokens=1000, provider="rag")
+
+        # 3) 답변 품질 검증 — "답변 불가" 패턴 감지 시 보완 프롬프트로 재시도
+        if answer and self._is_insufficient_answer(answer):
+            retry_answer = llm._chat(
+                self._build_retry_prompt(question), max_tokens=1000, provider="rag"
+            )
+            if retry_answer and not self._is_insufficient_answer(retry_answer):
+                answer = retry_answer
+
+        llm_answered = bool(answer)
+        if not answer:
+            answer = "답변을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
+
+        # 4) 신뢰도 + 소스 정보
+        result = {
             "answer": answer,
-            "sources": sources,
-            "confidence": round(confidence, 3),
+            "sources": self._format_sources(search_results),
+            "confidence": self._compute_confidence(search_results, has_strong_context),
         }
 
+        # 재시도 후에도 '답변 불가' 인 답변은 저장하지 않음 (ask_stream 과 같은 규칙)
+        if llm_answered and not self._is_insufficient_answer(answer):
+            with _db_session(db) as session:
+                cache.put(
+                    session, question, allergen, chunk_ids, result,
+                    paper_ids=[r["paper_id"] for r in search_results],
+                )
+
+        return result
+
+    def ask_stream(
+        self,
+        question: str,
+        allergen: Optional[str] = None,
+        n_context: int = 5,
+        db=None,
+    ) -> Iterator[tuple[str, dict]]:
+        """RAG 기반 질의응답 (스트리밍)
+
+        검색 직후 소스를 먼저 내보내고, LLM 응답은 토큰 단위로 전달합니다.
+        스트리밍 중에는 답변을 되돌릴 수 없으므로 ask()의 '답변 불가' 재시도는 하지 않고,
+        그런 답변은 캐시에 저장하지 않습니다.
+
+        Yields:
+            ("sources", {"sources", "confidence"})
+            ("token", {"text"})  — 0회 이상
+            ("done", {"answer", "sources", "confidence", "cached"})
+        """
+        from .ollama_service import get_ollama_service
+        from .rag_answer_cache import get_answer_cache
+
+        search_results, has_strong_context = self._retrieve_context(
+            question, allergen, n_context
+        )
+
+        cache = get_answer_cache()
+        chunk_ids = [r["chunk_id"] for r in search_results]
+        with _db_session(db) as session:
+            cached = cache.get(session, question, allergen, chunk_ids)
+        if cached is not None:
+            yield "sources", {"sources": cached["sources"], "confidence": cached["confidence"]}
+            yield "token", {"text": cached["answer"]}
+            yield "done", {**cached, "cached": True}
+            return
+
+        sources = self._format_sources(search_results)
+        confidence = self._compute_confidence(search_results, has_strong_context)
+        yield "sources", {"sources": sources, "confidence": confidence}
+
+        llm = get_ollama_service()
+        parts: list[str] = []
+        if llm.is_available or llm.is_gemini_available:
+            prompt = self._build_answer_prompt(question, search_results, has_strong_context)
+            for delta in llm._chat_stream(prompt, max_tokens=1000, provider="rag"):
+                parts.append(delta)
+                yield "token", {"text": delta}
+            answer = "".join(parts).strip()
+        else:
+            answer = ""
+
+        llm_answered = bool(answer)
+        if not llm_answered:
+            answer = "답변을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
+            yield "token", {"text": answer}
+
+        result = {"answer": answer, "sources": sources, "confidence": confidence}
+        if llm_answered and not self._is_insufficient_answer(answer):
+            with _db_session(db) as session:
+                cache.put(
+                    session, question, allergen, chunk_ids, result,
+                    paper_ids=[r["paper_id"] for r in search_results],
+                )
+
+        yield "done", {**result, "cached": False}
+
     @staticmethod
     def _is_insufficient_answer(answer: str) -> bool:
         """LLM 답변이 '답변 불가' 패턴인지 검사"""
@@ -559,28 +1130,38 @@ class RAGService:
         answer_lower = answer.strip()
         return any(pattern in answer_lower for pattern in insufficient_patterns)
 
-    def get_stats(self) -> dict:
-        """RAG 인덱스 통계"""
+    def get_stats(self, db=None) -> dict:
+        """RAG 인덱스 통계
+
+        논문 수는 rag_index_state 워터마크에서 집계하므로 컬렉션 크기와 무관하다.
+
+        Args:
+            db: SQLAlchemy 세션 (미지정 시 내부에서 생성)
+        """
         col = self._get_collection()
         if not col:
             return {"available": False, "total_chunks": 0, "total_papers": 0}
 
-        total_chunks = col.count()
+        from sqlalchemy import func
 
-        # 고유 paper_id 수 계산
-        paper_ids = set()
-        try:
-            all_meta = col.get(include=["metadatas"])
-            for meta in (all_meta.get("metadatas") or []):
-                if meta and "paper_id" in meta:
-                    paper_ids.add(meta["paper_id"])
-        except Exception:
-            pass
+        from ..database.models import RagIndexState
+        from .rag_answer_cache import get_answer_cache
+
+        total_papers = 0
+        with _db_session(db) as session:
+            try:
+                total_papers = (
+                    session.query(func.count(RagIndexState.paper_id)).scalar() or 0
+                )
+            except Exception as e:
+                logger.warning(f"RAG 워터마크 조회 실패: {e}")
+            answer_cache = get_answer_cache().get_stats(session)
 
         return {
             "available": True,
-            "total_chunks": total_chunks,
-            "total_papers": len(paper_ids),
+            "total_chunks": col.count(),
+            "total_papers": total_papers,
+            "answer_cache": answer_cache,
         }
 
 
@@ -351,7 +351,7 @@ def job_korean_translation(trigger_type: str = "scheduled") -> None:
     t0 = time.monotonic()
 
     try:
-        from .ollama_service import check_ollama_available, ollama_translate
+        from .ollama_service import check_ollama_available, ollama_translate_many
         from ..database.models import Paper as PaperORM
 
         if not check_ollama_available():
@@ -396,20 +396,22 @@ def job_korean_translation(trigger_type: str = "scheduled") -> None:
         translated_count = 0
         failed_count = 0
 
+        # 제목 + (미번역 + 초록 존재 시) 초록을 배치 프롬프트로 한 번에 번역
+        targets: list[tuple] = []
         for paper in papers:
-            # 제목 번역
-            title_kr = ollama_translate(paper.title)
-            if title_kr:
-                paper.title_kr = title_kr
-                translated_count += 1
-            else:
-                failed_count += 1
-
-            # 초록 번역 (미번역 + 초록 존재 시)
+            targets.append((paper, "title_kr", paper.title))
             if not paper.abstract_kr and paper.abstract:
-                abstract_kr = ollama_translate(paper.abstract)
-                if abstract_kr:
-                    paper.abstract_kr = abstract_kr
+                targets.append((paper, "abstract_kr", paper.abstract))
+
+        translations = ollama_translate_many([text for _, _, text in targets])
+
+        for (paper, field, _), translated in zip(targets, translations):
+            if translated:
+                setattr(paper, field, translated)
+                if field == "title_kr":
+                    translated_count += 1
+            elif field == "title_kr":
+                failed_count += 1
 
         db.commit()
 
@@ -0,0 +1,443 @@
+"""공유 검색 결과 캐시 (stale-while-revalidate)
+
+``UnifiedSearchResult`` 를 프로세스 밖 저장소에 보관하여 여러 워커
+(uvicorn workers, 스케줄러, 배치 프로세서)가 같은 검색 결과를 공유합니다.
+
+키: sha256(알러젠 | 교차반응 포함 여부 | max_results | source 집합)
+
+수명:
+    - fresh 구간 (SEARCH_CACHE_FRESH_MINUTES): 그대로 반환
+    - stale 구간 (~SEARCH_CACHE_TTL_HOURS): 즉시 반환하고 백그라운드에서 갱신
+      (refresh_lease_until 컬럼으로 워커 간 중복 갱신 방지)
+    - 그 이후: 미스 처리 후 삭제
+부분 실패(errors 가 있는, 예: 429/소스 타임아웃) 결과는 처음부터 stale 로 저장하여
+다음 요청에서 갱신을 재시도합니다. 재시도 간격은 REFRESH_LEASE_SECONDS 로 제한하고,
+부분 결과로 갱신된 경우 기존 항목을 덮어쓰지 않습니다.
+
+환경 변수:
+    SEARCH_CACHE_BACKEND: "sqlite" (기본, 호스트 내 공유) 또는 "database" (앱 DB 테이블, Postgres 공유)
+    SEARCH_CACHE_PATH: sqlite 파일 경로 (기본 backend/data/search_cache.sqlite3, ":memory:" 가능)
+    SEARCH_CACHE_FRESH_MINUTES: fresh 구간 (기본 360분)
+    SEARCH_CACHE_TTL_HOURS: 최대 보관 기간 (기본 24시간)
+    SEARCH_CACHE_MAX_BYTES: 저장 용량 상한 (기본 256MB, 초과 시 최근 미사용 순 제거)
+    SEARCH_CACHE_ENABLED: false 면 캐시 비활성화
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Optional
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    delete,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
+
+from .paper_search_service import UnifiedSearchResult
+
+logger = logging.getLogger(__name__)
+
+_BACKEND = os.getenv("SEARCH_CACHE_BACKEND", "sqlite").lower()
+_CACHE_PATH = os.getenv(
+    "SEARCH_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "search_cache.sqlite3"),
+)
+_FRESH_MINUTES = float(os.getenv("SEARCH_CACHE_FRESH_MINUTES", "360"))
+_TTL_HOURS = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "24"))
+_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+
+# 백그라운드 갱신 점유 시간 — 갱신 워커가 죽어도 이 시간 후 다른 워커가 재시도
+REFRESH_LEASE_SECONDS = 120.0
+
+CACHE_HIT = "hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+# 캐시가 아닌 로컬 전문 검색 색인에서 응답한 경우 (/api/search prefer_local)
+CACHE_LOCAL = "local"
+
+_metadata = MetaData()
+
+search_result_cache_table = Table(
+    "search_result_cache",
+    _metadata,
+    Column("cache_key", String(64), primary_key=True),
+    Column("allergen", String(200), nullable=False, index=True),
+    Column("payload", Text, nullable=False),
+    Column("size_bytes", Integer, nullable=False),
+    Column("hit_count", Integer, nullable=False, default=0),
+    Column("created_at", Float, nullable=False),
+    Column("last_accessed_at", Float, nullable=False, index=True),
+    Column("refresh_lease_until", Float, nullable=True),
+)
+
+
+def make_search_cache_key(
+    allergen: str,
+    include_cross_reactivity: bool,
+    max_results: int,
+    sources: Iterable[str],
+) -> str:
+    """캐시 키 생성 (알러젠 대소문자/공백, source 순서 무관)"""
+    raw = "\x1f".join([
+        allergen.strip().lower(),
+        "1" if include_cross_reactivity else "0",
+        str(max_results),
+        ",".join(sorted(set(sources))),
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedSearch:
+    """캐시 조회 결과"""
+    result: UnifiedSearchResult
+    age_seconds: float
+    stale: bool
+
+
+def _create_sqlite_engine(path: str) -> Engine:
+    if path == ":memory:":
+        return create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 10.0},
+    )
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    return engine
+
+
+class SearchResultCache:
+    """SQLite 파일 또는 앱 DB 테이블 기반 공유 검색 결과 캐시"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        fresh_minutes: float = _FRESH_MINUTES,
+        ttl_hours: float = _TTL_HOURS,
+        max_bytes: int = _MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.engine = engine
+        self.fresh_seconds = fresh_minutes * 60
+        self.ttl_seconds = max(ttl_hours * 3600, self.fresh_seconds)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        _metadata.create_all(engine, tables=[search_result_cache_table])
+
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0,
+            "refreshes": 0, "refresh_failures": 0,
+        }
+        # 이벤트 루프가 태스크를 약참조하므로 완료까지 참조 유지
+        self._tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls) -> "SearchResultCache":
+        """SEARCH_CACHE_BACKEND 에 따라 저장소 선택"""
+        if _BACKEND == "database":
+            from ..database.connection import engine
+            return cls(engine)
+        return cls(_create_sqlite_engine(_CACHE_PATH))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    # ───────── 저장소 ─────────
+
+    def get(self, key: str) -> Optional[CachedSearch]:
+        """캐시 조회 (fresh/stale 구분, 만료 항목은 미스 처리 후 삭제)"""
+        t = search_result_cache_table
+        now = self._clock()
+        cached = None
+        try:
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    select(t.c.payload, t.c.created_at).where(t.c.cache_key == key)
+                ).first()
+                if row is not None and now - row.created_at >= self.ttl_seconds:
+                    conn.execute(delete(t).where(t.c.cache_key == key))
+                elif row is not None:
+                    conn.execute(
+                        update(t).where(t.c.cache_key == key).values(
+                            hit_count=t.c.hit_count + 1, last_accessed_at=now,
+                        )
+                    )
+                    age = now - row.created_at
+                    cached = CachedSearch(
+                        result=UnifiedSearchResult.from_dict(json.loads(row.payload)),
+                        age_seconds=age,
+                        stale=age >= self.fresh_seconds,
+                    )
+        except (SQLAlchemyError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"검색 캐시 조회 실패: {e}")
+            cached = None
+
+        if cached is None:
+            self._count("misses")
+        else:
+            self._count("stale_hits" if cached.stale else "hits")
+        return cached
+
+    def put(self, key: str, allergen: str, result: UnifiedSearchResult) -> bool:
+        """결과 저장 + 용량 초과분 LRU 제거
+
+        부분 실패 결과는 created_at 을 fresh 구간만큼 앞당겨 stale 상태로 저장하고,
+        갱신 점유를 미리 걸어 재시도가 REFRESH_LEASE_SECONDS 마다 한 번만 일어나게 합니다.
+
+        Returns:
+            저장 여부
+        """
+        t = search_result_cache_table
+        now = self._clock()
+        created_at, lease_until = now, None
+        if result.errors:
+            if self.ttl_seconds <= self.fresh_seconds:
+                return False  # stale 구간이 없으면 보관 즉시 만료
+            created_at, lease_until = now - self.fresh_seconds, now + REFRESH_LEASE_SECONDS
+        payload = json.dumps(result.to_dict(), ensure_ascii=False)
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(t).where(t.c.cache_key == key))
+                conn.execute(t.insert().values(
+                    cache_key=key,
+                    allergen=allergen.strip().lower()[:200],
+                    payload=payload,
+                    size_bytes=len(payload.encode("utf-8")),
+                    hit_count=0,
+                    created_at=created_at,
+                    last_accessed_at=now,
+                    refresh_lease_until=lease_until,
+                ))
+                self._evict(conn, now)
+        except SQLAlchemyError as e:
+            logger.warning(f"검색 캐시 저장 실패: {e}")
+            return False
+        return True
+
+    def _evict(self, conn, now: float) -> int:
+        """만료 항목 삭제 후 max_bytes 초과분을 마지막 접근이 오래된 순으로 제거"""
+        t = search_result_cache_table
+        removed = conn.execute(
+            delete(t).where(t.c.created_at <= now - self.ttl_seconds)
+        ).rowcount or 0
+        used = conn.execute(select(func.coalesce(func.sum(t.c.size_bytes), 0))).scalar()
+        if used <= self.max_bytes:
+            return removed
+
+        victims = []
+        rows = conn.execute(
+            select(t.c.cache_key, t.c.size_bytes).order_by(t.c.last_accessed_at.asc())
+        )
+        for row in rows:
+            if used <= self.max_bytes:
+                break
+            victims.append(row.cache_key)
+            used -= row.size_bytes
+        if victims:
+            conn.execute(delete(t).where(t.c.cache_key.in_(victims)))
+        return removed + len(victims)
+
+    def claim_refresh(self, key: str, lease_seconds: float = REFRESH_LEASE_SECONDS) -> bool:
+        """stale 항목 갱신 권한 획득 (워커 간 원자적 조건부 UPDATE)"""
+        t = search_result_cache_table
+        now = self._clock()
+        try:
+            with self.engine.begin() as conn:
+                claimed = conn.execute(
+                    update(t)
+                    .where(t.c.cache_key == key)
+                    .where((t.c.refresh_lease_until.is_(None)) | (t.c.refresh_lease_until < now))
+                    .values(refresh_lease_until=now + lease_seconds)
+                ).rowcount
+        except SQLAlchemyError as e:
+            logger.warning(f"검색 캐시 갱신 점유 실패: {e}")
+            return False
+        return claimed == 1
+
+    def clear(self, allergen: Optional[str] = None) -> int:
+        """캐시 삭제 (allergen 지정 시 해당 알러젠만)
+
+        Returns:
+            삭제된 항목 수
+        """
+        t = search_result_cache_table
+        stmt = delete(t)
+        if allergen:
+            stmt = stmt.where(t.c.allergen == allergen.strip().lower())
+        with self.engine.begin() as conn:
+            return conn.execute(stmt).rowcount or 0
+
+    # ───────── 조회 + 갱신 ─────────
+
+    def fetch(
+        self,
+        key: str,
+        allergen: str,
+        search: Callable[[], UnifiedSearchResult],
+    ) -> tuple[UnifiedSearchResult, str]:
+        """캐시 우선 검색 (동기). stale 이면 데몬 스레드에서 갱신.
+
+        Returns:
+            (결과, CACHE_HIT | CACHE_STALE | CACHE_MISS)
+        """
+        cached = self.get(key)
+        if cached is not None and not cached.stale:
+            return cached.result, CACHE_HIT
+        if cached is not None:
+            self.refresh_in_background(key, allergen, search)
+            return cached.result, CACHE_STALE
+
+        result = search()
+        self.put(key, allergen, result)
+        return result, CACHE_MISS
+
+    async def afetch(
+        self,
+        key: str,
+        allergen: str,
+        search: Callable[[], Awaitable[UnifiedSearchResult]],
+    ) -> tuple[UnifiedSearchResult, str]:
+        """``fetch()`` 의 비동기 버전. stale 이면 백그라운드 태스크로 갱신."""
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None and not cached.stale:
+            return cached.result, CACHE_HIT
+        if cached is not None:
+            if await asyncio.to_thread(self.claim_refresh, key):
+                task = asyncio.create_task(self._refresh_async(key, allergen, search))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return cached.result, CACHE_STALE
+
+        result = await search()
+        await asyncio.to_thread(self.put, key, allergen, result)
+        return result, CACHE_MISS
+
+    def refresh_in_background(
+        self,
+        key: str,
+        allergen: str,
+        search: Callable[[], UnifiedSearchResult],
+    ) -> bool:
+        """갱신 권한을 얻은 경우에만 데몬 스레드에서 재검색 후 저장
+
+        Returns:
+            갱신 시작 여부 (다른 워커가 갱신 중이면 False)
+        """
+        if not self.claim_refresh(key):
+            return False
+        threading.Thread(
+            target=self._refresh_sync, args=(key, allergen, search),
+            name="search-cache-refresh", daemon=True,
+        ).start()
+        return True
+
+    def _refresh_sync(self, key: str, allergen: str, search: Callable[[], UnifiedSearchResult]) -> None:
+        try:
+            result = search()
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning(f"검색 캐시 갱신 실패 ({allergen}): {e}")
+            return
+        stored = not result.errors and self.put(key, allergen, result)
+        self._count("refreshes" if stored else "refresh_failures")
+
+    async def _refresh_async(
+        self, key: str, allergen: str, search: Callable[[], Awaitable[UnifiedSearchResult]],
+    ) -> None:
+        try:
+            result = await search()
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning(f"검색 캐시 갱신 실패 ({allergen}): {e}")
+            return
+        # 부분 결과로 기존 항목을 덮어쓰지 않음 — 점유 만료 후 다시 갱신 시도
+        stored = not result.errors and await asyncio.to_thread(self.put, key, allergen, result)
+        self._count("refreshes" if stored else "refresh_failures")
+
+    # ───────── 통계 ─────────
+
+    def get_stats(self) -> dict:
+        """히트율 (프로세스 단위) + 저장 항목 수/용량 (저장소 전체)
+
+        ``total_entries``/``valid_entries`` 는 SimpleCache 통계와 같은 키를 사용합니다.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        t = search_result_cache_table
+        cutoff = self._clock() - self.ttl_seconds
+        try:
+            with self.engine.connect() as conn:
+                entries, valid, bytes_used = conn.execute(
+                    select(
+                        func.count(),
+                        func.count().filter(t.c.created_at > cutoff),
+                        func.coalesce(func.sum(t.c.size_bytes), 0),
+                    )
+                ).one()
+        except SQLAlchemyError as e:
+            logger.warning(f"검색 캐시 통계 조회 실패: {e}")
+            entries, valid, bytes_used = 0, 0, 0
+
+        served = counters["hits"] + counters["stale_hits"]
+        lookups = served + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            "total_entries": entries,
+            "valid_entries": valid,
+            "bytes_used": int(bytes_used),
+            "max_bytes": self.max_bytes,
+            "fresh_minutes": self.fresh_seconds / 60,
+            "ttl_hours": self.ttl_seconds / 3600,
+            "backend": self.engine.dialect.name,
+        }
+
+    def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+
+# 싱글톤
+_search_cache: Optional[SearchResultCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_result_cache() -> Optional[SearchResultCache]:
+    """SearchResultCache 싱글톤 (비활성화 또는 초기화 실패 시 None)"""
+    global _search_cache
+    if not _ENABLED:
+        return None
+    with _search_cache_lock:
+        if _search_cache is None:
+            try:
+                _search_cache = SearchResultCache.from_env()
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning(f"검색 캐시 초기화 실패 (캐시 없이 동작): {e}")
+                return None
+        return _search_cache
@@ -10,6 +10,7 @@ import logging
 from typing import Optional
 from datetime import datetime
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,6 +18,7 @@ from urllib3.util.retry import Retry
 logger = logging.getLogger(__name__)
 
 from ..models.paper import Paper, PaperSearchResult, PaperSource
+from .async_http import AsyncHttpClient
 
 
 class SemanticScholarService:
@@ -24,6 +26,9 @@ class SemanticScholarService:
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
 
+    # paper/batch 요청당 최대 id 수
+    PDF_BATCH_SIZE = 500
+
     # API 필드 정의
     PAPER_FIELDS = [
         "paperId",
@@ -61,6 +66,8 @@ class SemanticScholarService:
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
+        # 비동기 경로 (search_async) — 동일 헤더·재시도 정책
+        self._async_http = AsyncHttpClient(timeout=30.0, headers=headers, retries=3)
 
     def search(
         self,
@@ -84,7 +91,56 @@ class SemanticScholarService:
             PaperSearchResult: 검색 결과
         """
         start_time = time.time()
+        params = self._search_params(query, max_results, year_range, open_access_only, fields_of_study)
+
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/paper/search",
+                params=params,
+                timeout=30,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except requests.RequestException as e:
+            logger.warning(f"Semantic Scholar search failed: {query} - {e}")
+            return self._search_result({}, query, start_time)
+
+        return self._search_result(data, query, start_time)
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 20,
+        year_range: Optional[tuple[int, int]] = None,
+        open_access_only: bool = False,
+        fields_of_study: Optional[list[str]] = None,
+    ) -> PaperSearchResult:
+        """search() 의 비동기 버전"""
+        start_time = time.time()
+        params = self._search_params(query, max_results, year_range, open_access_only, fields_of_study)
 
+        try:
+            response = await self._async_http.get(
+                f"{self.BASE_URL}/paper/search",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Semantic Scholar search failed: {query} - {e}")
+            return self._search_result({}, query, start_time)
+
+        return self._search_result(data, query, start_time)
+
+    def _search_params(
+        self,
+        query: str,
+        max_results: int,
+        year_range: Optional[tuple[int, int]],
+        open_access_only: bool,
+        fields_of_study: Optional[list[str]],
+    ) -> dict:
+        """paper/search 요청 파라미터"""
         params = {
             "query": query,
             "limit": min(max_results, 100),
@@ -99,25 +155,10 @@ class SemanticScholarService:
 
         if fields_of_study:
             params["fieldsOfStudy"] = ",".join(fields_of_study)
+        return params
 
-        try:
-            response = self.session.get(
-                f"{self.BASE_URL}/paper/search",
-                params=params,
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
-            logger.warning(f"Semantic Scholar search failed: {query} - {e}")
-            return PaperSearchResult(
-                papers=[],
-                total_count=0,
-                query=query,
-                source=PaperSource.SEMANTIC_SCHOLAR,
-                search_time_ms=(time.time() - start_time) * 1000,
-            )
-
+    def _search_result(self, data: dict, query: str, start_time: float) -> PaperSearchResult:
+        """paper/search 응답 → PaperSearchResult"""
         papers = []
         for item in data.get("data", []):
             paper = self._parse_paper(item)
@@ -210,6 +251,56 @@ class SemanticScholarService:
         except requests.RequestException:
             return None
 
+    def get_pdf_urls_batch(self, ids: list[str]) -> list[Optional[str]]:
+        """
+        여러 논문의 PDF URL 일괄 조회 (POST paper/batch)
+
+        Args:
+            ids: "PMID:..." / "DOI:..." / S2 paperId 혼합 목록 (PDF_BATCH_SIZE 단위로 분할 요청)
+
+        Returns:
+            ids 와 같은 순서의 PDF URL 목록 (미발견·비공개 논문은 None)
+
+        Raises:
+            requests.RequestException: 요청 실패 (미발견과 구분하기 위해 전파)
+        """
+        urls: list[Optional[str]] = []
+        for start in range(0, len(ids), self.PDF_BATCH_SIZE):
+            chunk = ids[start:start + self.PDF_BATCH_SIZE]
+            response = self.session.post(
+                f"{self.BASE_URL}/paper/batch",
+                params={"fields": "openAccessPdf"},
+                json={"ids": chunk},
+                timeout=30,
+            )
+            response.raise_for_status()
+            urls.extend(self._parse_pdf_batch(response.json(), len(chunk)))
+        return urls
+
+    async def get_pdf_urls_batch_async(self, ids: list[str]) -> list[Optional[str]]:
+        """get_pdf_urls_batch() 의 비동기 버전 (실패 시 httpx.HTTPError 전파)"""
+        urls: list[Optional[str]] = []
+        for start in range(0, len(ids), self.PDF_BATCH_SIZE):
+            chunk = ids[start:start + self.PDF_BATCH_SIZE]
+            response = await self._async_http.post(
+                f"{self.BASE_URL}/paper/batch",
+                params={"fields": "openAccessPdf"},
+                json={"ids": chunk},
+            )
+            response.raise_for_status()
+            urls.extend(self._parse_pdf_batch(response.json(), len(chunk)))
+        return urls
+
+    @staticmethod
+    def _parse_pdf_batch(data: list, expected: int) -> list[Optional[str]]:
+        """paper/batch 응답 → PDF URL 목록 (미발견 id 는 응답에 null)"""
+        urls: list[Optional[str]] = []
+        for item in (data or [])[:expected]:
+            pdf_info = (item or {}).get("openAccessPdf") or {}
+            urls.append(pdf_info.get("url") or None)
+        urls.extend([None] * (expected - len(urls)))
+        return urls
+
     def get_paper_by_doi(self, doi: str) -> Optional[Paper]:
         """
         DOI로 논문 정보 가져오기
@@ -253,19 +344,35 @@ class SemanticScholarService:
         Returns:
             PaperSearchResult: 검색 결과
         """
-        # 알러지 특화 검색 쿼리 구성
-        query = f"{allergen} allergy"
-
-        if include_cross_reactivity:
-            query = f"{allergen} allergy cross-reactivity"
-
         return self.search(
-            query=query,
+            query=self._allergy_query(allergen, include_cross_reactivity),
             max_results=max_results,
             open_access_only=open_access_only,
             fields_of_study=["Medicine", "Biology"],
         )
 
+    async def search_allergy_papers_async(
+        self,
+        allergen: str,
+        include_cross_reactivity: bool = True,
+        max_results: int = 20,
+        open_access_only: bool = False,
+    ) -> PaperSearchResult:
+        """search_allergy_papers() 의 비동기 버전"""
+        return await self.search_async(
+            query=self._allergy_query(allergen, include_cross_reactivity),
+            max_results=max_results,
+            open_access_only=open_access_only,
+            fields_of_study=["Medicine", "Biology"],
+        )
+
+    @staticmethod
+    def _allergy_query(allergen: str, include_cross_reactivity: bool) -> str:
+        """알러지 특화 검색 쿼리 구성"""
+        if include_cross_reactivity:
+            return f"{allergen} allergy cross-reactivity"
+        return f"{allergen} allergy"
+
     def get_recommendations(self, paper_id: str, limit: int = 10) -> list[Paper]:
         """
         관련 논문 추천
@@ -330,3 +437,7 @@ class SemanticScholarService:
             return papers
         except requests.RequestException:
             return []
+
+    async def aclose(self):
+        """비동기 클라이언트 정리"""
+        await self._async_http.aclose()
@@ -0,0 +1,126 @@
+"""다중 키워드 매칭 — 단어 단위 Aho–Corasick 오토마톤
+
+키워드 사전 여러 개를 하나의 오토마톤으로 합쳐 텍스트를 한 번만 훑으면서
+모든 일치를 (단어 위치, payload) 로 보고합니다. 전이는 문자 대신 단어 토큰 단위라서
+단어 경계가 자동으로 지켜지고 ("cod" 는 "code" 에 일치하지 않음), 파이썬 루프
+반복 횟수가 문자 수가 아닌 단어 수에 비례합니다.
+
+    automaton = KeywordAutomaton()
+    automaton.add("cow's milk", ("avoid", "cow's milk"))
+    automaton.add("egg", ("allergen", "egg"))
+    automaton.build()
+    automaton.find_all("Hen's eggs and cow's milk")
+    # → [KeywordHit(start=1, end=2, payload=("allergen", "egg")),
+    #    KeywordHit(start=3, end=5, payload=("avoid", "cow's milk"))]
+
+토큰화: 소문자 → 아포스트로피 삭제 → ASCII 구두점/공백 기준 분리 (str.translate + split).
+마지막 단어에는 복수형(-s, -es)도 일치합니다 (inflect=False 로 끔).
+"""
+from __future__ import annotations
+
+import string
+from collections import deque
+from typing import Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+_PLURAL_SUFFIXES = ("s", "es")
+
+# 구두점/공백 → 공백, 아포스트로피는 삭제 ("cow's" → "cows")
+_SEPARATORS = {ord(ch): " " for ch in string.punctuation + string.whitespace}
+_SEPARATORS.update({ord("'"): None, ord("’"): None})
+
+
+def tokenize(text: str) -> list[str]:
+    """텍스트 → 소문자 단어 목록"""
+    return text.lower().translate(_SEPARATORS).split()
+
+
+class KeywordHit(NamedTuple):
+    """키워드 일치 1건 — start/end 는 tokenize() 결과의 단어 위치 [start, end)"""
+    start: int
+    end: int
+    payload: object
+
+
+class KeywordAutomaton(Generic[T]):
+    """단어 단위 Aho–Corasick 오토마톤 (add → build → find_all)"""
+
+    def __init__(self, inflect: bool = True):
+        self.inflect = inflect
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 상태별 출력: (키워드 단어 수, payload)
+        self._outputs: list[tuple[tuple[int, T], ...]] = [()]
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def add(self, keyword: str, payload: T) -> None:
+        """키워드 등록 (build 전에만 가능)"""
+        if self._built:
+            raise RuntimeError("build() 이후에는 키워드를 추가할 수 없습니다")
+        words = tokenize(keyword)
+        if not words:
+            return
+        variants = [words]
+        if self.inflect:
+            variants += [words[:-1] + [words[-1] + suffix] for suffix in _PLURAL_SUFFIXES]
+        for variant in variants:
+            state = 0
+            for word in variant:
+                nxt = self._goto[state].get(word)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][word] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = nxt
+            output = (len(variant), payload)
+            if output not in self._outputs[state]:
+                self._outputs[state] += (output,)
+
+    def build(self) -> "KeywordAutomaton[T]":
+        """실패 링크 계산 (BFS), 접미 키워드 출력 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._outputs[nxt] += tuple(
+                    out for out in self._outputs[self._fail[nxt]] if out not in self._outputs[nxt]
+                )
+        self._built = True
+        return self
+
+    def find_all(self, text: str) -> list[KeywordHit]:
+        """텍스트 1회 순회로 모든 일치 반환 (끝 위치 순)"""
+        return self.find_all_words(tokenize(text))
+
+    def find_all_words(self, words: list[str]) -> list[KeywordHit]:
+        """이미 tokenize() 한 단어 목록에서 일치 검색"""
+        if not self._built:
+            self.build()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        hits: list[KeywordHit] = []
+        state = 0
+        for i, word in enumerate(words):
+            if state:
+                while state and word not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(word, 0)
+            else:
+                # 대부분의 단어는 루트에서 전이가 없음 — 빠른 경로
+                state = root.get(word, 0)
+            if state:
+                for length, payload in outputs[state]:
+                    hits.append(KeywordHit(i + 1 - length, i + 1, payload))
+        return hits
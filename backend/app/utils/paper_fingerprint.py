@@ -0,0 +1,230 @@
+"""논문 근접 중복 판별 — 정규화 제목 지문 · MinHash/LSH
+
+같은 논문이 소스마다 구두점, 그리스 문자(α/alpha), HTML 태그, 부제 유무만 다르게
+들어오는 경우를 묶기 위한 지문입니다. 검색 결과 병합(PaperSearchService)과
+DB 중복 검사(PaperPersistenceService.find_duplicate)가 같은 규칙을 사용합니다.
+
+판별 규칙:
+    - 제목: 정규화 전체 제목 일치, 또는 한쪽에만 부제가 있고 본 제목 일치,
+      또는 토큰 Jaccard 유사도 >= threshold (짧은 제목은 정확 일치만)
+    - 연도: 둘 다 있으면 차이 1년 이내 (프리프린트 → 게재)
+    - 제1저자: 둘 다 있으면 이름 토큰이 하나 이상 겹침
+
+후보 탐색은 MinHash 시그니처를 band 로 나눈 LSH 버킷으로 하므로
+논문 수에 대해 거의 선형 시간입니다 (dedup_helpers.title_minhash 와 달리
+문자 shingle 이 아닌 단어 토큰 + 정수 해시 순열 사용).
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Generic, Iterable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_JACCARD_THRESHOLD = 0.8
+
+# 이보다 토큰이 적은 제목은 Jaccard 가 불안정하므로 정확 일치만 인정
+MIN_TOKENS = 4
+
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+# 본 제목/부제 구분자 (콜론, 대시류)
+_SUBTITLE_RE = re.compile(r"\s*(?::|\s[-–—]\s)\s*")
+
+
+def _greek_to_name(ch: str) -> str:
+    """그리스 문자 → 영문 이름 (α → alpha)"""
+    try:
+        name = unicodedata.name(ch)
+    except ValueError:
+        return ch
+    if name.startswith("GREEK") and "LETTER" in name:
+        return f" {name.split()[-1].lower()} "
+    return ch
+
+
+def normalize_text(text: str) -> str:
+    """HTML 태그 제거 → 악센트 제거 (NFKD) → 그리스 문자 풀어쓰기 → 소문자 → 구두점 제거"""
+    text = unicodedata.normalize("NFKD", _TAG_RE.sub(" ", text or ""))
+    text = "".join(
+        _greek_to_name(ch) if "\u0370" <= ch <= "\u03ff" else ch
+        for ch in text
+        if not unicodedata.combining(ch)
+    )
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+
+def title_tokens(title: str) -> tuple[str, ...]:
+    """정규화 제목 토큰"""
+    return tuple(normalize_text(title).split())
+
+
+def _main_title(title: str) -> str:
+    """부제 앞부분 (본 제목이 너무 짧으면 전체 제목)"""
+    head = _SUBTITLE_RE.split(_TAG_RE.sub(" ", title or ""), maxsplit=1)[0]
+    return head if len(title_tokens(head)) >= MIN_TOKENS else title
+
+
+def _key(tokens: Iterable[str]) -> str:
+    return hashlib.sha1(" ".join(tokens).encode("utf-8")).hexdigest()
+
+
+# 토큰이 없는 제목(빈 문자열, 기호만 있는 제목)의 지문 — 중복 후보 키로 쓰지 않음
+EMPTY_KEY = _key(())
+
+
+def title_fingerprint(title: str) -> str:
+    """DB 인덱스용 제목 지문 (정규화 본 제목의 sha1, 40자)"""
+    return _key(title_tokens(_main_title(title)))
+
+
+def _first_author_tokens(authors: Union[str, list[str], None]) -> frozenset[str]:
+    """제1저자 이름 토큰 (이니셜 제외) — list 또는 ORM 의 쉼표 구분 문자열"""
+    if not authors:
+        return frozenset()
+    first = authors.split(",")[0] if isinstance(authors, str) else authors[0]
+    return frozenset(t for t in normalize_text(first or "").split() if len(t) > 1)
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@dataclass(frozen=True)
+class PaperFingerprint:
+    """논문 1건의 근접 중복 판별용 지문"""
+    tokens: frozenset[str]
+    full_key: str
+    main_key: str
+    year: Optional[int] = None
+    first_author: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(
+        cls,
+        title: str,
+        year: Optional[int] = None,
+        authors: Union[str, list[str], None] = None,
+    ) -> "PaperFingerprint":
+        tokens = title_tokens(title)
+        return cls(
+            tokens=frozenset(tokens),
+            full_key=_key(tokens),
+            main_key=title_fingerprint(title),
+            year=year,
+            first_author=_first_author_tokens(authors),
+        )
+
+    @classmethod
+    def from_paper(cls, paper) -> "PaperFingerprint":
+        """dataclass Paper / ORM Paper 공용 (title, year, authors 속성)"""
+        return cls.of(paper.title, getattr(paper, "year", None), getattr(paper, "authors", None))
+
+    @cached_property
+    def signature(self) -> tuple[int, ...]:
+        """토큰 집합의 MinHash 시그니처 (NUM_PERM 개)"""
+        hashes = [_token_hash(t) for t in self.tokens] or [0]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in _PERMUTATIONS
+        )
+
+    @cached_property
+    def bands(self) -> tuple[tuple, ...]:
+        """LSH 버킷 키 (band 번호, band 시그니처)"""
+        sig = self.signature
+        return tuple(
+            (i, sig[i * LSH_ROWS:(i + 1) * LSH_ROWS]) for i in range(LSH_BANDS)
+        )
+
+    @property
+    def is_main_only(self) -> bool:
+        """부제 없는 제목 여부"""
+        return self.main_key == self.full_key
+
+    def jaccard(self, other: "PaperFingerprint") -> float:
+        union = len(self.tokens | other.tokens)
+        return len(self.tokens & other.tokens) / union if union else 0.0
+
+    def matches(
+        self, other: "PaperFingerprint", threshold: float = DEFAULT_JACCARD_THRESHOLD,
+    ) -> bool:
+        """근접 중복 여부 (제목 + 연도 + 제1저자)"""
+        if not self.tokens or not other.tokens:
+            return False
+        same_title = (
+            self.full_key == other.full_key
+            # 한쪽에만 부제가 있는 경우 (둘 다 다른 부제면 Jaccard 로 판단)
+            or (self.main_key == other.main_key and (self.is_main_only or other.is_main_only))
+            or (
+                min(len(self.tokens), len(other.tokens)) >= MIN_TOKENS
+                and self.jaccard(other) >= threshold
+            )
+        )
+        if not same_title:
+            return False
+        if self.year and other.year and abs(self.year - other.year) > 1:
+            return False
+        if self.first_author and other.first_author and not (self.first_author & other.first_author):
+            return False
+        return True
+
+
+class NearDuplicateIndex(Generic[T]):
+    """지문 → 항목 색인 (정확 키 + LSH 버킷 후보 → matches 검증)"""
+
+    def __init__(self, threshold: float = DEFAULT_JACCARD_THRESHOLD):
+        self.threshold = threshold
+        self._entries: list[tuple[PaperFingerprint, T]] = []
+        self._buckets: dict = {}
+        self.comparisons = 0  # find() 가 matches 로 검증한 후보 수 (누적)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, fp: PaperFingerprint) -> list:
+        # 빈 지문(제목 없음)은 버킷에 넣지 않음 — 한 버킷에 몰려 전체 쌍 비교가 되므로
+        keys: list = [
+            (kind, key) for kind, key in (("full", fp.full_key), ("main", fp.main_key)) if key != EMPTY_KEY
+        ]
+        if len(fp.tokens) >= MIN_TOKENS:
+            keys.extend(fp.bands)
+        return keys
+
+    def find(
+        self,
+        fp: PaperFingerprint,
+        accept: Optional[Callable[[T], bool]] = None,
+    ) -> Optional[T]:
+        """먼저 등록된 근접 중복 항목 반환 (accept 로 추가 조건 지정)"""
+        candidates: set[int] = set()
+        for key in self._keys(fp):
+            candidates.update(self._buckets.get(key, ()))
+        for idx in sorted(candidates):
+            other, item = self._entries[idx]
+            self.comparisons += 1
+            if fp.matches(other, self.threshold) and (accept is None or accept(item)):
+                return item
+        return None
+
+    def add(self, fp: PaperFingerprint, item: T) -> None:
+        idx = len(self._entries)
+        self._entries.append((fp, item))
+        for key in self._keys(fp):
+            self._buckets.setdefault(key, []).append(idx)
@@ -0,0 +1,7 @@
+"""Server-Sent Events 공용 유틸리티"""
+import json
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Server-Sent Events 프레임 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -0,0 +1,88 @@
+"""논문 알러젠 링크 백필 스크립트
+
+키워드 사전(app/data/paper_keywords.py) 변경 후 전체 논문의 PaperAllergenLink 를
+다시 추출합니다. 논문을 스트리밍하며 프로세스 풀로 추출하고, 일정 건수마다
+커밋 + 체크포인트를 남기므로 중단 후 다시 실행하면 이어서 처리합니다.
+
+사용법:
+    # 새 키워드로 누락 링크만 추가 (기존 링크 유지)
+    python -m scripts.backfill_paper_links
+
+    # 자동 추출 링크를 모두 다시 생성
+    python -m scripts.backfill_paper_links --replace
+
+    # 워커/배치 크기 지정
+    python -m scripts.backfill_paper_links --workers 8 --chunk-size 500 --commit-every 5000
+
+    # 체크포인트 무시하고 처음부터
+    python -m scripts.backfill_paper_links --restart
+"""
+import argparse
+import logging
+import os
+import sys
+
+# 프로젝트 루트를 sys.path에 추가
+_backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _backend_dir)
+
+# .env 로드 (Docker 환경에서는 환경변수가 이미 설정됨)
+try:
+    from dotenv import load_dotenv
+
+    for env_path in [
+        os.path.join(_backend_dir, "..", ".env"),
+        os.path.join(_backend_dir, ".env"),
+    ]:
+        if os.path.exists(env_path):
+            load_dotenv(env_path, override=False)
+            break
+except ImportError:
+    pass
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = os.path.join(_backend_dir, "paper_link_backfill.checkpoint.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="논문 알러젠 링크 백필")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="추출 프로세스 수 (0 = 현재 프로세스)")
+    parser.add_argument("--chunk-size", type=int, default=200, help="프로세스 작업 1건당 논문 수")
+    parser.add_argument("--commit-every", type=int, default=2000, help="커밋(체크포인트) 1회당 논문 수")
+    parser.add_argument("--replace", action="store_true", help="기존 자동 추출 링크를 지우고 다시 생성")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 논문 수")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="체크포인트 파일 경로")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터")
+    args = parser.parse_args()
+
+    from app.database.connection import SessionLocal
+    from app.services.paper_link_backfill import LinkBackfillCheckpoint, PaperLinkBackfill
+
+    checkpoint = LinkBackfillCheckpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.clear()
+
+    stats = PaperLinkBackfill(
+        SessionLocal,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        commit_every=args.commit_every,
+        replace_existing=args.replace,
+        checkpoint=checkpoint,
+    ).run(limit=args.limit)
+
+    print(
+        f"논문 {stats.papers}건, 링크 +{stats.links_added}, "
+        f"{stats.elapsed_s:.1f}s, {stats.papers_per_sec:.1f} papers/sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""공개 읽기 라우트 동시 처리량 벤치마크 — 동기 Session vs AsyncSession
+
+async def 라우트 안에서 동기 Session 쿼리를 실행하면(변경 전) DB 왕복 동안 이벤트
+루프가 멈춰, 워커 1개가 요청을 사실상 하나씩 처리합니다. 변경 후에는 AsyncSession 으로
+왕복을 기다리는 동안 다른 요청을 처리합니다.
+
+SQLite 파일 DB 에 약물 성분을 채우고 커서 실행마다 --latency-ms 만큼 지연을 주어
+네트워크 너머 PostgreSQL 왕복을 흉내 냅니다. 워커 1개(이벤트 루프 1개)에
+--concurrency 개 요청을 동시에 보내 초당 처리량을 비교합니다.
+대상은 GET /api/public/drugs/{identifier} (성분명 조회, 쿼리 1회) 입니다.
+
+사용법:
+    python -m scripts.benchmark_async_routes
+    python -m scripts.benchmark_async_routes --requests 400 --concurrency 32 --latency-ms 5
+"""
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+_backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _backend_dir)
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # noqa: E402
+
+from app.api import public_drug_routes  # noqa: E402
+from app.database.connection import get_async_db  # noqa: E402
+from app.database.drug_models import DrugIngredient  # noqa: E402
+from app.services.drug_safety import serialize_ingredient_public  # noqa: E402
+
+
+class _LatentCursor(sqlite3.Cursor):
+    """실행마다 DB 왕복 지연을 흉내 내는 커서"""
+    latency_s = 0.0
+
+    def execute(self, *args):
+        time.sleep(self.latency_s)
+        return super().execute(*args)
+
+
+class _LatentConnection(sqlite3.Connection):
+    def cursor(self, factory=_LatentCursor):
+        return super().cursor(factory)
+
+
+def seed(path: str, n: int) -> list[str]:
+    engine = create_engine(f"sqlite:///{path}")
+    DrugIngredient.__table__.create(engine)
+    names = [f"ingredient{i:04d}" for i in range(n)]
+    with Session(engine) as db:
+        db.add_all(
+            DrugIngredient(rxcui=str(100000 + i), inn=name, atc_code="R06AE07")
+            for i, name in enumerate(names)
+        )
+        db.commit()
+    engine.dispose()
+    return names
+
+
+def legacy_app(path: str, pool_size: int) -> FastAPI:
+    """변경 전 구현 — async def 라우트에서 동기 Session 쿼리"""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"factory": _LatentConnection, "check_same_thread": False},
+        pool_size=pool_size,
+    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.state.engine = engine
+
+    @app.get("/api/public/drugs/{identifier}")
+    async def get_ingredient(identifier: str, db: Session = Depends(get_db)):
+        ingredient = (
+            db.query(DrugIngredient)
+            .filter(DrugIngredient.inn.ilike(identifier))
+            .first()
+        )
+        if not ingredient:
+            raise HTTPException(status_code=404)
+        return {"success": True, **serialize_ingredient_public(ingredient)}
+
+    return app
+
+
+def current_app(path: str, pool_size: int) -> FastAPI:
+    """현재 구현 — public_drug_routes 라우터 + AsyncSession"""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        connect_args={"factory": _LatentConnection},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+    )
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.state.engine = engine
+    app.include_router(public_drug_routes.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+async def run_load(app: FastAPI, names: list[str], requests: int, concurrency: int) -> float:
+    """초당 처리 요청 수"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i: int):
+            async with semaphore:
+                res = await client.get(f"/api/public/drugs/{names[i % len(names)]}")
+                res.raise_for_status()
+
+        await asyncio.gather(*(one(i) for i in range(concurrency)))  # 커넥션 풀 예열
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    # aiosqlite 커넥션 스레드가 남지 않도록 풀 정리
+    engine = app.state.engine
+    if isinstance(engine, AsyncEngine):
+        await engine.dispose()
+    else:
+        engine.dispose()
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공개 읽기 라우트 동시 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=300, help="측정 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="쿼리 1회당 DB 왕복 지연 (ms)")
+    parser.add_argument("--rows", type=int, default=500, help="약물 성분 행 수")
+    args = parser.parse_args()
+
+    _LatentCursor.latency_s = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        names = seed(path, args.rows)
+        legacy_rps = asyncio.run(run_load(legacy_app(path, args.concurrency), names, args.requests, args.concurrency))
+        current_rps = asyncio.run(run_load(current_app(path, args.concurrency), names, args.requests, args.concurrency))
+
+    print(f"요청 {args.requests}건 · 동시 {args.concurrency} · 쿼리당 지연 {args.latency_ms:g}ms (워커 1개)")
+    print(f"  기존 (동기 Session):  {legacy_rps:8.1f} 요청/초")
+    print(f"  현재 (AsyncSession):  {current_rps:8.1f} 요청/초")
+    print(f"  처리량 향상: ×{current_rps / legacy_rps:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""PaperLinkExtractor 처리량 벤치마크 — 기존 부분 문자열 검사 vs 오토마톤
+
+기존 방식(키워드 사전마다 `kw in text` 반복)과 현재 방식(단어 단위 Aho–Corasick
+1회 순회)의 논문 1건당 처리 시간을 비교합니다. 초록은 키워드 사전과 일반 문장으로
+재현 가능하게 합성합니다.
+
+사용법:
+    python -m scripts.benchmark_link_extractor
+    python -m scripts.benchmark_link_extractor --papers 2000 --words 300 --density 0.08
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+_backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _backend_dir)
+
+from app.services.paper_link_extractor import ExtractedLink, PaperLinkExtractor  # noqa: E402
+
+_FILLER = (
+    "we enrolled children and adults with suspected allergy in a prospective multicenter "
+    "study measuring specific ige levels skin prick tests and oral food challenge outcomes "
+    "over a follow up period results were compared between groups using regression models"
+).split()
+
+_CROSS_PATTERNS = [r"cross[- ]?react", r"cross[- ]?sensitiz", r"co[- ]?sensitiz", r"cross[- ]?allerg"]
+
+
+def legacy_extract(extractor: PaperLinkExtractor, title: str, abstract: str) -> int:
+    """변경 전 extract_links + detect_paper_type 구현 (키워드마다 `in` 검사) — 링크 수 반환"""
+    text = f"{title} {abstract}".lower()
+    allergens = list({
+        code for code, kws in extractor.ALLERGEN_KEYWORDS.items()
+        if any(kw.lower() in text for kw in kws)
+    })
+    links = []
+    for code in allergens:
+        for kw, kr_name in extractor._symptom_keywords.items():
+            if kw in text:
+                relevance = 90 if kw in text[:200] else 75
+                link_type = "emergency" if "anaphyla" in kw else "symptom"
+                links.append(ExtractedLink(code, link_type, kr_name, relevance, kw))
+        for table, link_type, base, lead in (
+            (extractor._avoid_food_keywords, "dietary", 70, 85),
+            (extractor._substitute_keywords, "substitute", 70, 85),
+            (extractor._management_keywords, "management", 75, 90),
+        ):
+            for kw, (kr_name, related) in table.items():
+                if related != code and not (link_type == "management" and related == "general"):
+                    continue
+                if kw in text:
+                    relevance = lead if kw in text[:200] else base
+                    links.append(ExtractedLink(code, link_type, kr_name, relevance, kw))
+    if any(re.search(p, text) for p in _CROSS_PATTERNS):
+        links.extend(ExtractedLink(code, "cross_reactivity", "교차반응", 80, "cross-reactivity") for code in allergens)
+    links = extractor._deduplicate_links(links)
+    links.sort(key=lambda x: (-x.relevance_score, x.allergen_code))
+    for kw in extractor._paper_type_keywords:
+        if kw in f"{title} {abstract}".lower():
+            break
+    return len(links)
+
+
+def current_extract(extractor: PaperLinkExtractor, title: str, abstract: str) -> int:
+    links = extractor.extract_links(title=title, abstract=abstract)
+    extractor.detect_paper_type(title, abstract)
+    return len(links)
+
+
+def synth_papers(n: int, words: int, density: float = 0.04, seed: int = 42) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    extractor = PaperLinkExtractor()
+    vocab = [kw for kws in extractor.ALLERGEN_KEYWORDS.values() for kw in kws]
+    vocab += list(extractor._symptom_keywords) + list(extractor._avoid_food_keywords)
+    vocab += list(extractor._substitute_keywords) + list(extractor._management_keywords)
+    vocab += list(extractor._paper_type_keywords)
+    papers = []
+    for _ in range(n):
+        body = [
+            rng.choice(vocab) if rng.random() < density else rng.choice(_FILLER)
+            for _ in range(words)
+        ]
+        title = " ".join(rng.choice(vocab if i % 4 == 0 else _FILLER) for i in range(12))
+        papers.append((title.capitalize(), " ".join(body) + "."))
+    return papers
+
+
+def bench(fn, extractor, papers, repeat: int) -> float:
+    """논문 1건당 최소 소요 시간 (µs)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title, abstract in papers:
+            fn(extractor, title, abstract)
+        best = min(best, time.perf_counter() - start)
+    return best / len(papers) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PaperLinkExtractor 처리량 벤치마크")
+    parser.add_argument("--papers", type=int, default=1000, help="합성 초록 수")
+    parser.add_argument("--words", type=int, default=250, help="초록당 단어 수")
+    parser.add_argument("--density", type=float, default=0.04, help="초록 단어 중 키워드 비율")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    extractor = PaperLinkExtractor()
+    papers = synth_papers(args.papers, args.words, args.density)
+
+    legacy_us = bench(legacy_extract, extractor, papers, args.repeat)
+    current_us = bench(current_extract, extractor, papers, args.repeat)
+
+    print(f"초록 {args.papers}건 × {args.words}단어 (키워드 비율 {args.density:.0%})")
+    print(f"  기존 (부분 문자열 검사): {legacy_us:8.1f} µs/건  {1e6 / legacy_us:8.0f} 건/초")
+    print(f"  현재 (Aho–Corasick):     {current_us:8.1f} µs/건  {1e6 / current_us:8.0f} 건/초")
+    print(f"  속도 향상: ×{legacy_us / current_us:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,12 @@
 
     # 수집만 (RAG 재구축 없이)
     python -m scripts.bulk_collect_papers --no-rag
+
+    # PubMed 연도별 전체 결과 수집 (WebEnv 페이지 단위 스트리밍)
+    python -m scripts.bulk_collect_papers --pubmed-max 0
+
+    # RAG 재구축 upsert 배치 크기 지정
+    python -m scripts.bulk_collect_papers --rag-only --rag-batch-size 1000
 """
 import argparse
 import logging
@@ -76,13 +82,19 @@ def _save_paper_safe(persistence, paper, db, allergen_code=None):
         return False
 
 
-def collect_year(year: int, allergens: list[str], dry_run: bool = False) -> dict:
+def collect_year(
+    year: int,
+    allergens: list[str],
+    dry_run: bool = False,
+    pubmed_max_results: int | None = MAX_RESULTS_PER_SOURCE,
+) -> dict:
     """특정 연도의 논문 수집
 
     Args:
         year: 수집 대상 연도
         allergens: 수집할 알레르겐 목록
         dry_run: True이면 실제 DB 저장 안함
+        pubmed_max_results: 알레르겐당 PubMed 최대 수집 수 (None 이면 전체)
 
     Returns:
         {"year": int, "total_found": int, "total_new": int, "details": dict}
@@ -114,24 +126,23 @@ def collect_year(year: int, allergens: list[str], dry_run: bool = False) -> dict
             allergen_found = 0
             allergen_new = 0
 
-            # --- PubMed (연도 필터 지원) ---
+            # --- PubMed (연도 필터 지원, WebEnv 페이지 단위 스트리밍) ---
             try:
                 query = (
                     f'("{allergen}"[Title/Abstract]) AND '
                     f'(allergy[Title/Abstract] OR allergic[Title/Abstract] '
                     f'OR hypersensitivity[Title/Abstract])'
                 )
-                result = pubmed.search(
+                for paper in pubmed.iter_search(
                     query=query,
-                    max_results=MAX_RESULTS_PER_SOURCE,
+                    max_results=pubmed_max_results,
                     sort="relevance",
                     min_date=min_date,
                     max_date=max_date,
-                )
-                for paper in result.papers:
+                ):
                     if _save_paper_safe(persistence, paper, db, allergen_code=allergen):
                         allergen_new += 1
-                allergen_found += len(result.papers)
+                    allergen_found += 1
             except Exception as e:
                 logger.warning(f"  PubMed 실패 ({allergen}, {year}): {e}")
 
@@ -192,8 +203,12 @@ def collect_year(year: int, allergens: list[str], dry_run: bool = False) -> dict
     }
 
 
-def rebuild_rag_db() -> dict:
-    """RAG DB 재구축 (기존 인덱스 삭제 → 전체 재인덱싱)"""
+def rebuild_rag_db(upsert_batch_size: int | None = None) -> dict:
+    """RAG DB 재구축 (기존 인덱스 삭제 → 전체 재인덱싱)
+
+    Args:
+        upsert_batch_size: upsert(임베딩 호출) 1회당 청크 수 (기본: RAG_UPSERT_BATCH_SIZE)
+    """
     from app.services.rag_service import get_rag_service
 
     logger.info("=" * 60)
@@ -205,19 +220,13 @@ def rebuild_rag_db() -> dict:
         logger.error("ChromaDB를 사용할 수 없습니다.")
         return {"error": "ChromaDB unavailable"}
 
-    # 1) 기존 컬렉션 삭제 후 재생성
-    try:
-        if rag._client:
-            rag._client.delete_collection("allergy_papers")
-            logger.info("기존 RAG 컬렉션 삭제 완료")
-            rag._collection = None
-            rag._available = None
-    except Exception as e:
-        logger.warning(f"기존 컬렉션 삭제 중 오류 (무시): {e}")
-
-    # 2) 전체 논문 배치 인덱싱
+    # 1) 기존 컬렉션 + 인덱스 워터마크 삭제 후 재생성
     db = SessionLocal()
     try:
+        rag.reset_index(db)
+        logger.info("기존 RAG 컬렉션 삭제 완료")
+
+        # 2) 전체 논문 배치 인덱싱
         from app.database.models import Paper as PaperORM
 
         total_papers = (
@@ -233,7 +242,9 @@ def rebuild_rag_db() -> dict:
         total_chunks = 0
 
         while True:
-            result = rag.index_papers_from_db(db, batch_size=batch_size)
+            result = rag.index_papers_from_db(
+                db, batch_size=batch_size, upsert_batch_size=upsert_batch_size,
+            )
             indexed = result.get("indexed", 0)
             chunks = result.get("total_chunks", 0)
 
@@ -317,6 +328,14 @@ def main():
         "--no-rag", action="store_true",
         help="RAG DB 재구축 건너뛰기",
     )
+    parser.add_argument(
+        "--rag-batch-size", type=int, default=None,
+        help="RAG 재구축 시 upsert 1회당 청크 수 (기본: RAG_UPSERT_BATCH_SIZE 또는 512)",
+    )
+    parser.add_argument(
+        "--pubmed-max", type=int, default=MAX_RESULTS_PER_SOURCE,
+        help=f"알레르겐당 PubMed 최대 수집 수, 0이면 전체 (기본: {MAX_RESULTS_PER_SOURCE})",
+    )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="실제 DB 저장 없이 시뮬레이션",
@@ -344,7 +363,10 @@ def main():
             logger.info(f"{'='*40}")
 
             try:
-                result = collect_year(year, allergens, dry_run=args.dry_run)
+                result = collect_year(
+                    year, allergens, dry_run=args.dry_run,
+                    pubmed_max_results=args.pubmed_max or None,
+                )
                 results.append(result)
 
                 logger.info(
@@ -366,7 +388,7 @@ def main():
 
     # 2) RAG DB 재구축
     if not args.no_rag:
-        rag_result = rebuild_rag_db()
+        rag_result = rebuild_rag_db(upsert_batch_size=args.rag_batch_size)
 
     # 3) 결과 요약
     elapsed = time.time() - start_time
@@ -0,0 +1,136 @@
+"""import 시간 프로파일러 — `python -X importtime` 결과 요약
+
+새 인터프리터에서 대상 모듈을 `-X importtime` 으로 import 하고, 누적 시간 상위 모듈,
+자체(self) 시간 상위 모듈, 최상위 패키지별 합계를 표로 출력합니다. 지연 import
+대상으로 지정한 무거운 모듈이 import 시점에 로드됐는지도 함께 표시합니다.
+
+--budget-ms 를 주면 전체 import 시간이 예산을 넘을 때 종료 코드 1 을 반환하므로
+CI 에서 콜드 스타트 회귀를 막는 데 쓸 수 있습니다.
+
+사용법:
+    python -m scripts.profile_imports
+    python -m scripts.profile_imports --module app.api.main --top 30 --by-package
+    python -m scripts.profile_imports --budget-ms 4000 --json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+_backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# import 시점에 로드되지 않아야 하는 무거운 선택 의존성 / 서비스 구현
+DEFERRED_MODULES = (
+    "fitz",
+    "pdfplumber",
+    "chromadb",
+    "sentence_transformers",
+    "app.services.paper_search_service",
+    "app.services.pdf_service",
+    "app.services.qa_engine",
+    "app.services.rag_service",
+    "app.services.competitor_news_service",
+)
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """`-X importtime` 한 줄 (시간 단위: 마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """`-X importtime` stderr → ImportRecord 목록 (헤더·기타 출력은 무시)"""
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def run_importtime(module: str) -> list[ImportRecord]:
+    """새 인터프리터에서 module 을 import 하며 import 시간 수집"""
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    env.setdefault("JWT_SECRET_KEY", "profile-imports")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_backend_dir, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"{module} import 실패:\n{tail}")
+    return parse_importtime(proc.stderr)
+
+
+def summarize(records: list[ImportRecord], module: str, top: int) -> dict:
+    """전체 시간, 상위 모듈, 패키지별 합계, 지연 대상 로드 여부"""
+    by_package: dict[str, int] = defaultdict(int)
+    for rec in records:
+        by_package[rec.module.split(".")[0]] += rec.self_us
+
+    loaded = {rec.module for rec in records}
+    total_us = sum(rec.self_us for rec in records)
+    return {
+        "module": module,
+        "total_ms": round(total_us / 1000, 1),
+        "module_count": len(records),
+        "top_cumulative": [asdict(r) for r in sorted(records, key=lambda r: -r.cumulative_us)[:top]],
+        "top_self": [asdict(r) for r in sorted(records, key=lambda r: -r.self_us)[:top]],
+        "by_package": dict(sorted(by_package.items(), key=lambda kv: -kv[1])[:top]),
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in loaded],
+    }
+
+
+def _print_table(title: str, rows: list[dict], key: str) -> None:
+    print(f"\n{title}")
+    print(f"  {'ms':>9}  module")
+    for row in rows:
+        print(f"  {row[key] / 1000:>9.1f}  {row['module']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="import 시간 프로파일러 (-X importtime 요약)")
+    parser.add_argument("--module", default="app.api.main", help="import 할 모듈 (기본 app.api.main)")
+    parser.add_argument("--top", type=int, default=20, help="표마다 출력할 항목 수")
+    parser.add_argument("--by-package", action="store_true", help="최상위 패키지별 자체 시간 합계 출력")
+    parser.add_argument("--budget-ms", type=float, default=None, help="전체 import 시간 예산 (초과 시 종료 코드 1)")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    summary = summarize(run_importtime(args.module), args.module, args.top)
+    over_budget = args.budget_ms is not None and summary["total_ms"] > args.budget_ms
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"{args.module}: {summary['total_ms']:.1f}ms ({summary['module_count']}개 모듈)")
+        _print_table(f"누적 시간 상위 {args.top}", summary["top_cumulative"], "cumulative_us")
+        _print_table(f"자체 시간 상위 {args.top}", summary["top_self"], "self_us")
+        if args.by_package:
+            print(f"\n패키지별 자체 시간 상위 {args.top}")
+            for package, us in summary["by_package"].items():
+                print(f"  {us / 1000:>9.1f}  {package}")
+        if summary["deferred_loaded"]:
+            print(f"\n경고: 지연 import 대상이 로드됨 — {', '.join(summary['deferred_loaded'])}")
+        if args.budget_ms is not None:
+            verdict = "초과" if over_budget else "통과"
+            print(f"\n예산 {args.budget_ms:.0f}ms: {verdict}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
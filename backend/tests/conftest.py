@@ -10,6 +10,9 @@ import sys
 # FIRST: Set environment variable to use SQLite before any imports
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 os.environ["TESTING"] = "1"
+os.environ.setdefault("LLM_CACHE_PATH", ":memory:")
+os.environ.setdefault("SEARCH_CACHE_PATH", ":memory:")
+os.environ.setdefault("BATCH_JOB_STORE_PATH", ":memory:")
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -20,21 +23,34 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from fastapi.testclient import TestClient
 
-from app.database.connection import Base, get_db
+from app.database.connection import Base, get_async_db, get_db
 from app.database.models import User, DiagnosisKit, UserDiagnosis
 from app.api.main import app
 from app.auth.jwt_handler import create_access_token
+from app.auth.principal_cache import get_principal_cache
+from app.core.static_response_cache import get_static_response_cache
 
 
 # ============================================================================
 # Database Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    """테스트마다 DB 가 새로 만들어지므로 인증 주체 캐시와 정적 응답 캐시도 비움"""
+    get_principal_cache().clear()
+    get_static_response_cache().invalidate()
+    yield
+    get_principal_cache().clear()
+    get_static_response_cache().invalidate()
+
+
 @pytest.fixture(scope="function")
 def test_db() -> Generator[Session, None, None]:
     """Create a fresh test database for each test function.
@@ -62,11 +78,43 @@ def test_db() -> Generator[Session, None, None]:
         Base.metadata.drop_all(bind=engine)
 
 
+class _SharedSQLiteConnection:
+    """test_db 의 sqlite3 커넥션을 비동기 엔진과 공유 (close 는 무시)"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 @pytest.fixture(scope="function")
-def client(test_db: Session) -> Generator[TestClient, None, None]:
+def async_session_factory(test_db: Session) -> async_sessionmaker:
+    """Create an AsyncSession factory bound to the same in-memory database as test_db.
+
+    Each checkout wraps the shared sqlite3 connection in a fresh aiosqlite
+    connection, so sessions work across TestClient event loops.
+    """
+    import aiosqlite
+
+    raw_conn = test_db.connection().connection.driver_connection
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        async_creator=lambda: aiosqlite.Connection(lambda: _SharedSQLiteConnection(raw_conn), 64),
+        poolclass=NullPool,
+        pool_reset_on_return=None,
+    )
+    return async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture(scope="function")
+def client(test_db: Session, async_session_factory: async_sessionmaker) -> Generator[TestClient, None, None]:
     """Create a test client with test database override.
 
-    This fixture overrides the database dependency to use the test database.
+    This fixture overrides the database dependencies (sync and async) to use the test database.
     """
     def override_get_db():
         try:
@@ -74,7 +122,12 @@ def client(test_db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
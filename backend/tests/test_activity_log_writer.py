@@ -0,0 +1,155 @@
+"""행동 로그 미들웨어 · write-behind 큐 (ActivityLoggerMiddleware / ActivityLogWriter) 테스트.
+
+핵심 검증:
+- 추적 경로 디스패치 테이블: 메서드 구분, 접두 패턴
+- batch_size 도달 / flush_interval 경과 시 배치 INSERT
+- 큐가 가득 차면 요청을 막지 않고 dropped 카운터 증가
+- close() 시 남은 레코드 기록, 이후 등록은 버림
+- 미들웨어는 응답 경로에서 큐에만 등록
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.analytics_models import PatientActivityLog
+from app.middleware import activity_logger
+from app.middleware.activity_log_writer import ActivityLogWriter
+from app.middleware.activity_logger import match_tracked_route
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    PatientActivityLog.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def _record(i: int = 0) -> dict:
+    return {"user_id": None, "action_type": "view", "resource_type": "paper", "resource_id": str(i)}
+
+
+def _count(session_factory) -> int:
+    with session_factory() as db:
+        return db.scalar(select(func.count()).select_from(PatientActivityLog))
+
+
+def test_dispatch_table():
+    assert match_tracked_route("GET", "/api/papers/12") == ("view", "paper")
+    assert match_tracked_route("POST", "/api/papers/12") is None
+    assert match_tracked_route("GET", "/api/papers/12/pdf") is None
+    assert match_tracked_route("POST", "/api/pro/research/search") == ("search", "paper")
+    assert match_tracked_route("PUT", "/api/admin/news/3/important") == ("toggle", "news_important")
+    assert match_tracked_route("POST", "/api/auth/login/simple") == ("login", None)
+    assert match_tracked_route("DELETE", "/api/papers/12") is None
+    assert match_tracked_route("GET", "/api/prescription/by-diagnosis/ab-12") == ("view", "prescription")
+
+
+def test_flush_by_batch_size(session_factory):
+    writer = ActivityLogWriter(session_factory, batch_size=5, flush_interval_ms=60_000)
+    try:
+        for i in range(10):
+            assert writer.submit(_record(i))
+        deadline = time.monotonic() + 5
+        while writer.stats().written < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = writer.stats()
+        assert (stats.written, stats.batches) == (10, 2)
+        assert _count(session_factory) == 10
+    finally:
+        writer.close()
+
+
+def test_flush_by_interval(session_factory):
+    writer = ActivityLogWriter(session_factory, batch_size=100, flush_interval_ms=50)
+    try:
+        writer.submit(_record())
+        deadline = time.monotonic() + 5
+        while writer.stats().written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count(session_factory) == 1
+    finally:
+        writer.close()
+
+
+def test_full_queue_drops_without_blocking(session_factory):
+    entered, gate = threading.Event(), threading.Event()
+
+    def slow_factory():
+        entered.set()
+        gate.wait(5)
+        return session_factory()
+
+    writer = ActivityLogWriter(slow_factory, batch_size=1, flush_interval_ms=0, max_queue=2)
+    try:
+        assert writer.submit(_record(0))
+        assert entered.wait(5)  # 기록 스레드가 첫 레코드를 들고 DB 대기 중
+        assert writer.submit(_record(1)) and writer.submit(_record(2))
+
+        start = time.monotonic()
+        assert writer.submit(_record(3)) is False
+        assert time.monotonic() - start < 0.5
+        assert writer.stats().dropped == 1
+    finally:
+        gate.set()
+        writer.close()
+    assert writer.stats().written == 3
+    assert _count(session_factory) == 3
+
+
+def test_close_flushes_pending(session_factory):
+    writer = ActivityLogWriter(session_factory, batch_size=1000, flush_interval_ms=60_000)
+    for i in range(25):
+        writer.submit(_record(i))
+    writer.close()
+
+    assert _count(session_factory) == 25
+    assert writer.submit(_record()) is False
+    stats = writer.stats()
+    assert (stats.enqueued, stats.written, stats.dropped, stats.pending) == (25, 25, 1, 0)
+
+
+def test_insert_failure_is_counted():
+    no_table = sessionmaker(bind=create_engine("sqlite://"))  # 테이블 없음
+    writer = ActivityLogWriter(no_table, batch_size=10, flush_interval_ms=60_000)
+    writer.submit(_record())
+    writer.close()
+    assert (writer.stats().written, writer.stats().failed) == (0, 1)
+
+
+def test_middleware_enqueues_tracked_requests(monkeypatch, session_factory):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    writer = ActivityLogWriter(session_factory, batch_size=100, flush_interval_ms=60_000)
+    monkeypatch.setattr(activity_logger, "get_activity_log_writer", lambda: writer)
+
+    app = FastAPI()
+    app.add_middleware(activity_logger.ActivityLoggerMiddleware)
+
+    @app.get("/api/papers/{paper_id}")
+    async def paper(paper_id: int):
+        return {"id": paper_id}
+
+    @app.get("/api/other")
+    async def other():
+        return {}
+
+    client = TestClient(app)
+    assert client.get("/api/papers/42", headers={"user-agent": "pytest"}).status_code == 200
+    assert client.get("/api/papers/abc").status_code == 422  # 2xx 아님
+    assert client.get("/api/other").status_code == 200
+    assert _count(session_factory) == 0  # 요청 경로에서는 커밋하지 않음
+
+    writer.close()
+    with session_factory() as db:
+        log = db.scalars(select(PatientActivityLog)).one()
+    assert (log.action_type, log.resource_type, log.resource_id) == ("view", "paper", "42")
+    assert log.user_agent == "pytest" and len(log.ip_hash) == 16
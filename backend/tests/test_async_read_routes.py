@@ -0,0 +1,121 @@
+"""AsyncSession 기반 읽기 경로 테스트.
+
+핵심 검증:
+- DATABASE_URL → 비동기 드라이버 URL 변환
+- 인증 사용자 조회(require_auth)가 비동기 세션으로 동작
+- MAST / 약물 / 임상 이미지 공개 라우트, 대시보드 통계가 비동기 세션으로 같은 결과 반환
+- 벤치마크 스크립트 실행 (동기 Session 대비 동시 처리량 출력)
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database.allergen_models import AllergenMaster
+from app.database.clinical_image_models import ClinicalImage
+from app.database.connection import to_async_url
+from app.database.drug_models import DrugIngredient
+from app.database.organization_models import HospitalPatient, Organization
+
+
+def test_to_async_url():
+    assert to_async_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert to_async_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert to_async_url("sqlite:///./local.db") == "sqlite+aiosqlite:///./local.db"
+    with pytest.raises(RuntimeError):
+        to_async_url("mysql://u:p@db/app")
+
+
+def test_auth_user_lookup(client, test_user, auth_headers):
+    res = client.get("/api/auth/me", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["name"] == test_user.name
+
+
+def test_auth_rejects_unknown_user(client):
+    from app.auth.jwt_handler import create_access_token
+
+    token = create_access_token(data={"sub": "9999", "auth_type": "simple"})
+    res = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert res.status_code == 401
+
+
+def test_mast_allergens_and_match(client, test_db):
+    test_db.add(AllergenMaster(
+        code="peanut", name_kr="땅콩(마스터)", name_en="Peanut", category="food", type="food",
+    ))
+    test_db.commit()
+
+    items = {i["code"]: i for i in client.get("/api/public/mast/allergens").json()["items"]}
+    assert items["peanut"]["name_kr"] == "땅콩(마스터)"
+
+    body = client.post("/api/public/mast/match", json={"allergen_code": "peanut", "grade": 3}).json()
+    assert body["allergen"]["name_en"] == "Peanut"
+    assert body["emergency_required"] is True
+
+
+def test_drug_search_and_lookup(client, test_db):
+    test_db.add_all([
+        DrugIngredient(rxcui="20610", inn="cetirizine", atc_code="R06AE07"),
+        DrugIngredient(rxcui="6809", inn="metformin", atc_code="A10BA02"),
+    ])
+    test_db.commit()
+
+    body = client.get("/api/public/drugs/search").json()
+    assert (body["total"], [i["inn"] for i in body["items"]]) == (1, ["cetirizine"])
+    assert client.get("/api/public/drugs/search", params={"allergy_only": False}).json()["total"] == 2
+
+    assert client.get("/api/public/drugs/20610").json()["inn"] == "cetirizine"
+    assert client.get("/api/public/drugs/Metformin").json()["rxcui"] == "6809"
+    assert client.get("/api/public/drugs/12345").status_code == 404
+
+
+def test_clinical_images(client, test_db):
+    licensed = ClinicalImage(
+        allergen_code="peanut", image_url="https://example.org/a.png", license="CC-BY",
+        caption_kr="입술 부종", severity_level="moderate",
+    )
+    test_db.add_all([
+        licensed,
+        ClinicalImage(allergen_code="peanut", image_url="https://example.org/b.png"),
+    ])
+    test_db.commit()
+
+    body = client.get("/api/public/clinical-images", params={"allergen": "peanut"}).json()
+    assert body["total"] == 1 and body["message"] is None
+    assert client.get("/api/public/clinical-images", params={"symptom": "부종"}).json()["total"] == 1
+    assert client.get("/api/public/clinical-images", params={"severity": "severe"}).json()["total"] == 0
+
+    assert client.get(f"/api/public/clinical-images/{licensed.id}").json()["license"]["name"] == "CC-BY"
+
+
+def test_dashboard_stats(client, test_db, test_user, test_diagnosis, admin_headers):
+    org = Organization(name="테스트병원")
+    test_db.add(org)
+    test_db.flush()
+    test_db.add(HospitalPatient(
+        organization_id=org.id, patient_user_id=test_user.id, patient_number="P-001",
+        status="active", created_at=datetime.now(timezone.utc),
+    ))
+    test_db.commit()
+
+    res = client.get("/api/pro/dashboard/stats", headers=admin_headers)
+    assert res.status_code == 200
+    stats = res.json()
+    assert (stats["total_patients"], stats["active_patients"], stats["pending_consent"]) == (1, 1, 0)
+    assert stats["recent_patients"][0]["patient_name"] == test_user.name
+    assert [d["id"] for d in stats["recent_diagnoses"]] == [test_diagnosis.id]
+
+
+def test_benchmark_script_runs(monkeypatch, capsys):
+    from scripts import benchmark_async_routes
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["benchmark_async_routes", "--requests", "16", "--concurrency", "4", "--latency-ms", "1", "--rows", "20"],
+    )
+    benchmark_async_routes.main()
+
+    out = capsys.readouterr().out
+    assert "요청/초" in out and "처리량 향상" in out
@@ -0,0 +1,238 @@
+"""배치 워커 풀 · 작업 저장소 (BatchProcessor / BatchJobStore) 테스트.
+
+핵심 검증:
+- 동시에 등록된 작업들의 태스크가 AllergenItem.priority 순으로 처리
+- 작업 수와 무관하게 워커 스레드 수 고정
+- 저장소 기록 → 다른 프로세스(owner)가 lease 만료 후 미완료 태스크만 재개
+- 완료 작업은 보관 기간이 지나면 메모리/저장소에서 제거
+- ProgressiveLoader 진행 스트림, /api/batch/search 워커 풀 등록
+"""
+from __future__ import annotations
+
+import threading
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models.paper import Paper, PaperSource
+from app.services.batch_job_store import BatchJobStore
+from app.services.batch_processor import (
+    AllergenItem,
+    BatchProcessor,
+    ProcessingStatus,
+    SimpleCache,
+)
+from app.services.paper_search_service import UnifiedSearchResult
+from app.services.progressive_loader import ProgressiveLoader
+
+
+class FakeSearchService:
+    """호출 순서를 기록하는 검색 서비스 (gate 가 열릴 때까지 첫 호출 대기)"""
+
+    def __init__(self, gate: threading.Event | None = None):
+        self.calls: list[str] = []
+        self.gate = gate
+        self.started = threading.Event()
+        self._lock = threading.Lock()
+
+    def allergy_sources(self):
+        return ["pubmed"]
+
+    def search_allergy(self, allergen, include_cross_reactivity=True, max_results_per_source=10):
+        with self._lock:
+            self.calls.append(allergen)
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        paper = Paper(
+            title=f"{allergen} allergy", abstract="", authors=[],
+            source=PaperSource.PUBMED, source_id=allergen, published_at=date(2024, 1, 1),
+        )
+        return UnifiedSearchResult(
+            papers=[paper], pubmed_count=1, semantic_scholar_count=0,
+            total_unique=1, query=allergen, search_time_ms=1.0,
+        )
+
+    def close(self):
+        pass
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine():
+    return create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+
+
+def _processor(search, store=None, **kw) -> BatchProcessor:
+    processor = BatchProcessor(
+        search_service=search, delay_between_batches=0, job_store=store, **kw,
+    )
+    processor.cache = SimpleCache()
+    return processor
+
+
+def _items(*specs: tuple[str, int]) -> list[AllergenItem]:
+    return [AllergenItem(name=name, priority=priority) for name, priority in specs]
+
+
+def test_tasks_across_jobs_follow_priority(engine):
+    gate = threading.Event()
+    search = FakeSearchService(gate)
+    processor = _processor(search, BatchJobStore(engine), max_workers=1)
+    try:
+        blocker = processor.submit_job(processor.create_job(_items(("latex", 30))))
+        assert search.started.wait(5)
+        # 워커가 첫 태스크에서 대기하는 동안 두 병원 업로드가 도착
+        job_a = processor.submit_job(processor.create_job(_items(("pollen", 35), ("peanut", 100))))
+        job_b = processor.submit_job(processor.create_job(_items(("milk", 80), ("cat", 45))))
+        gate.set()
+
+        for job in (blocker, job_a, job_b):
+            assert processor.wait_for_job(job.job_id, timeout=5)
+        assert search.calls == ["latex", "peanut", "milk", "cat", "pollen"]
+        assert job_a.is_completed and job_a.completed_at is not None
+    finally:
+        processor.close()
+
+
+def test_worker_count_is_bounded(engine):
+    processor = _processor(FakeSearchService(), BatchJobStore(engine), max_workers=2)
+    try:
+        jobs = [
+            processor.submit_job(processor.create_job(_items((f"a{i}", i), (f"b{i}", i))))
+            for i in range(20)
+        ]
+        workers = [t for t in threading.enumerate() if t.name.startswith("batch-worker-")]
+        assert len(workers) == 2
+        assert all(processor.wait_for_job(job.job_id, timeout=5) for job in jobs)
+    finally:
+        processor.close()
+
+
+def test_progress_and_complete_callbacks(engine):
+    processor = _processor(FakeSearchService(), BatchJobStore(engine), max_workers=2)
+    progress, completed = [], []
+    try:
+        job = processor.create_job(_items(("egg", 75), ("soy", 65), ("fish", 85)))
+        processor.submit_job(
+            job, on_progress=lambda j: progress.append(j.job_id), on_complete=completed.append,
+        )
+        assert processor.wait_for_job(job.job_id, timeout=5)
+        assert len(progress) == 3
+        assert completed == [job]
+    finally:
+        processor.close()
+
+
+def test_orphaned_job_resumes_pending_tasks_only(engine):
+    clock = Clock()
+    crashed = BatchJobStore(engine, owner="old", clock=clock)
+    old = _processor(FakeSearchService(), crashed)
+    job = old.create_job(_items(("peanut", 100), ("milk", 80), ("egg", 75)))
+    crashed.save_job(job, include_cross_reactivity=False, max_results=7)
+
+    # 첫 태스크 완료, 두 번째 처리 중에 프로세스 종료
+    done, running = job.tasks[0], job.tasks[1]
+    old._process_single_task(done, False, 7)
+    crashed.save_task(job, done)
+    running.status = ProcessingStatus.IN_PROGRESS
+    crashed.save_task(job, running)
+
+    search = FakeSearchService()
+    store = BatchJobStore(engine, owner="new", clock=clock)
+    processor = _processor(search, store)
+    try:
+        assert processor.resume_pending_jobs() == 0  # lease 유효
+        clock.now += store.lease_seconds + 1
+        assert processor.resume_pending_jobs() == 1
+        assert processor.wait_for_job(job.job_id, timeout=5)
+        assert sorted(search.calls) == ["egg", "milk"]
+
+        # 이미 이전된 작업은 다시 가져가지 않음
+        assert BatchJobStore(engine, owner="other", clock=clock).claim_orphaned_jobs() == []
+
+        restored = BatchJobStore(engine, clock=clock).load_job(job.job_id)
+        assert restored.job.is_completed and restored.job.completed_at is not None
+        assert (restored.include_cross_reactivity, restored.max_results) == (False, 7)
+        assert [t.allergen.name for t in restored.job.tasks] == ["peanut", "milk", "egg"]
+        assert restored.job.tasks[0].result.papers[0].title == "peanut allergy"
+    finally:
+        processor.close()
+
+
+def test_completed_jobs_are_evicted_by_age(engine):
+    clock = Clock()
+    store = BatchJobStore(engine, clock=clock)
+    processor = _processor(FakeSearchService(), store, job_retention_hours=1)
+    try:
+        job = processor.submit_job(processor.create_job(_items(("wheat", 70))))
+        assert processor.wait_for_job(job.job_id, timeout=5)
+
+        processor._evict_expired_jobs(purge_store=True)
+        assert processor.get_job(job.job_id) is job
+
+        # 메모리에서 빠져도 저장소에서 조회
+        with processor._lock:
+            processor._jobs.clear()
+        assert processor.get_job(job.job_id).get_status_summary()["completed"] == 1
+
+        job.completed_at = job.completed_at.replace(year=job.completed_at.year - 1)
+        with processor._lock:
+            processor._jobs[job.job_id] = job
+        clock.now = job.tasks[0].completed_at.timestamp() + 2 * 3600
+        assert processor._evict_expired_jobs(purge_store=True) == 1
+        assert processor.get_job(job.job_id) is None
+    finally:
+        processor.close()
+
+
+def test_progressive_loader_streams_background_progress(engine):
+    loader = ProgressiveLoader(_processor(FakeSearchService(), BatchJobStore(engine), max_workers=2))
+    try:
+        immediate, job_id = loader.load_priority_first(
+            _items(("peanut", 100), ("milk", 80), ("egg", 75), ("soy", 65)),
+            priority_count=1,
+            include_cross_reactivity=False,
+        )
+        assert [r["allergen"] for r in immediate] == ["peanut"]
+
+        events = list(loader.get_progress_stream(job_id))
+        assert events[-1].is_complete and events[-1].loaded == 3
+        assert len(loader.get_background_results(job_id)) == 3
+    finally:
+        loader.close()
+
+
+def test_batch_search_route_uses_worker_pool(monkeypatch, engine):
+    # startup(init_db) 없이 호출 — scheduler_models 의 JSONB 가 등록된 뒤에는 SQLite create_all 이 실패하므로
+    from fastapi.testclient import TestClient
+
+    from app.api import main
+
+    processor = _processor(FakeSearchService(), BatchJobStore(engine), max_workers=2)
+    monkeypatch.setattr(main, "get_batch_processor", lambda: processor)
+    client = TestClient(main.app)
+    try:
+        body = client.post(
+            "/api/batch/search",
+            json={"allergens": ["peanut", "milk"], "include_cross_reactivity": False},
+        ).json()
+        assert processor.wait_for_job(body["job_id"], timeout=5)
+
+        status = client.get(f"/api/batch/status/{body['job_id']}").json()
+        results = client.get(f"/api/batch/results/{body['job_id']}").json()
+        assert (status["completed"], status["is_completed"]) == (2, True)
+        assert [r["allergen"] for r in results["results"]] == ["peanut", "milk"]
+    finally:
+        processor.close()
@@ -0,0 +1,177 @@
+"""배치 작업 진행 스트림 (SSE) · 증분 상태 카운터 테스트.
+
+핵심 검증:
+- BatchJob 상태 카운터가 태스크 상태 변경을 따라감 (요약 조회 시 태스크 순회 없음)
+- 태스크가 끝날 때마다 result → progress 이벤트, 마지막에 done (이벤트 구동)
+- 구독 전에 끝난 태스크는 먼저 재전송 (중복 없음)
+- 워커 풀 밖의 작업 (저장소에만 있는 작업) 은 조회 방식으로 스트림
+- GET /api/batch/stream/{job_id} SSE 프레임, 없는 작업은 404
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models.paper import Paper, PaperSource
+from app.services.batch_job_store import BatchJobStore
+from app.services.batch_processor import (
+    AllergenItem,
+    BatchJob,
+    BatchProcessor,
+    ProcessingStatus,
+    SearchTask,
+    SimpleCache,
+)
+from app.services.paper_search_service import UnifiedSearchResult
+from app.services.progressive_loader import ProgressiveLoader
+
+
+class GatedSearchService:
+    """항원별 gate 가 열릴 때까지 검색 대기 (없는 항원은 바로 반환, "bad" 는 실패)"""
+
+    def __init__(self, gates: dict[str, threading.Event] | None = None):
+        self.gates = gates or {}
+
+    def allergy_sources(self):
+        return ["pubmed"]
+
+    def search_allergy(self, allergen, include_cross_reactivity=True, max_results_per_source=10):
+        gate = self.gates.get(allergen)
+        if gate is not None:
+            gate.wait(5)
+        if allergen == "bad":
+            raise RuntimeError("upstream 503")
+        paper = Paper(
+            title=f"{allergen} allergy", abstract="", authors=[],
+            source=PaperSource.PUBMED, source_id=allergen, published_at=date(2024, 1, 1),
+        )
+        return UnifiedSearchResult(
+            papers=[paper], pubmed_count=1, semantic_scholar_count=0,
+            total_unique=1, query=allergen, search_time_ms=1.0,
+        )
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def processor():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    processor = BatchProcessor(
+        search_service=GatedSearchService(), delay_between_batches=0,
+        job_store=BatchJobStore(engine), max_workers=1,
+    )
+    processor.cache = SimpleCache()
+    processor.DEFAULT_MAX_RETRIES = 1
+    yield processor
+    processor.close()
+
+
+def _items(*names: str) -> list[AllergenItem]:
+    return [AllergenItem(name=name, priority=100 - i) for i, name in enumerate(names)]
+
+
+async def _collect(loader: ProgressiveLoader, job_id: str) -> list[tuple[str, dict]]:
+    return [event async for event in loader.stream_job_events(job_id)]
+
+
+def test_status_counters_follow_task_changes():
+    tasks = [SearchTask(task_id=f"t{i}", allergen=AllergenItem(name=f"a{i}")) for i in range(3)]
+    job = BatchJob(job_id="job", tasks=tasks)
+
+    tasks[0].status = ProcessingStatus.IN_PROGRESS
+    assert job.current_allergen == "a0"
+    tasks[0].status = ProcessingStatus.CACHED
+    tasks[1].status = ProcessingStatus.FAILED
+    assert job.current_allergen is None
+
+    summary = job.get_status_summary()
+    assert (summary["completed"], summary["cached"], summary["failed"], summary["pending"]) == (1, 1, 1, 1)
+    assert not job.is_completed
+    tasks[2].status = ProcessingStatus.COMPLETED
+    assert job.is_completed and job.progress_percent == pytest.approx(200 / 3)
+
+
+async def test_events_pushed_as_tasks_finish(processor):
+    gates = {"milk": threading.Event()}
+    processor.search_service.gates = gates
+    loader = ProgressiveLoader(processor)
+    job = processor.submit_job(
+        processor.create_job(_items("peanut", "milk", "bad")), include_cross_reactivity=False,
+    )
+
+    while job.completed_count < 1:  # peanut 완료, milk 는 gate 에서 대기
+        await asyncio.sleep(0.01)
+
+    stream = loader.stream_job_events(job.job_id)
+    first = [await stream.__anext__() for _ in range(2)]
+    # 구독 전에 끝난 peanut 은 현재 진행 상태와 함께 재전송
+    assert first[0] == ("progress", first[0][1]) and first[0][1]["loaded"] == 1
+    assert first[1][0] == "result" and first[1][1]["papers"][0]["title"] == "peanut allergy"
+
+    gates["milk"].set()
+    rest = [event async for event in stream]
+    events = first + rest
+    assert rest[0][0] == "result" and rest[0][1]["allergen"] == "milk"
+
+    results = [data for name, data in events if name == "result"]
+    assert [r["allergen"] for r in results] == ["peanut", "milk", "bad"]
+    assert results[2]["status"] == "failed" and "503" in results[2]["error"]
+    assert events[-1][0] == "done" and events[-1][1]["is_completed"]
+    progress = [data for name, data in events if name == "progress"]
+    assert progress[-1]["loaded"] == 2 and progress[-1]["failed"] == 1
+
+
+async def test_stream_for_job_outside_worker_pool(processor):
+    loader = ProgressiveLoader(processor)
+    job = processor.create_job(_items("egg", "soy"))
+    processor.process_job_sync(job, include_cross_reactivity=False)
+
+    events = await _collect(loader, job.job_id)
+
+    assert [name for name, _ in events] == ["result", "result", "progress", "done"]
+    assert events[-2][1]["percent"] == 100.0
+    assert await _collect(loader, "job_missing") == []
+
+
+def test_sync_progress_stream_ends_with_job(processor):
+    gates = {"fish": threading.Event()}
+    processor.search_service.gates = gates
+    loader = ProgressiveLoader(processor)
+    job = processor.submit_job(processor.create_job(_items("fish", "wheat")), include_cross_reactivity=False)
+
+    threading.Timer(0.05, gates["fish"].set).start()
+    progress = list(loader.get_progress_stream(job.job_id))
+
+    assert progress[-1].is_complete and progress[-1].loaded == 2
+    assert [p.loaded for p in progress] == sorted(p.loaded for p in progress)
+
+
+def test_stream_route_sends_sse_frames(monkeypatch, processor):
+    # startup(init_db) 없이 호출 — scheduler_models 의 JSONB 가 등록된 뒤에는 SQLite create_all 이 실패하므로
+    from fastapi.testclient import TestClient
+
+    from app.api import main
+
+    monkeypatch.setattr(main, "get_batch_processor", lambda: processor)
+    client = TestClient(main.app)
+    job = processor.submit_job(processor.create_job(_items("sesame", "cat")), include_cross_reactivity=False)
+
+    with client.stream("GET", f"/api/batch/stream/{job.job_id}") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    frames = [frame.split("\n") for frame in body.strip().split("\n\n")]
+    events = [(lines[0].removeprefix("event: "), json.loads(lines[1].removeprefix("data: "))) for lines in frames]
+    assert [data["allergen"] for name, data in events if name == "result"] == ["sesame", "cat"]
+    assert events[-1][0] == "done" and events[-1][1]["completed"] == 2
+
+    assert client.get("/api/batch/stream/job_missing").status_code == 404
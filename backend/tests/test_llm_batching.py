@@ -0,0 +1,142 @@
+"""LLM 다건 배치 프롬프트 단위 테스트.
+
+LLM 호출은 OllamaService._achat 을 monkeypatch 로 대체한다.
+
+핵심 검증:
+- plan_batches: 항목 수 / 컨텍스트 창 / 최대 출력 토큰 기준 분할, 순서 유지
+- parse_json_items: 코드블록·잘린 응답에서도 살릴 수 있는 항목 복구
+- analyze_articles / translate_many: N건 → 1회 호출, 누락 항목만 단건 재시도, 캐시 공유
+"""
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from app.services import llm_response_cache
+from app.services.llm_batching import parse_json_items, plan_batches
+from app.services.llm_client_pool import PROVIDER_GEMINI, PROVIDER_LOCAL
+from app.services.llm_response_cache import LLMResponseCache
+from app.services.ollama_service import OllamaService
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    instance = LLMResponseCache(":memory:")
+    monkeypatch.setattr(llm_response_cache, "_response_cache", instance)
+    monkeypatch.setattr(llm_response_cache, "_ENABLED", True)
+    return instance
+
+
+@pytest.fixture
+def service():
+    svc = OllamaService(api_url="http://local/v1", model="local-model")
+    svc._news_provider = "local"
+    svc._available = True
+    svc._gemini_available = False
+    svc.prompts = []
+    return svc
+
+
+def _use_llm(monkeypatch, service, respond):
+    async def fake_achat(prompt, max_tokens=500, max_retries=2, provider="news"):
+        service.prompts.append(prompt)
+        return respond(prompt)
+
+    monkeypatch.setattr(service, "_achat", fake_achat)
+
+
+def _item_count(prompt: str) -> int:
+    return len(re.findall(r"^\[\d+\]$", prompt, re.MULTILINE))
+
+
+class TestPlanBatches:
+    def test_respects_max_items_and_order(self):
+        batches = plan_batches(["t"] * 7, PROVIDER_GEMINI, lambda t: 10, max_items=3)
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_local_context_window_limits_long_items(self):
+        long_text = "x" * 10000  # ≈ 3300 토큰
+        batches = plan_batches([long_text, long_text, "short"], PROVIDER_LOCAL, lambda t: 50)
+        assert batches == [[0], [1, 2]]
+
+    def test_output_budget_limits_batch(self):
+        batches = plan_batches(["t"] * 4, PROVIDER_LOCAL, lambda t: 1500)
+        assert [len(b) for b in batches] == [2, 2]
+
+
+class TestParseJsonItems:
+    def test_array_inside_code_block(self):
+        response = '```json\n[{"id": 1, "ko": "가"}, {"id": "2", "ko": "나"}]\n```'
+        assert {k: v["ko"] for k, v in parse_json_items(response).items()} == {1: "가", 2: "나"}
+
+    def test_truncated_array_recovers_complete_objects(self):
+        response = '[{"id": 1, "ko": "가"}, {"id": 2, "ko": "나"}, {"id": 3, "ko": "다'
+        assert sorted(parse_json_items(response)) == [1, 2]
+
+    def test_garbage(self):
+        assert parse_json_items("번역할 수 없습니다") == {}
+        assert parse_json_items("") == {}
+
+
+class TestAnalyzeArticles:
+    ARTICLES = [(f"Allergy news {i}", f"desc {i}") for i in range(5)]
+
+    def test_batch_prompt_and_single_fallback(self, monkeypatch, service):
+        def respond(prompt):
+            if _item_count(prompt) > 1:
+                # 4번 기사 누락
+                items = [
+                    {"id": i, "relevance": 0.9, "summary": f"요약 {i}",
+                     "importance": 0.4, "category": "market"}
+                    for i in range(1, _item_count(prompt) + 1) if i != 4
+                ]
+                return json.dumps(items, ensure_ascii=False)
+            return "RELEVANCE: 0.2\nSUMMARY: 단건\nIMPORTANCE: 0.1\nCATEGORY: general"
+
+        _use_llm(monkeypatch, service, respond)
+
+        results = service.analyze_articles(self.ARTICLES)
+
+        assert len(service.prompts) == 2  # 배치 1회 + 누락 1건 단건
+        assert [r["summary"] for r in results] == ["요약 1", "요약 2", "요약 3", "단건", "요약 5"]
+        assert results[0]["category"] == "market"
+
+    def test_batch_results_are_shared_with_single_cache(self, monkeypatch, service):
+        _use_llm(monkeypatch, service, lambda prompt: json.dumps([
+            {"id": i, "relevance": 0.7, "summary": f"s{i}", "importance": 0.5, "category": "x"}
+            for i in range(1, _item_count(prompt) + 1)
+        ]))
+        batched = service.analyze_articles(self.ARTICLES)
+        service.prompts.clear()
+
+        single = service.analyze_article(*self.ARTICLES[2])
+
+        assert service.prompts == []
+        assert single == batched[2]
+        assert single["category"] == "general"
+
+
+class TestTranslateMany:
+    def test_batch_translation_with_fallback(self, monkeypatch, service):
+        def respond(prompt):
+            if prompt.startswith("Translate each"):
+                return '[{"id": 1, "ko": "땅콩 알러지"}, {"id": 3, "ko": "우유"}]'
+            return "단건 번역"
+
+        _use_llm(monkeypatch, service, respond)
+
+        results = service.translate_many(["Peanut allergy", "Egg", "Milk", ""])
+
+        assert results == ["땅콩 알러지", "단건 번역", "우유", None]
+        assert len(service.prompts) == 2
+
+    def test_translations_are_cached_per_item(self, monkeypatch, service):
+        _use_llm(monkeypatch, service, lambda p: '[{"id": 1, "ko": "가"}, {"id": 2, "ko": "나"}]')
+        service.translate_many(["a", "b"])
+        service.prompts.clear()
+
+        assert service.translate("a") == "가"
+        assert service.translate_many(["a", "b"]) == ["가", "나"]
+        assert service.prompts == []
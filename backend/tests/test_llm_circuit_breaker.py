@@ -0,0 +1,190 @@
+"""LLM 프로바이더 서킷 브레이커 단위 테스트.
+
+HTTP 는 httpx.MockTransport 로 대체하고, 브레이커 시계는 FakeClock 으로 제어한다.
+
+핵심 검증:
+- CLOSED → OPEN (구간 내 실패 누적) → HALF_OPEN (쿨다운 후 시험 요청 1건) → CLOSED/OPEN
+- OPEN 동안 프로바이더 호출 없이 즉시 Fallback
+- 일시 장애 1회로 Gemini 가 영구 비활성화되지 않음
+- /api/health 에 프로바이더별 서킷 상태 노출
+"""
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.services.llm_client_pool import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    PROVIDER_GEMINI,
+    PROVIDER_LOCAL,
+    CircuitBreaker,
+    LLMClientPool,
+)
+from app.services.ollama_service import OllamaService
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _completion(content: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(clock):
+    instance = LLMClientPool(limits={
+        PROVIDER_GEMINI: {"rpm": 0, "rpd": 0, "max_concurrency": 2},
+        PROVIDER_LOCAL: {"rpm": 0, "rpd": 0, "max_concurrency": 2},
+    })
+    for name in (PROVIDER_GEMINI, PROVIDER_LOCAL):
+        instance._breakers[name] = CircuitBreaker(
+            name, failure_threshold=2, window_seconds=60, cooldown_seconds=30, clock=clock,
+        )
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def service(pool, monkeypatch):
+    svc = OllamaService(api_url="http://local/v1", model="m")
+    svc._gemini_api_key = "key"
+    svc._gemini_url = "http://gemini"
+    svc._available = True
+    svc._gemini_available = True
+    svc._news_provider = "gemini"
+    monkeypatch.setattr(svc, "_get_pool", lambda: pool)
+    return svc
+
+
+def _mount(pool: LLMClientPool, provider: str, handler) -> list:
+    calls = []
+
+    def recording(request):
+        calls.append(request.url.path)
+        return handler(request)
+
+    pool._clients[provider] = httpx.AsyncClient(transport=httpx.MockTransport(recording))
+    return calls
+
+
+def _down(request):
+    raise httpx.ConnectError("connection refused", request=request)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_within_window(self, clock):
+        breaker = CircuitBreaker("x", failure_threshold=2, window_seconds=60, clock=clock)
+
+        breaker.record_failure()
+        clock.now += 61  # 구간 밖 실패는 집계에서 제외
+        breaker.record_failure()
+        assert breaker.state == BREAKER_CLOSED
+
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.state == BREAKER_OPEN
+        assert not breaker.allow_request()
+        assert breaker.get_stats()["last_error"] == "RuntimeError: boom"
+
+    def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker("x", cooldown_seconds=30, clock=clock)
+        breaker.trip()
+
+        clock.now += 30
+        assert breaker.state == BREAKER_HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == BREAKER_CLOSED
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker("x", cooldown_seconds=30, clock=clock)
+        breaker.trip()
+        clock.now += 30
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.get_stats()["open_count"] == 2
+
+    def test_release_returns_trial_slot(self, clock):
+        breaker = CircuitBreaker("x", cooldown_seconds=0, clock=clock)
+        breaker.trip()
+        assert breaker.allow_request()
+        breaker.release()
+        assert breaker.allow_request()
+
+
+class TestServiceIntegration:
+    def test_open_circuit_skips_dead_provider(self, pool, service):
+        calls = _mount(pool, PROVIDER_LOCAL, _down)
+
+        assert service._chat("q", provider="local") is None  # 2회 시도 → OPEN
+        assert len(calls) == 2
+        assert pool.breaker(PROVIDER_LOCAL).state == BREAKER_OPEN
+        assert service.is_available is False
+
+        assert service._chat("q", provider="local") is None
+        assert len(calls) == 2  # OPEN 동안 호출 없음
+
+    def test_half_open_trial_recovers_provider(self, pool, service, clock):
+        _mount(pool, PROVIDER_LOCAL, _down)
+        service._chat("q", provider="local")
+        assert service.is_available is False
+
+        clock.now += 30
+        assert service.is_available is True  # HALF_OPEN: 시험 요청 허용
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("복구"))
+
+        assert service._chat("q", provider="local") == "복구"
+        assert pool.breaker(PROVIDER_LOCAL).state == BREAKER_CLOSED
+
+    def test_transient_gemini_error_is_not_permanent(self, pool, service):
+        responses = iter([httpx.Response(503), _completion("gemini")])
+        gemini_calls = _mount(pool, PROVIDER_GEMINI, lambda request: next(responses))
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("local"))
+
+        assert service._chat("q1", provider="news") == "local"
+        assert service._chat("q2", provider="news") == "gemini"
+        assert len(gemini_calls) == 2
+        assert service.is_gemini_available is True
+
+    def test_client_errors_do_not_trip(self, pool, service):
+        _mount(pool, PROVIDER_GEMINI, lambda request: httpx.Response(400))
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("local"))
+
+        for _ in range(3):
+            service._chat("q", provider="news")
+        assert pool.breaker(PROVIDER_GEMINI).state == BREAKER_CLOSED
+
+    def test_failed_probe_trips_and_retries_after_cooldown(self, pool, service, clock):
+        service._available = None
+        _mount(pool, PROVIDER_LOCAL, _down)
+        assert service.is_available is False
+        assert pool.breaker(PROVIDER_LOCAL).state == BREAKER_OPEN
+
+        clock.now += 30
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("ok"))
+        assert service._chat("q", provider="local") == "ok"
+        assert service.is_available is True
+
+
+def test_health_exposes_breaker_state(client):
+    resp = client.get("/api/health")
+
+    assert resp.status_code == 200
+    providers = resp.json()["llm_providers"]
+    assert set(providers) == {PROVIDER_GEMINI, PROVIDER_LOCAL}
+    assert providers[PROVIDER_LOCAL]["state"] in {BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN}
@@ -0,0 +1,213 @@
+"""LLM 비동기 클라이언트 풀 단위 테스트.
+
+HTTP 는 httpx.MockTransport 로 대체한다 — 실제 네트워크 호출 없음.
+
+핵심 검증:
+- TokenBucket: RPM 대기 시간, RPD 소진/자정 리셋, 429 보류(penalize)
+- 프로바이더별 동시성 세마포어 상한
+- OllamaService._chat 동기 래퍼 / arun 비동기 호출
+- 스트리밍도 프로바이더 세마포어·토큰 버킷을 거침
+- Gemini 429 → Retry-After 보류 후 재시도, RPD 소진 → 로컬 Fallback
+"""
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.llm_client_pool import (
+    PROVIDER_GEMINI,
+    PROVIDER_LOCAL,
+    DailyQuotaExceeded,
+    LLMClientPool,
+    TokenBucket,
+)
+from app.services.ollama_service import OllamaService
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _completion(content: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+@pytest.fixture
+def pool():
+    instance = LLMClientPool(limits={
+        PROVIDER_GEMINI: {"rpm": 0, "rpd": 0, "max_concurrency": 2},
+        PROVIDER_LOCAL: {"rpm": 0, "rpd": 0, "max_concurrency": 2},
+    })
+    yield instance
+    instance.close()
+
+
+def _mount(pool: LLMClientPool, provider: str, handler) -> None:
+    pool._clients[provider] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def service(pool, monkeypatch):
+    svc = OllamaService(api_url="http://local/v1", model="m")
+    svc._gemini_api_key = "key"
+    svc._gemini_url = "http://gemini"
+    svc._available = True
+    svc._gemini_available = True
+    svc._news_provider = "gemini"
+    monkeypatch.setattr(svc, "_get_pool", lambda: pool)
+    return svc
+
+
+class TestTokenBucket:
+    def test_rpm_delay(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rpm=2, clock=clock)
+
+        assert bucket.delay() == 0.0
+        assert bucket.delay() == 0.0
+        assert bucket.delay() == pytest.approx(30.0)
+
+        clock.now += 30
+        assert bucket.delay() == 0.0
+
+    def test_rpd_exhausted_until_next_day(self):
+        wall = FakeClock(86400 * 10 + 100)
+        bucket = TokenBucket(rpd=1, wall_clock=wall)
+
+        assert bucket.delay() == 0.0
+        with pytest.raises(DailyQuotaExceeded):
+            bucket.delay()
+
+        wall.now += 86400
+        assert bucket.delay() == 0.0
+
+    def test_penalize_blocks_new_requests(self):
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock)
+        bucket.penalize(5)
+
+        assert bucket.delay() == pytest.approx(5.0)
+        clock.now += 5
+        assert bucket.delay() == 0.0
+
+
+class TestPool:
+    def test_concurrency_is_capped_per_provider(self, pool, service):
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.02)
+            state["active"] -= 1
+            return _completion(request.read().decode()[-8:])
+
+        _mount(pool, PROVIDER_LOCAL, handler)
+        prompts = [f"prompt-{i}" for i in range(6)]
+
+        results = service._chat_many(prompts, provider="local")
+
+        assert len(results) == 6 and all(results)
+        assert state["peak"] == 2
+
+    def test_run_from_pool_loop_is_rejected(self, pool):
+        async def nested():
+            coro = asyncio.sleep(0)
+            with pytest.raises(RuntimeError):
+                pool.run(coro)
+
+        pool.run(nested())
+
+    def test_arun_awaits_without_blocking_caller_loop(self, pool, service):
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("로컬 답변"))
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            answer = await pool.arun(service._achat("q", provider="local"))
+            task.cancel()
+            return answer, ticks
+
+        answer, ticks = asyncio.run(main())
+        assert answer == "로컬 답변"
+        assert ticks > 0
+
+
+def _sse(*deltas: str) -> bytes:
+    frames = [f'data: {{"choices":[{{"delta":{{"content":"{d}"}}}}]}}\n\n' for d in deltas]
+    return ("".join(frames) + "data: [DONE]\n\n").encode("utf-8")
+
+
+class TestStreaming:
+    def test_stream_holds_provider_slot_and_consumes_token(self, pool, service):
+        limiter = pool.limiter(PROVIDER_LOCAL)
+        seen_in_flight = []
+
+        def handler(request):
+            seen_in_flight.append(limiter.get_stats()["in_flight"])
+            return httpx.Response(200, content=_sse("땅콩 ", "알러지"))
+
+        _mount(pool, PROVIDER_LOCAL, handler)
+        before = limiter.get_stats()["used_today"]
+
+        assert list(service._chat_stream("q", provider="local")) == ["땅콩 ", "알러지"]
+        assert seen_in_flight == [1]
+        assert limiter.get_stats()["used_today"] == before + 1
+        assert limiter.get_stats()["in_flight"] == 0
+
+    def test_closing_stream_early_releases_slot(self, pool, service):
+        _mount(pool, PROVIDER_LOCAL, lambda request: httpx.Response(200, content=_sse("a", "b", "c")))
+
+        stream = service._chat_stream("q", provider="local")
+        assert next(stream) == "a"
+        stream.close()
+        assert pool.limiter(PROVIDER_LOCAL).get_stats()["in_flight"] == 0
+
+    def test_stream_daily_quota_falls_back_to_local(self, pool, service):
+        service._rag_provider = "gemini"
+        pool.limiter(PROVIDER_GEMINI).bucket.rpd = 1
+        pool.limiter(PROVIDER_GEMINI).bucket._used_today = 1
+        _mount(pool, PROVIDER_GEMINI, lambda request: pytest.fail("Gemini 호출 금지"))
+        _mount(pool, PROVIDER_LOCAL, lambda request: httpx.Response(200, content=_sse("로컬")))
+
+        assert list(service._chat_stream("q", provider="rag")) == ["로컬"]
+
+
+class TestGeminiRateLimit:
+    def test_429_penalizes_bucket_and_retries(self, pool, service, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0.05"})
+            return _completion("재시도 성공")
+
+        _mount(pool, PROVIDER_GEMINI, handler)
+        monkeypatch.setattr("time.sleep", lambda s: pytest.fail("time.sleep 호출 금지"))
+
+        assert service._chat("q", provider="news") == "재시도 성공"
+        assert len(calls) == 2
+        assert pool.limiter(PROVIDER_GEMINI).bucket._blocked_until > 0
+
+    def test_daily_quota_falls_back_to_local(self, pool, service):
+        pool._limits[PROVIDER_GEMINI] = {"rpm": 0, "rpd": 1, "max_concurrency": 1}
+        _mount(pool, PROVIDER_GEMINI, lambda request: _completion("gemini"))
+        _mount(pool, PROVIDER_LOCAL, lambda request: _completion("local"))
+
+        assert service._chat("q1", provider="news") == "gemini"
+        assert service._chat("q2", provider="news") == "local"
+        assert service._gemini_available is True
@@ -0,0 +1,144 @@
+"""결정적 LLM 작업 응답 캐시 단위 테스트.
+
+LLM 호출은 OllamaService._achat 을 monkeypatch 로 대체한다.
+
+핵심 검증:
+- 키: 작업/버전/모델/프롬프트가 같을 때만 동일
+- TTL 만료, 최대 항목 초과 시 LRU 제거, 작업별 히트율
+- _chat(cache_task=...) 재호출 시 LLM 미호출, 실패 응답은 미저장
+- _chat_many 는 미스만 LLM 호출
+"""
+from __future__ import annotations
+
+import pytest
+
+from app.services import llm_response_cache
+from app.services.llm_response_cache import LLMResponseCache, make_cache_key
+from app.services.ollama_service import OllamaService
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(monkeypatch, clock):
+    instance = LLMResponseCache(":memory:", ttl_days=1, max_entries=100, clock=clock)
+    monkeypatch.setattr(llm_response_cache, "_response_cache", instance)
+    monkeypatch.setattr(llm_response_cache, "_ENABLED", True)
+    return instance
+
+
+@pytest.fixture
+def service(monkeypatch):
+    svc = OllamaService(api_url="http://local/v1", model="local-model")
+    svc.calls = []
+
+    async def fake_achat(prompt, max_tokens=500, max_retries=2, provider="news"):
+        svc.calls.append(prompt)
+        return None if "fail" in prompt else f"응답:{prompt}"
+
+    monkeypatch.setattr(svc, "_achat", fake_achat)
+    return svc
+
+
+class TestKey:
+    def test_key_depends_on_every_component(self):
+        base = make_cache_key("translate", "1", "m", "hello", "sys", 500)
+        assert base == make_cache_key("translate", "1", "m", "hello", "sys", 500)
+        assert base != make_cache_key("translate", "2", "m", "hello", "sys", 500)
+        assert base != make_cache_key("translate", "1", "m2", "hello", "sys", 500)
+        assert base != make_cache_key("extract_allergens", "1", "m", "hello", "sys", 500)
+        assert base != make_cache_key("translate", "1", "m", "hello!", "sys", 500)
+
+
+class TestCacheStore:
+    def test_ttl_expiry(self, cache, clock):
+        cache.put("k", "translate", "m", "번역")
+        assert cache.get("k", "translate") == "번역"
+
+        clock.now += 86400
+        assert cache.get("k", "translate") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_lru_eviction(self, cache, clock):
+        cache.max_entries = 2
+        cache.put("old", "t", "m", "a")
+        clock.now += 1
+        cache.put("recent", "t", "m", "b")
+        clock.now += 1
+        cache.get("old", "t")  # old 를 최근 사용으로 갱신
+        clock.now += 1
+        cache.put("new", "t", "m", "c")
+
+        assert cache.get("recent", "t") is None
+        assert cache.get("old", "t") == "a"
+        assert cache.get("new", "t") == "c"
+
+    def test_stats_by_task(self, cache):
+        cache.put("k", "translate", "m", "번역")
+        cache.get("k", "translate")
+        cache.get("missing", "translate")
+        cache.get("missing", "extract_allergens")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["by_task"]["translate"]["hit_rate"] == 0.5
+        assert stats["by_task"]["extract_allergens"]["hits"] == 0
+
+
+class TestChatIntegration:
+    def test_repeated_call_served_from_cache(self, cache, service):
+        first = service._chat("abstract", provider="local", cache_task="translate")
+        second = service._chat("abstract", provider="local", cache_task="translate")
+
+        assert first == second == "응답:abstract"
+        assert service.calls == ["abstract"]
+        assert cache.get_stats()["by_task"]["translate"]["hits"] == 1
+
+    def test_uncached_task_always_calls_llm(self, cache, service):
+        service._chat("q", provider="rag")
+        service._chat("q", provider="rag")
+        assert len(service.calls) == 2
+
+    def test_failures_are_not_cached(self, cache, service):
+        assert service._chat("fail", provider="local", cache_task="translate") is None
+        assert service._chat("fail", provider="local", cache_task="translate") is None
+        assert len(service.calls) == 2
+
+    def test_prompt_version_bump_invalidates(self, cache, service, monkeypatch):
+        service._chat("q", provider="local", cache_task="translate")
+        monkeypatch.setitem(OllamaService._PROMPT_VERSIONS, "translate", "2")
+        service._chat("q", provider="local", cache_task="translate")
+        assert len(service.calls) == 2
+
+    def test_chat_many_only_calls_misses(self, cache, service):
+        service._chat("a", provider="news", cache_task="analyze_article")
+
+        results = service._chat_many(["a", "b", "c"], provider="news", cache_task="analyze_article")
+
+        assert results == ["응답:a", "응답:b", "응답:c"]
+        assert service.calls == ["a", "b", "c"]
+
+    def test_analyze_article_rerun_is_free(self, cache, service, monkeypatch):
+        async def fake_achat(prompt, max_tokens=500, max_retries=2, provider="news"):
+            service.calls.append(prompt)
+            return "RELEVANCE: 0.9\nSUMMARY: 요약\nIMPORTANCE: 0.5\nCATEGORY: market"
+
+        monkeypatch.setattr(service, "_achat", fake_achat)
+
+        first = service.analyze_article("Peanut OIT approved", "FDA approval")
+        again = service.analyze_articles([("Peanut OIT approved", "FDA approval")])
+
+        assert again == [first]
+        assert len(service.calls) == 1
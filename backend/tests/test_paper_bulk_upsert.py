@@ -0,0 +1,163 @@
+"""검색 결과 일괄 저장 (PaperPersistenceService.save_papers_bulk) 테스트.
+
+핵심 검증:
+- 키 종류별 1회 조회 + 링크 배치 INSERT 로 왕복 횟수가 논문 수와 무관
+  (papers INSERT 의 배치 여부는 방언 의존 — PostgreSQL 은 insertmanyvalues,
+  SQLite 는 RETURNING 순서 보장을 위해 행 단위)
+- 기존 레코드 갱신 (DOI 대소문자, PMID, 제목) 과 같은 배치 안 중복 병합
+- 신규 논문의 알러젠 링크 일괄 기록, 검색 이력 저장
+- 일괄 기록 실패 시 논문 단위 저장으로 재시도
+- lower(doi) / lower(title) 조회가 함수 인덱스 사용
+- 단건 find_duplicate 는 첫 일치에서 멈춤, 제목 후보 수는 SQL 에서 제한
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+
+from app.database.models import Paper as PaperORM, PaperAllergenLink, SearchHistory
+from app.models.paper import Paper, PaperSource
+from app.services.paper_mapper import PaperMapper
+from app.services import paper_persistence_service
+from app.services.paper_persistence_service import PaperPersistenceService, _DuplicateLookup
+from app.services.paper_search_service import UnifiedSearchResult
+
+
+def _paper(i: int, source: PaperSource = PaperSource.PUBMED, **kw) -> Paper:
+    return Paper(
+        title=kw.pop("title", f"Peanut allergy cohort {i} with anaphylaxis outcomes"),
+        abstract=kw.pop("abstract", "Peanut allergy and anaphylaxis in children."),
+        authors=["Jane Kim"], source=source, source_id=kw.pop("source_id", str(1000 + i)),
+        year=2024, **kw,
+    )
+
+
+@contextmanager
+def _statements(db):
+    """세션 엔진에서 실행된 SQL 문 기록"""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_round_trips_do_not_grow_with_batch_size(test_db):
+    persistence = PaperPersistenceService()
+
+    with _statements(test_db) as small:
+        persistence.save_papers_bulk([_paper(i) for i in range(5)], test_db, allergen_code="peanut")
+    with _statements(test_db) as large:
+        persistence.save_papers_bulk(
+            [_paper(i) for i in range(100, 220)], test_db, allergen_code="peanut",
+        )
+    test_db.commit()
+
+    def round_trips(executed: list[str]) -> int:
+        return sum(not stmt.startswith("INSERT INTO papers ") for stmt in executed)
+
+    assert test_db.query(PaperORM).count() == 125
+    assert round_trips(large) == round_trips(small)
+    assert sum(stmt.startswith("SELECT") for stmt in large) <= 5
+    assert sum(stmt.startswith("INSERT INTO paper_allergen_links") for stmt in large) == 1
+
+
+def test_updates_existing_and_merges_within_batch(test_db):
+    persistence = PaperPersistenceService()
+    by_doi = PaperMapper.dc_to_orm(_paper(1, doi="10.1016/J.JACI.2024.1"))
+    by_pmid = PaperMapper.dc_to_orm(_paper(2))
+    legacy = PaperMapper.dc_to_orm(_paper(3, source=PaperSource.OPENALEX, source_id="W3"))
+    legacy.title_fingerprint = None  # 지문 컬럼 도입 전 레코드
+    test_db.add_all([by_doi, by_pmid, legacy])
+    test_db.commit()
+
+    batch = [
+        _paper(1, source=PaperSource.OPENALEX, source_id="W1", doi="10.1016/j.jaci.2024.1", citation_count=7),
+        _paper(2, title="Renamed title for the same pmid record in pubmed"),
+        _paper(3, source=PaperSource.CORE, source_id="C3", title=legacy.title.upper()),
+        _paper(4, doi="10.1/new"),
+        _paper(4, source=PaperSource.EUROPE_PMC, source_id="E4", doi="10.1/NEW", pdf_url="https://x.pdf"),
+    ]
+
+    new_count = persistence.save_papers_bulk(batch, test_db)
+    test_db.commit()
+
+    assert new_count == 1
+    assert test_db.query(PaperORM).count() == 4
+    assert test_db.get(PaperORM, by_doi.id).citation_count == 7
+    new_paper = test_db.query(PaperORM).filter(PaperORM.doi == "10.1/new").one()
+    assert new_paper.pdf_url == "https://x.pdf"
+
+
+def test_links_and_history_are_written(test_db):
+    persistence = PaperPersistenceService()
+    papers = [_paper(i) for i in range(3)]
+    result = UnifiedSearchResult(
+        papers=papers, pubmed_count=3, semantic_scholar_count=0,
+        total_unique=3, query="peanut allergy", search_time_ms=12.0,
+    )
+
+    assert persistence.save_search_results(result, test_db, allergen_code="peanut") == 3
+
+    links = test_db.query(PaperAllergenLink).all()
+    assert {link.paper_id for link in links} == {p.id for p in test_db.query(PaperORM)}
+    assert all(link.note.startswith("Auto-extracted: ") for link in links)
+    history = test_db.query(SearchHistory).one()
+    assert (history.new_papers_saved, history.allergen_code) == (3, "peanut")
+
+
+def test_falls_back_to_per_paper_save(test_db, monkeypatch):
+    persistence = PaperPersistenceService()
+
+    def fail(*args, **kwargs):
+        raise IntegrityError("INSERT INTO papers", {}, Exception("duplicate key"))
+
+    monkeypatch.setattr(persistence, "_save_papers_bulk", fail)
+
+    assert persistence.save_papers_bulk([_paper(i) for i in range(3)], test_db) == 3
+    test_db.commit()
+    assert test_db.query(PaperORM).count() == 3
+
+
+def test_duplicate_lookups_use_functional_indexes(test_db):
+    def plan(sql: str) -> str:
+        return " ".join(str(row[-1]) for row in test_db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    assert "idx_papers_doi_lower" in plan("SELECT id FROM papers WHERE lower(doi) IN ('10.1/a', '10.1/b')")
+    assert "idx_papers_title_lower" in plan("SELECT id FROM papers WHERE lower(title) = 'peanut'")
+    assert "idx_papers_s2_id" in plan("SELECT id FROM papers WHERE semantic_scholar_id = 'abc'")
+
+
+def test_find_duplicate_stops_at_first_match(test_db):
+    persistence = PaperPersistenceService()
+    existing = PaperMapper.dc_to_orm(_paper(1, doi="10.1/a"))
+    test_db.add(existing)
+    test_db.commit()
+
+    with _statements(test_db) as executed:
+        assert persistence.find_duplicate(_paper(1, doi="10.1/A"), test_db).id == existing.id
+    assert len(executed) == 1
+
+    with _statements(test_db) as executed:
+        assert persistence.find_duplicate(_paper(2, doi="10.1/b", title="Unrelated title"), test_db) is None
+    assert len(executed) == 4  # DOI, PMID, 제목 지문, 제목
+
+
+def test_title_candidates_are_limited_in_sql(test_db, monkeypatch):
+    monkeypatch.setattr(paper_persistence_service, "FINGERPRINT_CANDIDATE_LIMIT", 3)
+    test_db.add_all([PaperMapper.dc_to_orm(_paper(i, title="Same title everywhere")) for i in range(10)])
+    test_db.commit()
+
+    loaded = []
+    monkeypatch.setattr(_DuplicateLookup, "add", lambda self, paper_orm: loaded.append(paper_orm.id))
+    _DuplicateLookup.prefetch([_paper(99, title="Same title everywhere")], test_db)
+
+    assert len(loaded) == 3 + 1  # 지문 후보 3건 + 제목 일치 1건
@@ -0,0 +1,148 @@
+"""논문 근접 중복 지문 (PaperFingerprint / NearDuplicateIndex) 테스트.
+
+핵심 검증:
+- 정규화: HTML 태그, 그리스 문자, 악센트, 구두점, 대소문자 무시
+- 판별: 부제 누락 / Jaccard 임계값 / 연도·제1저자 거부 / 짧은 제목은 정확 일치만
+- 수천 건 병합의 후보 검증 횟수가 항목 수에 비례 (전체 쌍 비교 아님), 빈 제목은 버킷에 넣지 않음
+- PaperSearchService._merge_duplicates 와 PaperPersistenceService.find_duplicate 가 같은 지문 사용
+"""
+from __future__ import annotations
+
+import random
+
+from app.database.models import Paper as PaperORM
+from app.models.paper import Paper, PaperSource
+from app.services.paper_mapper import PaperMapper
+from app.services.paper_persistence_service import PaperPersistenceService
+from app.services.paper_search_service import PaperSearchService
+from app.utils.paper_fingerprint import (
+    NearDuplicateIndex,
+    PaperFingerprint,
+    normalize_text,
+    title_fingerprint,
+)
+
+
+def _paper(title: str, source: PaperSource = PaperSource.PUBMED, source_id: str = "1", **kw) -> Paper:
+    return Paper(
+        title=title, abstract="", authors=kw.pop("authors", ["Jane Kim"]),
+        source=source, source_id=source_id, **kw,
+    )
+
+
+class TestNormalization:
+    def test_markup_greek_accents_and_punctuation(self):
+        assert normalize_text("IgE-binding of <i>Ara h</i> 2 to β-Lactoglobulin (µ-opioid) — café") == (
+            "ige binding of ara h 2 to beta lactoglobulin mu opioid cafe"
+        )
+
+    def test_title_fingerprint_ignores_dropped_subtitle(self):
+        assert title_fingerprint("Peanut oral immunotherapy in preschool children: a randomized trial") == (
+            title_fingerprint("PEANUT ORAL IMMUNOTHERAPY IN PRESCHOOL CHILDREN.")
+        )
+
+
+class TestMatching:
+    def test_source_variants_match(self):
+        a = PaperFingerprint.of(
+            "Cross-reactivity between β-lactoglobulin and goat milk proteins", 2023, ["Jane Kim"],
+        )
+        b = PaperFingerprint.of(
+            "Cross reactivity between beta-lactoglobulin and goat-milk proteins.", 2024, "Kim J, Lee S",
+        )
+        assert a.matches(b)
+
+    def test_different_subtitles_need_jaccard(self):
+        a = PaperFingerprint.of("Food allergy in young children: prevalence in Korea", 2023)
+        b = PaperFingerprint.of("Food allergy in young children: a systematic review of therapies", 2023)
+        assert not a.matches(b)
+
+    def test_year_and_first_author_veto(self):
+        title = "Component resolved diagnostics for hazelnut allergy in adults"
+        base = PaperFingerprint.of(title, 2020, ["Jane Kim"])
+        assert not base.matches(PaperFingerprint.of(title, 2023, ["Jane Kim"]))
+        assert not base.matches(PaperFingerprint.of(title, 2020, ["Hans Müller"]))
+        assert base.matches(PaperFingerprint.of(title, None, None))
+
+    def test_short_titles_require_exact_match(self):
+        assert not PaperFingerprint.of("Milk allergy").matches(PaperFingerprint.of("Egg allergy"))
+        assert PaperFingerprint.of("Milk allergy!").matches(PaperFingerprint.of("milk allergy"))
+
+
+def test_index_scales_to_thousands():
+    rng = random.Random(7)
+    vocab = [f"term{i}" for i in range(2000)]
+    titles = [" ".join(rng.sample(vocab, 10)) for _ in range(3000)]
+    # 300건은 단어 하나를 바꾼 변형 (Jaccard 9/11 ≈ 0.82)
+    variants = [t.rsplit(" ", 1)[0] + " variantword" for t in titles[:300]]
+
+    index: NearDuplicateIndex[int] = NearDuplicateIndex()
+    unique = 0
+    for i, title in enumerate(titles + variants):
+        fp = PaperFingerprint.of(title)
+        if index.find(fp) is None:
+            index.add(fp, i)
+            unique += 1
+
+    assert unique == 3000
+    # 전체 쌍 비교라면 약 500만 회 — LSH 후보만 검증하므로 항목 수 이하
+    assert index.comparisons <= len(titles) + len(variants)
+
+
+def test_index_skips_empty_titles():
+    index: NearDuplicateIndex[int] = NearDuplicateIndex()
+    for i in range(500):
+        fp = PaperFingerprint.of("" if i % 2 else "—")
+        assert index.find(fp) is None
+        index.add(fp, i)
+
+    assert len(index) == 500
+    assert index.comparisons == 0
+
+
+class TestIntegration:
+    def test_search_merge_collapses_preprint_copies(self):
+        service = PaperSearchService()
+        try:
+            papers = [
+                _paper("Dupilumab for <i>peanut</i> allergy: a phase 2 trial",
+                       PaperSource.BIORXIV_MEDRXIV, "b1", year=2024),
+                _paper("Dupilumab for Peanut Allergy — A Phase 2 Trial",
+                       PaperSource.EUROPE_PMC, "e1", year=2024, doi="10.1101/2024.1", pdf_url="https://x.pdf"),
+                _paper("Dupilumab for peanut allergy: a phase-2 trial",
+                       PaperSource.OPENALEX, "W1", year=2024, doi="10.1101/2024.1"),
+                # 같은 제목이지만 다른 DOI → 별도 레코드
+                _paper("Dupilumab for peanut allergy: a phase 2 trial",
+                       PaperSource.PUBMED, "111", year=2025, doi="10.1016/j.jaci.2025.1"),
+            ]
+            merged = service._merge_duplicates(papers)
+        finally:
+            service.close()
+
+        assert [p.source_id for p in merged] == ["b1", "111"]
+        assert merged[0].doi == "10.1101/2024.1"
+        assert merged[0].pdf_url == "https://x.pdf"
+
+    def test_find_duplicate_uses_fingerprint(self, test_db):
+        persistence = PaperPersistenceService()
+        stored = PaperMapper.dc_to_orm(_paper(
+            "Epicutaneous immunotherapy for milk allergy in children: the MILES study",
+            year=2022, authors=["Jane Kim", "Lee S"],
+        ))
+        test_db.add(stored)
+        test_db.commit()
+
+        variant = _paper(
+            "Epicutaneous Immunotherapy for Milk Allergy in Children.",
+            PaperSource.OPENALEX, "W9", year=2023, authors=["J. Kim"],
+        )
+        other_year = _paper(
+            "Epicutaneous immunotherapy for milk allergy in children",
+            PaperSource.OPENALEX, "W10", year=2018,
+        )
+
+        assert persistence.find_duplicate(variant, test_db).id == stored.id
+        assert persistence.find_duplicate(other_year, test_db) is None
+        assert test_db.query(PaperORM).filter(
+            PaperORM.title_fingerprint == title_fingerprint(variant.title)
+        ).count() == 1
@@ -0,0 +1,143 @@
+"""논문 전문 검색 색인 (paper_fulltext) 테스트.
+
+SQLite FTS5 가상 테이블로 검증 (PostgreSQL 은 같은 토큰을 tsvector 로 색인).
+
+핵심 검증:
+- 토큰화: 한글 음절 bigram, 악센트/대소문자 무시
+- ORM flush 시 색인 자동 갱신 (추가 / 제목 수정 / 삭제), rebuild 로 재생성
+- 관련도순 정렬 (제목 일치 > 초록 일치), 조사가 붙은 한글 검색
+- 발췌문 강조, /api/papers 검색이 관련도순
+- /api/search/local 전체 건수, /api/search prefer_local 로컬 우선 경로
+"""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Paper
+from app.database.paper_fulltext import (
+    fulltext_tokens,
+    highlight,
+    rebuild_paper_fulltext,
+)
+from app.services.paper_persistence_service import PaperPersistenceService
+
+
+def _add(db, title: str, abstract: str = "", **kw) -> Paper:
+    paper = Paper(title=title, abstract=abstract, year=kw.pop("year", 2024), **kw)
+    db.add(paper)
+    db.commit()
+    return paper
+
+
+def _search(db, query: str) -> list[str]:
+    return [p.title for p in PaperPersistenceService().search_local(query, db)]
+
+
+def test_tokens_use_hangul_bigrams_and_fold_accents():
+    assert fulltext_tokens("땅콩알레르기는 Café-au-lait IgE") == [
+        "땅콩", "콩알", "알레", "레르", "르기", "기는", "cafe", "au", "lait", "ige",
+    ]
+    assert fulltext_tokens("꽃 A") == ["꽃", "a"]
+
+
+def test_index_follows_orm_changes(test_db):
+    paper = _add(test_db, "Peanut oral immunotherapy outcomes")
+    assert _search(test_db, "immunotherapy") == [paper.title]
+
+    paper.title = "Walnut sensitization in adults"
+    test_db.commit()
+    assert _search(test_db, "immunotherapy") == []
+    assert _search(test_db, "walnut") == [paper.title]
+
+    test_db.delete(paper)
+    test_db.commit()
+    assert _search(test_db, "walnut") == []
+
+
+def test_rebuild_restores_index(test_db):
+    _add(test_db, "Shrimp tropomyosin cross reactivity")
+    test_db.execute(text("DELETE FROM paper_search_index"))
+
+    assert rebuild_paper_fulltext(test_db.connection()) == 1
+    assert rebuild_paper_fulltext(test_db.connection(), only_if_empty=True) == 0
+    assert _search(test_db, "tropomyosin") == ["Shrimp tropomyosin cross reactivity"]
+
+
+def test_ranking_and_korean_search(test_db):
+    _add(test_db, "Dietary management of food allergy", "Includes peanut avoidance advice.", year=2025)
+    _add(test_db, "Peanut allergy in infants", "Early introduction study.", year=2020)
+    _add(test_db, "Milk ladder", "Baked milk", title_kr="우유 사다리", abstract_kr="땅콩알레르기는 제외")
+
+    # 제목 일치가 최신 초록 일치보다 앞
+    assert _search(test_db, "peanut") == [
+        "Peanut allergy in infants", "Dietary management of food allergy",
+    ]
+    assert _search(test_db, "pea") == _search(test_db, "peanut")
+    assert _search(test_db, "땅콩 알레르기") == ["Milk ladder"]
+    assert _search(test_db, "peanut milk") == []
+    assert _search(test_db, "!!!") == []
+
+
+def test_highlight_escapes_and_marks():
+    snippet = highlight("<i>Ara h 2</i> & peanut IgE in 땅콩알레르기 환자", "peanut 알레르기")
+    assert snippet == "Ara h 2 &amp; <mark>peanut</mark> IgE in 땅콩<mark>알레</mark><mark>르기</mark> 환자"
+    assert highlight("Milk ladder", "peanut") is None
+
+
+def test_paper_list_route_ranks_results(client, test_db):
+    _add(test_db, "Egg allergy review", "Mentions sesame briefly.", year=2025)
+    _add(test_db, "Sesame allergy prevalence", "Sesame sesame.", year=2019)
+    _add(test_db, "Unrelated title", "nothing")
+
+    body = client.get("/api/papers", params={"search": "sesame"}).json()
+
+    assert body["total"] == 2
+    assert [p["title"] for p in body["items"]] == ["Sesame allergy prevalence", "Egg allergy review"]
+
+
+@pytest.fixture
+def local_session(monkeypatch, test_db):
+    """SessionLocal 을 직접 여는 라우트가 테스트 DB 를 보도록 교체"""
+    from app.api import main
+
+    monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=test_db.get_bind()))
+    return main
+
+
+def test_local_search_route_reports_total_count(client, test_db, local_session):
+    for i in range(3):
+        _add(test_db, f"Sesame allergy cohort {i}")
+    _add(test_db, "Unrelated title")
+
+    body = client.get("/api/search/local", params={"q": "sesame", "limit": 2}).json()
+
+    assert body["total"] == 3
+    assert len(body["papers"]) == 2
+    assert PaperPersistenceService().count_local("sesame", test_db) == 3
+
+
+def test_search_prefer_local_skips_remote_when_enough(client, test_db, local_session, monkeypatch):
+    calls = []
+
+    class FakeService:
+        def allergy_sources(self):
+            return ["pubmed"]
+
+        async def search_allergy_async(self, **kwargs):
+            calls.append(kwargs)
+            raise AssertionError("외부 검색이 호출되면 안 됨")
+
+    monkeypatch.setattr(local_session, "get_search_service", lambda: FakeService())
+    for i in range(2):
+        _add(test_db, f"Kiwi allergy case {i}", source="pubmed", pmid=str(100 + i))
+
+    body = client.post(
+        "/api/search", json={"allergen": "kiwi", "max_results": 2, "prefer_local": True},
+    ).json()
+
+    assert body["cache_status"] == "local"
+    assert sorted(p["title"] for p in body["papers"]) == ["Kiwi allergy case 0", "Kiwi allergy case 1"]
+    assert calls == []
+    assert local_session._search_local_first("kiwi", 3) is None  # 부족하면 외부 검색으로
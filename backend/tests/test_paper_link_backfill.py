@@ -0,0 +1,155 @@
+"""논문 링크 백필 (PaperLinkBackfill) 테스트.
+
+파일 SQLite DB(WAL) 로 검증 — 읽기 스트림과 쓰기 세션이 서로 다른 연결을 사용.
+
+핵심 검증:
+- 스트리밍 → 추출 → 배치 INSERT, 진행 통계 (papers/sec)
+- 체크포인트 이어하기 (limit 로 중단 후 재실행)
+- 재실행 / replace 모드 멱등 (수동 링크는 유지)
+- 프로세스 풀 경로가 현재 프로세스 결과와 동일
+"""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Paper, PaperAllergenLink
+from app.services.paper_link_backfill import (
+    AUTO_NOTE_PREFIX,
+    LinkBackfillCheckpoint,
+    PaperLinkBackfill,
+)
+from app.services.paper_link_extractor import PaperLinkExtractor
+
+_ABSTRACTS = [
+    ("Peanut anaphylaxis in children", "Epinephrine use after peanut exposure."),
+    ("Cow's milk allergy", "Urticaria and eczema in infants; soy milk substitution."),
+    ("Shrimp tropomyosin", "Cross-reactivity between shrimp and crab."),
+    ("Egg ladder outcomes", "Baked egg tolerance and hives."),
+]
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    Paper.__table__.create(engine)
+    PaperAllergenLink.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+
+    db = factory()
+    db.add_all(
+        Paper(title=title, abstract=abstract, year=2024)
+        for _ in range(5)
+        for title, abstract in _ABSTRACTS
+    )
+    db.add(Paper(title="No abstract", abstract=None, year=2024))
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+def _links(factory) -> list[tuple]:
+    db = factory()
+    try:
+        return sorted(
+            db.query(
+                PaperAllergenLink.paper_id,
+                PaperAllergenLink.allergen_code,
+                PaperAllergenLink.link_type,
+                PaperAllergenLink.specific_item,
+            )
+        )
+    finally:
+        db.close()
+
+
+def _expected_links() -> list[tuple]:
+    extractor = PaperLinkExtractor()
+    expected = []
+    for i in range(5):
+        for j, (title, abstract) in enumerate(_ABSTRACTS):
+            paper_id = i * len(_ABSTRACTS) + j + 1
+            expected += [
+                (paper_id, l.allergen_code, l.link_type, l.specific_item)
+                for l in extractor.extract_links(title=title, abstract=abstract)
+            ]
+    return sorted(expected)
+
+
+def test_backfill_writes_links_and_stats(session_factory):
+    stats = PaperLinkBackfill(session_factory, chunk_size=3, commit_every=6).run()
+
+    assert stats.papers == 20
+    assert stats.last_paper_id == 20
+    assert stats.links_added == len(_expected_links()) > 0
+    assert stats.papers_per_sec > 0
+    assert _links(session_factory) == _expected_links()
+
+    db = session_factory()
+    notes = {note for (note,) in db.query(PaperAllergenLink.note)}
+    db.close()
+    assert all(note.startswith(AUTO_NOTE_PREFIX) for note in notes)
+
+
+def test_resume_from_checkpoint(session_factory, tmp_path):
+    checkpoint = LinkBackfillCheckpoint(str(tmp_path / "backfill.json"))
+
+    first = PaperLinkBackfill(session_factory, chunk_size=4, commit_every=4, checkpoint=checkpoint).run(limit=8)
+    assert (first.papers, first.last_paper_id) == (8, 8)
+    assert checkpoint.load().last_paper_id == 8
+
+    second = PaperLinkBackfill(session_factory, chunk_size=4, commit_every=4, checkpoint=checkpoint).run()
+    assert (second.papers, second.last_paper_id) == (20, 20)
+    assert second.links_added == len(_expected_links())
+    assert _links(session_factory) == _expected_links()
+
+    checkpoint.clear()
+    assert checkpoint.load().last_paper_id == 0
+
+
+def test_rerun_and_replace_are_idempotent(session_factory):
+    db = session_factory()
+    db.add(PaperAllergenLink(
+        paper_id=1, allergen_code="peanut", link_type="symptom",
+        specific_item="수동 입력", relevance_score=100, note="curated",
+    ))
+    # 이전 사전으로 추출된, 더 이상 일치하지 않는 자동 링크
+    db.add(PaperAllergenLink(
+        paper_id=1, allergen_code="peanut", link_type="symptom",
+        specific_item="구 키워드", relevance_score=70, note=f"{AUTO_NOTE_PREFIX}old",
+    ))
+    db.commit()
+    db.close()
+    manual = [(1, "peanut", "symptom", "수동 입력")]
+    stale = [(1, "peanut", "symptom", "구 키워드")]
+
+    PaperLinkBackfill(session_factory).run()
+    assert PaperLinkBackfill(session_factory).run().links_added == 0
+    assert _links(session_factory) == sorted(_expected_links() + manual + stale)
+
+    PaperLinkBackfill(session_factory, replace_existing=True).run()
+    assert _links(session_factory) == sorted(_expected_links() + manual)
+
+
+def test_process_pool_matches_in_process(session_factory):
+    stats = PaperLinkBackfill(session_factory, workers=2, chunk_size=3, commit_every=6).run()
+
+    assert stats.papers == 20
+    assert _links(session_factory) == _expected_links()
+    db = session_factory()
+    assert db.query(func.count(PaperAllergenLink.id)).scalar() == stats.links_added
+    db.close()
+
+
+def test_extract_links_batch_with_workers():
+    extractor = PaperLinkExtractor()
+    papers = [
+        {"id": i, "title": title, "abstract": abstract}
+        for i, (title, abstract) in enumerate(_ABSTRACTS * 3)
+    ]
+
+    assert extractor.extract_links_batch(papers, workers=2, chunk_size=4) == extractor.extract_links_batch(papers)
@@ -0,0 +1,90 @@
+"""논문 링크 추출 (PaperLinkExtractor) · 키워드 오토마톤 테스트.
+
+핵심 검증:
+- 오토마톤: 단어 경계, 구 키워드, 접미 키워드 동시 보고, 복수형, 아포스트로피
+- 추출기: 알러젠 감지 → 증상/회피/대체/관리/교차반응 링크, 앞부분 관련도 가산
+- 논문 타입은 사전 순서 우선
+- 벤치마크 스크립트 실행 (기존 구현 대비 처리량 출력)
+"""
+from __future__ import annotations
+
+from app.services.paper_link_extractor import PaperLinkExtractor
+from app.utils.keyword_automaton import KeywordAutomaton, tokenize
+from scripts import benchmark_link_extractor
+
+
+def _automaton(*keywords: str) -> KeywordAutomaton:
+    automaton = KeywordAutomaton()
+    for kw in keywords:
+        automaton.add(kw, kw)
+    return automaton.build()
+
+
+class TestAutomaton:
+    def test_word_boundaries_and_plurals(self):
+        automaton = _automaton("cod", "egg", "tree nut")
+        hits = automaton.find_all("Codeine, cod-liver oil, EGGS and tree nuts; eggplant")
+        assert [h.payload for h in hits] == ["cod", "egg", "tree nut"]
+        assert [(h.start, h.end) for h in hits] == [(1, 2), (4, 5), (6, 8)]
+
+    def test_overlapping_and_suffix_keywords(self):
+        automaton = _automaton("anaphylactic shock", "shock", "oral allergy syndrome", "allergy")
+        payloads = [h.payload for h in automaton.find_all("anaphylactic shock with oral allergy syndrome")]
+        assert payloads == ["anaphylactic shock", "shock", "allergy", "oral allergy syndrome"]
+
+    def test_failure_links_restart_partial_matches(self):
+        automaton = _automaton("peanut oil", "oil")
+        assert [h.payload for h in automaton.find_all("peanut peanut oil")] == ["peanut oil", "oil"]
+
+    def test_apostrophes_and_punctuation(self):
+        assert tokenize("Cow’s-milk (CMPA), hen's egg.") == ["cows", "milk", "cmpa", "hens", "egg"]
+        assert [h.payload for h in _automaton("cow's milk").find_all("cows milk")] == ["cow's milk"]
+
+
+class TestExtractor:
+    def test_links_with_lead_relevance(self):
+        extractor = PaperLinkExtractor()
+        filler = " ".join(["outcome"] * 60)
+        links = extractor.extract_links(
+            title="Peanut anaphylaxis in children",
+            abstract=f"{filler} urticaria and epinephrine use; peanut butter and sunflower butter.",
+        )
+        by_item = {(l.link_type, l.specific_item): l for l in links}
+
+        assert {l.allergen_code for l in links} == {"peanut"}
+        assert by_item[("emergency", "아나필락시스")].relevance_score == 90
+        assert by_item[("symptom", "두드러기")].relevance_score == 75
+        assert ("dietary", "땅콩버터") in by_item
+        assert ("substitute", "해바라기씨버터") in by_item
+        assert by_item[("emergency", "에피네프린")].matched_keyword == "epinephrine"
+
+    def test_word_boundaries_avoid_false_allergens(self):
+        extractor = PaperLinkExtractor()
+        links = extractor.extract_links(
+            title="Shellfish tropomyosin cross-reactivity",
+            abstract="ICD code analysis of shrimp and crab allergy.",
+        )
+        assert {l.allergen_code for l in links} == {"shellfish"}
+        assert any(l.link_type == "cross_reactivity" for l in links)
+
+    def test_target_allergen_and_first_synonym_wins(self):
+        links = PaperLinkExtractor().extract_links(
+            title="Hives and urticaria", abstract="", target_allergen="milk",
+        )
+        assert [(l.allergen_code, l.matched_keyword) for l in links] == [("milk", "urticaria")]
+
+    def test_paper_type_follows_dictionary_order(self):
+        extractor = PaperLinkExtractor()
+        assert extractor.detect_paper_type("A systematic review and meta-analyses", "") == "review"
+        assert extractor.detect_paper_type("EAACI guidelines on food allergy", "") == "guideline"
+        assert extractor.detect_paper_type("Peanut allergy", "") == "research"
+
+
+def test_benchmark_script_runs(monkeypatch, capsys):
+    monkeypatch.setattr(
+        "sys.argv", ["benchmark_link_extractor", "--papers", "20", "--words", "80", "--repeat", "1"],
+    )
+    benchmark_link_extractor.main()
+
+    out = capsys.readouterr().out
+    assert "µs/건" in out and "속도 향상" in out
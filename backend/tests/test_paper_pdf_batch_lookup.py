@@ -0,0 +1,207 @@
+"""Semantic Scholar paper/batch 기반 PDF 일괄 보강 테스트.
+
+핵심 검증:
+- PMID/DOI 혼합 id 를 PDF_BATCH_SIZE 단위 POST paper/batch 로 조회, 순서 유지
+- "PDF 없음" 확인 id 는 negative cache 로 재조회하지 않음 (요청 실패는 캐시하지 않음)
+- PaperSearchService 는 논문 수와 무관하게 1회 일괄 조회, 병합 결과에 반영
+- 비동기 경로도 동일 (httpx.MockTransport)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+
+from app.core.sources.base import NormalizedDoc, SourceSearchResult
+from app.core.sources.paper import semantic_scholar as s2_module
+from app.core.sources.paper.semantic_scholar import (
+    PdfNegativeCache,
+    SemanticScholarConnector,
+)
+from app.services.async_http import AsyncHttpClient
+from app.services.paper_search_service import PaperSearchService
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clean_negative_cache():
+    s2_module._NO_PDF_CACHE.clear()
+    yield
+    s2_module._NO_PDF_CACHE.clear()
+
+
+def _batch_response(items: list) -> MagicMock:
+    resp = MagicMock()
+    resp.json.return_value = items
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def _pdf(url: str) -> dict:
+    return {"paperId": "x", "openAccessPdf": {"url": url}}
+
+
+# ───────── SemanticScholarService.get_pdf_urls_batch ─────────
+
+
+class TestServiceBatch:
+    def test_chunks_and_preserves_order(self, monkeypatch):
+        c = SemanticScholarConnector()
+        monkeypatch.setattr(c._service, "PDF_BATCH_SIZE", 2)
+        c._service.session.post = MagicMock(side_effect=[
+            _batch_response([_pdf("https://a.pdf"), None]),
+            _batch_response([{"paperId": "y", "openAccessPdf": None}]),
+        ])
+
+        urls = c._service.get_pdf_urls_batch(["PMID:1", "DOI:10.1/x", "PMID:3"])
+
+        assert urls == ["https://a.pdf", None, None]
+        assert c._service.session.post.call_count == 2
+        first = c._service.session.post.call_args_list[0]
+        assert first.args[0].endswith("/paper/batch")
+        assert first.kwargs["json"] == {"ids": ["PMID:1", "DOI:10.1/x"]}
+        assert first.kwargs["params"] == {"fields": "openAccessPdf"}
+
+
+# ───────── connector + negative cache ─────────
+
+
+class TestConnectorNegativeCache:
+    def test_missing_pdfs_are_not_requeried(self):
+        c = SemanticScholarConnector()
+        c._service.get_pdf_urls_batch = MagicMock(return_value=["https://a.pdf", None])
+
+        first = c.get_pdf_urls(["PMID:1", "DOI:10.1/none"])
+        c._service.get_pdf_urls_batch = MagicMock(return_value=["https://b.pdf"])
+        second = c.get_pdf_urls(["DOI:10.1/none", "PMID:2", "PMID:2"])
+
+        assert first == {"PMID:1": "https://a.pdf", "DOI:10.1/none": None}
+        c._service.get_pdf_urls_batch.assert_called_once_with(["PMID:2"])
+        assert second == {"DOI:10.1/none": None, "PMID:2": "https://b.pdf"}
+
+    def test_request_failure_is_not_cached(self):
+        c = SemanticScholarConnector()
+        c._service.get_pdf_urls_batch = MagicMock(side_effect=requests.ConnectionError("down"))
+
+        assert c.get_pdf_urls(["PMID:1"]) == {}
+        assert "PMID:1" not in s2_module._NO_PDF_CACHE
+
+    def test_cache_ttl_and_max_entries(self):
+        clock = FakeClock()
+        cache = PdfNegativeCache(ttl_s=60, max_entries=2, clock=clock)
+        cache.add("a")
+        cache.add("b")
+        cache.add("c")  # 가장 오래된 a 제거
+
+        assert "a" not in cache
+        assert "b" in cache and "c" in cache
+
+        clock.now += 60
+        assert "b" not in cache
+        assert len(cache) == 1
+
+    async def test_async_batch_lookup(self):
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            assert request.method == "POST"
+            assert request.url.params["fields"] == "openAccessPdf"
+            return httpx.Response(200, json=[_pdf("https://a.pdf"), None])
+
+        c = SemanticScholarConnector()
+        c._service._async_http = AsyncHttpClient(transport=httpx.MockTransport(handler))
+
+        found = await c.get_pdf_urls_async(["PMID:1", "DOI:10.1/none"])
+        again = await c.get_pdf_urls_async(["DOI:10.1/none"])
+        await c.aclose()
+
+        assert found == {"PMID:1": "https://a.pdf", "DOI:10.1/none": None}
+        assert again == {"DOI:10.1/none": None}
+        assert bodies == [{"ids": ["PMID:1", "DOI:10.1/none"]}]
+
+
+# ───────── PaperSearchService 통합 ─────────
+
+
+def _doc(source: str, source_id: str, **kw) -> NormalizedDoc:
+    return NormalizedDoc(source=source, source_id=source_id, title=kw.pop("title", source_id), **kw)
+
+
+@pytest.fixture
+def service():
+    svc = PaperSearchService()
+    for c in svc._connectors.values():
+        c.is_available = MagicMock(return_value=True)
+        c.search = MagicMock(return_value=SourceSearchResult(docs=[], source=c.name, query="q"))
+    yield svc
+    svc.close()
+
+
+class TestServiceEnrichment:
+    def test_many_papers_single_batch_request(self, service):
+        service._connectors["pubmed"].search.return_value = SourceSearchResult(
+            docs=[_doc("pubmed", str(i)) for i in range(120)], source="pubmed", query="q",
+        )
+        service._s2_connector.get_pdf_urls = MagicMock(
+            return_value={"PMID:7": "https://s2/7.pdf"},
+        )
+        service._s2_connector.get_pdf_url_by_pmid = MagicMock()
+
+        result = service.search("q")
+
+        service._s2_connector.get_pdf_urls.assert_called_once()
+        assert len(service._s2_connector.get_pdf_urls.call_args.args[0]) == 120
+        service._s2_connector.get_pdf_url_by_pmid.assert_not_called()
+        assert result.downloadable_count == 1
+
+    def test_lookup_result_applied_after_merge(self, service):
+        service._connectors["pubmed"].search.return_value = SourceSearchResult(
+            docs=[_doc("pubmed", "111", doi="10.1/same", title="Same")],
+            source="pubmed", query="q",
+        )
+        service._connectors["openalex"].search.return_value = SourceSearchResult(
+            docs=[_doc("openalex", "W1", doi="10.1/same", title="Same")],
+            source="openalex", query="q",
+        )
+        service._s2_connector.get_pdf_urls = MagicMock(
+            return_value={"PMID:111": "https://s2/p.pdf", "DOI:10.1/same": None},
+        )
+
+        result = service.search("q")
+
+        assert service._s2_connector.get_pdf_urls.call_args.args[0] == ["PMID:111", "DOI:10.1/same"]
+        assert result.total_unique == 1
+        assert result.papers[0].pdf_url == "https://s2/p.pdf"
+
+    async def test_async_path_uses_batch_lookup(self, service):
+        async def search_async(query, max_results=20, **kwargs):
+            return SourceSearchResult(
+                docs=[_doc("pubmed", "1"), _doc("pubmed", "2")], source="pubmed", query=query,
+            )
+
+        calls = []
+
+        async def get_pdf_urls_async(ids):
+            calls.append(ids)
+            await asyncio.sleep(0)
+            return {"PMID:2": "https://s2/2.pdf"}
+
+        service._connectors["pubmed"].search_async = search_async
+        service._s2_connector.get_pdf_urls_async = get_pdf_urls_async
+
+        result = await service.search_async("q", sources=["pubmed"])
+
+        assert calls == [["PMID:1", "PMID:2"]]
+        assert [p.pdf_url for p in result.papers] == [None, "https://s2/2.pdf"]
@@ -0,0 +1,274 @@
+"""비동기 통합 논문 검색 (search_async / search_allergy_async) 테스트.
+
+HTTP 는 httpx.MockTransport 로 대체하고, fan-out 테스트는 connector 의
+search_async 를 코루틴으로 monkeypatch 한다.
+
+핵심 검증:
+- source 호출이 순차가 아닌 동시 실행
+- 전체 deadline 초과 source 는 취소 + errors 기록, 나머지로 부분 결과 반환
+- ABC 기본 search_async 는 동기 search 를 워커 스레드에서 실행
+- native async connector (PubMed esearch→efetch, Europe PMC) 결과 형태가 동기 경로와 동일
+- AsyncHttpClient 는 루프별 클라이언트를 두고 루프 종료 시 닫음
+- /api/search 가 비동기 경로를 사용하고 errors 를 노출
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.core.sources.base import NormalizedDoc, SourceSearchResult
+from app.core.sources.paper.europe_pmc import EuropePMCConnector
+from app.core.sources.paper.pubmed import PubMedConnector
+from app.models.paper import Paper, PaperSearchResult, PaperSource
+from app.services.async_http import AsyncHttpClient
+from app.services.paper_search_service import PaperSearchService
+
+
+# ───────── 헬퍼 ─────────
+
+
+def _doc(source: str, source_id: str) -> NormalizedDoc:
+    # NormalizedDoc.source 는 PaperSource value 여야 하므로 pubmed 로 고정, 제목으로 구분
+    return NormalizedDoc(source="pubmed", source_id=source_id, title=f"{source}-{source_id}")
+
+
+def _delayed(source: str, delay: float, docs: int = 1):
+    async def search_async(query, max_results=20, **kwargs):
+        await asyncio.sleep(delay)
+        return SourceSearchResult(
+            docs=[_doc(source, str(i)) for i in range(docs)],
+            source=source,
+            query=query,
+            meta={"total_count": docs},
+        )
+
+    return search_async
+
+
+def _legacy(source: PaperSource, delay: float = 0.0, error: Exception | None = None):
+    async def search(*args, **kwargs):
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        paper = Paper(title=f"{source.value} paper", abstract="", authors=[],
+                      source=source, source_id=f"{source.value}-1")
+        return PaperSearchResult(papers=[paper], total_count=7, query="q",
+                                 source=source, search_time_ms=0.0)
+
+    return search
+
+
+@pytest.fixture
+def service():
+    svc = PaperSearchService()
+    for c in svc._connectors.values():
+        c.is_available = MagicMock(return_value=True)
+    yield svc
+    svc.close()
+
+
+# ───────── fan-out / deadline ─────────
+
+
+class TestSearchAsync:
+    async def test_sources_run_concurrently(self, service):
+        for c in service._connectors.values():
+            c.search_async = _delayed(c.name, 0.2)
+
+        start = time.monotonic()
+        result = await service.search_async("q", enrich_pdf_links=False)
+
+        assert time.monotonic() - start < 0.6  # 순차 실행이면 6 × 0.2s
+        assert result.errors == {}
+        assert result.pubmed_count == 1 and result.core_count == 1
+        assert result.total_unique == 6
+
+    async def test_deadline_returns_partial_results(self, service):
+        for c in service._connectors.values():
+            c.search_async = _delayed(c.name, 0.0, docs=2)
+        service._connectors["semantic_scholar"].search_async = _delayed("semantic_scholar", 5.0)
+
+        start = time.monotonic()
+        result = await service.search_async("q", enrich_pdf_links=False, deadline_s=0.3)
+
+        assert time.monotonic() - start < 1.0
+        assert set(result.errors) == {"semantic_scholar"}
+        assert result.errors["semantic_scholar"].startswith("TimeoutError")
+        assert result.semantic_scholar_count == 0
+        assert result.pubmed_count == 2
+
+    async def test_connector_exception_is_isolated(self, service):
+        for c in service._connectors.values():
+            c.search_async = _delayed(c.name, 0.0)
+
+        async def boom(query, max_results=20, **kwargs):
+            raise RuntimeError("down")
+
+        service._connectors["openalex"].search_async = boom
+
+        result = await service.search_async("q", enrich_pdf_links=False)
+
+        assert result.errors == {"openalex": "RuntimeError: down"}
+        assert result.total_unique == 5
+
+    async def test_default_search_async_runs_sync_search(self, service):
+        conn = service._connectors["pubmed"]
+        conn.search = MagicMock(return_value=SourceSearchResult(
+            docs=[_doc("pubmed", "1")], source="pubmed", query="q",
+        ))
+        # 인스턴스 override 제거 → ABC 기본 구현(to_thread) 검증
+        result = await super(PubMedConnector, conn).search_async("q", 5, sort="pub_date")
+
+        conn.search.assert_called_once_with("q", 5, sort="pub_date")
+        assert result.count == 1
+
+
+class TestSearchAllergyAsync:
+    async def test_partial_results_with_slow_and_failing_sources(self, service):
+        service.pubmed.search_allergy_papers_async = _legacy(PaperSource.PUBMED)
+        service.semantic_scholar.search_allergy_papers_async = _legacy(
+            PaperSource.SEMANTIC_SCHOLAR, delay=5.0,
+        )
+        service.europe_pmc.search_allergy_async = _legacy(PaperSource.EUROPE_PMC)
+        service.openalex.search_allergy_async = _legacy(
+            PaperSource.OPENALEX, error=ValueError("bad json"),
+        )
+        service.biorxiv.search_allergy_async = _legacy(PaperSource.BIORXIV_MEDRXIV)
+        service.core.api_key = None
+        service._s2_connector = None
+
+        result = await service.search_allergy_async("peanut", deadline_s=0.3)
+
+        assert result.query == "peanut allergy cross-reactivity"
+        assert result.pubmed_count == 7 and result.europe_pmc_count == 7
+        assert set(result.errors) == {"semantic_scholar", "openalex"}
+        assert result.errors["openalex"] == "ValueError: bad json"
+        assert result.total_unique == 3
+
+
+# ───────── native async connectors ─────────
+
+
+_PUBMED_XML = """<?xml version="1.0"?>
+<PubmedArticleSet><PubmedArticle><MedlineCitation>
+  <PMID>111</PMID>
+  <Article>
+    <Journal><Title>J Allergy</Title></Journal>
+    <ArticleTitle>Peanut allergy in children</ArticleTitle>
+    <Abstract><AbstractText>abstract text</AbstractText></Abstract>
+  </Article>
+</MedlineCitation></PubmedArticle></PubmedArticleSet>"""
+
+
+class TestNativeAsyncConnectors:
+    async def test_pubmed_esearch_then_efetch(self):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path.rsplit("/", 1)[-1])
+            if request.url.path.endswith("esearch.fcgi"):
+                assert request.url.params["mindate"] == "2020/01/01"
+                return httpx.Response(200, json={"esearchresult": {"idlist": ["111"], "count": "42"}})
+            return httpx.Response(200, text=_PUBMED_XML)
+
+        conn = PubMedConnector()
+        conn._service._async_http = AsyncHttpClient(transport=httpx.MockTransport(handler))
+
+        result = await conn.search_async("peanut", 5, year_range=(2020, 2024))
+        await conn.aclose()
+
+        assert paths == ["esearch.fcgi", "efetch.fcgi"]
+        assert result.meta["total_count"] == 42
+        assert [d.source_id for d in result.docs] == ["111"]
+        assert result.docs[0].title == "Peanut allergy in children"
+
+    async def test_async_http_retries_server_errors(self):
+        responses = iter([httpx.Response(503), httpx.Response(200, json={"esearchresult": {}})])
+        client = AsyncHttpClient(
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            retries=2, backoff_factor=0,
+        )
+        resp = await client.get("http://eutils/esearch.fcgi")
+        await client.aclose()
+
+        assert resp.status_code == 200
+
+    def test_async_http_closes_client_when_loop_shuts_down(self):
+        http = AsyncHttpClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+        async def call():
+            await http.get("http://eutils/esearch.fcgi")
+            return await http._get_client()
+
+        first = asyncio.run(call())
+        second = asyncio.run(call())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+        assert len(http._clients) == 0
+
+    async def test_europe_pmc_http_error_returns_empty(self):
+        conn = EuropePMCConnector()
+        conn._service._async_http = AsyncHttpClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+
+        result = await conn.search_async("peanut")
+
+        assert result.count == 0
+        assert result.source == "europe_pmc"
+
+    async def test_europe_pmc_parses_results(self):
+        payload = {"resultList": {"result": [
+            {"id": "123", "source": "MED", "pmid": "123", "title": "Milk allergy",
+             "authorString": "Kim J, Lee S.", "pubYear": "2023"},
+        ]}}
+        conn = EuropePMCConnector()
+        conn._service._async_http = AsyncHttpClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload)),
+        )
+
+        result = await conn.search_async("milk", 10)
+
+        assert [d.title for d in result.docs] == ["Milk allergy"]
+        assert result.meta["total_count"] == 1
+
+
+# ───────── /api/search ─────────
+
+
+def test_search_route_awaits_async_path(client, monkeypatch):
+    from app.api import main
+    from app.services.paper_search_service import UnifiedSearchResult
+
+    called = {}
+
+    class FakeService:
+        def allergy_sources(self):
+            return ["pubmed", "semantic_scholar"]
+
+        def search_allergy(self, *args, **kwargs):
+            raise AssertionError("동기 경로가 호출됨")
+
+        async def search_allergy_async(self, **kwargs):
+            called.update(kwargs)
+            return UnifiedSearchResult(
+                papers=[], pubmed_count=3, semantic_scholar_count=0,
+                total_unique=0, query="peanut allergy", search_time_ms=12.0,
+                errors={"semantic_scholar": "TimeoutError: deadline 20s exceeded"},
+            )
+
+    monkeypatch.setattr(main, "get_search_service", lambda: FakeService())
+    monkeypatch.setattr(main.settings, "AUTO_SAVE_SEARCH", False)
+
+    resp = client.post("/api/search", json={"allergen": "peanut", "max_results": 20})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["pubmed_count"] == 3
+    assert "semantic_scholar" in body["errors"]
+    assert called["allergen"] == "peanut" and called["max_results_per_source"] == 10
@@ -234,7 +234,7 @@ class TestErrorVisibility:
         assert result.errors == {}
 
 
-# ───────── D-002: PDF 보강 via S2 connector ─────────
+# ───────── D-002: PDF 보강 via S2 connector (paper/batch 일괄 조회) ─────────
 
 
 class TestPdfEnrichment:
@@ -249,14 +249,14 @@ class TestPdfEnrichment:
             "pubmed",
             [_make_doc("pubmed", "111", title="P1", pdf_url=None)],
         )
-        # S2 connector 의 cross-lookup 메서드 mock
-        svc._s2_connector.get_pdf_url_by_pmid = MagicMock(
-            return_value="https://s2/p.pdf"
+        # S2 connector 의 일괄 cross-lookup 메서드 mock
+        svc._s2_connector.get_pdf_urls = MagicMock(
+            return_value={"PMID:111": "https://s2/p.pdf"}
         )
 
         result = svc.search("q", enrich_pdf_links=True)
 
-        svc._s2_connector.get_pdf_url_by_pmid.assert_called_once_with("111")
+        svc._s2_connector.get_pdf_urls.assert_called_once_with(["PMID:111"])
         assert result.papers[0].pdf_url == "https://s2/p.pdf"
 
     def test_doi_paper_pdf_via_s2_connector_doi_lookup(self):
@@ -270,13 +270,13 @@ class TestPdfEnrichment:
             "openalex",
             [_make_doc("openalex", "W1", doi="10.1/x", pdf_url=None)],
         )
-        svc._s2_connector.get_pdf_url_by_doi = MagicMock(
-            return_value="https://s2/d.pdf"
+        svc._s2_connector.get_pdf_urls = MagicMock(
+            return_value={"DOI:10.1/x": "https://s2/d.pdf"}
         )
 
         result = svc.search("q", enrich_pdf_links=True)
 
-        svc._s2_connector.get_pdf_url_by_doi.assert_called_once_with("10.1/x")
+        svc._s2_connector.get_pdf_urls.assert_called_once_with(["DOI:10.1/x"])
         assert result.papers[0].pdf_url == "https://s2/d.pdf"
 
     def test_pdf_already_present_skips_lookup(self):
@@ -289,11 +289,11 @@ class TestPdfEnrichment:
             "pubmed",
             [_make_doc("pubmed", "111", pdf_url="https://existing/p.pdf")],
         )
-        svc._s2_connector.get_pdf_url_by_pmid = MagicMock()
+        svc._s2_connector.get_pdf_urls = MagicMock()
 
         result = svc.search("q", enrich_pdf_links=True)
 
-        svc._s2_connector.get_pdf_url_by_pmid.assert_not_called()
+        svc._s2_connector.get_pdf_urls.assert_not_called()
         assert result.papers[0].pdf_url == "https://existing/p.pdf"
 
     def test_enrich_disabled_skips_s2(self):
@@ -306,11 +306,11 @@ class TestPdfEnrichment:
             "pubmed",
             [_make_doc("pubmed", "111", pdf_url=None)],
         )
-        svc._s2_connector.get_pdf_url_by_pmid = MagicMock(return_value="x")
+        svc._s2_connector.get_pdf_urls = MagicMock(return_value={"PMID:111": "x"})
 
         svc.search("q", enrich_pdf_links=False)
 
-        svc._s2_connector.get_pdf_url_by_pmid.assert_not_called()
+        svc._s2_connector.get_pdf_urls.assert_not_called()
 
 
 # ───────── 중복 제거 (기존 동작 회귀) ─────────
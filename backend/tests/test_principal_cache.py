@@ -0,0 +1,156 @@
+"""인증 주체 캐시 (PrincipalCache) 테스트.
+
+핵심 검증:
+- (user_id, iat) 키의 LRU 축출 / TTL 만료 / 사용자 단위 무효화 / 적중률 통계
+- 스냅샷에서 복원한 User 는 요청마다 별도의 detached 객체
+- 같은 토큰의 반복 요청은 DB 를 다시 읽지 않음 (새 토큰은 다시 조회)
+- 관리자 역할·정보 변경 라우트가 커밋 후 캐시를 무효화
+- 조직 컨텍스트는 캐시된 활성 멤버십을 사용
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import inspect
+
+from app.auth.jwt_handler import create_access_token
+from app.auth.principal_cache import Principal, PrincipalCache, get_principal_cache, invalidate_principal
+from app.database.models import User
+from app.database.organization_models import Organization, OrganizationMember
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _principal(user_id: int, role: str = "user") -> Principal:
+    return Principal(user_id=user_id, is_active=True, role=role, user_values={"id": user_id}, membership_values=())
+
+
+def _token(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+# ───────── PrincipalCache 단위 ─────────
+
+def test_lru_eviction_and_stats():
+    cache = PrincipalCache(maxsize=2, ttl_seconds=60)
+    cache.put(_principal(1), 100)
+    cache.put(_principal(2), 100)
+    assert cache.get(1, 100) is not None  # 1 이 최근 사용
+    cache.put(_principal(3), 100)
+
+    assert cache.get(2, 100) is None
+    assert cache.get(1, 100) is not None and cache.get(3, 100) is not None
+    stats = cache.get_stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1, 1)
+    assert stats["hit_rate"] == 0.75
+
+
+def test_ttl_expiry():
+    clock = _Clock()
+    cache = PrincipalCache(maxsize=10, ttl_seconds=30, clock=clock)
+    cache.put(_principal(1), 100)
+    clock.now = 29.9
+    assert cache.get(1, 100) is not None
+    clock.now = 30.0
+    assert cache.get(1, 100) is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_invalidate_user_removes_every_token():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=60)
+    cache.put(_principal(1), 100)
+    cache.put(_principal(1), 200)
+    cache.put(_principal(2), 100)
+
+    assert cache.invalidate_user(1) == 2
+    assert cache.get(1, 100) is None and cache.get(1, 200) is None
+    assert cache.get(2, 100) is not None
+    assert cache.invalidate_user(1) == 0
+    assert cache.get_stats()["invalidations"] == 2
+
+
+def test_zero_ttl_disables_cache():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=0)
+    cache.put(_principal(1), 100)
+    assert cache.get(1, 100) is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_restored_user_is_detached_copy(test_user):
+    principal = Principal.from_models(test_user, [])
+    first, second = principal.user(), principal.user()
+
+    assert first is not second
+    assert (first.id, first.name, first.role) == (test_user.id, test_user.name, test_user.role)
+    assert inspect(first).detached
+    assert principal.primary_membership() is None
+
+
+# ───────── 인증 의존성 통합 ─────────
+
+def test_repeated_requests_hit_cache(client, test_db, test_user):
+    headers = _token(test_user)
+    before = get_principal_cache().get_stats()
+    assert client.get("/api/auth/me", headers=headers).json()["name"] == "테스트유저"
+
+    # 캐시 무효화 없이 DB 만 바꾸면 같은 토큰은 캐시된 값을 본다
+    test_user.name = "변경됨"
+    test_db.commit()
+    assert client.get("/api/auth/me", headers=headers).json()["name"] == "테스트유저"
+    stats = get_principal_cache().get_stats()
+    assert (stats["hits"] - before["hits"], stats["misses"] - before["misses"]) == (1, 1)
+
+    # 새로 발급된 토큰(iat 가 다름)은 DB 에서 다시 읽음
+    time.sleep(1.01)
+    assert client.get("/api/auth/me", headers=_token(test_user)).json()["name"] == "변경됨"
+
+
+def test_admin_updates_invalidate(client, test_db, test_user):
+    super_admin = User(name="슈퍼관리자", auth_type="simple", role="super_admin")
+    test_db.add(super_admin)
+    test_db.commit()
+    admin_headers, user_headers = _token(super_admin), _token(test_user)
+
+    assert client.get("/api/auth/me", headers=user_headers).json()["role"] == "user"
+    resp = client.put(f"/api/admin/users/{test_user.id}/role", json={"role": "doctor"}, headers=admin_headers)
+    assert resp.status_code == 200
+    assert client.get("/api/auth/me", headers=user_headers).json()["role"] == "doctor"
+
+    resp = client.put(f"/api/admin/users/{test_user.id}", json={"is_active": False}, headers=admin_headers)
+    assert resp.status_code == 200
+    assert client.get("/api/auth/me", headers=user_headers).status_code == 403
+
+    before = get_principal_cache().get_stats()
+    client.put(f"/api/admin/users/{test_user.id}", json={"name": "재변경"}, headers=admin_headers)
+    stats = client.get("/api/admin/users/auth-cache/stats", headers=admin_headers).json()
+    assert stats["hits"] > before["hits"] and "hit_rate" in stats
+
+
+@pytest.fixture
+def doctor_member(test_db, doctor_user):
+    org = Organization(name="테스트병원", status="active")
+    test_db.add(org)
+    test_db.commit()
+    member = OrganizationMember(organization_id=org.id, user_id=doctor_user.id, role="doctor")
+    test_db.add(member)
+    test_db.commit()
+    return member
+
+
+def test_org_context_uses_cached_membership(client, test_db, doctor_user, doctor_member):
+    headers = _token(doctor_user)
+    assert client.get("/api/hospital/dashboard", headers=headers).status_code == 200
+
+    doctor_member.is_active = False
+    test_db.commit()
+    assert client.get("/api/hospital/dashboard", headers=headers).status_code == 200  # TTL 동안 유지
+
+    invalidate_principal(doctor_user.id)
+    assert client.get("/api/hospital/dashboard", headers=headers).status_code == 403
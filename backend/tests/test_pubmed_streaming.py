@@ -0,0 +1,185 @@
+"""PubMed history server(WebEnv) 페이지 단위 efetch + iterparse 스트리밍 테스트.
+
+HTTP 는 session.get 을 MagicMock 으로 대체하여 retstart/retmax 창에 해당하는
+PubmedArticleSet XML 을 스트림(raw) 으로 돌려준다.
+
+핵심 검증:
+- esearch 는 ID 없이 WebEnv/query_key 만 받고, efetch 는 창 단위로 나눠 호출
+- 제너레이터라서 소비한 만큼만 efetch 호출
+- 실패/손상 페이지는 건너뛰고 다음 창 계속
+- search() 도 한 페이지를 넘으면 WebEnv 페이지네이션 사용
+- iterparse 는 처리한 논문을 해제하여 메모리 사용량이 결과 크기에 비례하지 않음
+"""
+from __future__ import annotations
+
+import io
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from app.services import pubmed_service as pubmed_module
+from app.services.pubmed_service import PubMedService
+
+
+def _article(pmid: int) -> str:
+    return (
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<Journal><Title>J Allergy</Title></Journal>"
+        f"<ArticleTitle>Paper {pmid}</ArticleTitle>"
+        f"<Abstract><AbstractText>abstract {pmid} {'x' * 200}</AbstractText></Abstract>"
+        f"</Article></MedlineCitation></PubmedArticle>"
+    )
+
+
+def _article_set(start: int, count: int) -> bytes:
+    body = "".join(_article(i) for i in range(start, start + count))
+    return f'<?xml version="1.0"?><PubmedArticleSet>{body}</PubmedArticleSet>'.encode()
+
+
+def _response(*, json_data=None, content: bytes = b"", status: int = 200) -> MagicMock:
+    resp = MagicMock()
+    resp.json.return_value = json_data
+    resp.raw = io.BytesIO(content)
+    resp.text = content.decode()
+    if status >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(f"{status}")
+    return resp
+
+
+class FakeEutils:
+    """esearch/efetch 요청을 기록하고 창에 맞는 XML 을 반환"""
+
+    def __init__(self, count: int, idlist: list[str] | None = None, broken: set[int] = frozenset()):
+        self.count = count
+        self.idlist = idlist or []
+        self.broken = broken
+        self.efetch_params: list[dict] = []
+        self.efetch_kwargs: list[dict] = []
+
+    def __call__(self, url, params=None, **kwargs):
+        if url.endswith("esearch.fcgi"):
+            return _response(json_data={"esearchresult": {
+                "count": str(self.count), "idlist": self.idlist,
+                "webenv": "WE1", "querykey": "1",
+            }})
+        self.efetch_params.append(params)
+        self.efetch_kwargs.append(kwargs)
+        if "id" in params:
+            return _response(content=_article_set(0, len(params["id"].split(","))))
+        start = params["retstart"]
+        if start in self.broken:
+            return _response(status=500)
+        return _response(content=_article_set(start, params["retmax"]))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(pubmed_module.time, "sleep", lambda s: None)
+
+
+@pytest.fixture
+def service():
+    svc = PubMedService()
+    svc.EFETCH_PAGE_SIZE = 10
+    return svc
+
+
+class TestIterSearch:
+    def test_pages_through_history_in_order(self, service):
+        eutils = FakeEutils(count=25)
+        service.session.get = MagicMock(side_effect=eutils)
+
+        papers = list(service.iter_search("peanut", max_results=None))
+
+        assert [p.source_id for p in papers] == [str(i) for i in range(25)]
+        assert [(p["retstart"], p["retmax"]) for p in eutils.efetch_params] == [
+            (0, 10), (10, 10), (20, 5),
+        ]
+        assert all(p["WebEnv"] == "WE1" and p["query_key"] == "1" for p in eutils.efetch_params)
+        assert all(kw["stream"] is True for kw in eutils.efetch_kwargs)
+        esearch_params = service.session.get.call_args_list[0].kwargs["params"]
+        assert esearch_params["retmax"] == 0 and esearch_params["usehistory"] == "y"
+
+    def test_max_results_caps_total(self, service):
+        eutils = FakeEutils(count=1000)
+        service.session.get = MagicMock(side_effect=eutils)
+
+        papers = list(service.iter_search("peanut", max_results=15))
+
+        assert len(papers) == 15
+        assert [(p["retstart"], p["retmax"]) for p in eutils.efetch_params] == [(0, 10), (10, 5)]
+
+    def test_generator_fetches_lazily(self, service):
+        eutils = FakeEutils(count=1000)
+        service.session.get = MagicMock(side_effect=eutils)
+
+        stream = service.iter_search("peanut")
+        first = next(stream)
+        stream.close()
+
+        assert first.source_id == "0"
+        assert len(eutils.efetch_params) == 1
+
+    def test_failed_page_is_skipped(self, service):
+        eutils = FakeEutils(count=30, broken={10})
+        service.session.get = MagicMock(side_effect=eutils)
+
+        papers = list(service.iter_search("peanut"))
+
+        assert [p.source_id for p in papers] == [str(i) for i in range(10)] + [
+            str(i) for i in range(20, 30)
+        ]
+
+    def test_esearch_failure_yields_nothing(self, service):
+        service.session.get = MagicMock(side_effect=requests.ConnectionError("down"))
+
+        assert list(service.iter_search("peanut")) == []
+
+
+class TestSearchUsesHistory:
+    def test_large_result_is_paginated(self, service):
+        eutils = FakeEutils(count=500, idlist=[str(i) for i in range(25)])
+        service.session.get = MagicMock(side_effect=eutils)
+
+        result = service.search("peanut", max_results=25)
+
+        assert len(result.papers) == 25 and result.total_count == 500
+        assert len(eutils.efetch_params) == 3
+        assert all("id" not in p for p in eutils.efetch_params)
+
+    def test_small_result_uses_single_id_fetch(self, service):
+        eutils = FakeEutils(count=500, idlist=["1", "2"])
+        service.session.get = MagicMock(side_effect=eutils)
+
+        result = service.search("peanut", max_results=2)
+
+        assert len(result.papers) == 2
+        assert [p["id"] for p in eutils.efetch_params] == ["1,2"]
+
+
+class TestIterparse:
+    def test_invalid_xml_returns_empty_list(self):
+        assert PubMedService()._parse_pubmed_xml("<PubmedArticleSet><Pub") == []
+
+    def test_memory_stays_flat(self):
+        service = PubMedService()
+        payload = _article_set(0, 3000)
+
+        def peak(consume) -> int:
+            tracemalloc.start()
+            try:
+                consume()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        def streaming():
+            for _ in service._iter_pubmed_xml(io.BytesIO(payload)):
+                pass
+
+        def whole_dom():
+            pubmed_module.ET.fromstring(payload)
+
+        assert peak(streaming) < peak(whole_dom) / 4
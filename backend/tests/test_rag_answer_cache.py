@@ -0,0 +1,165 @@
+"""RAGService.ask 답변 캐시 단위 테스트.
+
+ChromaDB 검색과 LLM 호출은 monkeypatch 로 대체한다.
+
+핵심 검증:
+- 질문 정규화 (공백/대소문자/끝 문장부호)
+- 같은 질문 + 같은 검색 청크 → LLM 재호출 없음, 히트/미스 카운터 반영
+- 재시도 후에도 '답변 불가' 인 답변은 저장하지 않음
+- 히트 카운터는 메모리에 모았다가 일정 건수마다 한 번에 반영
+- 근거 논문 재인덱싱 시 무효화, TTL 만료, 최대 항목 초과 시 LRU 제거
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from app.database.models import RagAnswerCacheEntry, RagAnswerCachePaper
+from app.services import rag_answer_cache
+from app.services.rag_answer_cache import (
+    RagAnswerCache,
+    make_cache_key,
+    normalize_question,
+)
+from app.services.rag_service import RAGService
+from app.utils.timezone import utc_now
+
+
+class FakeLLM:
+    is_available = True
+    is_gemini_available = False
+
+    def __init__(self):
+        self.calls = 0
+
+    def _chat(self, prompt, max_tokens=500, provider="news"):
+        self.calls += 1
+        return f"답변 {self.calls}"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    instance = RagAnswerCache(ttl_hours=1, max_entries=100)
+    monkeypatch.setattr(rag_answer_cache, "_answer_cache", instance)
+    return instance
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    fake = FakeLLM()
+    monkeypatch.setattr("app.services.ollama_service.get_ollama_service", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    service = RAGService()
+    hits = [
+        {
+            "chunk_id": "paper_1_chunk_0", "paper_id": 1, "title": "Peanut OIT",
+            "text": "...", "score": 0.8, "year": 2024, "doi": "", "allergens": "peanut",
+        },
+        {
+            "chunk_id": "paper_2_chunk_0", "paper_id": 2, "title": "Peanut SLIT",
+            "text": "...", "score": 0.7, "year": 2023, "doi": "", "allergens": "peanut",
+        },
+    ]
+    monkeypatch.setattr(service, "search", lambda **kwargs: list(hits))
+    return service
+
+
+class TestKey:
+    def test_normalize_question(self):
+        assert normalize_question("  땅콩  알러지 증상은?? ") == "땅콩 알러지 증상은"
+        assert normalize_question("Peanut ALLERGY.") == "peanut allergy"
+
+    def test_key_ignores_chunk_order_and_question_noise(self):
+        a = make_cache_key("땅콩 알러지 증상은?", "peanut", ["c2", "c1"])
+        b = make_cache_key("땅콩  알러지 증상은", "Peanut", ["c1", "c2"])
+        assert a == b
+        assert a != make_cache_key("땅콩 알러지 증상은?", "milk", ["c1", "c2"])
+
+
+class TestAsk:
+    def test_repeated_question_served_from_cache(self, test_db, rag, cache, llm):
+        first = rag.ask("땅콩 알러지 증상은?", allergen="peanut", db=test_db)
+        second = rag.ask("땅콩 알러지 증상은", allergen="peanut", db=test_db)
+
+        assert llm.calls == 1
+        assert second == first
+        stats = cache.get_stats(test_db)
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_llm_failure_is_not_cached(self, test_db, rag, cache, llm):
+        llm._chat = lambda *args, **kwargs: None
+        rag.ask("우유 알러지", db=test_db)
+        assert test_db.query(RagAnswerCacheEntry).count() == 0
+
+    def test_insufficient_answer_is_not_cached(self, test_db, rag, cache, llm):
+        llm._chat = lambda *args, **kwargs: "제공된 논문에는 관련 정보가 없습니다."
+        result = rag.ask("우유 알러지", db=test_db)
+
+        assert result["answer"].endswith("관련 정보가 없습니다.")
+        assert test_db.query(RagAnswerCacheEntry).count() == 0
+
+
+class TestHitCounter:
+    def test_hits_are_flushed_in_batches(self, test_db):
+        cache = RagAnswerCache(ttl_hours=1, max_entries=100, hit_flush=3)
+        cache.put(test_db, "q", None, ["c"], {"answer": "a", "sources": [], "confidence": 0.5}, paper_ids=[1])
+        key = make_cache_key("q", None, ["c"])
+
+        for _ in range(2):
+            assert cache.get(test_db, "q", None, ["c"]) is not None
+        test_db.expire_all()
+        assert test_db.get(RagAnswerCacheEntry, key).hit_count == 0
+
+        assert cache.get(test_db, "q", None, ["c"]) is not None
+        test_db.expire_all()
+        assert test_db.get(RagAnswerCacheEntry, key).hit_count == 3
+        assert cache.flush_hits(test_db) == 0
+
+
+class TestInvalidation:
+    def _put(self, db, cache, chunk_ids, paper_ids, question="q"):
+        cache.put(
+            db, question, None, chunk_ids,
+            {"answer": "a", "sources": [], "confidence": 0.5},
+            paper_ids=paper_ids,
+        )
+
+    def test_reindexed_paper_drops_dependent_answers(self, test_db, cache):
+        self._put(test_db, cache, ["paper_1_chunk_0"], [1], question="q1")
+        self._put(test_db, cache, ["paper_2_chunk_0"], [2], question="q2")
+
+        assert cache.invalidate_papers(test_db, [1]) == 1
+        test_db.commit()
+
+        assert cache.get(test_db, "q1", None, ["paper_1_chunk_0"]) is None
+        assert cache.get(test_db, "q2", None, ["paper_2_chunk_0"]) is not None
+        assert test_db.query(RagAnswerCachePaper).count() == 1
+
+    def test_expired_entry_is_a_miss(self, test_db, cache):
+        self._put(test_db, cache, ["c"], [1])
+        entry = test_db.query(RagAnswerCacheEntry).one()
+        entry.created_at = utc_now() - timedelta(hours=2)
+        test_db.commit()
+
+        assert cache.get(test_db, "q", None, ["c"]) is None
+        assert test_db.query(RagAnswerCacheEntry).count() == 0
+
+    def test_lru_eviction_keeps_recently_used(self, test_db, cache):
+        cache.max_entries = 2
+        self._put(test_db, cache, ["a"], [1], question="old")
+        self._put(test_db, cache, ["b"], [2], question="recent")
+        old = test_db.get(RagAnswerCacheEntry, make_cache_key("old", None, ["a"]))
+        old.last_accessed_at = utc_now() - timedelta(minutes=30)
+        test_db.commit()
+
+        self._put(test_db, cache, ["c"], [3], question="new")
+
+        questions = {e.question for e in test_db.query(RagAnswerCacheEntry).all()}
+        assert questions == {"recent", "new"}
@@ -0,0 +1,177 @@
+"""RAGService 하이브리드 검색 (벡터 + BM25 RRF) 단위 테스트.
+
+ChromaDB 는 토큰 해시 기반 장난감 임베딩을 쓰는 FakeCollection 으로 대체한다.
+
+핵심 검증:
+- LexicalIndex: BM25 랭킹, 알러젠 포스팅 리스트, 논문 단위 교체
+- reciprocal_rank_fusion 합산
+- 알러젠 필터는 벡터·렉시컬 양쪽 사전 필터로 적용 (쿼리 텍스트 변형 없음)
+- 사이드카 동기화가 덜 끝났으면 (청크 수 < 컬렉션) 사전 필터를 쓰지 않음
+- 렉시컬로만 찾은 청크도 결과에 포함되고, score 는 저장 임베딩 기반 코사인 유사도
+"""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from app.services.rag_lexical_index import LexicalIndex, reciprocal_rank_fusion
+from app.services.rag_service import RAGService, _cosine_similarity
+
+_DIM = 64
+
+
+def toy_embed(text: str) -> list[float]:
+    vec = [0.0] * _DIM
+    for token in re.findall(r"\w+", text.lower()):
+        vec[sum(map(ord, token)) % _DIM] += 1.0
+    return vec
+
+
+class FakeCollection:
+    """query / get(ids) / upsert / delete 만 지원하는 ChromaDB 대체 구현"""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.queries: list[dict] = []
+
+    def count(self):
+        return len(self.rows)
+
+    def upsert(self, ids, documents, metadatas):
+        for cid, doc, meta in zip(ids, documents, metadatas):
+            self.rows[cid] = {"document": doc, "metadata": meta, "embedding": toy_embed(doc)}
+
+    def delete(self, ids=None, where=None):
+        pass
+
+    def query(self, n_results, where=None, query_embeddings=None, query_texts=None):
+        self.queries.append({"where": where, "query_texts": query_texts})
+        q = query_embeddings[0] if query_embeddings else toy_embed(query_texts[0])
+        rows = [
+            (cid, row) for cid, row in self.rows.items()
+            if not where or all(row["metadata"].get(k) == v for k, v in where.items())
+        ]
+        rows.sort(key=lambda r: _cosine_similarity(q, r[1]["embedding"]), reverse=True)
+        rows = rows[:n_results]
+        return {
+            "ids": [[cid for cid, _ in rows]],
+            "documents": [[row["document"] for _, row in rows]],
+            "metadatas": [[row["metadata"] for _, row in rows]],
+            "distances": [[1 - _cosine_similarity(q, row["embedding"]) for _, row in rows]],
+        }
+
+    def get(self, ids=None, include=None, **kwargs):
+        ids = [cid for cid in (ids or []) if cid in self.rows]
+        return {"ids": ids, "embeddings": [self.rows[cid]["embedding"] for cid in ids]}
+
+
+@pytest.fixture
+def rag():
+    service = RAGService()
+    service._collection = FakeCollection()
+    service._available = True
+    service._lexical = LexicalIndex(":memory:")
+    service._embedding_fn = lambda texts: [toy_embed(t) for t in texts]
+    service.index_papers([
+        {"paper_id": 1, "title": "Peanut oral immunotherapy",
+         "abstract": "Peanut OIT induces desensitization in children.",
+         "allergen_codes": ["peanut"]},
+        {"paper_id": 2, "title": "Cow's milk ladder",
+         "abstract": "Baked milk introduction for milk allergic infants.",
+         "allergen_codes": ["milk"]},
+        {"paper_id": 3, "title": "Omalizumab adjunct",
+         "abstract": "Anti-IgE omalizumab with peanut and milk OIT.",
+         "allergen_codes": ["peanut", "milk"]},
+    ])
+    return service
+
+
+class TestLexicalIndex:
+    def test_bm25_ranks_matching_chunks(self):
+        idx = LexicalIndex(":memory:")
+        idx.replace_papers(
+            [1, 2, 3],
+            ["paper_1_chunk_0", "paper_2_chunk_0", "paper_3_chunk_0"],
+            ["omalizumab omalizumab dosing", "baked milk ladder", "egg ladder"],
+            [
+                {"paper_id": 1, "allergens": "peanut"},
+                {"paper_id": 2, "allergens": "milk"},
+                {"paper_id": 3, "allergens": "egg"},
+            ],
+        )
+        hits = idx.search("omalizumab")
+        assert [h["chunk_id"] for h in hits] == ["paper_1_chunk_0"]
+        assert hits[0]["bm25"] > 0
+
+        assert idx.search("omalizumab", allergen="milk") == []
+        assert idx.search("???") == []
+
+    def test_replace_drops_old_chunks(self):
+        idx = LexicalIndex(":memory:")
+        meta = [{"paper_id": 1, "allergens": "egg"}] * 2
+        idx.replace_papers([1], ["c0", "c1"], ["egg white", "egg yolk"], meta)
+        idx.replace_papers([1], ["c0"], ["ovomucoid"], meta[:1])
+
+        assert idx.count() == 1
+        assert idx.search("yolk") == []
+        assert idx.has_allergen("egg")
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+    assert fused["b"] == pytest.approx(1 / 62 + 1 / 61)
+    assert max(fused, key=fused.get) == "b"
+
+
+class TestHybridSearch:
+    def test_allergen_filter_is_a_prefilter(self, rag):
+        results = rag.search("immunotherapy desensitization", n_results=5, allergen_filter="milk")
+
+        assert {r["paper_id"] for r in results} <= {2, 3}
+        last = rag._collection.queries[-1]
+        assert last["where"] == {"allergen_milk": True}
+
+    def test_results_are_fused_and_scored(self, rag):
+        results = rag.search("omalizumab", n_results=3)
+
+        assert results[0]["paper_id"] == 3
+        assert results[0]["lexical_score"] > 0
+        assert all("fused_score" in r for r in results)
+        assert results == sorted(results, key=lambda r: r["fused_score"], reverse=True)
+        assert 0.0 < results[0]["score"] <= 1.0
+
+    def test_lexical_only_hit_gets_vector_score(self, rag):
+        rag._collection.query = lambda **kwargs: {
+            "ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]],
+        }
+        results = rag.search("omalizumab", n_results=3)
+
+        assert [r["paper_id"] for r in results] == [3]
+        assert results[0]["score"] > 0
+
+    def test_unknown_allergen_falls_back_to_query_bias(self, rag):
+        rag.search("reaction", allergen_filter="latex")
+        last = rag._collection.queries[-1]
+        assert last["where"] is None
+
+    def test_partial_sidecar_skips_prefilter(self, rag):
+        # 초기 동기화 도중 중단 — 사이드카에 논문 1 만 남음
+        rag._lexical.clear()
+        rows = rag._collection.rows
+        rag._lexical.replace_papers(
+            [1], ["paper_1_chunk_0"], [rows["paper_1_chunk_0"]["document"]],
+            [rows["paper_1_chunk_0"]["metadata"]],
+        )
+
+        results = rag.search("milk", n_results=3, allergen_filter="peanut")
+        assert rag._collection.queries[-1]["where"] is None
+        assert 3 in {r["paper_id"] for r in results}
+
+    def test_dense_only_without_sidecar(self, rag):
+        rag._lexical.clear()
+        results = rag.search("milk", n_results=2, allergen_filter="milk")
+
+        assert len(results) == 2
+        assert "fused_score" not in results[0]
+        assert rag._collection.queries[-1]["where"] is None
@@ -0,0 +1,293 @@
+"""RAGService 증분 인덱싱 워터마크(rag_index_state) 단위 테스트.
+
+ChromaDB 는 메모리 기반 FakeCollection 으로 대체한다 — 실제 임베딩 없음.
+
+핵심 검증:
+- 워터마크에 없는 논문만 인덱싱, 재실행 시 0건
+- 기존 컬렉션 → 워터마크 1회 초기화 (이후 메타데이터 스캔 없음)
+- 여러 논문 청크를 모아 배치 upsert, 재인덱싱 시 잔여 청크 제거, 변경 없는 논문은 건너뜀
+- get_stats 는 워터마크 기준으로 논문 수 집계
+- enrich_with_fulltext 대상은 abstract 로만 인덱싱된 논문
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database.models import Paper, RagIndexState
+from app.services.rag_lexical_index import LexicalIndex
+from app.services.rag_service import RAGService, _content_hash
+
+
+class FakeCollection:
+    """ChromaDB Collection 최소 대체 구현"""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.full_scans = 0
+        self.upsert_calls = 0
+
+    def count(self) -> int:
+        return len(self.rows)
+
+    def get(self, where=None, include=None, limit=None, offset=None):
+        if where is None:
+            if not offset:
+                self.full_scans += 1
+            items = list(self.rows.items())[offset or 0:]
+            if limit is not None:
+                items = items[:limit]
+        else:
+            items = [
+                (cid, row) for cid, row in self.rows.items()
+                if self._matches(row["metadata"], where)
+            ]
+        return {
+            "ids": [cid for cid, _ in items],
+            "documents": [row["document"] for _, row in items],
+            "metadatas": [row["metadata"] for _, row in items],
+        }
+
+    def update(self, ids, metadatas):
+        for cid, meta in zip(ids, metadatas):
+            self.rows[cid]["metadata"] = meta
+
+    def _matches(self, meta: dict, where: dict) -> bool:
+        for key, cond in where.items():
+            if isinstance(cond, dict) and "$in" in cond:
+                if meta.get(key) not in cond["$in"]:
+                    return False
+            elif meta.get(key) != cond:
+                return False
+        return True
+
+    def delete(self, ids=None, where=None):
+        if where is not None:
+            ids = [
+                cid for cid, row in self.rows.items()
+                if self._matches(row["metadata"], where)
+            ]
+        for cid in ids or []:
+            self.rows.pop(cid, None)
+
+    def upsert(self, ids, documents, metadatas):
+        self.upsert_calls += 1
+        for cid, doc, meta in zip(ids, documents, metadatas):
+            self.rows[cid] = {"document": doc, "metadata": meta}
+
+
+@pytest.fixture
+def rag():
+    service = RAGService()
+    service._collection = FakeCollection()
+    service._available = True
+    service._lexical = LexicalIndex(":memory:")
+    return service
+
+
+def _add_paper(db, title: str, abstract: str = "abstract text", doi: str | None = None) -> Paper:
+    paper = Paper(
+        title=title,
+        abstract=abstract,
+        doi=doi,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(paper)
+    db.commit()
+    db.refresh(paper)
+    return paper
+
+
+class TestIncrementalIndexing:
+    def test_indexes_only_papers_without_watermark(self, test_db, rag):
+        p1 = _add_paper(test_db, "Peanut allergy cohort")
+        p2 = _add_paper(test_db, "Milk allergy cohort")
+
+        result = rag.index_papers_from_db(test_db, batch_size=10)
+        assert result == {"indexed": 2, "skipped": 0, "total_chunks": 2}
+
+        states = {s.paper_id: s for s in test_db.query(RagIndexState).all()}
+        assert set(states) == {p1.id, p2.id}
+        assert states[p1.id].chunk_count == 1
+        assert states[p1.id].content_source == "abstract"
+        assert states[p1.id].content_hash == _content_hash(
+            "Peanut allergy cohort\n\nabstract text"
+        )
+
+        again = rag.index_papers_from_db(test_db, batch_size=10)
+        assert again == {"indexed": 0, "skipped": 2, "total_chunks": 0}
+
+    def test_new_paper_picked_up_without_collection_scan(self, test_db, rag):
+        _add_paper(test_db, "Egg allergy")
+        rag.index_papers_from_db(test_db)
+
+        p2 = _add_paper(test_db, "Wheat allergy")
+        result = rag.index_papers_from_db(test_db)
+
+        assert result["indexed"] == 1
+        assert test_db.get(RagIndexState, p2.id) is not None
+        assert rag._collection.full_scans == 0
+
+    def test_papers_without_abstract_are_ignored(self, test_db, rag):
+        _add_paper(test_db, "No abstract", abstract="")
+        assert rag.index_papers_from_db(test_db)["indexed"] == 0
+        assert test_db.query(RagIndexState).count() == 0
+
+
+class TestBootstrap:
+    def test_existing_collection_seeds_watermark_once(self, test_db, rag):
+        p1 = _add_paper(test_db, "Legacy indexed paper")
+        rag.index_paper(p1.id, p1.title, p1.abstract)  # db 미지정 — 워터마크 없음
+        assert test_db.query(RagIndexState).count() == 0
+
+        result = rag.index_papers_from_db(test_db)
+        assert result["indexed"] == 0
+        assert result["skipped"] == 1
+        assert rag._collection.full_scans == 1
+
+        rag.index_papers_from_db(test_db)
+        assert rag._collection.full_scans == 1
+
+    def test_existing_collection_seeds_lexical_index(self, test_db, rag):
+        p1 = _add_paper(test_db, "Legacy peanut paper")
+        rag.index_paper(p1.id, p1.title, p1.abstract, allergen_codes=["peanut"])
+        rag._lexical.clear()
+        for row in rag._collection.rows.values():
+            row["metadata"].pop("allergen_peanut")
+
+        rag.index_papers_from_db(test_db)
+
+        assert rag._lexical.count() == 1
+        assert rag._lexical.has_allergen("peanut")
+        meta = next(iter(rag._collection.rows.values()))["metadata"]
+        assert meta["allergen_peanut"] is True
+
+    def test_interrupted_lexical_seed_resumes(self, test_db, rag):
+        p1 = _add_paper(test_db, "Legacy peanut paper")
+        p2 = _add_paper(test_db, "Legacy milk paper")
+        rag.index_paper(p1.id, p1.title, p1.abstract, allergen_codes=["peanut"])
+        rag.index_paper(p2.id, p2.title, p2.abstract, allergen_codes=["milk"])
+        # 이전 프로세스가 첫 논문만 동기화하고 종료
+        rag._lexical.clear()
+        first_id, first = next(iter(rag._collection.rows.items()))
+        rag._lexical.replace_papers([p1.id], [first_id], [first["document"]], [first["metadata"]])
+        assert rag._lexical.count() == 1
+
+        rag.index_papers_from_db(test_db)
+
+        assert rag._lexical.count() == 2
+        assert rag._lexical.has_allergen("peanut") and rag._lexical.has_allergen("milk")
+
+
+class TestBulkIndexing:
+    def test_chunks_from_many_papers_share_upsert_batches(self, test_db, rag):
+        for i in range(5):
+            _add_paper(test_db, f"Paper {i}", abstract="z" * 1500)  # 3 청크
+
+        result = rag.index_papers_from_db(test_db, upsert_batch_size=10)
+
+        assert result["indexed"] == 5
+        assert result["total_chunks"] == 15
+        assert rag._collection.upsert_calls == 2
+
+    def test_reindex_drops_stale_chunks(self, test_db, rag):
+        paper = _add_paper(test_db, "Shrinking paper", abstract="z" * 1500)
+        rag.index_papers_from_db(test_db)
+        assert rag._collection.count() == 3
+
+        rag.index_paper(paper.id, paper.title, "short", db=test_db)
+        test_db.commit()
+
+        assert rag._collection.count() == 1
+        assert test_db.get(RagIndexState, paper.id).chunk_count == 1
+
+    def test_unchanged_papers_are_not_reembedded(self, test_db, rag):
+        from sqlalchemy import event
+
+        papers = [_add_paper(test_db, f"Stable paper {i}") for i in range(3)]
+        rag.index_papers_from_db(test_db)
+        upserts = rag._collection.upsert_calls
+        payload = [
+            {"paper_id": p.id, "title": p.title, "abstract": p.abstract} for p in papers
+        ]
+        payload[0]["abstract"] = "revised abstract"
+
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_db.get_bind(), "before_cursor_execute", listener)
+        try:
+            indexed = rag.index_papers(payload, db=test_db)
+        finally:
+            event.remove(test_db.get_bind(), "before_cursor_execute", listener)
+        test_db.commit()
+
+        assert indexed == {papers[0].id: 1}
+        assert rag._collection.upsert_calls == upserts + 1
+        assert sum("FROM rag_index_state" in sql for sql in statements) == 1
+        assert test_db.get(RagIndexState, papers[0].id).content_hash == _content_hash(
+            "Stable paper 0\n\nrevised abstract"
+        )
+
+        # 같은 원문이라도 content_source 가 바뀌면 재인덱싱
+        fulltext = rag.index_papers(payload[1:2], db=test_db, content_source="fulltext")
+        assert fulltext == {papers[1].id: 1}
+
+    def test_allergen_codes_attached_in_metadata(self, test_db, rag):
+        from app.database.models import PaperAllergenLink
+
+        paper = _add_paper(test_db, "Peanut OIT")
+        test_db.add(PaperAllergenLink(
+            paper_id=paper.id, allergen_code="peanut", link_type="general",
+        ))
+        test_db.commit()
+
+        rag.index_papers_from_db(test_db)
+
+        metas = [row["metadata"] for row in rag._collection.rows.values()]
+        assert metas[0]["allergens"] == "peanut"
+
+
+class TestStats:
+    def test_stats_use_watermark_count(self, test_db, rag):
+        _add_paper(test_db, "Dust mite sensitization")
+        _add_paper(test_db, "Cat dander", abstract="y" * 2000)
+        rag.index_papers_from_db(test_db)
+
+        stats = rag.get_stats(db=test_db)
+        assert stats["available"] is True
+        assert stats["total_papers"] == 2
+        assert stats["total_chunks"] == rag._collection.count()
+        assert rag._collection.full_scans == 0
+
+
+class TestFulltextTargets:
+    def test_only_abstract_indexed_papers_are_enriched(self, test_db, rag, monkeypatch):
+        p1 = _add_paper(test_db, "Abstract only", doi="10.1/a")
+        p2 = _add_paper(test_db, "Already fulltext", doi="10.1/b")
+        rag.index_papers_from_db(test_db)
+        test_db.get(RagIndexState, p2.id).content_source = "fulltext"
+        test_db.commit()
+
+        searched = []
+
+        class FakeCore:
+            is_available = True
+
+            def search(self, title, max_results=1):
+                searched.append(title)
+
+                class _Result:
+                    papers = []
+                return _Result()
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr("app.services.core_service.CoreService", FakeCore)
+        rag.enrich_with_fulltext(test_db, batch_size=10)
+
+        assert searched == [p1.title[:100]]
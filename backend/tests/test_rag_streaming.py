@@ -0,0 +1,185 @@
+"""RAG 스트리밍 답변 (SSE) 단위 테스트.
+
+LLM 스트리밍과 검색은 monkeypatch 로 대체한다 — 실제 네트워크 호출 없음.
+
+핵심 검증:
+- OpenAI 호환 SSE 델타 파싱
+- _chat_stream: 첫 토큰 전 실패 시 로컬 Fallback
+- ask_stream: sources → token… → done 순서, 캐시 저장/재사용
+- /api/ai/consult/ask/rag/stream 엔드포인트 이벤트 스트림, LLMOps 보고, 오류 메시지 비노출
+"""
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from app.services import rag_answer_cache
+from app.services.ollama_service import OllamaService
+from app.services.rag_answer_cache import RagAnswerCache
+from app.services.rag_service import RAGService
+
+_HITS = [
+    {
+        "chunk_id": "paper_7_chunk_0", "paper_id": 7, "title": "Peanut OIT",
+        "text": "...", "score": 0.82, "year": 2024, "doi": "10.1/x", "allergens": "peanut",
+    },
+]
+
+
+class FakeStreamLLM:
+    is_available = True
+    is_gemini_available = True
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.calls = 0
+
+    def _chat_stream(self, prompt, max_tokens=500, provider="news"):
+        self.calls += 1
+        yield from self.deltas
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    instance = RagAnswerCache()
+    monkeypatch.setattr(rag_answer_cache, "_answer_cache", instance)
+    return instance
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    service = RAGService()
+    monkeypatch.setattr(service, "search", lambda **kwargs: [dict(h) for h in _HITS])
+    return service
+
+
+def _use_llm(monkeypatch, llm):
+    monkeypatch.setattr("app.services.ollama_service.get_ollama_service", lambda: llm)
+
+
+class TestSSEParsing:
+    def test_iter_sse_deltas(self):
+        body = (
+            'data: {"choices":[{"delta":{"role":"assistant"}}]}\n\n'
+            'data: {"choices":[{"delta":{"content":"땅콩 "}}]}\n\n'
+            ': keep-alive\n\n'
+            'data: {"choices":[{"delta":{"content":"알러지"}}]}\n\n'
+            'data: [DONE]\n\n'
+        )
+        resp = httpx.Response(200, content=body.encode("utf-8"))
+        assert list(OllamaService._iter_sse_deltas(resp.iter_lines())) == ["땅콩 ", "알러지"]
+
+    def test_chat_stream_falls_back_before_first_token(self, monkeypatch):
+        service = OllamaService()
+        service._rag_provider = "gemini"
+
+        def broken(prompt, max_tokens=500):
+            raise httpx.ConnectError("down")
+            yield  # pragma: no cover
+
+        monkeypatch.setattr(service, "_stream_gemini", broken)
+        monkeypatch.setattr(service, "_stream_local", lambda p, m=500: iter(["로컬", " 응답"]))
+
+        assert list(service._chat_stream("q", provider="rag")) == ["로컬", " 응답"]
+
+
+class TestAskStream:
+    def test_event_order_and_cache(self, test_db, rag, monkeypatch):
+        llm = FakeStreamLLM(["경구 ", "면역치료 [1]"])
+        _use_llm(monkeypatch, llm)
+
+        events = list(rag.ask_stream("땅콩 OIT 효과?", allergen="peanut", db=test_db))
+
+        assert [e for e, _ in events] == ["sources", "token", "token", "done"]
+        assert events[0][1]["sources"][0]["paper_id"] == 7
+        done = events[-1][1]
+        assert done["answer"] == "경구 면역치료 [1]"
+        assert done["cached"] is False
+
+        again = list(rag.ask_stream("땅콩 OIT 효과", allergen="peanut", db=test_db))
+        assert [e for e, _ in again] == ["sources", "token", "done"]
+        assert again[-1][1]["cached"] is True
+        assert llm.calls == 1
+
+    def test_empty_stream_yields_fallback_message(self, test_db, rag, monkeypatch):
+        _use_llm(monkeypatch, FakeStreamLLM([]))
+
+        events = list(rag.ask_stream("우유", db=test_db))
+
+        assert events[-1][0] == "done"
+        assert "답변을 생성할 수 없습니다" in events[-1][1]["answer"]
+
+
+def _parse_sse(text: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_endpoint(client, rag, monkeypatch):
+    from app.api import ai_consult_routes
+
+    reports = []
+    monkeypatch.setattr(ai_consult_routes._LLMOPS_CHAT, "report", lambda **kw: reports.append(kw))
+    rag._available = True
+    _use_llm(monkeypatch, FakeStreamLLM(["답변"]))
+    monkeypatch.setattr("app.services.rag_service.get_rag_service", lambda: rag)
+    monkeypatch.setattr(
+        "app.services.rag_service._db_session",
+        _fixed_session(client.app),
+    )
+
+    resp = client.post(
+        "/api/ai/consult/ask/rag/stream",
+        json={"question": "땅콩 알러지 증상", "allergen": "peanut"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(resp.text)
+    assert [e for e, _ in events] == ["sources", "token", "done"]
+    assert events[-1][1]["engine"] == "rag"
+    assert events[-1][1]["source_count"] == 1
+    assert len(reports) == 1
+    assert reports[0]["metrics"]["source_count"] == 1
+    assert reports[0]["extra"] == {"engine": "rag", "stream": True}
+
+
+def test_stream_endpoint_hides_internal_errors(client, rag, monkeypatch):
+    rag._available = True
+
+    def broken_stream(**kwargs):
+        raise RuntimeError("connection refused: postgres://secret@db")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(rag, "ask_stream", broken_stream)
+    monkeypatch.setattr("app.services.rag_service.get_rag_service", lambda: rag)
+
+    resp = client.post(
+        "/api/ai/consult/ask/rag/stream",
+        json={"question": "땅콩 알러지 증상", "allergen": "peanut"},
+    )
+
+    [(event, data)] = _parse_sse(resp.text)
+    assert event == "error" and data["success"] is False
+    assert "secret" not in data["error"]
+
+
+def _fixed_session(app):
+    """client fixture 의 get_db override 세션을 그대로 사용"""
+    from contextlib import contextmanager
+
+    from app.database.connection import get_db
+
+    override = app.dependency_overrides[get_db]
+
+    @contextmanager
+    def session_scope(db=None):
+        gen = override()
+        yield next(gen)
+
+    return session_scope
@@ -0,0 +1,279 @@
+"""공유 검색 결과 캐시 (SearchResultCache) 테스트.
+
+시계는 FakeClock 으로 제어하고, 저장소는 SQLite (메모리 / tmp 파일) 를 사용한다.
+
+핵심 검증:
+- fresh → stale → 만료 수명, 부분 실패 결과는 stale 로 저장되어 재시도
+- 같은 파일을 여는 두 인스턴스(워커) 간 공유, 갱신 점유는 한 워커만
+- max_bytes 초과 시 최근 미사용 항목부터 제거
+- stale 항목은 즉시 반환 + 백그라운드 갱신 (동기 스레드 / asyncio 태스크)
+- BatchProcessor, /api/search, /api/stats 연동
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.paper import Paper, PaperSource
+from app.services.batch_processor import AllergenItem, BatchProcessor, ProcessingStatus
+from app.services.paper_search_service import UnifiedSearchResult
+from app.services.search_result_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_STALE,
+    SearchResultCache,
+    _create_sqlite_engine,
+    make_search_cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(title: str = "Peanut allergy", errors: dict | None = None) -> UnifiedSearchResult:
+    paper = Paper(
+        title=title, abstract="abstract", authors=["Kim J"],
+        source=PaperSource.PUBMED, source_id="111",
+        doi="10.1/x", published_at=date(2024, 3, 1),
+    )
+    return UnifiedSearchResult(
+        papers=[paper], pubmed_count=1, semantic_scholar_count=0,
+        total_unique=1, query="peanut allergy", search_time_ms=5.0,
+        errors=errors or {},
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return SearchResultCache(
+        _create_sqlite_engine(":memory:"),
+        fresh_minutes=10, ttl_hours=1, max_bytes=1_000_000, clock=clock,
+    )
+
+
+KEY = make_search_cache_key("peanut", True, 10, ["pubmed", "semantic_scholar"])
+
+
+# ───────── 키 / 저장소 ─────────
+
+
+class TestStorage:
+    def test_key_ignores_case_and_source_order(self):
+        assert make_search_cache_key(" Peanut ", True, 10, ["semantic_scholar", "pubmed"]) == KEY
+        assert make_search_cache_key("peanut", False, 10, ["pubmed", "semantic_scholar"]) != KEY
+        assert make_search_cache_key("peanut", True, 10, ["pubmed"]) != KEY
+
+    def test_round_trip_and_lifecycle(self, cache, clock):
+        assert cache.get(KEY) is None
+        assert cache.put(KEY, "peanut", _result())
+
+        hit = cache.get(KEY)
+        assert not hit.stale
+        paper = hit.result.papers[0]
+        assert paper.published_at == date(2024, 3, 1) and paper.source is PaperSource.PUBMED
+
+        clock.now += 10 * 60
+        assert cache.get(KEY).stale
+
+        clock.now += 3600
+        assert cache.get(KEY) is None
+        assert cache.get_stats()["total_entries"] == 0
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 2)
+        assert stats["hit_rate"] == 0.5
+
+    def test_partial_results_are_stored_stale_with_retry_backoff(self, cache, clock):
+        assert cache.put(KEY, "peanut", _result(errors={"semantic_scholar": "HTTP 429"}))
+
+        cached = cache.get(KEY)
+        assert cached.stale and cached.result.errors == {"semantic_scholar": "HTTP 429"}
+        assert not cache.claim_refresh(KEY)  # 즉시 재시도하지 않음
+        clock.now += 121
+        assert cache.claim_refresh(KEY)
+
+        clock.now += 3600 - 10 * 60
+        assert cache.get(KEY) is None
+
+    def test_evicts_least_recently_used_over_max_bytes(self, cache, clock):
+        keys = [make_search_cache_key(f"a{i}", True, 10, ["pubmed"]) for i in range(3)]
+        cache.put(keys[0], "a0", _result())
+        size = cache.get_stats()["bytes_used"]
+        cache.max_bytes = size * 2
+
+        clock.now += 1
+        cache.put(keys[1], "a1", _result())
+        clock.now += 1
+        cache.get(keys[0])  # a0 최근 사용 → a1 이 가장 오래됨
+        clock.now += 1
+        cache.put(keys[2], "a2", _result())
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+        assert cache.get_stats()["bytes_used"] <= cache.max_bytes
+
+    def test_shared_between_workers_with_single_refresh_lease(self, tmp_path, clock):
+        path = str(tmp_path / "search_cache.sqlite3")
+        worker_a = SearchResultCache(_create_sqlite_engine(path), clock=clock)
+        worker_b = SearchResultCache(_create_sqlite_engine(path), clock=clock)
+
+        worker_a.put(KEY, "peanut", _result("from worker a"))
+
+        assert worker_b.get(KEY).result.papers[0].title == "from worker a"
+        assert worker_a.claim_refresh(KEY, lease_seconds=60)
+        assert not worker_b.claim_refresh(KEY, lease_seconds=60)
+        clock.now += 61
+        assert worker_b.claim_refresh(KEY, lease_seconds=60)
+
+
+# ───────── stale-while-revalidate ─────────
+
+
+class TestRevalidate:
+    def test_fetch_serves_stale_and_refreshes_in_thread(self, cache, clock):
+        cache.put(KEY, "peanut", _result("old"))
+        clock.now += 11 * 60
+        refreshed = threading.Event()
+
+        def search():
+            refreshed.set()
+            return _result("new")
+
+        result, status = cache.fetch(KEY, "peanut", search)
+        assert (status, result.papers[0].title) == (CACHE_STALE, "old")
+
+        assert refreshed.wait(2)
+        for t in threading.enumerate():
+            if t.name == "search-cache-refresh":
+                t.join(2)
+        result, status = cache.fetch(KEY, "peanut", MagicMock())
+        assert (status, result.papers[0].title) == (CACHE_HIT, "new")
+        assert cache.get_stats()["refreshes"] == 1
+
+    def test_partial_refresh_keeps_existing_entry(self, cache, clock):
+        cache.put(KEY, "peanut", _result("old"))
+        clock.now += 11 * 60
+        cache._refresh_sync(KEY, "peanut", lambda: _result("new", errors={"pubmed": "TimeoutError"}))
+
+        assert cache.get(KEY).result.papers[0].title == "old"
+        assert cache.get_stats()["refresh_failures"] == 1
+
+    async def test_afetch_partial_miss_is_retried(self, cache, clock):
+        results = [_result("partial", errors={"pubmed": "TimeoutError"}), _result("complete")]
+
+        async def search():
+            return results.pop(0)
+
+        result, status = await cache.afetch(KEY, "peanut", search)
+        assert (status, result.papers[0].title) == (CACHE_MISS, "partial")
+
+        clock.now += 121
+        result, status = await cache.afetch(KEY, "peanut", search)
+        assert (status, result.papers[0].title) == (CACHE_STALE, "partial")
+        await asyncio.gather(*cache._tasks)
+
+        result, status = await cache.afetch(KEY, "peanut", search)
+        assert (status, result.papers[0].title) == (CACHE_HIT, "complete")
+
+    async def test_afetch_miss_then_hit(self, cache):
+        calls = []
+
+        async def search():
+            calls.append(1)
+            return _result()
+
+        _, first = await cache.afetch(KEY, "peanut", search)
+        _, second = await cache.afetch(KEY, "peanut", search)
+
+        assert (first, second) == (CACHE_MISS, CACHE_HIT)
+        assert len(calls) == 1
+
+    async def test_afetch_refreshes_stale_once(self, cache, clock):
+        cache.put(KEY, "peanut", _result("old"))
+        clock.now += 11 * 60
+        gate = asyncio.Event()
+        calls = []
+
+        async def search():
+            calls.append(1)
+            await gate.wait()
+            return _result("new")
+
+        r1, s1 = await cache.afetch(KEY, "peanut", search)
+        r2, s2 = await cache.afetch(KEY, "peanut", search)  # 갱신 진행 중 → 추가 갱신 없음
+        assert (s1, s2) == (CACHE_STALE, CACHE_STALE)
+        assert r1.papers[0].title == r2.papers[0].title == "old"
+
+        gate.set()
+        await asyncio.gather(*cache._tasks)
+        result, status = await cache.afetch(KEY, "peanut", search)
+        assert (status, result.papers[0].title) == (CACHE_HIT, "new")
+        assert len(calls) == 1
+
+
+# ───────── 연동 ─────────
+
+
+def test_batch_processor_uses_shared_cache(cache):
+    search_service = MagicMock()
+    search_service.allergy_sources.return_value = ["pubmed"]
+    search_service.search_allergy.return_value = _result()
+    processor = BatchProcessor(search_service=search_service, delay_between_batches=0)
+    processor.cache = cache
+
+    job1 = processor.create_job([AllergenItem(name="peanut", grade=3)])
+    processor.process_job_sync(job1, include_cross_reactivity=False, max_results_per_allergen=10)
+    job2 = processor.create_job([AllergenItem(name="Peanut", grade=3)])
+    processor.process_job_sync(job2, include_cross_reactivity=False, max_results_per_allergen=10)
+
+    assert job2.tasks[0].status == ProcessingStatus.CACHED
+    search_service.search_allergy.assert_called_once()
+
+
+def test_search_route_caches_and_reports_stats(monkeypatch, cache):
+    # DB 를 쓰지 않는 경로라 client fixture (test_db create_all) 와 startup (init_db) 없이 호출
+    # — scheduler_models 의 JSONB 가 등록된 뒤에는 SQLite create_all 이 실패하므로
+    from fastapi.testclient import TestClient
+
+    from app.api import main
+    from app.services import search_result_cache
+
+    calls = []
+
+    class FakeService:
+        def allergy_sources(self):
+            return ["pubmed"]
+
+        async def search_allergy_async(self, **kwargs):
+            calls.append(kwargs)
+            return _result()
+
+    monkeypatch.setattr(main, "get_search_service", lambda: FakeService())
+    monkeypatch.setattr(main.settings, "AUTO_SAVE_SEARCH", False)
+    monkeypatch.setattr(search_result_cache, "get_search_result_cache", lambda: cache)
+    monkeypatch.setattr(main.get_batch_processor(), "cache", cache)
+
+    client = TestClient(main.app)
+    first = client.post("/api/search", json={"allergen": "walnut", "max_results": 20}).json()
+    second = client.post("/api/search", json={"allergen": "walnut", "max_results": 20}).json()
+    stats = client.get("/api/stats").json()["cache"]
+
+    assert (first["cache_status"], second["cache_status"]) == (CACHE_MISS, CACHE_HIT)
+    assert second["papers"] == first["papers"]
+    assert len(calls) == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes_used"] > 0
@@ -0,0 +1,176 @@
+"""startup 단계 버전 검사 · 지연 import · import 시간 프로파일러 테스트.
+
+핵심 검증:
+- run_startup_step: 같은 버전이면 생략, 버전이 바뀌거나 강제 실행이면 재실행
+- 실패한 단계(예외 또는 오류를 삼키고 False 반환)는 버전을 기록하지 않아 다음 startup 에 재시도
+- 시드 버전은 원본 데이터 지문 (내용이 같으면 같은 값)
+- app.services 패키지는 이름을 처음 참조할 때 서브모듈을 import
+- app.api.main import 시 지연 대상 모듈이 로드되지 않음 (프로파일러 CLI)
+- startup_event 가 단계별 소요 시간을 app.state 에 기록
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.startup_steps import StartupStepVersion, fingerprint, get_applied_version, run_startup_step
+from scripts import profile_imports
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    StartupStepVersion.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_step_runs_once_per_version(session_factory, monkeypatch):
+    monkeypatch.delenv("STARTUP_FORCE_STEPS", raising=False)
+    calls = []
+
+    def step():
+        calls.append(1)
+
+    assert run_startup_step("seed_x", "v1", step, session_factory) is True
+    assert run_startup_step("seed_x", "v1", step, session_factory) is False
+    assert run_startup_step("seed_x", "v2", step, session_factory) is True
+    assert len(calls) == 2
+    with session_factory() as db:
+        assert get_applied_version(db, "seed_x") == "v2"
+
+    monkeypatch.setenv("STARTUP_FORCE_STEPS", "true")
+    assert run_startup_step("seed_x", "v2", step, session_factory) is True
+    assert len(calls) == 3
+
+
+def test_failed_step_is_not_recorded(session_factory):
+    def broken():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_startup_step("normalize_x", "1", broken, session_factory)
+    with session_factory() as db:
+        assert get_applied_version(db, "normalize_x") is None
+    assert run_startup_step("normalize_x", "1", lambda: None, session_factory) is True
+
+
+def test_swallowed_failure_is_not_recorded(session_factory):
+    def swallowing():
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            return False
+
+    assert run_startup_step("seed_y", "v1", swallowing, session_factory) is False
+    with session_factory() as db:
+        assert get_applied_version(db, "seed_y") is None
+    assert run_startup_step("seed_y", "v1", lambda: 0, session_factory) is True  # 0 건 처리도 성공
+    with session_factory() as db:
+        assert get_applied_version(db, "seed_y") == "v1"
+
+
+def test_missing_version_table_runs_step():
+    no_table = sessionmaker(bind=create_engine("sqlite://"))
+    calls = []
+    assert run_startup_step("seed_x", "v1", lambda: calls.append(1), no_table) is True
+    assert calls == [1]
+
+
+def test_seed_versions_are_data_fingerprints():
+    from app.database import seed_users
+
+    assert fingerprint([{"a": 1, "b": 2}]) == fingerprint([{"b": 2, "a": 1}])
+    assert fingerprint([{"a": 1}]) != fingerprint([{"a": 2}])
+    assert seed_users.SEED_VERSION == fingerprint(seed_users.TEST_USERS)
+
+
+def test_services_package_imports_lazily():
+    code = (
+        "import sys, app.services as s; "
+        "assert 'app.services.paper_search_service' not in sys.modules; "
+        "cls = s.PaperSearchService; "
+        "assert 'app.services.paper_search_service' in sys.modules; "
+        "assert s.PaperSearchService is cls and 'PaperSearchService' in dir(s)"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=profile_imports._backend_dir,
+        env={**os.environ, "DATABASE_URL": "sqlite:///:memory:"},
+        capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:      1000 |       1000 |   json.decoder\n"
+        "import time:      2500 |       3500 | json\n"
+        "something else\n"
+    )
+    records = profile_imports.parse_importtime(stderr)
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("json.decoder", 1000, 1000, 1),
+        ("json", 2500, 3500, 0),
+    ]
+    summary = profile_imports.summarize(records, "json", top=1)
+    assert summary["total_ms"] == 3.5
+    assert summary["top_cumulative"][0]["module"] == "json"
+    assert summary["by_package"] == {"json": 3500}
+
+
+def test_profiler_main_reports_no_deferred_modules(capsys):
+    assert profile_imports.main(["--json", "--top", "3"]) == 0
+    out = capsys.readouterr().out
+    summary = json.loads(out)
+    assert summary["module"] == "app.api.main"
+    assert summary["deferred_loaded"] == []
+
+    assert profile_imports.main(["--module", "json", "--budget-ms", "0"]) == 1
+
+
+def test_startup_records_timings(monkeypatch):
+    from app.api import main
+    from app.database import startup_steps
+
+    # 스키마/시드는 위에서 검증 — 여기서는 단계별 시간 기록만 확인
+    steps = {}
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(startup_steps, "run_startup_step", lambda name, version, step: steps.setdefault(name, step))
+
+    with TestClient(main.app):
+        timings = main.app.state.startup_timings
+    for step in ("init_db", "seed_users", "seed_allergens", "normalize_legacy_grades", "batch_processor"):
+        assert step in timings and timings[step] >= 0
+    assert list(steps) == [
+        "seed_users", "seed_allergens", "seed_persona_newsletter",
+        "normalize_legacy_grades", "normalize_core_source",
+    ]
+
+
+def test_self_handling_steps_report_failure(monkeypatch):
+    """오류를 자체 처리하는 단계도 실패를 run_startup_step 에 알림"""
+    from app.api import main
+    from app.database import normalize_core_source, seed_persona_newsletter, startup_steps
+
+    steps = {}
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(startup_steps, "run_startup_step", lambda name, version, step: steps.setdefault(name, step))
+    with TestClient(main.app):
+        pass
+
+    monkeypatch.setattr(seed_persona_newsletter, "seed_persona_newsletter", lambda: 0)
+    assert steps["seed_persona_newsletter"]() is False
+
+    # papers 테이블이 없는 DB — 사전 검사 실패를 noop(0) 으로 삼키지 않음
+    monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=create_engine("sqlite://")))
+    with pytest.raises(Exception):
+        steps["normalize_core_source"]()
+    assert normalize_core_source.normalize_core_source(main.SessionLocal()) == 0
@@ -0,0 +1,134 @@
+"""정적 참조 데이터 응답 캐시 (StaticResponseCache) 테스트.
+
+핵심 검증:
+- 미리 직렬화한 본문이 기존 JSONResponse 와 같은 내용, strong ETag + Cache-Control
+- If-None-Match 일치 시 본문 없는 304 (W/ 접두어, 목록, * 허용)
+- startup warm 은 DB 가 필요 없는 빌더만 미리 생성
+- DB 빌더는 TTL 이 지나거나 invalidate() 되면 다시 생성
+- 관리자 캐시 초기화 API 와 알러젠 수정 훅이 캐시를 비움
+"""
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import static_response_cache as src
+from app.core.static_response_cache import StaticResponseCache, etag_matches, get_static_response_cache
+
+STATIC_ROUTES = [
+    "/api/allergens",
+    "/api/sgti/info",
+    "/api/sgti/grades",
+    "/api/public/mast/grades",
+    "/api/public/drugs/allergy-classes",
+    "/api/ai/consult/allergens",
+]
+
+
+@pytest.fixture
+def app_client():
+    from app.api import main
+
+    return TestClient(main.app)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def db_builder(monkeypatch):
+    """테스트 전용 DB 빌더 등록 — 호출 횟수와 받은 세션 기록"""
+    calls = []
+
+    async def build(db):
+        calls.append(db)
+        return {"version": len(calls)}
+
+    monkeypatch.setitem(src._BUILDERS, "test_db_payload", (build, True))
+    return calls
+
+
+@pytest.mark.parametrize("path", STATIC_ROUTES)
+def test_static_routes_serve_etag_and_304(app_client, path):
+    res = app_client.get(path)
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    assert res.headers["cache-control"] == f"public, max-age={src.DEFAULT_MAX_AGE}"
+    etag = res.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    again = app_client.get(path, headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == etag
+
+    assert app_client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_payload_matches_previous_json_shape(app_client):
+    grades = app_client.get("/api/sgti/grades").json()
+    assert grades["restriction_levels"]["4"]["level"] == "strict_avoid"
+    assert set(grades["grades"]) == {"0", "1", "2", "3", "4"}
+
+    consult = app_client.get("/api/ai/consult/allergens").json()
+    assert consult["total"] == len(consult["food"]) + len(consult["inhalant"])
+    assert app_client.get("/api/allergens").json()["food"] == consult["food"]
+
+
+def test_etag_matching_rules():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
+
+
+def test_warm_skips_db_builders(db_builder):
+    cache = StaticResponseCache()
+    built = cache.warm()
+
+    assert {"allergens", "sgti_info", "public_mast_grades", "consult_allergens"} <= set(built)
+    assert "public_mast_allergens" not in built and "test_db_payload" not in built
+    assert db_builder == []
+    assert cache.warm() == []  # 이미 만들어진 항목은 다시 만들지 않음
+
+
+async def test_db_builder_ttl_and_invalidate(db_builder):
+    clock = _Clock()
+    cache = StaticResponseCache(db_ttl_seconds=60, clock=clock)
+    session = object()
+
+    first = await cache.get_or_build("test_db_payload", session)
+    assert (await cache.get_or_build("test_db_payload", session)) is first
+    assert db_builder == [session]
+
+    clock.now = 60
+    assert (await cache.get_or_build("test_db_payload", session)).body == b'{"version":2}'
+
+    assert cache.invalidate(["test_db_payload", "unknown"]) == ["test_db_payload"]
+    assert (await cache.get_or_build("test_db_payload", session)).body == b'{"version":3}'
+    stats = cache.get_stats()
+    assert (stats["builds"], stats["hits"], stats["invalidations"]) == (3, 1, 1)
+
+
+def test_admin_invalidate_endpoint(app_client):
+    from app.admin.dependencies import require_super_admin
+    from app.api import main
+    from app.database.models import User
+
+    app_client.get("/api/sgti/info")
+    assert "sgti_info" in get_static_response_cache().get_stats()["cached"]
+
+    main.app.dependency_overrides[require_super_admin] = lambda: User(id=1, role="super_admin")
+    try:
+        body = app_client.post("/api/admin/reference-cache/invalidate").json()
+        assert "sgti_info" in body["invalidated"]
+        stats = app_client.get("/api/admin/reference-cache/stats").json()
+    finally:
+        main.app.dependency_overrides.pop(require_super_admin, None)
+    assert stats["cached"] == [] and "public_mast_allergens" in stats["registered"]